@@ -0,0 +1,82 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+群配置存储基准测试 config_store.py 2026-10-19
+Author: AptS:1547
+
+在临时目录中生成包含大量QQ群的config.yml，分别测量yaml和sqlite两种存储方式下：
+set: 一次 ~conf set（修改单个群的server_address）的耗时
+reload: 一次 ~conf reload（重新读取并编译配置）的耗时
+
+用法：python benchmark/config_store.py [--groups 10000] [-n 20]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "plugin"))
+
+from handler.ConfigHandler import ConfigHandler  # pylint: disable=wrong-import-position, import-error
+
+
+def write_config(path: Path, groups: int, backend: str) -> None:
+    """生成测试用的配置文件"""
+    config = {
+        "enable": True,
+        "mc_config_backend": backend,
+        "mc_qqgroup_id": list(range(100000, 100000 + groups)),
+        "mc_qqgroup_default_server": {
+            groupid: {"server_address": f"mc{groupid}.example.com", "default_icon_type": "Server Icon",
+                      "default_icon": "", "need_scan": groupid % 10 == 0}
+            for groupid in range(100000, 100000 + groups)
+        },
+    }
+    with open(path, encoding="utf-8", mode="w") as f:
+        yaml.dump(config, f)
+
+
+def measure(backend: str, groups: int, repeat: int) -> tuple[list[float], list[float]]:
+    """返回(set耗时列表, reload耗时列表)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "config.yml"
+        write_config(path, groups, backend)
+        ConfigHandler.initialize(path)
+        assert ConfigHandler.error == "", ConfigHandler.error
+
+        set_samples, reload_samples = [], []
+        for i in range(repeat):
+            groupid = 100000 + (i * 7919) % groups
+            start = time.perf_counter()
+            ConfigHandler.set_config(["set", "server_address", f"changed{i}.example.com"], groupid)
+            set_samples.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            ConfigHandler.reload_config()
+            reload_samples.append(time.perf_counter() - start)
+        ConfigHandler.close_store()
+    return set_samples, reload_samples
+
+
+def main() -> None:
+    """运行基准测试并输出中位数/最大值（毫秒）"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--groups", type=int, default=10000, help="QQ群数量")
+    parser.add_argument("-n", type=int, default=20, help="重复次数")
+    args = parser.parse_args()
+
+    for backend in ("yaml", "sqlite"):
+        set_samples, reload_samples = measure(backend, args.groups, args.n)
+        for name, values in (("set", set_samples), ("reload", reload_samples)):
+            print(f"{backend:<7} {name:<7} median {statistics.median(values) * 1000:9.2f} ms   "
+                  f"max {max(values) * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
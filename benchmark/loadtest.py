@@ -0,0 +1,475 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+离线压力测试 loadtest.py 2026-10-19
+Author: AptS:1547
+
+不需要真实的Minecraft服务器和OneBot实现，在本机完整地跑一遍插件：
+FakeJavaServer: asyncio实现的Java版服务器（TCP上的Server List Ping：握手、状态JSON、ping/pong）
+FakeBedrockServer: asyncio实现的基岩版服务器（UDP上的RakNet Unconnected Ping/Pong）
+Behaviour: 每个假服务器的行为，可以注入延迟、抖动和丢包；set_offline停止/恢复监听，模拟服务器离线
+RecordingAdapter: 假的OneBot V11适配器，记录所有API调用（经过插件注册的限速钩子），不连接任何实现
+
+压测脚本：
+1. 按 --java/--bedrock 启动假服务器，每个群的默认服务器指向其中一个，需要扫描
+2. 开头一次性发出 --burst 条~ping，之后按 --rate 条/秒（泊松到达）持续 --duration 秒，
+   每条~ping随机选一个群，按 --multi 的比例查询多个地址
+3. 同时每隔 --scan-interval 秒跑一轮扫描器；--flap 比例的服务器在中途离线、之后恢复，产生提醒消息
+4. 输出吞吐量、~ping端到端耗时的p50/p95/p99、事件循环延迟、API调用统计和内存占用（包括MemoryBudget中各缓存的占用）
+
+~ping通过NoneBot的handle_event分发给插件的命令处理函数，走的是和真实消息相同的路径
+（命令解析、PingCoalescer、渲染、MessageDispatcher、RateLimiter）；配置写在临时目录中，不会修改插件的config.yml
+
+用法：python benchmark/loadtest.py [--java 8] [--bedrock 4] [--duration 20] [--rate 5] [--burst 20]
+                                   [--latency-ms 20] [--loss 0.0] [--flap 0.25] [--tracemalloc]
+                                   [--config mc_ping_cooldown_second=0 ...]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import resource
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
+from base64 import b64encode
+from collections import Counter
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+
+import yaml
+
+REPO_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_PATH))
+
+import nonebot  # pylint: disable=wrong-import-position
+from nonebot.adapters.onebot.v11 import Adapter, Bot, GroupMessageEvent, Message  # pylint: disable=wrong-import-position
+
+RAKNET_MAGIC = bytes.fromhex("00ffff00fefefefefdfdfdfd12345678")
+SELF_ID = "10000"
+
+
+@dataclass(slots=True)
+class Behaviour:
+    """
+    假服务器的行为
+    latency: 每次回复前的固定延迟（秒）
+    jitter: 额外的随机延迟上限（秒）
+    loss: 请求被丢弃（不回复，客户端只能等到超时）的概率
+    """
+    latency: float = 0.0
+    jitter: float = 0.0
+    loss: float = 0.0
+
+    def dropped(self) -> bool:
+        """这次请求是否丢弃"""
+        return random.random() < self.loss
+
+    def delay(self) -> float:
+        """这次回复前的延迟"""
+        return self.latency + random.uniform(0, self.jitter)
+
+
+def varint(value: int) -> bytes:
+    """编码VarInt"""
+    value &= 0xFFFFFFFF
+    data = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            data.append(byte | 0x80)
+        else:
+            data.append(byte)
+            return bytes(data)
+
+
+async def read_varint(reader: asyncio.StreamReader) -> int:
+    """从流中读取VarInt"""
+    value = 0
+    for shift in range(0, 35, 7):
+        byte = (await reader.readexactly(1))[0]
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value
+    raise ValueError("VarInt太长")
+
+
+def make_icon(seed: int) -> str:
+    """生成64x64的纯色PNG服务器图标（data URI）"""
+    from PIL import Image  # pylint: disable=import-outside-toplevel
+    buffer = BytesIO()
+    Image.new("RGB", (64, 64), ((seed * 67) % 256, (seed * 131) % 256, (seed * 29) % 256)).save(buffer, format="PNG")
+    return "data:image/png;base64," + b64encode(buffer.getvalue()).decode("ascii")
+
+
+class FakeJavaServer:
+    """Java版服务器：握手 -> 状态请求 -> 状态JSON -> ping -> pong"""
+
+    def __init__(self, index: int, behaviour: Behaviour) -> None:
+        self.index = index
+        self.behaviour = behaviour
+        self.requests = 0
+        self.address: tuple[str, int] | None = None
+        self.server: asyncio.base_events.Server | None = None
+        status = {
+            "version": {"name": "1.21.1", "protocol": 767},
+            "players": {"max": 20, "online": index % 21, "sample": []},
+            "description": {"text": f"§aFake Java server §f#{index}"},
+            "favicon": make_icon(index),
+        }
+        self.status = json.dumps(status).encode("utf-8")
+
+    async def start(self, host: str, port: int) -> None:
+        """开始监听"""
+        self.address = (host, port)
+        self.server = await asyncio.start_server(self.handle, host, port)
+
+    async def close(self) -> None:
+        """停止监听"""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def set_offline(self, offline: bool) -> None:
+        """离线时停止监听（连接被拒绝），恢复时重新监听同一个端口"""
+        if offline:
+            await self.close()
+        elif self.server is None:
+            await self.start(*self.address)
+
+    @staticmethod
+    def packet(packet_id: int, payload: bytes) -> bytes:
+        """按 长度 + 包ID + 内容 打包"""
+        body = varint(packet_id) + payload
+        return varint(len(body)) + body
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """处理一个连接"""
+        self.requests += 1
+        try:
+            while True:
+                data = await reader.readexactly(await read_varint(reader))
+                packet_id = data[0]
+                if packet_id == 0x00 and len(data) > 1:          # 握手，不需要回复
+                    continue
+                if self.behaviour.dropped():                     # 丢包：不回复，客户端等到超时
+                    await reader.read()
+                    return
+                await asyncio.sleep(self.behaviour.delay())
+                if packet_id == 0x00:                            # 状态请求
+                    writer.write(self.packet(0x00, varint(len(self.status)) + self.status))
+                elif packet_id == 0x01:                          # ping，原样返回8字节的token
+                    writer.write(self.packet(0x01, data[1:9]))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+class FakeBedrockServer(asyncio.DatagramProtocol):
+    """基岩版服务器：Unconnected Ping(0x01) -> Unconnected Pong(0x1c)"""
+
+    def __init__(self, index: int, behaviour: Behaviour) -> None:
+        self.index = index
+        self.behaviour = behaviour
+        self.requests = 0
+        self.address: tuple[str, int] | None = None
+        self.transport: asyncio.DatagramTransport | None = None
+        motd = f"MCPE;Fake Bedrock server #{index};712;1.21.2;{index % 11};10;{1000 + index};Bedrock level;Survival;1;19132;19133;"
+        self.motd = motd.encode("utf-8")
+        self.guid = struct.pack(">Q", 0x1547_0000 + index)
+
+    async def start(self, host: str, port: int) -> None:
+        """开始监听"""
+        self.address = (host, port)
+        await asyncio.get_running_loop().create_datagram_endpoint(lambda: self, local_addr=(host, port))
+
+    async def close(self) -> None:
+        """停止监听"""
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
+
+    async def set_offline(self, offline: bool) -> None:
+        """离线时关闭端口（客户端收到ICMP端口不可达），恢复时重新监听"""
+        if offline:
+            await self.close()
+        elif self.transport is None:
+            await self.start(*self.address)
+
+    def connection_made(self, transport) -> None:
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        if not data or data[0] != 0x01 or len(data) < 25:
+            return
+        self.requests += 1
+        if self.behaviour.dropped():
+            return
+        pong = b"\x1c" + data[1:9] + self.guid + RAKNET_MAGIC + struct.pack(">H", len(self.motd)) + self.motd
+        asyncio.get_running_loop().call_later(self.behaviour.delay(), self._reply, pong, addr)
+
+    def _reply(self, pong: bytes, addr) -> None:
+        if self.transport is not None:          # 离线或压测结束后才到期的回复直接丢弃
+            self.transport.sendto(pong, addr)
+
+    def error_received(self, exc) -> None:
+        pass                                    # 客户端已经关闭套接字（Java版先返回了结果）
+
+
+class RecordingAdapter(Adapter):
+    """假的OneBot V11适配器：API调用只记录下来，按 --api-latency-ms 模拟实现的处理时间"""
+    api_latency = 0.0
+    calls: list[tuple[float, str, dict]] = []
+    message_ids = itertools.count(1)
+
+    async def _call_api(self, bot: Bot, api: str, **data):
+        self.calls.append((time.perf_counter(), api, data))
+        await asyncio.sleep(self.api_latency)
+        if api.startswith("send_"):
+            return {"message_id": next(self.message_ids)}
+        return None
+
+
+class LoopLagMonitor:
+    """定时醒来，记录实际醒来时间比预期晚了多少，反映事件循环被阻塞的程度"""
+    INTERVAL = 0.01
+
+    def __init__(self) -> None:
+        self.samples: list[float] = []
+        self.task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.INTERVAL
+            await asyncio.sleep(self.INTERVAL)
+            self.samples.append(max(0.0, time.perf_counter() - expected))
+
+    def start(self) -> None:
+        """开始监测"""
+        self.task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """停止监测"""
+        self.task.cancel()
+
+
+def percentile(values: list[float], q: float) -> float:
+    """百分位数（最近秩），没有数据时为0"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))]
+
+
+def report(name: str, values: list[float], unit: float = 1000, suffix: str = "ms") -> None:
+    """输出一行p50/p95/p99/max"""
+    if not values:
+        print(f"{name:<18} (无数据)")
+        return
+    print(f"{name:<18} n={len(values):<6} p50 {percentile(values, 50) * unit:9.2f} {suffix}   "
+          f"p95 {percentile(values, 95) * unit:9.2f} {suffix}   p99 {percentile(values, 99) * unit:9.2f} {suffix}   "
+          f"max {max(values) * unit:9.2f} {suffix}")
+
+
+def parse_overrides(items: list[str]) -> dict:
+    """解析 --config key=value，value按YAML解析"""
+    overrides = {}
+    for item in items:
+        key, _, value = item.partition("=")
+        overrides[key.strip()] = yaml.safe_load(value)
+    return overrides
+
+
+def load_plugin():
+    """初始化NoneBot（不启动驱动器），注册假适配器并加载插件"""
+    nonebot.init(driver="~none", command_start={"~"}, superusers={"1"}, log_level="WARNING")
+    nonebot.get_driver().register_adapter(RecordingAdapter)
+    nonebot.load_plugin("nonebot_plugin_apscheduler")
+    return nonebot.load_plugin("plugin").module
+
+
+def make_event(message_id: int, group_id: int, user_id: int, text: str) -> GroupMessageEvent:
+    """构造一条群消息事件"""
+    message = Message(text)
+    return GroupMessageEvent.model_validate({
+        "time": int(time.time()), "self_id": int(SELF_ID), "post_type": "message", "sub_type": "normal",
+        "user_id": user_id, "message_type": "group", "message_id": message_id, "group_id": group_id,
+        "message": message, "original_message": message, "raw_message": text, "font": 0,
+        "sender": {"user_id": user_id, "nickname": f"user{user_id}", "role": "member"}, "to_me": False,
+    })
+
+
+async def run(args: argparse.Namespace) -> None:
+    """按脚本压测并输出结果"""
+    random.seed(args.seed)
+    module = load_plugin()
+    from nonebot.message import handle_event  # pylint: disable=import-outside-toplevel
+
+    # 假服务器：Java版和基岩版各自监听一个端口，每个群的默认服务器依次指向它们
+    servers, addresses = [], []
+    for index in range(args.java + args.bedrock):
+        behaviour = Behaviour(args.latency_ms / 1000, args.jitter_ms / 1000, args.loss)
+        server = FakeJavaServer(index, behaviour) if index < args.java else FakeBedrockServer(index, behaviour)
+        await server.start(args.host, args.port + index)
+        servers.append(server)
+        addresses.append(f"{args.host}:{args.port + index}")
+
+    groups = list(range(100001, 100001 + args.groups))
+    settings = {
+        "enable": True, "mc_serverscaner_enable": True, "mc_config_watch_enable": False, "mc_prewarm_enable": False,
+        "mc_qqgroup_id": groups,
+        "mc_qqgroup_default_server": {group: {"server_address": addresses[i % len(addresses)], "need_scan": True}
+                                      for i, group in enumerate(groups)},
+    }
+    settings.update(parse_overrides(args.config))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = Path(tmp) / "config.yml"
+        config_path.write_text(yaml.safe_dump(settings, allow_unicode=True), encoding="utf-8")
+        module.ConfigHandler.initialize(config_path)
+        if module.ConfigHandler.error:
+            raise SystemExit(module.ConfigHandler.error)
+        module.Tracer.configure(module.ConfigHandler.config.mc_trace_enable, module.ConfigHandler.config.mc_trace_sink)
+        module.MemoryBudget.configure(module.ConfigHandler.config.mc_memory_budget_mb * 1024 * 1024)
+        RecordingAdapter.api_latency = args.api_latency_ms / 1000
+
+        adapter = next(a for a in nonebot.get_adapters().values() if isinstance(a, RecordingAdapter))
+        bot = Bot(adapter, SELF_ID)
+        scanner = module.mcServerScaner
+        scanner.update_config(module.ConfigHandler.snapshot)
+        scanner.bound_bot(bot)
+
+        if args.tracemalloc:
+            tracemalloc.start()
+        monitor = LoopLagMonitor()
+        monitor.start()
+
+        ping_latency, scan_durations, ping_tasks, scans = [], [], set(), set()
+        message_ids = itertools.count(1)
+
+        async def one_ping() -> None:
+            group = random.choice(groups)
+            if random.random() < args.multi:
+                text = "~ping " + " ".join(random.sample(addresses, min(len(addresses), 3)))
+            else:
+                text = "~ping"
+            event = make_event(next(message_ids), group, random.randint(20000, 29999), text)
+            start = time.perf_counter()
+            await handle_event(bot, event)
+            ping_latency.append(time.perf_counter() - start)
+
+        def fire() -> None:
+            task = asyncio.create_task(one_ping())
+            ping_tasks.add(task)
+            task.add_done_callback(ping_tasks.discard)
+
+        async def scan_loop() -> None:
+            async def one_scan() -> None:
+                start = time.perf_counter()
+                await scanner.run_scanner(1)
+                scan_durations.append(time.perf_counter() - start)
+
+            while True:
+                if len(scans) < 5:              # 和start_scaner中的max_instances一致
+                    task = asyncio.create_task(one_scan())
+                    scans.add(task)
+                    task.add_done_callback(scans.discard)
+                await asyncio.sleep(args.scan_interval)
+
+        async def flap_loop() -> None:
+            flapping = random.sample(servers, round(len(servers) * args.flap))
+            await asyncio.sleep(args.duration / 3)
+            for server in flapping:
+                await server.set_offline(True)
+            await asyncio.sleep(args.duration / 3)
+            for server in flapping:
+                await server.set_offline(False)
+
+        started = time.perf_counter()
+        background = [asyncio.create_task(scan_loop()), asyncio.create_task(flap_loop())]
+        for _ in range(args.burst):
+            fire()
+        deadline = started + args.duration
+        while args.rate > 0 and (now := time.perf_counter()) < deadline:
+            await asyncio.sleep(min(random.expovariate(args.rate), deadline - now))
+            if time.perf_counter() < deadline:
+                fire()
+        await asyncio.sleep(max(0.0, deadline - time.perf_counter()))
+        for task in background:
+            task.cancel()
+        issued = len(ping_latency) + len(ping_tasks)
+        if ping_tasks:
+            await asyncio.wait(ping_tasks, timeout=args.drain)
+        elapsed = time.perf_counter() - started
+        monitor.stop()
+
+        traced = tracemalloc.get_traced_memory() if args.tracemalloc else None
+        tracemalloc.stop()
+        await module.MessageDispatcher.stop()
+        for server in servers:
+            await server.close()
+
+    calls = Counter(api for _, api, _ in RecordingAdapter.calls)
+    sends = [stamp for stamp, api, _ in RecordingAdapter.calls if api.startswith("send_")]
+    print(f"假服务器: Java {args.java} 基岩版 {args.bedrock}  群 {args.groups}  延迟 {args.latency_ms} ms  "
+          f"丢包 {args.loss:.0%}  中途离线 {round(len(servers) * args.flap)} 个")
+    print(f"运行 {elapsed:.1f} s  ~ping 发出 {issued} 完成 {len(ping_latency)}  "
+          f"吞吐 {len(ping_latency) / elapsed:.2f} 条/秒  扫描 {len(scan_durations)} 轮（另有 {len(scans)} 轮未完成）")
+    report("~ping 端到端", ping_latency)
+    report("扫描一轮", scan_durations)
+    report("事件循环延迟", monitor.samples)
+    print("API调用          " + "  ".join(f"{api} {count}" for api, count in sorted(calls.items())))
+    if len(sends) > 1:
+        print(f"发送速率         {(len(sends) - 1) / (sends[-1] - sends[0]):.2f} 条/秒")
+    print(f"服务器请求       {sum(server.requests for server in servers)}")
+    if traced is not None:
+        print(f"tracemalloc      当前 {traced[0] / 1048576:.1f} MB  峰值 {traced[1] / 1048576:.1f} MB")
+    print(f"最大RSS          {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB")
+    for name, entries, size, evictions in module.MemoryBudget.usage():
+        print(f"  {name:<18} {entries:>5} 条 {size / 1048576:8.2f} MB" + ("" if evictions is None else f"   预算淘汰 {evictions} 次"))
+    if args.trace:
+        for name, (count, p50, p95) in module.Tracer.summary().items():
+            print(f"  {name:<18} n={count:<6} p50 {p50:8.2f} ms   p95 {p95:8.2f} ms")
+
+
+def main() -> None:
+    """解析参数并运行压测"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--java", type=int, default=8, help="假Java版服务器数量")
+    parser.add_argument("--bedrock", type=int, default=4, help="假基岩版服务器数量")
+    parser.add_argument("--host", default="127.0.0.1", help="假服务器监听地址")
+    parser.add_argument("--port", type=int, default=35565, help="第一个假服务器的端口，之后依次加一")
+    parser.add_argument("--groups", type=int, default=20, help="QQ群数量")
+    parser.add_argument("--duration", type=float, default=20.0, help="持续发送~ping的时间（秒）")
+    parser.add_argument("--rate", type=float, default=5.0, help="平均每秒发出的~ping数量，0为只发开头的突发")
+    parser.add_argument("--burst", type=int, default=20, help="开头一次性发出的~ping数量")
+    parser.add_argument("--multi", type=float, default=0.1, help="查询多个地址的~ping所占比例")
+    parser.add_argument("--scan-interval", type=float, default=2.0, help="扫描器间隔（秒）")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="假服务器的固定延迟（毫秒）")
+    parser.add_argument("--jitter-ms", type=float, default=10.0, help="假服务器的随机延迟上限（毫秒）")
+    parser.add_argument("--loss", type=float, default=0.0, help="假服务器的丢包率")
+    parser.add_argument("--flap", type=float, default=0.25, help="中途离线再恢复的服务器比例")
+    parser.add_argument("--api-latency-ms", type=float, default=5.0, help="假OneBot实现处理一次API调用的时间（毫秒）")
+    parser.add_argument("--drain", type=float, default=30.0, help="结束后等待未完成~ping的最长时间（秒）")
+    parser.add_argument("--config", action="append", default=[], metavar="KEY=VALUE", help="覆盖插件配置，可以重复")
+    parser.add_argument("--trace", action="store_true", help="开启Tracer并输出各阶段耗时")
+    parser.add_argument("--tracemalloc", action="store_true", help="用tracemalloc统计Python内存（会变慢）")
+    parser.add_argument("--seed", type=int, default=1547, help="随机数种子")
+    args = parser.parse_args()
+    if args.trace:
+        args.config.append("mc_trace_enable=true")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
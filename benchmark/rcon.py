@@ -0,0 +1,189 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+RCON基准测试 rcon.py 2026-10-19
+Author: AptS:1547
+
+在本机启动一个假的RCON服务器（和Minecraft一样每个连接按顺序处理命令，输出超过4096字节时拆包），测量RconClient：
+fresh: 对照组，每条命令都新建连接并登录
+pooled: 连接池中依次执行
+concurrent: 同时发出--concurrency条命令（流水线+多连接）
+fragment: 拆成多个数据包的长输出是否完整
+reconnect: 服务器断开全部连接后，下一条命令自动重连重新登录
+auth: 密码错误时抛出PermissionError
+
+用法：python benchmark/rcon.py [-n 200] [--latency-ms 2] [--concurrency 32] [--pool-size 2] [--depth 4]
+"""
+
+import argparse
+import asyncio
+import statistics
+import struct
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "plugin"))
+
+from handler.RconClient import (COMMAND, FRAGMENT_SIZE, LOGIN, RESPONSE,  # pylint: disable=wrong-import-position, import-error
+                                RconClient, RconConnection, encode_packet, read_packet)
+
+PASSWORD = "benchmark"
+
+
+class FakeRconServer:
+    """假的RCON服务器：whitelist add/remove/list、big <字节数>、其他命令原样返回"""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.whitelist: set[str] = set()
+        self.connections = 0
+        self.logins = 0
+        self.writers: set[asyncio.StreamWriter] = set()
+        self.handlers: set[asyncio.Task] = set()
+        self.server: asyncio.Server | None = None
+
+    async def start(self) -> int:
+        """在随机端口上开始监听，返回端口"""
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    def drop_all(self) -> None:
+        """断开全部连接（模拟服务器重启）"""
+        for writer in self.writers:
+            writer.close()
+        self.writers.clear()
+
+    async def stop(self) -> None:
+        """停止监听，等全部连接的处理结束（否则asyncio.run退出时取消它们会打印CancelledError）"""
+        self.drop_all()
+        self.server.close()
+        await asyncio.gather(*self.handlers, return_exceptions=True)
+        await self.server.wait_closed()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """一个连接：先登录，之后按顺序执行命令"""
+        self.connections += 1
+        self.writers.add(writer)
+        self.handlers.add(asyncio.current_task())
+        try:
+            request_id, packet_type, body = await read_packet(reader)
+            if packet_type != LOGIN or body.decode() != PASSWORD:
+                writer.write(encode_packet(-1, COMMAND, ""))
+                await writer.drain()
+                return
+            self.logins += 1
+            writer.write(encode_packet(request_id, COMMAND, ""))
+            while True:
+                request_id, packet_type, body = await read_packet(reader)
+                await asyncio.sleep(self.latency)
+                output = self.run(body.decode())
+                for start in range(0, max(len(output), 1), FRAGMENT_SIZE):
+                    writer.write(self.encode_raw(request_id, output[start:start + FRAGMENT_SIZE]))
+                await writer.drain()
+        except (OSError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            self.writers.discard(writer)
+            self.handlers.discard(asyncio.current_task())
+            writer.close()
+
+    @staticmethod
+    def encode_raw(request_id: int, body: bytes) -> bytes:
+        """按原始字节编码一个输出包（拆包时不能在UTF-8字符中间重新编码）"""
+        payload = body + b"\x00\x00"
+        return struct.pack("<iii", 8 + len(payload), request_id, RESPONSE) + payload
+
+    def run(self, command: str) -> bytes:
+        """执行一条命令"""
+        args = command.split()
+        match args:
+            case ["whitelist", "add", name]:
+                self.whitelist.add(name)
+                return f"§eAdded {name} to the whitelist".encode()
+            case ["whitelist", "remove", name]:
+                self.whitelist.discard(name)
+                return f"Removed {name} from the whitelist".encode()
+            case ["whitelist", "list"]:
+                return f"There are {len(self.whitelist)} whitelisted players: {', '.join(sorted(self.whitelist))}".encode()
+            case ["big", size]:
+                return b"x" * int(size)
+            case _:
+                return command.encode()
+
+
+async def fresh_execute(port: int, command: str) -> str:
+    """对照组：新建连接、登录、执行、关闭"""
+    connection = await RconConnection.open("127.0.0.1", port, PASSWORD, 5.0)
+    try:
+        return await connection.request(command, 5.0)
+    finally:
+        connection.close()
+
+
+def report(name: str, values: list[float]) -> None:
+    """输出中位数/p95（毫秒）"""
+    cuts = statistics.quantiles(values, n=20) if len(values) > 1 else values * 19
+    print(f"{name:<12} median {statistics.median(values) * 1000:8.3f} ms   p95 {cuts[18] * 1000:8.3f} ms   n={len(values)}")
+
+
+async def main(args: argparse.Namespace) -> None:
+    """运行基准测试"""
+    server = FakeRconServer(args.latency_ms / 1000)
+    port = await server.start()
+    address = f"127.0.0.1:{port}"
+    RconClient.configure(args.pool_size, args.depth, 5.0, 300.0)
+
+    timings = []
+    for i in range(args.n):
+        start = time.perf_counter()
+        await fresh_execute(port, f"say {i}")
+        timings.append(time.perf_counter() - start)
+    report("fresh", timings)
+
+    connections = server.connections
+    timings = []
+    for i in range(args.n):
+        start = time.perf_counter()
+        await RconClient.execute(address, PASSWORD, f"whitelist add Player{i}")
+        timings.append(time.perf_counter() - start)
+    report("pooled", timings)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(RconClient.execute(address, PASSWORD, f"echo {i}") for i in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+    assert results == [f"echo {i}" for i in range(args.concurrency)], "流水线的响应没有对应到正确的命令"
+    print(f"{'concurrent':<12} {args.concurrency} 条命令共 {elapsed * 1000:8.3f} ms   "
+          f"新建连接 {server.connections - connections} 个（上限 {args.pool_size}）")
+
+    for size in (10, FRAGMENT_SIZE, FRAGMENT_SIZE * 3, FRAGMENT_SIZE * 3 + 17):
+        output = await RconClient.execute(address, PASSWORD, f"big {size}")
+        assert len(output) == size, f"长输出不完整：{len(output)} != {size}"
+    print(f"{'fragment':<12} ok")
+
+    logins = server.logins
+    server.drop_all()
+    await asyncio.sleep(0.05)
+    output = await RconClient.execute(address, PASSWORD, "whitelist list")
+    assert output.startswith(f"There are {args.n} "), output
+    print(f"{'reconnect':<12} ok（重新登录 {server.logins - logins} 次）")
+
+    try:
+        await RconClient.execute(address, "wrong", "list")
+        print(f"{'auth':<12} 错误：密码错误没有抛出异常")
+    except PermissionError:
+        print(f"{'auth':<12} ok")
+
+    RconClient.close_all()
+    await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=200, help="依次执行的命令数")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="服务器执行每条命令的耗时")
+    parser.add_argument("--concurrency", type=int, default=32, help="同时发出的命令数")
+    parser.add_argument("--pool-size", type=int, default=2, help="mc_rcon_pool_size")
+    parser.add_argument("--depth", type=int, default=4, help="mc_rcon_pipeline_depth")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,106 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+插件启动耗时基准测试 startup.py 2026-10-19
+Author: AptS:1547
+
+在干净的子进程中反复测量：
+import: NoneBot加载本插件所用时间
+first_ping: 第一次~ping除网络探测外的开销（导入MinecraftServer/PictureHandler、编译布局、渲染、JPEG编码、base64）
+first_ping_prewarmed: 执行过prewarm_plugin后第一次~ping的同样开销
+deferred: 加载插件时不应该导入的重依赖（HEAVY_MODULES），加载后出现在sys.modules中的会被列出
+传入 --server 时，first_ping 还会包含对该服务器的真实探测
+resources/fonts 中没有字体时渲染会失败，可以用 --font 指定一个字体文件代替
+
+用法：python benchmark/startup.py [-n 次数] [--server 地址] [--font 字体文件]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_PATH = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ("yaml", "sqlite3", "PIL", "PIL.Image", "mcstatus")
+
+CHILD = r'''
+import asyncio, base64, json, sys, time
+from io import BytesIO
+sys.path.insert(0, {repo!r})
+import nonebot
+from nonebot.adapters.onebot.v11 import Adapter
+nonebot.init(driver="~none", command_start={{"~"}})
+nonebot.get_driver().register_adapter(Adapter)
+nonebot.load_plugin("nonebot_plugin_apscheduler")
+
+result = {{}}
+before = set(sys.modules)
+start = time.perf_counter()
+plugin = nonebot.load_plugin("plugin")
+result["import"] = time.perf_counter() - start
+result["eager"] = sorted(name for name in {heavy!r} if name in sys.modules and name not in before)
+if {font!r}:
+    from plugin.handler import PictureDefine as picture_define
+    picture_define.FONTS.update(dict.fromkeys(picture_define.FONTS, {font!r}))
+
+async def first_ping():
+    module = plugin.module
+    module.ConfigHandler.initialize()
+    if {prewarm}:
+        await module.prewarm_plugin()
+    start = time.perf_counter()
+    from plugin.handler.MinecraftServer import MinecraftServer
+    from plugin.handler.PictureHandler import PictureHandler
+    information = {{"server_address": "bench.example.com", "serverType": "Java", "version": "1.21",
+                    "onlinePlayers": 1, "maxPlayers": 20, "pingLatency": 1.0, "MOTD": ["benchmark"],
+                    "Icon": module.PictureDefine.Black}}
+    if {server!r}:
+        server = MinecraftServer({server!r}, module.ConfigHandler.snapshot, 0)
+        if await server.ping_server() is True:
+            information = server.server_information
+    image = PictureHandler(information, module.ConfigHandler.config.mc_picture_layout).make_picture()
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG")
+    base64.b64encode(buffer.getvalue())
+    return time.perf_counter() - start
+
+result["first_ping"] = asyncio.run(first_ping())
+print(json.dumps(result))
+'''
+
+
+def run_child(prewarm: bool, server: str, font: str) -> dict:
+    """在新进程中跑一次，保证导入缓存是冷的"""
+    code = CHILD.format(repo=str(REPO_PATH), prewarm=prewarm, server=server, heavy=HEAVY_MODULES, font=font)
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """运行基准测试并输出中位数/最大值（毫秒）"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=5, help="每项的重复次数")
+    parser.add_argument("--server", default="", help="真实探测的服务器地址，为空时只测本地开销")
+    parser.add_argument("--font", default="", help="代替resources/fonts中字体的字体文件（绝对路径）")
+    args = parser.parse_args()
+
+    samples = {"import": [], "first_ping": [], "first_ping_prewarmed": []}
+    eager = set()
+    for _ in range(args.n):
+        cold = run_child(False, args.server, args.font)
+        eager.update(cold["eager"])
+        warm = run_child(True, args.server, args.font)
+        samples["import"].append(cold["import"])
+        samples["first_ping"].append(cold["first_ping"])
+        samples["first_ping_prewarmed"].append(warm["first_ping"])
+
+    for name, values in samples.items():
+        print(f"{name:<22} median {statistics.median(values) * 1000:8.1f} ms   max {max(values) * 1000:8.1f} ms")
+    print(f"{'deferred':<22} {'ok' if not eager else '加载插件时导入了：' + ', '.join(sorted(eager))}")
+
+
+if __name__ == "__main__":
+    main()
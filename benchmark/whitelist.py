@@ -0,0 +1,81 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+白名单基准测试 whitelist.py 2026-10-19
+Author: AptS:1547
+
+在临时目录中生成包含大量玩家的白名单文件，测量VelocityWhitelist：
+load: 加载白名单文件（并重放日志）的耗时
+add/del: 单次添加/删除的耗时（只追加日志）
+rewrite: 对照组，每次修改都重写整个文件的耗时
+list: 修改后第一次分页（需要重新排序）和之后分页的耗时
+compact: 合并日志的耗时
+
+用法：python benchmark/whitelist.py [--entries 50000] [-n 200]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "plugin"))
+
+from handler.VelocityWhitelist import VelocityWhitelist  # pylint: disable=wrong-import-position, import-error
+
+
+def write_whitelist(path: Path, entries: int) -> None:
+    """生成测试用的白名单文件"""
+    data = [{"uuid": str(uuid.UUID(int=index)), "name": f"Player{index}"} for index in range(entries)]
+    with open(path, encoding="utf-8", mode="w") as f:
+        json.dump(data, f, indent=2)
+
+
+def timed(func, *args) -> float:
+    """单次调用耗时（秒）"""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def report(name: str, values: list[float]) -> None:
+    """输出中位数/最大值（毫秒）"""
+    print(f"{name:<14} median {statistics.median(values) * 1000:9.3f} ms   max {max(values) * 1000:9.3f} ms")
+
+
+def main() -> None:
+    """运行基准测试"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=50000, help="白名单中的玩家数量")
+    parser.add_argument("-n", type=int, default=200, help="重复次数")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "whitelist.json"
+        write_whitelist(path, args.entries)
+        VelocityWhitelist.FLUSH_DELAY_SECOND = 3600.0             # 测量add/del时后台不合并
+
+        report("load", [timed(VelocityWhitelist, path)])
+        whitelist = VelocityWhitelist(path)
+
+        report("add", [timed(whitelist.add, f"NewPlayer{i}") for i in range(args.n)])
+        report("del", [timed(whitelist.remove, f"Player{i}") for i in range(args.n)])
+        report("rewrite", [timed(whitelist.compact) for _ in range(min(args.n, 20))])
+
+        whitelist.add("Another")
+        report("list (sort)", [timed(whitelist.page, 1)])
+        report("list", [timed(whitelist.page, page) for page in range(1, args.n + 1)])
+
+        for i in range(args.n):
+            whitelist.add(f"Journal{i}")
+        report("load+replay", [timed(VelocityWhitelist, path)])
+        report("compact", [timed(whitelist.compact)])
+
+
+if __name__ == "__main__":
+    main()
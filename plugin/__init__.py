@@ -8,8 +8,10 @@ Author: AptS:1547
 Minecraft插件主文件，用于处理Minecraft服务器的Ping查询等功能
 """
 
-import base64
 import asyncio
+import re
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
 
@@ -30,11 +32,22 @@ from nonebot.permission import SUPERUSER
 from nonebot.adapters.onebot.v11.permission import GROUP_ADMIN, GROUP_OWNER
 
 from .handler.MessageDefine import MessageDefine
-from .handler.ConfigHandler import ConfigHandler, Config, convert_string
-from .handler.MinecraftServer import MinecraftServer as mc_MinecraftServer
+from .handler.ConfigHandler import ConfigHandler, ConfigSnapshot, Config, GroupConfig, convert_string
+from .handler.ConfigWatcher import ConfigWatcher
 from .handler.ServerScaner import ServerScaner as mc_ServerScaner
-from .handler.PictureHandler import PictureHandler as mc_PictureHandler
 from .handler.PictureDefine import PictureDefine
+from .handler.RateLimiter import RateLimiter
+from .handler.PingCoalescer import PingCoalescer
+from .handler.MessageDispatcher import MessageDispatcher, BROADCAST
+from .handler.ImageStore import ImageStore
+from .handler.Tracer import Tracer
+from .handler.MemoryBudget import MemoryBudget
+from .handler.RconClient import RconClient
+from .handler.StatusApi import StatusApi
+from .handler.ScannerState import ScannerState
+
+# MinecraftServer(mcstatus, requests)、PictureHandler(PIL)等重依赖在首次使用时才导入，
+# 或者在机器人连接后由prewarm_plugin在后台导入，不拖慢NoneBot启动
 
 # 加载嵌套插件
 sub_plugins = nonebot.load_plugins(
@@ -54,14 +67,6 @@ __plugin_meta__ = PluginMetadata(
 # 获取全局配置
 globalConfig = nonebot.get_driver().config
 
-# 获取config.yml文件设置的参数
-ConfigHandler.initialize()
-if ConfigHandler.error != "":
-    logger.error(ConfigHandler.error)
-else:
-    ConfigHandler.config = ConfigHandler.config
-    logger.info("[epmc_minecraft_bot] 配置文件加载成功")
-
 
 # 参数分割函数
 def split_args(args: str) -> list[str]:
@@ -80,36 +85,125 @@ def split_args(args: str) -> list[str]:
 
 
 async def before_handle_message(bot: Bot, message_id: str):
-    """发送一个贴纸"""
-    await asyncio.sleep(0.5)
+    """发送一个贴纸（没有群号，只受全局令牌桶限制）"""
+    await RateLimiter.acquire(None, ConfigHandler.config)
     await bot.call_api("set_msg_emoji_like", message_id=message_id, emoji_id=181, set=True)
 
 
-# Bot连接事件，用ServerScaner类的start_scaner方法启动定时任务
+async def prewarm_plugin() -> None:
+    """后台预热：导入重依赖、编译布局、合成底图并解码默认图标，让第一次~ping不用付出这些开销"""
+    def _prewarm() -> None:
+        from .handler.MinecraftServer import MinecraftServer  # pylint: disable=import-outside-toplevel, unused-import
+        from .handler.PictureHandler import PictureHandler  # pylint: disable=import-outside-toplevel
+        from .handler.ParseLayout import ParseLayout  # pylint: disable=import-outside-toplevel
+        from .handler.IconCache import IconCache  # pylint: disable=import-outside-toplevel
+        PictureHandler.base_image(ParseLayout.load(ConfigHandler.config.mc_picture_layout))
+        IconCache.preload(ConfigHandler.snapshot)
+
+    try:
+        await asyncio.to_thread(_prewarm)
+        logger.debug("[epmc_minecraft_bot] 预热完成")
+    except Exception as e:  # pylint: disable=broad-except
+        logger.warning(f"[epmc_minecraft_bot] 预热失败：{e}")
+
+
+async def apply_watched_config(config: Config) -> None:
+    """配置文件被手动修改后的回调：整体替换配置快照，扫描器能继续运行时不停止扫描器"""
+    await apply_snapshot(ConfigHandler.apply_config(config))
+
+
+async def apply_snapshot(snapshot: ConfigSnapshot) -> None:
+    """把新的配置快照应用到各模块，扫描器能继续运行时只切换快照，不停止、不重新安排扫描任务"""
+    Tracer.configure(snapshot.config.mc_trace_enable, snapshot.config.mc_trace_sink)
+    MemoryBudget.configure(snapshot.config.mc_memory_budget_mb * 1024 * 1024)
+    RconClient.configure(snapshot.config.mc_rcon_pool_size, snapshot.config.mc_rcon_pipeline_depth,
+                         snapshot.config.mc_rcon_timeout_second, snapshot.config.mc_rcon_idle_second)
+    if snapshot.config.mc_api_enable:
+        StatusApi.register_routes(mcServerScaner)
+    mcServerScaner.state_path = scanner_state_path(snapshot.config)
+    if mcServerScaner.running and snapshot.config.enable and snapshot.config.mc_serverscaner_enable:
+        if not mcServerScaner.update_config(snapshot):
+            mcServerScaner.stop_scaner(deletebot=False)
+    else:
+        await reload_plugin_config(reload_file=False)
+
+
+def scanner_state_path(config: Config) -> Path | None:
+    """扫描器状态文件（config.yml同目录下的scanner_state.json），mc_scanner_state_enable关闭时为None"""
+    return ConfigHandler.config_file_path.with_name("scanner_state.json") if config.mc_scanner_state_enable else None
+
+
 driver = get_driver()
-mcServerScaner = mc_ServerScaner(ConfigHandler.config)
+mcServerScaner = mc_ServerScaner()
+prewarm_task: asyncio.Task | None = None
+card_warmer_task: asyncio.Task | None = None
+config_watcher: ConfigWatcher | None = None
+render_executor: ThreadPoolExecutor | None = None
+
 
+# 在NoneBot启动时（所有插件加载完成后）才读取config.yml文件设置的参数
+@driver.on_startup
+async def _():
+    global config_watcher  # pylint: disable=global-statement
+    ConfigHandler.initialize()
+    Tracer.configure(ConfigHandler.config.mc_trace_enable, ConfigHandler.config.mc_trace_sink)
+    MemoryBudget.configure(ConfigHandler.config.mc_memory_budget_mb * 1024 * 1024)
+    RconClient.configure(ConfigHandler.config.mc_rcon_pool_size, ConfigHandler.config.mc_rcon_pipeline_depth,
+                         ConfigHandler.config.mc_rcon_timeout_second, ConfigHandler.config.mc_rcon_idle_second)
+    if ConfigHandler.config.mc_api_enable:
+        StatusApi.register_routes(mcServerScaner)
+    mcServerScaner.plugin_config = ConfigHandler.snapshot
+    mcServerScaner.add_scan_server()
+    mcServerScaner.state_path = scanner_state_path(ConfigHandler.config)
+    if mcServerScaner.state_path is not None:
+        restored = ScannerState.load(mcServerScaner, mcServerScaner.state_path, ConfigHandler.config.mc_scanner_state_max_age_second)
+        if restored:
+            logger.info(f"[epmc_minecraft_bot] 已恢复{restored}个服务器的扫描状态")
+    if ConfigHandler.error != "":
+        logger.error(ConfigHandler.error)
+    else:
+        logger.info("[epmc_minecraft_bot] 配置文件加载成功")
+    for font_path in PictureDefine.missing_fonts():
+        logger.error(MessageDefine.font_missing.format(font_path))
+    if ConfigHandler.config.mc_config_watch_enable:
+        config_watcher = ConfigWatcher(ConfigHandler.config_file_path, apply_watched_config)
+        config_watcher.start()
 
+
+@driver.on_shutdown
+async def _():
+    if config_watcher is not None:
+        await config_watcher.stop()
+    await MessageDispatcher.stop()
+    await mcServerScaner.save_state()
+    RconClient.close_all()
+    stop_card_warmer()
+    if render_executor is not None:
+        render_executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Bot连接事件，用ServerScaner类的start_scaner方法启动定时任务
 @driver.on_bot_connect
 async def _(bot: Bot):
+    global prewarm_task  # pylint: disable=global-statement
     mcServerScaner.bound_bot(bot)  # pylint: disable=expression-not-assigned
+    if ConfigHandler.config.enable and ConfigHandler.config.mc_prewarm_enable and prewarm_task is None:
+        prewarm_task = asyncio.create_task(prewarm_plugin())
+    start_card_warmer()
     if bot.adapter.get_name() != "OneBot V11":
         logger.info("当前插件仅支持OneBot V11协议")
     else:
         if ConfigHandler.error != "":
             logger.error(ConfigHandler.error)
-            [await bot.send_private_msg(user_id=superuser, message=ConfigHandler.error) for superuser in nonebot.get_driver().config.superusers]  # pylint: disable=expression-not-assigned
+            [MessageDispatcher.post(bot, ConfigHandler.error, user_id=int(superuser), priority=BROADCAST) for superuser in nonebot.get_driver().config.superusers]  # pylint: disable=expression-not-assigned
         elif not ConfigHandler.config.mc_serverscaner_enable or not ConfigHandler.config.enable:
-            ConfigHandler.config.mc_serverscaner_status = False
             logger.info(MessageDefine.bot_is_connected_without_scanner)
-            [await bot.send_private_msg(user_id=superuser, message=MessageDefine.bot_is_connected_without_scanner) for superuser in nonebot.get_driver().config.superusers]  # pylint: disable=expression-not-assigned
+            [MessageDispatcher.post(bot, MessageDefine.bot_is_connected_without_scanner, user_id=int(superuser), priority=BROADCAST) for superuser in nonebot.get_driver().config.superusers]  # pylint: disable=expression-not-assigned
         elif mcServerScaner.start_scaner():
             logger.info(MessageDefine.bot_is_connected_with_scanner)
-            ConfigHandler.config.mc_serverscaner_status = True
             # [await bot.send_private_msg(user_id=superuser, message=MessageDefine.bot_is_connected_with_scanner) for superuser in nonebot.get_driver().config.superusers]  # pylint: disable=expression-not-assigned
         else:
             logger.info(MessageDefine.bot_is_connected_without_server)
-            ConfigHandler.config.mc_serverscaner_status = False
             # [await bot.send_private_msg(user_id=superuser, message=MessageDefine.bot_is_connected_without_server) for superuser in nonebot.get_driver().config.superusers]  # pylint: disable=expression-not-assigned
 
 # Bot断开连接事件，用ServerScaner类的stopScaner方法停止定时任务
@@ -117,8 +211,8 @@ async def _(bot: Bot):
 
 @driver.on_bot_disconnect
 async def _():
+    stop_card_warmer()
     if mcServerScaner.stop_scaner(deletebot=True):
-        ConfigHandler.config.mc_serverscaner_status = False
         logger.info(MessageDefine.bot_is_disconnected_with_scanner)
     else:
         logger.warning(MessageDefine.bot_is_disconnected_without_scanner)
@@ -130,10 +224,10 @@ HelpCommand = on_command("help", priority=0, block=True)
 
 @HelpCommand.handle()
 async def _(event: ob_event_GroupMessageEvent, bot: Bot):  # Q群消息事件响应
-    if event.group_id in ConfigHandler.config.mc_qqgroup_id and ConfigHandler.config.enable:  # 确认Q群在获准名单内
+    if ConfigHandler.snapshot.is_enabled_group(event.group_id):  # 确认Q群在获准名单内
         await before_handle_message(bot, str(event.message_id))
-        await asyncio.sleep(0.5)  # 延时0.5s 防止风控
-        await HelpCommand.finish(MessageDefine.group_help_message, at_sender=True)
+        await MessageDispatcher.reply(bot, event, MessageDefine.group_help_message, at_sender=True)
+        await HelpCommand.finish()
 
 # 对只@机器人的消息进行回复
 AtBotCommand = on_message(rule=to_me(), priority=50, block=True)
@@ -141,10 +235,10 @@ AtBotCommand = on_message(rule=to_me(), priority=50, block=True)
 
 @AtBotCommand.handle()
 async def _(event: ob_event_GroupMessageEvent, bot: Bot):  # Q群消息事件响应
-    if event.group_id in ConfigHandler.config.mc_qqgroup_id and ConfigHandler.config.enable:  # 确认Q群在获准名单内
+    if ConfigHandler.snapshot.is_enabled_group(event.group_id):  # 确认Q群在获准名单内
         await before_handle_message(bot, str(event.message_id))
-        await asyncio.sleep(0.5)  # 延时0.5s 防止风控
-        await HelpCommand.finish(MessageDefine.group_help_message, at_sender=True)
+        await MessageDispatcher.reply(bot, event, MessageDefine.group_help_message, at_sender=True)
+        await HelpCommand.finish()
 
 # 命令 ~ping 执行Ping命令
 PingCommand = on_command("ping", priority=0, block=True)
@@ -152,29 +246,267 @@ PingCommand = on_command("ping", priority=0, block=True)
 
 @PingCommand.handle()
 async def _(event: ob_event_GroupMessageEvent, bot: Bot, args: Message = CommandArg()):
-    if event.group_id in ConfigHandler.config.mc_qqgroup_id and ConfigHandler.config.enable:  # 确认Q群在获准名单内
+    if ConfigHandler.snapshot.is_enabled_group(event.group_id):  # 确认Q群在获准名单内
         await before_handle_message(bot, str(event.message_id))
 
-        mc_server = mc_MinecraftServer(
-            args.extract_plain_text(), ConfigHandler.config, event.group_id)
+        addresses = split_addresses(args.extract_plain_text())
+        snapshot = ConfigHandler.snapshot
+        address = addresses[0] if addresses else ""
+        if len(addresses) > 1:
+            job = lambda: build_multi_ping_reply(addresses, snapshot, event.group_id)  # pylint: disable=unnecessary-lambda-assignment
+        else:
+            job = lambda: build_ping_reply(address, snapshot, event.group_id)  # pylint: disable=unnecessary-lambda-assignment
+        with Tracer.span("ping.total", addresses=len(addresses)):
+            if (snapshot.config.mc_ping_progressive != "off" and len(addresses) <= 1
+                    and network_group(address, snapshot, event.group_id) is None):
+                await reply_progressive(bot, event, address, snapshot)
+            else:
+                # 同一个群对同一组地址的并发~ping只查询一次，冷却时间内复用上次的结果
+                with Tracer.span("ping.query"):
+                    result = await PingCoalescer.run((event.group_id, tuple(addresses)), job,
+                                                     cooldown=ping_cooldown(snapshot, addresses), version=snapshot)
+                with Tracer.span("ping.send"):
+                    await MessageDispatcher.reply(bot, event, result, at_sender=True)
+        await PingCommand.finish()
+
+
+async def reply_progressive(bot: Bot, event: ob_event_GroupMessageEvent, address: str, snapshot: ConfigSnapshot) -> None:
+    """
+    渐进式回复：Ping完成后马上回复文字摘要，状态卡片在渲染线程中生成后再单独发送（replace模式发送后撤回摘要）
+    冷却时间内已经有渲染好的卡片时直接回复卡片；卡片超过mc_ping_render_deadline_second还没生成时放弃发送
+    """
+    config = snapshot.config
+    key = (event.group_id, (address,) if address else ())
+    cooldown = ping_cooldown(snapshot, key[1])
+    card = PingCoalescer.peek(key, cooldown, snapshot)
+    if card is not None:
+        with Tracer.span("ping.send"):
+            await MessageDispatcher.reply(bot, event, card, at_sender=True)
+        return
+
+    with Tracer.span("ping.query"):
+        information = await PingCoalescer.run(("probe", *key), lambda: probe_server(address, snapshot, event.group_id))
+    if isinstance(information, str):                 # 连接失败的原因
+        await MessageDispatcher.reply(bot, event, information, at_sender=True)
+        return
+    with Tracer.span("ping.send"):
+        sent = await MessageDispatcher.reply(bot, event, MessageDefine.ping_summary(information), at_sender=True)
+
+    try:
+        # 同一个群同时~ping时只渲染一次，渲染好的卡片在冷却时间内直接复用
+        card = await PingCoalescer.run(key, lambda: render_card_later(information, snapshot),
+                                       cooldown=cooldown, version=snapshot)
+    except TimeoutError:
+        logger.warning(f"[epmc_minecraft_bot] 状态卡片渲染超过{config.mc_ping_render_deadline_second}秒，已放弃发送")
+        return
+    await MessageDispatcher.reply(bot, event, card)
+    if config.mc_ping_progressive == "replace" and isinstance(sent, dict) and sent.get("message_id") is not None:
+        try:
+            await bot.delete_msg(message_id=sent["message_id"])
+        except Exception as e:  # pylint: disable=broad-except
+            logger.debug(f"[epmc_minecraft_bot] 撤回文字摘要失败：{e}")
+
+
+def ping_cooldown(snapshot: ConfigSnapshot, addresses) -> float:
+    """~ping复用最近结果的时间：不带地址并且开启了卡片预热时，预热的卡片在一个刷新周期内都直接回复"""
+    config = snapshot.config
+    if not addresses and config.mc_card_prewarm_enable:
+        return max(config.mc_ping_cooldown_second, config.mc_card_prewarm_interval_second + config.mc_ping_deadline_second)
+    return config.mc_ping_cooldown_second
+
+
+def start_card_warmer() -> None:
+    """启动卡片预热（已经在运行时不重复启动），是否预热在每一轮开始时按当前配置决定，重载配置后不用重启"""
+    global card_warmer_task  # pylint: disable=global-statement
+    if card_warmer_task is None or card_warmer_task.done():
+        card_warmer_task = asyncio.create_task(card_warmer())
+
+
+def stop_card_warmer() -> None:
+    """停止卡片预热（机器人断开连接或插件关闭时）"""
+    global card_warmer_task  # pylint: disable=global-statement
+    if card_warmer_task is not None:
+        card_warmer_task.cancel()
+        card_warmer_task = None
+
+
+async def card_warmer() -> None:
+    """每mc_card_prewarm_interval_second刷新一次各群默认服务器的卡片，不带地址的~ping直接回复预热好的卡片"""
+    while True:
+        snapshot = ConfigHandler.snapshot
+        if snapshot.config.enable and snapshot.config.mc_card_prewarm_enable:
+            await warm_default_cards(snapshot)
+        await asyncio.sleep(snapshot.config.mc_card_prewarm_interval_second)
+
+
+async def warm_default_cards(snapshot: ConfigSnapshot) -> None:
+    """
+    按~ping相同的方式查询各群的默认服务器并生成回复，记为该群不带地址的~ping的最近结果
+    低优先级：同时只查询mc_card_prewarm_concurrency个群，卡片在默认线程池中渲染，不占用事件循环也不和~ping抢渲染线程；
+    群里正好有人在~ping时等待那次查询，不重复查询。查询的同时也填好了状态、图标缓存
+    """
+    group_ids = [group_id for group_id in snapshot.group_ids
+                 if (group := snapshot.groups.get(group_id)) is not None and group.server_address]
+    semaphore = asyncio.Semaphore(snapshot.config.mc_card_prewarm_concurrency)
+
+    async def warm(group_id: int) -> None:
+        async with semaphore:
+            try:
+                with Tracer.span("ping.prewarm"):
+                    await PingCoalescer.refresh((group_id, ()), lambda: build_ping_reply("", snapshot, group_id, offload=True),
+                                                version=snapshot)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.debug(f"[epmc_minecraft_bot] 预热群{group_id}的状态卡片失败：{e}")
+
+    await asyncio.gather(*(warm(group_id) for group_id in group_ids))
 
+
+def split_addresses(text: str) -> list[str]:
+    """把~ping的参数拆成地址列表，空格、逗号都可以分隔，重复的地址只保留一个"""
+    return list(dict.fromkeys(address for address in re.split(r"[\s,，]+", text) if address))
+
+
+async def build_multi_ping_reply(addresses: list[str], snapshot: ConfigSnapshot, group_id: int) -> str:
+    """并发查询多个地址，返回文本表格；单个地址失败或超时只影响它自己那一行"""
+    from .handler.MinecraftServer import MinecraftServer as mc_MinecraftServer  # pylint: disable=import-outside-toplevel
+
+    config = snapshot.config
+    ignored = len(addresses) - config.mc_ping_multi_max
+    results = await mc_MinecraftServer.ping_many(addresses[:config.mc_ping_multi_max], snapshot, group_id,
+                                                 concurrency=config.mc_ping_multi_concurrency,
+                                                 deadline=config.mc_ping_deadline_second)
+    lines = [MessageDefine.multi_ping_title]
+    for address, mc_server, ping_server_return in results:
+        if ping_server_return is True:
+            lines.append(MessageDefine.multi_ping_line(address, mc_server.server_information))
+        else:
+            lines.append(MessageDefine.multi_ping_line(address, error=ping_server_return))
+    if ignored > 0:
+        lines.append(MessageDefine.multi_ping_truncated(ignored))
+    return "\n".join(lines)
+
+
+async def build_ping_reply(address: str, snapshot: ConfigSnapshot, group_id: int,
+                           offload: bool = False) -> str | ob_message_MessageSegment | ob_message_Message:
+    """
+    查询服务器并渲染状态卡片，返回图片消息段，失败时返回失败原因；群设置了子服务器时查询整个网络
+    :param offload: 在默认线程池中渲染（后台预热使用）
+    """
+    group = network_group(address, snapshot, group_id)
+    if group is not None:
+        return await build_network_reply(group, snapshot, offload)
+
+    information = await probe_server(address, snapshot, group_id)
+    if isinstance(information, str):                 # 如果返回的是字符串，说明出现了错误
+        return information
+    return await (render_card_offloaded(information, snapshot) if offload else render_card(information, snapshot))
+
+
+def network_group(address: str, snapshot: ConfigSnapshot, group_id: int) -> GroupConfig | None:
+    """不带地址的~ping并且群设置了子服务器时返回群设置，查询整个服务器网络"""
+    group = snapshot.groups.get(group_id)
+    if address == "" and group is not None and group.server_address and group.backends:
+        return group
+    return None
+
+
+async def probe_server(address: str, snapshot: ConfigSnapshot, group_id: int) -> dict | str:
+    """Ping服务器，成功返回服务器信息，失败返回失败原因"""
+    from .handler.MinecraftServer import MinecraftServer as mc_MinecraftServer  # pylint: disable=import-outside-toplevel
+
+    mc_server = mc_MinecraftServer(address, snapshot, group_id)
+    with Tracer.span("ping.probe"):
         ping_server_return = await mc_server.ping_server()
-        if isinstance(ping_server_return, str):          # 如果返回的是字符串，说明出现了错误
-            await PingCommand.finish(ping_server_return, at_sender=True)
+    return mc_server.server_information if ping_server_return is True else ping_server_return
+
+
+async def build_network_reply(group: GroupConfig, snapshot: ConfigSnapshot, offload: bool = False) -> str | ob_message_Message:
+    """同时查询代理和全部子服务器，返回合计人数的状态卡片和每个成员一行的文本；全部离线时只返回文本"""
+    from .handler.ServerNetwork import ServerNetwork  # pylint: disable=import-outside-toplevel
+
+    with Tracer.span("ping.probe", backends=len(group.backends)):
+        status = await ServerNetwork.probe(group, snapshot)
+    summary = MessageDefine.network_summary(status)
+    information = status.card_information()
+    if information is None:
+        return summary
+    card = await (render_card_offloaded(information, snapshot) if offload else render_card(information, snapshot))
+    return card + summary
+
+
+async def render_card(information: dict, snapshot: ConfigSnapshot) -> ob_message_MessageSegment:
+    """渲染状态卡片并编码为JPEG图片消息段"""
+    return await image_segment(render_card_bytes(information, snapshot))
 
+
+async def render_card_offloaded(information: dict, snapshot: ConfigSnapshot) -> ob_message_MessageSegment:
+    """在默认线程池中渲染状态卡片，不阻塞事件循环"""
+    return await image_segment(await asyncio.to_thread(render_card_bytes, information, snapshot))
+
+
+def render_card_bytes(information: dict, snapshot: ConfigSnapshot) -> bytes:
+    """渲染状态卡片并编码为JPEG，会阻塞，可以在渲染线程中调用"""
+    from .handler.PictureHandler import PictureHandler as mc_PictureHandler  # pylint: disable=import-outside-toplevel
+
+    with Tracer.span("ping.render"):
+        final_image_image = mc_PictureHandler(information, snapshot.config.mc_picture_layout).make_picture()
+    with Tracer.span("ping.encode"):
         final_image_byte = BytesIO()
-        final_image_image = mc_PictureHandler(
-            mc_server.server_information).make_picture()
         final_image_image.save(final_image_byte, format="JPEG")
-        final_image_base64str = "base64://" + \
-            base64.b64encode(final_image_byte.getvalue()).decode('utf-8')
+        return final_image_byte.getvalue()
+
+
+async def render_card_later(information: dict, snapshot: ConfigSnapshot) -> ob_message_MessageSegment:
+    """
+    在渲染线程中生成状态卡片，超过mc_ping_render_deadline_second时抛出TimeoutError
+    渲染线程只有一个，卡片依次生成；超时时还在排队的渲染会被取消，已经开始的会做完但结果被丢弃
+    """
+    global render_executor  # pylint: disable=global-statement
+    if render_executor is None:
+        render_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="epmc-render")
+    future = asyncio.get_running_loop().run_in_executor(render_executor, render_card_bytes, information, snapshot)
+    data = await asyncio.wait_for(future, timeout=snapshot.config.mc_ping_render_deadline_second)
+    return await image_segment(data)
+
+
+async def image_segment(data: bytes, suffix: str = "jpg") -> ob_message_MessageSegment:
+    """
+    按mc_image_delivery生成图片消息段：写入按内容寻址的缓存后发送file://或URL，必要时退回base64
+    缓存的目录扫描、写入和淘汰在默认线程池中进行，不阻塞事件循环
+    """
+    config = ConfigHandler.config
+    if config.mc_image_delivery == "base64":
+        return ob_message_MessageSegment.image(ImageStore.source(data))
+    if config.mc_image_delivery == "http":
+        ImageStore.register_route()
+    return ob_message_MessageSegment.image(await asyncio.to_thread(cached_image_source, data, config, suffix))
+
+
+def cached_image_source(data: bytes, config: Config, suffix: str) -> str:
+    """写入图片缓存并返回图片来源，会读写磁盘，在线程池中调用"""
+    ImageStore.configure(config.mc_image_cache_dir or ConfigHandler.config_file_path.with_name("image_cache"),
+                         config.mc_image_cache_max_mb * 1024 * 1024)
+    return ImageStore.source(data, config.mc_image_delivery, config.mc_image_http_base_url, suffix)
+
+
+# 命令 ~who 查看扫描器最近看到的在线玩家（不Ping服务器）
+WhoCommand = on_command("who", priority=0, block=True)
+
+
+@WhoCommand.handle()
+async def _(event: ob_event_GroupMessageEvent, bot: Bot):
+    if ConfigHandler.snapshot.is_enabled_group(event.group_id):
+        await before_handle_message(bot, str(event.message_id))
+        await MessageDispatcher.reply(bot, event, build_who_reply(event.group_id), at_sender=True)
+        await WhoCommand.finish()
+
+
+def build_who_reply(group_id: int) -> str:
+    """本群扫描的服务器（服务器网络时代理和每个子服务器）各自的在线玩家，直接读取扫描器的结果"""
+    lines = [MessageDefine.who_server(result, mcServerScaner.players.online(key))
+             for key, result in mcServerScaner.results.items() if key[0] == group_id]
+    return "\n\n".join(lines) if lines else MessageDefine.who_no_data
 
-        return_message = ob_message_Message()
-        return_message += ob_message_MessageSegment.image(
-            final_image_base64str)
-        del mc_server, final_image_image, final_image_byte, final_image_base64str
-        await asyncio.sleep(0.5)
-        await PingCommand.finish(message=return_message, at_sender=True)
 
 # 命令 ~vwl 执行VelocityWhiteList命令
 VwlCommand = on_command("vwl", priority=0, block=True)
@@ -183,15 +515,46 @@ VwlCommand = on_command("vwl", priority=0, block=True)
 
 
 @VwlCommand.handle()
-async def _(event: ob_event_GroupMessageEvent, cmd: Message = CommandArg()):
+async def _(event: ob_event_GroupMessageEvent, bot: Bot, cmd: Message = CommandArg()):
     args = split_args(cmd.extract_plain_text())  # 分割参数
-    if event.group_id in ConfigHandler.config.mc_qqgroup_id:
-        return_message = await handle_vwl_command(args, event.group_id)
-        await asyncio.sleep(0.5)  # 延时0.5s 防止风控
-        await VwlCommand.finish(return_message)
+    if event.group_id in ConfigHandler.snapshot.group_ids:
+        is_admin = event.sender.role in ("admin", "owner") or str(event.user_id) in globalConfig.superusers
+        return_message = await handle_vwl_command(args, event.group_id, is_admin)
+        await MessageDispatcher.reply(bot, event, return_message)
+        await VwlCommand.finish()
     return False
 
 
+# 命令 ~rcon 在群服务器的控制台执行命令（只有超级用户在mc_qqgroup_default_server中为该群设置了RCON时可用）
+RconCommand = on_command("rcon", priority=0, block=True, permission=GROUP_OWNER | GROUP_ADMIN | SUPERUSER)
+
+
+@RconCommand.handle()
+async def _(event: ob_event_GroupMessageEvent, bot: Bot, cmd: Message = CommandArg()):
+    if ConfigHandler.snapshot.is_enabled_group(event.group_id):
+        await before_handle_message(bot, str(event.message_id))
+        group = ConfigHandler.snapshot.groups.get(event.group_id)
+        command = cmd.extract_plain_text().strip()
+        if group is None or not group.rcon_address:
+            return_message = MessageDefine.rcon_is_not_configured
+        elif command in ("", "help"):
+            return_message = MessageDefine.args_error_rcon_command
+        else:
+            return_message = await execute_rcon(group, command)
+        await MessageDispatcher.reply(bot, event, return_message)
+        await RconCommand.finish()
+
+
+async def execute_rcon(group: GroupConfig, command: str) -> str:
+    """在群的RCON服务器上执行命令（复用连接池中的连接），失败时返回错误信息"""
+    try:
+        return MessageDefine.command_rcon_result(await RconClient.execute(group.rcon_address, group.rcon_password, command))
+    except PermissionError:
+        return MessageDefine.rcon_auth_failed
+    except (OSError, asyncio.TimeoutError) as e:
+        return MessageDefine.rcon_failed(str(e) or type(e).__name__)
+
+
 # 命令 ~conf 执行配置命令
 ConfCommand = on_command(
     "conf", priority=0, block=True, permission=GROUP_OWNER | GROUP_ADMIN | SUPERUSER)
@@ -201,7 +564,7 @@ ConfCommand = on_command(
 async def _(event: ob_event_GroupMessageEvent | ob_event_PrivateMessageEvent, bot: Bot, cmd: Message = CommandArg()):  # Q群消息事件响应
     args = cmd.extract_plain_text().split(" ")  # 分割参数
     return_message = ""
-    if isinstance(event, ob_event_GroupMessageEvent) and event.group_id in ConfigHandler.config.mc_qqgroup_id:
+    if isinstance(event, ob_event_GroupMessageEvent) and event.group_id in ConfigHandler.snapshot.group_ids:
         await before_handle_message(bot, str(event.message_id))
         return_message = await handle_groupadmin_conf_command(args, event.group_id)
     elif isinstance(event, ob_event_PrivateMessageEvent) and str(event.user_id) in globalConfig.superusers:
@@ -209,8 +572,8 @@ async def _(event: ob_event_GroupMessageEvent | ob_event_PrivateMessageEvent, bo
         return_message = await handle_superuser_conf_command(args)
     else:
         return False
-    await asyncio.sleep(0.5)  # 延时0.5s 防止风控
-    await ConfCommand.finish(return_message)
+    await MessageDispatcher.reply(bot, event, return_message)
+    await ConfCommand.finish()
 
 # 命令 ~about 显示插件信息
 AboutCommand = on_command("about", priority=0, block=True)
@@ -218,26 +581,35 @@ AboutCommand = on_command("about", priority=0, block=True)
 
 @AboutCommand.handle()
 async def _(event: ob_event_GroupMessageEvent, bot: Bot):  # Q群消息事件响应
-    if event.group_id in ConfigHandler.config.mc_qqgroup_id and ConfigHandler.config.enable:  # 确认Q群在获准名单内
+    if ConfigHandler.snapshot.is_enabled_group(event.group_id):  # 确认Q群在获准名单内
         await before_handle_message(bot, str(event.message_id))
-        await asyncio.sleep(0.5)  # 延时0.5s 防止风控
-        await AboutCommand.finish(ob_message_MessageSegment.image(PictureDefine.about), at_sender=True)
-
-
-async def reload_plugin_config() -> str:
-    """重载配置文件"""
-    ConfigHandler.reload_config()
-    mcServerScaner.plugin_config = ConfigHandler.config
+        await MessageDispatcher.reply(bot, event, await image_segment(PictureDefine.read("about"), "webp"), at_sender=True)
+        await AboutCommand.finish()
+
+
+async def reload_plugin_config(reload_file: bool = True) -> str:
+    """
+    重载配置文件并重启扫描器
+    reload_file为False时不重新读取config.yml，只让扫描器使用内存中已经更新的配置快照
+    """
+    if reload_file:
+        ConfigHandler.reload_config()
+    Tracer.configure(ConfigHandler.config.mc_trace_enable, ConfigHandler.config.mc_trace_sink)
+    MemoryBudget.configure(ConfigHandler.config.mc_memory_budget_mb * 1024 * 1024)
+    RconClient.configure(ConfigHandler.config.mc_rcon_pool_size, ConfigHandler.config.mc_rcon_pipeline_depth,
+                         ConfigHandler.config.mc_rcon_timeout_second, ConfigHandler.config.mc_rcon_idle_second)
+    if ConfigHandler.config.mc_api_enable:
+        StatusApi.register_routes(mcServerScaner)
+    mcServerScaner.plugin_config = ConfigHandler.snapshot
+    mcServerScaner.state_path = scanner_state_path(ConfigHandler.config)
     if isinstance(ConfigHandler, str):
         return_message = ConfigHandler.error
     elif mcServerScaner.stop_scaner(deletebot=False):
         mcServerScaner.add_scan_server()
-        ConfigHandler.config.mc_serverscaner_status = False
         if not ConfigHandler.config.enable or not ConfigHandler.config.mc_serverscaner_enable:
             logger.warning(MessageDefine.logger_reload_without_scanner)
             return_message = MessageDefine.logger_reload_without_scanner
         elif mcServerScaner.start_scaner():
-            ConfigHandler.config.mc_serverscaner_status = True
             logger.info(MessageDefine.logger_reload_with_scanner)
             return_message = MessageDefine.logger_reload_with_scanner
         else:
@@ -252,26 +624,85 @@ async def reload_plugin_config() -> str:
 # 处理~vwl命令调用
 
 
-async def handle_vwl_command(args: list[str], groupid: int = 0) -> str:
-    """处理~vwl命令调用"""
+# 群设置了RCON时~vwl同步到服务器使用的命令
+VWL_RCON_COMMANDS = {"add": "whitelist add {name}", "del": "whitelist remove {name}", "list": "whitelist list"}
+VWL_PLAYER_NAME = re.compile(r"[\w.\-]{1,32}")       # 玩家名拼进RCON命令之前先检查，避免夹带其他命令参数
+
+
+async def handle_vwl_command(args: list[str], groupid: int = 0, is_admin: bool = False) -> str:
+    """
+    处理~vwl命令调用，add/del只有群管理员和超级用户可以使用
+    群设置了RCON时，修改白名单文件后通过RCON同步到服务器；没有设置白名单文件时只通过RCON管理服务器的白名单
+    """
+    config = ConfigHandler.config
+    if args[0] == "help":
+        return MessageDefine.public_vwl_command_help
+    group = ConfigHandler.snapshot.groups.get(groupid)
+    rcon = group if group is not None and group.rcon_address else None
+    if not config.mc_vwl_enable or (config.mc_vwl_file_path == "" and rcon is None):
+        return MessageDefine.vwl_is_not_enable
+    if config.mc_vwl_file_path == "":
+        return await handle_vwl_rcon_command(args, rcon, is_admin)
+
+    from .handler.VelocityWhitelist import VelocityWhitelist  # pylint: disable=import-outside-toplevel
+    try:
+        # 第一次使用时在线程中加载（几万条时也不会卡住事件循环）
+        whitelist = await asyncio.to_thread(VelocityWhitelist.open, config.mc_vwl_file_path)
+    except (OSError, ValueError) as e:
+        return MessageDefine.vwl_load_failed(str(e))
+
     match args[0]:
-        case "help":
-            return_message = MessageDefine.public_vwl_command_help + "\n Under Construction"
+        case "add" | "del" if not is_admin:
+            return_message = MessageDefine.vwl_permission_denied
 
         case "add":
-            pass
+            if len(args) not in (2, 3):
+                return MessageDefine.args_error_vwl_command
+            # 追加日志很快，但偶尔会触发合并（重写整个文件），所以放到线程里
+            if await asyncio.to_thread(whitelist.add, args[1], args[2] if len(args) == 3 else ""):
+                return_message = MessageDefine.command_vwl_success("添加", args[1])
+                if rcon is not None and VWL_PLAYER_NAME.fullmatch(args[1]):
+                    return_message += MessageDefine.vwl_rcon_synced(
+                        await execute_rcon(rcon, VWL_RCON_COMMANDS["add"].format(name=args[1])))
+            else:
+                return_message = MessageDefine.command_vwl_add_exist
 
         case "del":
-            pass
+            if len(args) != 2:
+                return MessageDefine.args_error_vwl_command
+            if await asyncio.to_thread(whitelist.remove, args[1]):
+                return_message = MessageDefine.command_vwl_success("删除", args[1])
+                if rcon is not None and VWL_PLAYER_NAME.fullmatch(args[1]):
+                    return_message += MessageDefine.vwl_rcon_synced(
+                        await execute_rcon(rcon, VWL_RCON_COMMANDS["del"].format(name=args[1])))
+            else:
+                return_message = MessageDefine.command_vwl_del_not_exist
 
         case "list":
-            pass
+            page = int(args[1]) if len(args) == 2 and args[1].isdigit() else 1
+            entries, pages = whitelist.page(page)
+            return_message = MessageDefine.command_vwl_list(entries, min(max(page, 1), pages), pages, len(whitelist))
 
         case _:
             return_message = MessageDefine.args_do_not_exist
 
     return return_message
 
+
+async def handle_vwl_rcon_command(args: list[str], group: GroupConfig, is_admin: bool = False) -> str:
+    """没有白名单文件时，~vwl直接通过RCON管理服务器的白名单"""
+    match args[0]:
+        case "add" | "del" if not is_admin:
+            return MessageDefine.vwl_permission_denied
+        case "add" | "del":
+            if len(args) not in ((2,) if args[0] == "del" else (2, 3)) or not VWL_PLAYER_NAME.fullmatch(args[1]):
+                return MessageDefine.args_error_vwl_command
+            return await execute_rcon(group, VWL_RCON_COMMANDS[args[0]].format(name=args[1]))
+        case "list":
+            return await execute_rcon(group, VWL_RCON_COMMANDS["list"])
+        case _:
+            return MessageDefine.args_do_not_exist
+
 # 处理~conf GroupAdmin命令调用
 
 
@@ -281,7 +712,7 @@ async def handle_groupadmin_conf_command(args: list[str], groupid: int = 0) -> s
     match args[0]:
         case "status":
             return_message = MessageDefine.command_groupadmin_status_message(
-                ConfigHandler.config.enable, ConfigHandler.config.mc_serverscaner_status)
+                ConfigHandler.config.enable, mcServerScaner.running)
         case "help":
             return_message = MessageDefine.public_groupadmin_command_help
 
@@ -290,7 +721,8 @@ async def handle_groupadmin_conf_command(args: list[str], groupid: int = 0) -> s
 
         case "set":
             return_message = ConfigHandler.set_config(args, groupid)
-            await reload_plugin_config()
+            if len(args) == 3 and return_message == MessageDefine.command_set_sueccess(args[1], args[2]):
+                await apply_snapshot(ConfigHandler.snapshot)
 
         case _:
             return_message = MessageDefine.args_do_not_exist
@@ -309,28 +741,14 @@ async def handle_superuser_conf_command(args: list[str]) -> str:
                 if len(args) != 3 or args[1] not in ["add", "del"] or not isinstance(value, int):
                     return_message = MessageDefine.args_error_qqgroup_command
                 elif args[1] == "add":
-                    if value in ConfigHandler.config.mc_qqgroup_id and value in ConfigHandler.config.mc_qqgroup_default_server:
-                        return_message = MessageDefine.command_qqgroup_add_exist
-                    else:
-                        if value not in ConfigHandler.config.mc_qqgroup_id:
-                            # TODO:这什么鬼变量啊，为什么下标是群号dict里面也放一个群号？你tm当时脑残了啊？
-                            ConfigHandler.config.mc_qqgroup_id.append(value)
-                        if value not in ConfigHandler.config.mc_qqgroup_default_server:
-                            server_config = {'server_address': None, 'default_icon_type': 'Server Icon',
-                                             'default_icon': '', 'need_scan': False, 'groupID': value}
-                            ConfigHandler.config.mc_qqgroup_default_server[value] = server_config
-                            del server_config
-                        ConfigHandler.save_config()
-                        await reload_plugin_config()
+                    if ConfigHandler.add_group(value):
+                        await apply_snapshot(ConfigHandler.snapshot)
                         return_message = MessageDefine.command_qqgroup_success("添加", value)
+                    else:
+                        return_message = MessageDefine.command_qqgroup_add_exist
                 elif args[1] == "del":
-                    if value in ConfigHandler.config.mc_qqgroup_id or value in ConfigHandler.config.mc_qqgroup_default_server:
-                        if value in ConfigHandler.config.mc_qqgroup_id:
-                            ConfigHandler.config.mc_qqgroup_id.remove(value)
-                        if value in ConfigHandler.config.mc_qqgroup_default_server:
-                            del ConfigHandler.config.mc_qqgroup_default_server[value]
-                        ConfigHandler.save_config()
-                        await reload_plugin_config()
+                    if ConfigHandler.del_group(value):
+                        await apply_snapshot(ConfigHandler.snapshot)
                         return_message = MessageDefine.command_qqgroup_success("删除", value)
                     else:
                         return_message = MessageDefine.command_qqgroup_del_not_exist
@@ -342,13 +760,38 @@ async def handle_superuser_conf_command(args: list[str]) -> str:
         case "status":
             if ConfigHandler.config.enable:
                 return_message = MessageDefine.command_superuser_status_message(ConfigHandler.config.enable,
-                                                                                  ConfigHandler.config.mc_serverscaner_status, mcServerScaner.scan_server_list)
+                                                                                  mcServerScaner.running, mcServerScaner.scan_server_list)
             else:
                 return_message = MessageDefine.plugin_is_not_enable
 
         case "reload":
             return_message = await reload_plugin_config()
 
+        case "trace":
+            if len(args) == 2 and args[1] == "clear":
+                Tracer.clear()
+                return_message = MessageDefine.command_trace_cleared
+            elif not ConfigHandler.config.mc_trace_enable:
+                return_message = MessageDefine.trace_is_not_enable
+            else:
+                return_message = MessageDefine.command_trace_message(Tracer.summary())
+
+        case "mem":
+            if len(args) == 1:
+                traced = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else None
+                return_message = MessageDefine.command_mem_message(MemoryBudget.usage(), MemoryBudget.budget_bytes, traced)
+            elif len(args) == 2 and args[1] == "snapshot":
+                # 拍摄快照要遍历所有追踪到的分配，放到线程中不卡住事件循环
+                return_message = MessageDefine.command_mem_snapshot(await asyncio.to_thread(MemoryBudget.snapshot))
+            elif len(args) == 2 and args[1] == "diff":
+                stats = await asyncio.to_thread(MemoryBudget.diff)
+                return_message = MessageDefine.mem_no_snapshot if stats is None else MessageDefine.command_mem_diff(stats)
+            elif len(args) == 2 and args[1] == "stop":
+                MemoryBudget.stop_tracing()
+                return_message = MessageDefine.command_mem_stopped
+            else:
+                return_message = MessageDefine.args_error_mem_command
+
         case "help":
             return_message = MessageDefine.private_superuser_command_help
 
@@ -359,17 +802,17 @@ async def handle_superuser_conf_command(args: list[str]) -> str:
                 return_message = ConfigHandler
             elif ConfigHandler.config.enable is False or ConfigHandler.config.mc_serverscaner_enable is False:
                 return_message = MessageDefine.plugin_is_not_enable
-            elif args[1] == "start" and not ConfigHandler.config.mc_serverscaner_status:
-                mcServerScaner.start_scaner()
-                ConfigHandler.config.mc_serverscaner_status = True
-                return_message = MessageDefine.scanner_is_running
-            elif args[1] == "stop" and ConfigHandler.config.mc_serverscaner_status:
+            elif args[1] == "start" and not mcServerScaner.running:
+                if mcServerScaner.start_scaner():
+                    return_message = MessageDefine.scanner_is_running
+                else:
+                    return_message = MessageDefine.scanner_without_server
+            elif args[1] == "stop" and mcServerScaner.running:
                 mcServerScaner.stop_scaner(deletebot=False)
-                ConfigHandler.config.mc_serverscaner_status = False
                 return_message = MessageDefine.scanner_is_stopped
-            elif args[1] == "start" and ConfigHandler.config.mc_serverscaner_status:
+            elif args[1] == "start" and mcServerScaner.running:
                 return_message = MessageDefine.scanner_already_running
-            elif args[1] == "stop" and not ConfigHandler.config.mc_serverscaner_status:
+            elif args[1] == "stop" and not mcServerScaner.running:
                 return_message = MessageDefine.scanner_already_stopped
 
         case "get":
@@ -377,7 +820,23 @@ async def handle_superuser_conf_command(args: list[str]) -> str:
 
         case "set":
             return_message = ConfigHandler.set_config(args, 0)
-            await reload_plugin_config()
+            if len(args) == 3 and return_message == MessageDefine.command_set_sueccess(args[1], args[2]):
+                await apply_snapshot(ConfigHandler.snapshot)
+
+        case "export":
+            try:
+                return_message = MessageDefine.command_export_success(str(ConfigHandler.export_yaml()))
+            except OSError as e:
+                return_message = MessageDefine.command_export_failed(str(e))
+
+        case "import":
+            import yaml  # pylint: disable=import-outside-toplevel
+            try:
+                count = ConfigHandler.import_yaml(args[1] if len(args) > 1 else None)
+                await reload_plugin_config(reload_file=False)
+                return_message = MessageDefine.command_import_success(count)
+            except (OSError, ValueError, yaml.YAMLError) as e:
+                return_message = MessageDefine.command_import_failed(str(e))
 
         case _:
             return_message = MessageDefine.args_do_not_exist
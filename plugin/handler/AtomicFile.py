@@ -0,0 +1,42 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+原子写入类 AtomicFile.py 2026-10-19
+Author: AptS:1547
+
+AtomicFile类把数据先写到同目录下的临时文件，再rename覆盖目标文件，写到一半崩溃也不会留下残缺的文件，提供了以下方法：
+write: 原子写入字节数据
+
+config.yml、扫描器状态、白名单文件和图片缓存都通过这里写入
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+
+class AtomicFile:
+    """原子写入文件"""
+
+    @staticmethod
+    def write(path: str | Path, data: bytes, sync: bool = True) -> None:
+        """
+        原子写入：先写临时文件再rename覆盖
+        :param sync: rename前fsync临时文件，断电后也不会得到空文件（缓存这类丢了也无所谓的文件可以关闭）
+        """
+        path = Path(path)
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+        try:
+            if path.exists():           # 保留原文件的权限，mkstemp默认是0600
+                os.chmod(tmp_path, path.stat().st_mode & 0o7777)
+            with os.fdopen(fd, mode="wb") as f:
+                f.write(data)
+                if sync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
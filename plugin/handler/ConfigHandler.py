@@ -5,24 +5,33 @@ Use of this source code is governed by a GPL-3.0 license that can be found in th
 配置文件处理类 ConfigHandler.py 2024-10-21
 Author: AptS:1547
 
-ConfigHandler类用于处理配置文件的加载和保存，提供了三个方法：
+ConfigHandler类用于处理配置文件的加载和保存，提供了以下方法：
 load_config: 加载配置文件，返回Config对象，无参数
-save_config: 保存更改的配置文件，返回bool，无参数
+read_config_file: 读取并校验配置文件，不修改状态（文件监视在线程中调用）
+save_config: 保存更改的配置文件（临时文件+rename原子写入），返回bool，无参数
 reload_config: 重载配置文件，无参数
+apply_config: 把Config编译为不可变的ConfigSnapshot并整体替换
+add_group/del_group/replace_group: 添加/删除/修改单个QQ群
+export_yaml/import_yaml: 导出/导入包含全部群配置的YAML
+
+ConfigSnapshot是消息处理和扫描器读取的不可变快照：群白名单是frozenset，每个群的设置是GroupConfig，
+修改配置时总是生成新的快照再整体替换，读者拿到的快照永远是完整的
+mc_config_backend为sqlite时，群配置保存在SQLite（ConfigStore.GroupStore）中，修改单个群只写数据库中的一行
 
 """
 
 import base64
 import ast
+import hashlib
 import re  # pylint: disable=multiple-imports
-from io import BytesIO
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 
-import yaml
-from PIL import Image
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ValidationInfo, field_validator
 from pydantic import ValidationError
 
+from .AtomicFile import AtomicFile  # pylint: disable=relative-beyond-top-level
 from .MessageDefine import MessageDefine  # pylint: disable=relative-beyond-top-level
 
 
@@ -31,6 +40,26 @@ def convert_string(value: str) -> bool | int | float | str | dict:
     return ast.literal_eval(value)
 
 
+def parse_backends(value) -> tuple[tuple[str, str], ...]:
+    """
+    解析群的子服务器列表，返回((名称, 地址), ...)
+    接受config.yml中的 {名称: 地址} 字典，或~conf set使用的 "名称=地址,名称=地址" 字符串
+    """
+    if not value:
+        return ()
+    if isinstance(value, dict):
+        return tuple((str(name), str(address)) for name, address in value.items() if address)
+    if isinstance(value, str):
+        backends = []
+        for item in re.split(r"[\s,，]+", value.strip()):
+            name, separator, address = item.partition("=")
+            if not separator or not name or not address:
+                raise ValueError(f"子服务器格式错误：{item}，应为 名称=地址")
+            backends.append((name, address))
+        return tuple(dict(backends).items())
+    raise ValueError("backends must be a dict or a string")
+
+
 class Config(BaseModel):
     """
     配置文件模型
@@ -39,11 +68,50 @@ class Config(BaseModel):
     mc_global_default_server: 默认服务器
     mc_global_default_icon: 默认服务器图标
     mc_ping_server_interval_second: 服务器ping间隔
-    mc_qqgroup_default_server: QQ群默认服务器
+    mc_qqgroup_default_server: QQ群默认服务器；backends为代理后面的子服务器（{名称: 地址}），设置后~ping和扫描器查询整个服务器网络；
+                               rcon_address/rcon_password为该群服务器的RCON（只能由超级用户在这里设置，设置后群管理员可以使用~rcon）
     mc_serverscaner_enable: 是否启用服务器扫描
+    mc_vwl_enable: 是否启用~vwl白名单管理
+    mc_vwl_file_path: Velocity白名单文件路径（[{"uuid", "name"}]格式的JSON）
+    mc_picture_layout: 状态卡片的XML布局文件路径，为空时使用默认布局
+    mc_prewarm_enable: 机器人连接后是否在后台预热（导入依赖、编译布局、合成底图）
+    mc_config_backend: 群配置的存储方式，yaml（写在本文件中）或sqlite（每个群单独一行，修改时只写一行）
+    mc_config_db_path: sqlite数据库路径，为空时使用config.yml同目录下的config.db
+    mc_config_watch_enable: 是否监视config.yml，手动编辑保存后自动校验并应用
+    mc_ratelimit_global_rate/mc_ratelimit_global_burst: 全局发送令牌桶，每秒补充的令牌数/桶容量
+    mc_ratelimit_group_rate/mc_ratelimit_group_burst: 每个群的发送令牌桶，每秒补充的令牌数/桶容量
+    mc_ratelimit_jitter_second: 需要排队时额外加上的随机延时上限（秒）
+    mc_ping_cooldown_second: 同一个群对同一个地址的~ping在这段时间内直接复用上次的结果，0为不复用
+    mc_ping_multi_max: ~ping一次最多查询的地址数量
+    mc_ping_multi_concurrency: ~ping多个地址时同时进行的查询数量上限
+    mc_ping_deadline_second: ~ping多个地址时的总时限（秒），超时的地址单独标记
+    mc_image_delivery: 图片发送方式，base64（内联）、file（file://路径）或http（NoneBot提供的图片URL）
+    mc_image_cache_dir: 图片缓存目录，为空时使用config.yml同目录下的image_cache
+    mc_image_cache_max_mb: 图片缓存目录的大小上限（MB）
+    mc_image_http_base_url: http方式下OneBot实现访问NoneBot的地址，例如http://127.0.0.1:8080
+    mc_trace_enable: 是否记录~ping各阶段的耗时（~conf trace查看）
+    mc_trace_sink: 耗时的额外输出，逗号分隔：ring（只在内存中）、log（debug日志）、otel（OpenTelemetry）
+    mc_memory_budget_mb: 图标、底图、~ping结果等内存缓存共用的预算（MB），超出时按优先级淘汰
+    mc_ping_progressive: ~ping的渐进式回复，off（渲染完再回复卡片）、followup（先回复文字摘要，卡片随后单独发送）
+                         或replace（同followup，卡片发出后撤回文字摘要）
+    mc_ping_render_deadline_second: 渐进式回复时状态卡片的渲染时限（秒），超时不再发送卡片
+    mc_rcon_pool_size: 每台服务器最多同时保持的RCON连接数
+    mc_rcon_pipeline_depth: 每个RCON连接上同时在途的命令数上限
+    mc_rcon_timeout_second: RCON连接、登录和单条命令的超时（秒）
+    mc_rcon_idle_second: RCON连接空闲超过这段时间后关闭（秒）
+    mc_api_enable: 是否在NoneBot的HTTP服务器（FastAPI驱动器）上提供/epmc/api状态接口
+    mc_api_probe_enable: 状态接口是否允许按需Ping（/epmc/api/ping，只能查询配置中的服务器）
+    mc_api_token: 状态接口的访问令牌，为空时不需要令牌
+    mc_ping_latency_samples: 在线服务器的延迟采样次数，大于1时多次测量并使用中位数（同时统计最小值/p95/抖动），1为只用status的单次延迟
+    mc_card_prewarm_enable: 机器人连接后是否在后台定期刷新各群默认服务器的~ping卡片，不带地址的~ping直接回复预热好的卡片
+    mc_card_prewarm_interval_second: 卡片预热的刷新间隔（秒），预热的卡片在这段时间内都可以直接回复
+    mc_card_prewarm_concurrency: 卡片预热同时查询的群数
+    mc_scanner_state_enable: 是否把扫描器的状态（在线/离线、最近结果、延迟记录、在线玩家）保存到config.yml同目录下的scanner_state.json，重启后恢复
+    mc_scanner_state_max_age_second: 保存超过这段时间的扫描器状态在重启时不再恢复（秒）
+    mc_query_enable: 扫描器是否用GameSpy4 Query获取完整的在线玩家名单（服务器需要enable-query=true），关闭时只用status中的部分名单
     """
     enable: bool = False
-    mc_qqgroup_id: list = [int]
+    mc_qqgroup_id: list = []
 
     mc_serverscaner_enable: bool = False
     mc_vwl_enable: bool = False
@@ -53,8 +121,43 @@ class Config(BaseModel):
     mc_global_default_icon: str = ""
     mc_ping_server_interval_second: int = 10
     mc_qqgroup_default_server: dict = {}
-
-    mc_serverscaner_status: bool = False
+    mc_picture_layout: str = ""
+    mc_prewarm_enable: bool = True
+    mc_config_backend: str = "yaml"
+    mc_config_db_path: str = ""
+    mc_config_watch_enable: bool = True
+    mc_ratelimit_global_rate: float = 5.0
+    mc_ratelimit_global_burst: int = 10
+    mc_ratelimit_group_rate: float = 1.0
+    mc_ratelimit_group_burst: int = 3
+    mc_ratelimit_jitter_second: float = 0.3
+    mc_ping_cooldown_second: float = 10.0
+    mc_ping_multi_max: int = 8
+    mc_ping_multi_concurrency: int = 4
+    mc_ping_deadline_second: float = 8.0
+    mc_image_delivery: str = "base64"
+    mc_image_cache_dir: str = ""
+    mc_image_cache_max_mb: int = 64
+    mc_image_http_base_url: str = ""
+    mc_trace_enable: bool = False
+    mc_trace_sink: str = "ring"
+    mc_memory_budget_mb: int = 128
+    mc_ping_progressive: str = "off"
+    mc_ping_render_deadline_second: float = 5.0
+    mc_rcon_pool_size: int = 2
+    mc_rcon_pipeline_depth: int = 4
+    mc_rcon_timeout_second: float = 5.0
+    mc_rcon_idle_second: float = 300.0
+    mc_api_enable: bool = False
+    mc_api_probe_enable: bool = False
+    mc_api_token: str = ""
+    mc_ping_latency_samples: int = 1
+    mc_card_prewarm_enable: bool = False
+    mc_card_prewarm_interval_second: float = 60.0
+    mc_card_prewarm_concurrency: int = 2
+    mc_query_enable: bool = False
+    mc_scanner_state_enable: bool = True
+    mc_scanner_state_max_age_second: float = 900.0
 
     @field_validator("mc_ping_server_interval_second")
     @classmethod
@@ -64,6 +167,51 @@ class Config(BaseModel):
             return v
         raise ValueError("mc_ping_server_interval_second must greater than 1")
 
+    @field_validator("mc_ratelimit_global_rate", "mc_ratelimit_global_burst", "mc_ratelimit_group_rate",
+                     "mc_ratelimit_group_burst", "mc_ping_multi_max", "mc_ping_multi_concurrency", "mc_ping_deadline_second",
+                     "mc_image_cache_max_mb", "mc_memory_budget_mb", "mc_ping_render_deadline_second",
+                     "mc_rcon_pool_size", "mc_rcon_pipeline_depth", "mc_rcon_timeout_second", "mc_rcon_idle_second",
+                     "mc_ping_latency_samples", "mc_card_prewarm_interval_second", "mc_card_prewarm_concurrency",
+                     "mc_scanner_state_max_age_second")
+    @classmethod
+    def validate_positive(cls, v: float, info: ValidationInfo) -> float:
+        """验证令牌桶和多地址查询参数是否大于0"""
+        if v > 0:
+            return v
+        raise ValueError(f"{info.field_name} must greater than 0")
+
+    @field_validator("mc_ratelimit_jitter_second", "mc_ping_cooldown_second")
+    @classmethod
+    def validate_seconds(cls, v: float) -> float:
+        """验证时间不为负数"""
+        if v >= 0:
+            return v
+        raise ValueError("mc_ratelimit_jitter_second and mc_ping_cooldown_second must not be negative")
+
+    @field_validator("mc_image_delivery")
+    @classmethod
+    def validate_delivery(cls, v: str) -> str:
+        """验证图片发送方式"""
+        if v in ("base64", "file", "http"):
+            return v
+        raise ValueError("mc_image_delivery must be base64, file or http")
+
+    @field_validator("mc_ping_progressive")
+    @classmethod
+    def validate_progressive(cls, v: str) -> str:
+        """验证渐进式回复模式"""
+        if v in ("off", "followup", "replace"):
+            return v
+        raise ValueError("mc_ping_progressive must be off, followup or replace")
+
+    @field_validator("mc_config_backend")
+    @classmethod
+    def validate_backend(cls, v: str) -> str:
+        """验证存储方式"""
+        if v in ("yaml", "sqlite"):
+            return v
+        raise ValueError("mc_config_backend must be yaml or sqlite")
+
     @field_validator("mc_global_default_server")
     @classmethod
     def validate_server(cls, v: str) -> str:
@@ -80,70 +228,265 @@ class Config(BaseModel):
     @field_validator("mc_global_default_icon")
     @classmethod
     def validate_base64(cls, v: str) -> str:
-        """验证是否为base64字符串"""
+        """验证是否为base64字符串，图片本身在首次使用时才解码"""
+        v = v.removeprefix("base64://")
         if v == "":
             return v
         try:
-            image_data = base64.b64decode(v)
-            bytesio_obj = BytesIO(image_data)
-            Image.open(bytesio_obj)
+            base64.b64decode(v, validate=True)
             return v
         except Exception as e:
             raise ValueError(
                 "mc_global_default_icon must be a valid base64 string") from e
 
 
+@dataclass(frozen=True, slots=True)
+class GroupConfig:
+    """单个QQ群的设置（mc_qqgroup_default_server中的一项）"""
+    group_id: int
+    server_address: str = ""
+    default_icon_type: str = "Server Icon"
+    default_icon: str = ""
+    need_scan: bool = False
+    backends: tuple = ()            # 代理（server_address）后面的子服务器，((名称, 地址), ...)
+    rcon_address: str = ""          # RCON地址host[:port]，为空时不能使用~rcon
+    rcon_password: str = ""
+
+    @classmethod
+    def from_dict(cls, group_id: int, value: dict) -> "GroupConfig":
+        """从配置文件中的字典生成"""
+        return cls(
+            group_id=group_id,
+            server_address=value.get("server_address") or "",
+            default_icon_type=value.get("default_icon_type") or "Server Icon",
+            default_icon=value.get("default_icon") or "",
+            need_scan=bool(value.get("need_scan", False)),
+            backends=parse_backends(value.get("backends")),
+            rcon_address=value.get("rcon_address") or "",
+            rcon_password=str(value.get("rcon_password") or ""),
+        )
+
+    def to_dict(self) -> dict:
+        """转换回配置文件中的字典格式，没有子服务器/RCON时不写backends/rcon_*"""
+        data = {"server_address": self.server_address or None, "default_icon_type": self.default_icon_type,
+                "default_icon": self.default_icon, "need_scan": self.need_scan}
+        if self.backends:
+            data["backends"] = dict(self.backends)
+        if self.rcon_address:
+            data["rcon_address"] = self.rcon_address
+            data["rcon_password"] = self.rcon_password
+        return data
+
+    @property
+    def backends_text(self) -> str:
+        """子服务器列表的 "名称=地址,名称=地址" 形式（~conf get显示用）"""
+        return ",".join(f"{name}={address}" for name, address in self.backends)
+
+
+GROUP_KEYS = ("mc_qqgroup_id", "mc_qqgroup_default_server")
+
+
+
+def load_yaml(stream):
+    """解析YAML，第一次读写配置时才导入PyYAML；有libyaml时使用C实现的解析器，群很多时读写config.yml快一个数量级"""
+    import yaml  # pylint: disable=import-outside-toplevel
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def dump_yaml(data: dict) -> str:
+    """序列化为YAML，和load_yaml一样延迟导入PyYAML"""
+    import yaml  # pylint: disable=import-outside-toplevel
+    return yaml.dump(data, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper), allow_unicode=True)
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigSnapshot:
+    """
+    编译后的只读配置快照
+    config: 原始Config对象（只读，不要修改；群相关字段以group_ids/groups为准）
+    group_ids: 获准名单，frozenset，O(1)查询
+    groups: 群号 -> GroupConfig 的只读映射
+    """
+    config: Config
+    group_ids: frozenset
+    groups: MappingProxyType
+
+    @classmethod
+    def compile(cls, config: Config, group_ids: list | None = None, groups: dict | None = None) -> "ConfigSnapshot":
+        """
+        从Config生成快照，mc_qqgroup_default_server中非群号的键（如version）会被忽略
+        group_ids/groups不为空时（例如来自SQLite）直接使用，不再读取Config中的群配置
+        """
+        if groups is None:
+            groups = {groupid: GroupConfig.from_dict(groupid, value)
+                      for groupid, value in config.mc_qqgroup_default_server.items()
+                      if isinstance(groupid, int) and isinstance(value, dict)}
+        if group_ids is None:
+            group_ids = config.mc_qqgroup_id
+        return cls(config=config, group_ids=frozenset(group_ids), groups=MappingProxyType(groups))
+
+    def is_enabled_group(self, groupid: int) -> bool:
+        """插件已启用并且群在获准名单内"""
+        return self.config.enable and groupid in self.group_ids
+
+    def scan_groups(self) -> list[GroupConfig]:
+        """需要定时扫描的群"""
+        return [group for group in self.groups.values() if group.need_scan and group.server_address]
+
+    def with_config(self, config: Config) -> "ConfigSnapshot":
+        """只替换全局设置，群配置原样保留"""
+        return ConfigSnapshot(config=config, group_ids=self.group_ids, groups=self.groups)
+
+    def with_group(self, groupid: int, group: GroupConfig | None = None, allowed: bool = True) -> "ConfigSnapshot":
+        """替换单个群，group为None时只修改获准名单"""
+        groups = self.groups
+        if group is not None:
+            groups = dict(groups)
+            groups[groupid] = group
+            groups = MappingProxyType(groups)
+        group_ids = self.group_ids | {groupid} if allowed else self.group_ids - {groupid}
+        return ConfigSnapshot(config=self.config, group_ids=group_ids, groups=groups)
+
+    def without_group(self, groupid: int) -> "ConfigSnapshot":
+        """删除单个群"""
+        groups = MappingProxyType({key: value for key, value in self.groups.items() if key != groupid})
+        return ConfigSnapshot(config=self.config, group_ids=self.group_ids - {groupid}, groups=groups)
+
+    def to_dict(self, with_groups: bool = True) -> dict:
+        """转换为config.yml的格式"""
+        data = self.config.model_dump(exclude=set(GROUP_KEYS))
+        data["mc_qqgroup_id"] = sorted(self.group_ids) if with_groups else []
+        data["mc_qqgroup_default_server"] = {groupid: group.to_dict() for groupid, group in self.groups.items()} if with_groups else {}
+        return data
+
+
 class ConfigHandler:
     """
     配置文件处理类
     load_config: 加载配置文件，返回Config对象，无参数
     save_config: 保存更改的配置文件，返回bool，无参数
     """
+    error = ""
+    config = Config()                # initialize() 之前的占位配置，插件未启用
+    snapshot = ConfigSnapshot.compile(config)
+    store = None                     # mc_config_backend为sqlite时的GroupStore
+    file_digest = ""                 # 最近一次读取/写入的config.yml内容摘要，用于忽略自己写入触发的文件变化
 
     @classmethod
-    def initialize(cls):
+    def initialize(cls, config_file_path: str | Path | None = None):
         """初始化配置信息"""
         cls.error = ""
-        cls.config_file_path = Path(__file__).parent.parent / "config.yml"
+        cls.config_file_path = Path(config_file_path) if config_file_path else Path(__file__).parent.parent / "config.yml"
         cls.config_list_group = ["default_icon", "default_icon_type",
-                                  "need_scan", "server_address"]
+                                  "need_scan", "server_address", "backends"]
         cls.config_list_superuser = ["enable", "mc_qqgroup_id", "mc_global_default_server", "mc_global_default_icon",
-                                      "mc_ping_server_interval_second", "mc_qqgroup_default_server", "mc_serverscaner_enable"]
-        cls.config = cls.load_config()
+                                      "mc_ping_server_interval_second", "mc_qqgroup_default_server", "mc_serverscaner_enable",
+                                      "mc_picture_layout", "mc_prewarm_enable", "mc_config_backend", "mc_config_db_path",
+                                      "mc_config_watch_enable", "mc_ratelimit_global_rate", "mc_ratelimit_global_burst",
+                                      "mc_ratelimit_group_rate", "mc_ratelimit_group_burst", "mc_ratelimit_jitter_second",
+                                      "mc_ping_cooldown_second", "mc_ping_multi_max", "mc_ping_multi_concurrency",
+                                      "mc_ping_deadline_second", "mc_vwl_enable", "mc_vwl_file_path", "mc_image_delivery", "mc_image_cache_dir",
+                                      "mc_image_cache_max_mb", "mc_image_http_base_url", "mc_trace_enable", "mc_trace_sink",
+                                      "mc_memory_budget_mb", "mc_ping_progressive", "mc_ping_render_deadline_second",
+                                      "mc_rcon_pool_size", "mc_rcon_pipeline_depth", "mc_rcon_timeout_second", "mc_rcon_idle_second",
+                                      "mc_api_enable", "mc_api_probe_enable", "mc_api_token", "mc_ping_latency_samples",
+                                      "mc_card_prewarm_enable", "mc_card_prewarm_interval_second", "mc_card_prewarm_concurrency",
+                                      "mc_query_enable", "mc_scanner_state_enable", "mc_scanner_state_max_age_second"]
+        cls.apply_config(cls.load_config())
 
     @classmethod
     def load_config(cls) -> Config:
         """加载配置文件"""
+        config, cls.error, digest = cls.read_config_file(cls.config_file_path)
+        if config is None:
+            return Config()
+        cls.file_digest = digest
+        return config
+
+    @staticmethod
+    def read_config_file(path: str | Path) -> tuple[Config | None, str, str]:
+        """
+        读取并校验配置文件，不修改任何状态，可以在线程中调用
+        返回(Config或None, 错误信息, 文件内容摘要)
+        """
         try:
-            cls.error = ""
             # TODO: 这里的路径应该是相对路径，而不是绝对路径
-            with open(cls.config_file_path, encoding="utf-8", mode="r") as f:
-                docs = yaml.safe_load(f)
-                f.close()
-
-            config = Config(**docs)
-            return config
+            with open(path, encoding="utf-8", mode="r") as f:
+                content = f.read()
+            digest = hashlib.sha1(content.encode("utf-8")).hexdigest()
+            docs = load_yaml(content)
+            return Config(**docs), "", digest
 
         except FileNotFoundError:
-            cls.error = "[epmc_minecraft_bot] 配置文件不存在！请检查你的配置并重载配置文件！"
-            return Config()
+            return None, "[epmc_minecraft_bot] 配置文件不存在！请检查你的配置并重载配置文件！", ""
         except ValidationError as e:
-            cls.error = "[epmc_minecraft_bot] 配置文件出错！请检查你的配置并重载配置文件！\n" + e.errors()[0]["msg"]
-            return Config()
+            return None, "[epmc_minecraft_bot] 配置文件出错！请检查你的配置并重载配置文件！\n" + e.errors()[0]["msg"], ""
         except Exception as e:              # pylint: disable=broad-except
-            cls.error = "[epmc_minecraft_bot] 配置文件格式错误！请检查你的配置并重载配置文件！" + str(e)
-            return Config()
+            return None, "[epmc_minecraft_bot] 配置文件格式错误！请检查你的配置并重载配置文件！" + str(e), ""
+
+    @staticmethod
+    def write_yaml(path: str | Path, data: dict) -> str:
+        """
+        原子写入YAML：先写同目录下的临时文件并fsync，再rename覆盖，写到一半崩溃也不会留下残缺的文件
+        返回写入内容的摘要
+        """
+        content = dump_yaml(data).encode("utf-8")
+        AtomicFile.write(path, content)
+        return hashlib.sha1(content).hexdigest()
+
+    @classmethod
+    def apply_config(cls, config: Config) -> ConfigSnapshot:
+        """编译新的快照并整体替换，正在使用旧快照的读者不受影响"""
+        if config.mc_config_backend == "sqlite":
+            import sqlite3  # pylint: disable=import-outside-toplevel
+            try:
+                store = cls.open_store(config)
+                migrate = store.is_empty() and bool(config.mc_qqgroup_id or config.mc_qqgroup_default_server)
+                if migrate:                     # 第一次切换到sqlite时，把config.yml中的群导入数据库
+                    yaml_snapshot = ConfigSnapshot.compile(config)
+                    store.import_groups(list(yaml_snapshot.group_ids), dict(yaml_snapshot.groups))
+                group_ids, groups = store.load()
+                snapshot = cls.swap(ConfigSnapshot.compile(config, group_ids, groups))
+                if migrate:                     # 群配置已经在数据库中，config.yml只保留全局设置
+                    cls.save_config()
+                return snapshot
+            except sqlite3.Error as e:
+                cls.error = "[epmc_minecraft_bot] 群配置数据库打开失败！" + str(e)
+                cls.close_store()
+                return cls.swap(ConfigSnapshot.compile(Config()))
+        cls.close_store()
+        return cls.swap(ConfigSnapshot.compile(config))
+
+    @classmethod
+    def swap(cls, snapshot: ConfigSnapshot) -> ConfigSnapshot:
+        """整体替换当前快照"""
+        cls.config, cls.snapshot = snapshot.config, snapshot
+        return snapshot
+
+    @classmethod
+    def open_store(cls, config: Config):
+        """打开（或复用）SQLite群配置数据库"""
+        from .ConfigStore import GroupStore  # pylint: disable=import-outside-toplevel, relative-beyond-top-level
+        db_path = Path(config.mc_config_db_path) if config.mc_config_db_path else cls.config_file_path.with_name("config.db")
+        if cls.store is None or cls.store.db_path != db_path:
+            cls.close_store()
+            cls.store = GroupStore(db_path)
+        return cls.store
+
+    @classmethod
+    def close_store(cls) -> None:
+        """关闭SQLite群配置数据库"""
+        if cls.store is not None:
+            cls.store.close()
+            cls.store = None
 
     @classmethod
     def save_config(cls) -> bool:
-        """保存更改的配置文件"""
+        """保存更改的配置文件，使用sqlite时群配置保存在数据库中，不写入config.yml"""
         try:
-            with open(cls.config_file_path, encoding="utf-8", mode="w") as f:
-                config_dict = {"enable": cls.config.enable, "mc_qqgroup_id": cls.config.mc_qqgroup_id, "mc_global_default_server": cls.config.mc_global_default_server, "mc_global_default_icon": cls.config.mc_global_default_icon,
-                               "mc_ping_server_interval_second": cls.config.mc_ping_server_interval_second, "mc_qqgroup_default_server": cls.config.mc_qqgroup_default_server, "mc_serverscaner_enable": cls.config.mc_serverscaner_enable}
-                yaml.dump(config_dict, f)
-                del config_dict
-                f.close()
+            config_dict = cls.snapshot.to_dict(with_groups=cls.store is None)
+            cls.file_digest = cls.write_yaml(cls.config_file_path, config_dict)
+            del config_dict
             return True
         except:  # pylint: disable=bare-except
             return False
@@ -151,7 +494,94 @@ class ConfigHandler:
     @classmethod
     def reload_config(cls) -> None:
         """重载配置文件"""
-        cls.config = cls.load_config()
+        cls.apply_config(cls.load_config())
+
+    @classmethod
+    def replace_config(cls, **changes) -> ConfigSnapshot:
+        """修改全局设置（会重新校验），替换快照；修改群相关的键时会替换全部群配置"""
+        if any(key in changes for key in GROUP_KEYS):
+            data = cls.snapshot.to_dict()
+            data.update(changes)
+            config = Config(**data)
+            if cls.store is not None:
+                new_snapshot = ConfigSnapshot.compile(config)
+                cls.store.replace_groups(list(new_snapshot.group_ids), dict(new_snapshot.groups))
+            return cls.apply_config(config)
+        data = cls.snapshot.to_dict(with_groups=False)
+        data.update(changes)
+        config = Config(**data)
+        if config.mc_config_backend != cls.config.mc_config_backend or config.mc_config_db_path != cls.config.mc_config_db_path:
+            return cls.switch_backend(config)
+        return cls.swap(cls.snapshot.with_config(config))
+
+    @classmethod
+    def switch_backend(cls, config: Config) -> ConfigSnapshot:
+        """切换存储后端，把当前群配置写到新的后端"""
+        if config.mc_config_backend == "sqlite":
+            cls.open_store(config).replace_groups(list(cls.snapshot.group_ids), dict(cls.snapshot.groups))
+            return cls.apply_config(config)
+        cls.close_store()
+        snapshot = cls.swap(cls.snapshot.with_config(config))
+        cls.save_config()
+        return snapshot
+
+    @classmethod
+    def persist_groups(cls) -> None:
+        """群配置变化后持久化：sqlite已经在事务中写入，yaml需要重写文件"""
+        if cls.store is None:
+            cls.save_config()
+
+    @classmethod
+    def replace_group(cls, group: GroupConfig) -> ConfigSnapshot:
+        """替换单个群的设置，只修改对应的一行/一项"""
+        allowed = group.group_id in cls.snapshot.group_ids
+        if cls.store is not None:
+            cls.store.upsert_group(group, group.group_id, allowed)
+        snapshot = cls.swap(cls.snapshot.with_group(group.group_id, group, allowed))
+        cls.persist_groups()
+        return snapshot
+
+    @classmethod
+    def add_group(cls, groupid: int) -> bool:
+        """添加QQ群，已存在时返回False"""
+        if groupid in cls.snapshot.group_ids and groupid in cls.snapshot.groups:
+            return False
+        group = None if groupid in cls.snapshot.groups else GroupConfig(group_id=groupid)
+        if cls.store is not None:
+            cls.store.upsert_group(group, groupid, True)
+        cls.swap(cls.snapshot.with_group(groupid, group, True))
+        cls.persist_groups()
+        return True
+
+    @classmethod
+    def del_group(cls, groupid: int) -> bool:
+        """删除QQ群，不存在时返回False"""
+        if groupid not in cls.snapshot.group_ids and groupid not in cls.snapshot.groups:
+            return False
+        if cls.store is not None:
+            cls.store.delete_group(groupid)
+        cls.swap(cls.snapshot.without_group(groupid))
+        cls.persist_groups()
+        return True
+
+    @classmethod
+    def export_yaml(cls, path: str | Path | None = None) -> Path:
+        """把完整配置（包括全部群）导出为YAML，默认导出到config.export.yml"""
+        path = Path(path) if path else cls.config_file_path.with_name("config.export.yml")
+        cls.write_yaml(path, cls.snapshot.to_dict())
+        return path
+
+    @classmethod
+    def import_yaml(cls, path: str | Path | None = None) -> int:
+        """从YAML导入群配置（覆盖当前全部群），返回导入的群数量，默认读取config.export.yml"""
+        path = Path(path) if path else cls.config_file_path.with_name("config.export.yml")
+        with open(path, encoding="utf-8", mode="r") as f:
+            docs = load_yaml(f)
+        imported = ConfigSnapshot.compile(Config(**docs))
+        cls.replace_config(mc_qqgroup_id=sorted(imported.group_ids),
+                           mc_qqgroup_default_server={groupid: group.to_dict() for groupid, group in imported.groups.items()})
+        cls.persist_groups()
+        return len(imported.group_ids | set(imported.groups))
 
     @classmethod
     def get_config(cls, args: list[str], groupid: int = 0) -> str:
@@ -160,14 +590,17 @@ class ConfigHandler:
             return_message = MessageDefine.args_error_get_command
         elif groupid == 0:
             return_message = MessageDefine.command_get_sueccess(args[1], str(
-                cls.config.__getattribute__(args[1])))
+                cls.snapshot.to_dict().get(args[1])))
             if return_message == "":
                 return_message = MessageDefine.conf_is_none
-        else:
+        elif groupid in cls.snapshot.groups and args[1] in cls.config_list_group:
+            group = cls.snapshot.groups[groupid]
             return_message = MessageDefine.command_get_sueccess(args[1], str(
-                cls.config.mc_qqgroup_default_server[groupid][args[1]]))
+                group.backends_text if args[1] == "backends" else getattr(group, args[1])))
             if return_message == "":
                 return_message = MessageDefine.conf_is_none
+        else:
+            return_message = MessageDefine.args_error_get_command
 
         return return_message
 
@@ -182,17 +615,21 @@ class ConfigHandler:
 
             if len(args) != 3 or (args[1] not in cls.config_list_superuser and args[1] not in cls.config_list_group):
                 return_message = MessageDefine.args_error_set_command
-            elif groupid == 0:
-                cls.config.__setattr__(args[1], value)
+            elif groupid == 0 and args[1] in cls.config_list_superuser:     # 群参数（server_address等）不能写到全局配置中
+                if args[1] in ("mc_qqgroup_id", "mc_qqgroup_default_server"):
+                    value = convert_string(args[2])
+                cls.replace_config(**{args[1]: value})
                 cls.save_config()
                 return_message = MessageDefine.command_set_sueccess(args[1], args[2])
-            else:
-                cls.config.mc_qqgroup_default_server[groupid][args[1]] = value
-                cls.save_config()
+            elif groupid != 0 and groupid in cls.snapshot.groups and args[1] in cls.config_list_group:
+                group = cls.snapshot.groups[groupid]
+                cls.replace_group(GroupConfig.from_dict(groupid, {**group.to_dict(), args[1]: value}))
                 return_message = MessageDefine.command_set_sueccess(args[1], args[2])
+            else:
+                return_message = MessageDefine.args_error_set_command
         except IndexError:
             return_message = MessageDefine.conf_get_args_is_none
-        except (ValueError, SyntaxError):
+        except (ValueError, SyntaxError, ValidationError):
             return_message = MessageDefine.args_error_set_command
 
         return return_message
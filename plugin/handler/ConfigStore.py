@@ -0,0 +1,159 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+QQ群配置存储类 ConfigStore.py 2026-10-19
+Author: AptS:1547
+
+GroupStore类把每个QQ群的设置保存在SQLite（WAL模式）中，修改单个群只写一行，不用重写整个config.yml，提供了以下方法：
+load: 读取全部获准群号和群设置
+upsert_group: 添加或更新一个群（单个事务）
+delete_group: 删除一个群（单个事务）
+import_groups: 批量导入（用于从config.yml迁移）
+replace_groups: 用给定的群配置替换数据库中的全部群
+is_empty: 数据库中是否还没有任何群
+close: 关闭数据库连接
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+
+from .ConfigHandler import GroupConfig, parse_backends   # pylint: disable=relative-beyond-top-level
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS allowed_group (
+    group_id INTEGER PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS group_config (
+    group_id INTEGER PRIMARY KEY,
+    server_address TEXT NOT NULL DEFAULT '',
+    default_icon_type TEXT NOT NULL DEFAULT 'Server Icon',
+    default_icon TEXT NOT NULL DEFAULT '',
+    need_scan INTEGER NOT NULL DEFAULT 0,
+    backends TEXT NOT NULL DEFAULT '',
+    rcon_address TEXT NOT NULL DEFAULT '',
+    rcon_password TEXT NOT NULL DEFAULT ''
+);
+"""
+
+
+class GroupStore:
+    """QQ群配置的SQLite存储"""
+
+    def __init__(self, db_path: str | Path) -> None:
+        """
+        打开（必要时创建）数据库
+        :param db_path: 数据库文件路径
+        """
+        self.db_path = Path(db_path)
+        self.connection = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(group_config)")}
+        for column in ("backends", "rcon_address", "rcon_password"):
+            if column not in columns:           # 旧版本创建的数据库
+                self.connection.execute(f"ALTER TABLE group_config ADD COLUMN {column} TEXT NOT NULL DEFAULT ''")
+
+    def load(self) -> tuple[list[int], dict[int, GroupConfig]]:
+        """读取全部获准群号和群设置"""
+        group_ids = [row[0] for row in self.connection.execute("SELECT group_id FROM allowed_group ORDER BY rowid")]
+        groups = {
+            row[0]: GroupConfig(group_id=row[0], server_address=row[1], default_icon_type=row[2],
+                                default_icon=row[3], need_scan=bool(row[4]),
+                                backends=parse_backends(json.loads(row[5])) if row[5] else (),
+                                rcon_address=row[6], rcon_password=row[7])
+            for row in self.connection.execute(
+                "SELECT group_id, server_address, default_icon_type, default_icon, need_scan, backends, "
+                "rcon_address, rcon_password FROM group_config")
+        }
+        return group_ids, groups
+
+    def is_empty(self) -> bool:
+        """数据库中是否还没有任何群"""
+        return (self.connection.execute("SELECT 1 FROM allowed_group LIMIT 1").fetchone() is None
+                and self.connection.execute("SELECT 1 FROM group_config LIMIT 1").fetchone() is None)
+
+    def upsert_group(self, group: GroupConfig | None, groupid: int, allowed: bool = True) -> None:
+        """
+        添加或更新一个群，在一个事务里完成
+        :param group: 群设置，为None时只修改获准名单
+        :param groupid: 群号
+        :param allowed: 是否在获准名单内
+        """
+        with self._transaction() as cursor:
+            if allowed:
+                cursor.execute("INSERT OR IGNORE INTO allowed_group (group_id) VALUES (?)", (groupid,))
+            else:
+                cursor.execute("DELETE FROM allowed_group WHERE group_id = ?", (groupid,))
+            if group is not None:
+                cursor.execute(
+                    "INSERT INTO group_config (group_id, server_address, default_icon_type, default_icon, need_scan, backends, "
+                    "rcon_address, rcon_password) VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT(group_id) DO UPDATE SET "
+                    "server_address = excluded.server_address, default_icon_type = excluded.default_icon_type, "
+                    "default_icon = excluded.default_icon, need_scan = excluded.need_scan, backends = excluded.backends, "
+                    "rcon_address = excluded.rcon_address, rcon_password = excluded.rcon_password",
+                    self._row(group))
+
+    def delete_group(self, groupid: int) -> None:
+        """删除一个群（获准名单和群设置）"""
+        with self._transaction() as cursor:
+            cursor.execute("DELETE FROM allowed_group WHERE group_id = ?", (groupid,))
+            cursor.execute("DELETE FROM group_config WHERE group_id = ?", (groupid,))
+
+    def import_groups(self, group_ids: list[int], groups: dict[int, GroupConfig]) -> None:
+        """批量导入，已有的群会被覆盖"""
+        with self._transaction() as cursor:
+            self._insert_groups(cursor, group_ids, groups)
+
+    def replace_groups(self, group_ids: list[int], groups: dict[int, GroupConfig]) -> None:
+        """用给定的群配置替换数据库中的全部群（单个事务）"""
+        with self._transaction() as cursor:
+            cursor.execute("DELETE FROM allowed_group")
+            cursor.execute("DELETE FROM group_config")
+            self._insert_groups(cursor, group_ids, groups)
+
+    @staticmethod
+    def _insert_groups(cursor: sqlite3.Cursor, group_ids: list[int], groups: dict[int, GroupConfig]) -> None:
+        """在已有事务中批量写入"""
+        cursor.executemany("INSERT OR IGNORE INTO allowed_group (group_id) VALUES (?)",
+                           [(groupid,) for groupid in group_ids])
+        cursor.executemany(
+            "INSERT OR REPLACE INTO group_config (group_id, server_address, default_icon_type, default_icon, need_scan, backends, "
+            "rcon_address, rcon_password) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [GroupStore._row(group) for group in groups.values()])
+
+    @staticmethod
+    def _row(group: GroupConfig) -> tuple:
+        """群设置对应的一行，子服务器保存为JSON对象"""
+        backends = json.dumps(dict(group.backends), ensure_ascii=False) if group.backends else ""
+        return (group.group_id, group.server_address, group.default_icon_type, group.default_icon,
+                int(group.need_scan), backends, group.rcon_address, group.rcon_password)
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        self.connection.close()
+
+    def _transaction(self):
+        """BEGIN IMMEDIATE 事务，出错自动回滚"""
+        return _Transaction(self.connection)
+
+
+class _Transaction:
+    """简单的事务上下文"""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.connection = connection
+        self.cursor = connection.cursor()
+
+    def __enter__(self) -> sqlite3.Cursor:
+        self.cursor.execute("BEGIN IMMEDIATE")
+        return self.cursor
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.cursor.execute("COMMIT")
+        else:
+            self.cursor.execute("ROLLBACK")
+        self.cursor.close()
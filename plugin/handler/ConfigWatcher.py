@@ -0,0 +1,105 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+配置文件监视类 ConfigWatcher.py 2026-10-19
+Author: AptS:1547
+
+ConfigWatcher类监视config.yml，手动编辑后自动校验并应用，提供了以下方法：
+start: 启动监视任务（有watchfiles时使用inotify等系统通知，否则按mtime轮询）
+stop: 停止监视任务
+check: 去抖后在线程中读取并校验新文件，有效时调用回调应用新配置
+"""
+
+import asyncio
+import os
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from nonebot import logger
+
+from .ConfigHandler import Config, ConfigHandler   # pylint: disable=relative-beyond-top-level
+
+
+class ConfigWatcher:
+    """配置文件监视类"""
+    DEBOUNCE_SECOND = 1.0       # 最后一次变化后等待多久才读取，编辑器保存时常常连续写好几次
+    POLL_INTERVAL_SECOND = 2.0  # 没有watchfiles时的轮询间隔
+
+    def __init__(self, path: str | Path, on_change: Callable[[Config], Awaitable[None]]) -> None:
+        """
+        :param path: 监视的配置文件
+        :param on_change: 新文件校验通过后调用，参数为新的Config
+        """
+        self.path = Path(path)
+        self.on_change = on_change
+        self.task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """启动监视任务"""
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run(), name="epmc config watcher")
+
+    async def stop(self) -> None:
+        """停止监视任务"""
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    async def _run(self) -> None:
+        """监视主循环"""
+        try:
+            from watchfiles import awatch  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            awatch = None
+
+        if awatch is not None:
+            logger.debug(f"[epmc_minecraft_bot] 使用watchfiles监视配置文件 {self.path}")
+            # 监视所在目录：原子写入是rename覆盖，直接监视文件会丢失后续事件
+            # step: 安静这么久才交付这一批变化（去抖）；debounce: 持续变化时最多攒这么久
+            async for changes in awatch(self.path.parent, step=int(self.DEBOUNCE_SECOND * 1000),
+                                        debounce=int(self.DEBOUNCE_SECOND * 10000),
+                                        watch_filter=lambda _, changed: Path(changed) == self.path):
+                if changes:
+                    await self.check()
+        else:
+            logger.debug(f"[epmc_minecraft_bot] 按mtime轮询配置文件 {self.path}")
+            last_mtime = self._mtime()
+            while True:
+                await asyncio.sleep(self.POLL_INTERVAL_SECOND)
+                mtime = self._mtime()
+                if mtime == last_mtime:
+                    continue
+                # 去抖：等文件在一个去抖窗口内不再变化
+                while True:
+                    await asyncio.sleep(self.DEBOUNCE_SECOND)
+                    settled = self._mtime()
+                    if settled == mtime:
+                        break
+                    mtime = settled
+                last_mtime = mtime
+                await self.check()
+
+    def _mtime(self) -> int:
+        """文件mtime，文件不存在时为0"""
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return 0
+
+    async def check(self) -> bool:
+        """在线程中读取并校验新文件，有效且与当前内容不同时应用，返回是否应用"""
+        config, error, digest = await asyncio.to_thread(ConfigHandler.read_config_file, self.path)
+        if config is None:
+            logger.error(f"{error}\n[epmc_minecraft_bot] 已忽略本次修改，继续使用当前配置")
+            return False
+        if digest == ConfigHandler.file_digest:     # 插件自己写入的，或者内容没有变化
+            return False
+        ConfigHandler.file_digest = digest
+        await self.on_change(config)
+        logger.info("[epmc_minecraft_bot] 检测到配置文件变化，已应用新配置")
+        return True
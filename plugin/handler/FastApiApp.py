@@ -0,0 +1,35 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+FastAPI应用获取类 FastApiApp.py 2026-10-19
+Author: AptS:1547
+
+FastApiApp类获取NoneBot驱动器的FastAPI应用，HTTP状态接口（StatusApi）和图片路由（ImageStore）共用，提供了以下方法：
+get: 返回可以注册路由的FastAPI应用，驱动器不是FastAPI时记录警告并返回None
+"""
+
+from nonebot import logger
+
+
+class FastApiApp:
+    """NoneBot驱动器的FastAPI应用"""
+
+    @staticmethod
+    def get(feature: str):
+        """
+        获取FastAPI应用
+        :param feature: 要注册的功能名称，写在警告日志中
+        :return: FastAPI应用，驱动器不是FastAPI（或者没有安装fastapi）时返回None
+        """
+        try:
+            import nonebot  # pylint: disable=import-outside-toplevel
+            import fastapi  # pylint: disable=import-outside-toplevel, unused-import
+            app = nonebot.get_app()
+        except (ImportError, ValueError) as e:
+            logger.warning(f"[epmc_minecraft_bot] 当前驱动器不支持{feature}：{e}")
+            return None
+        if not hasattr(app, "add_api_route"):
+            logger.warning(f"[epmc_minecraft_bot] 当前驱动器不是FastAPI，无法注册{feature}")
+            return None
+        return app
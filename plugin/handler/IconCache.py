@@ -0,0 +1,199 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+图标缓存类 IconCache.py 2026-10-19
+Author: AptS:1547
+
+IconCache类缓存解码后的图标，每个图标只解码一次、每种尺寸只缩放和加圆角一次，提供了以下方法：
+server_icon: 服务器favicon
+group_icon: 群自定义图标（base64 pic / file route / Picture Internet Address）
+global_icon: 全局默认图标（mc_global_default_icon）
+prepared: 获取已缩放、已加圆角的图标
+preload: 在线程中预先解码（包括下载）配置中的自定义图标
+round_corner: 给图片加上圆角效果
+
+缓存条目记录了解码时的源数据，配置快照中的图标变化后会自动重新解码，不需要手动失效
+两个缓存都登记在MemoryBudget中，除了条目数上限，还受全局内存预算约束
+"""
+
+import asyncio
+import base64
+import hashlib
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+
+import requests
+from nonebot import logger
+from PIL import Image, ImageDraw
+
+from .ConfigHandler import ConfigSnapshot, GroupConfig   # pylint: disable=relative-beyond-top-level
+from .MemoryBudget import MemoryBudget                   # pylint: disable=relative-beyond-top-level
+from .PictureDefine import PictureDefine                 # pylint: disable=relative-beyond-top-level
+
+
+def _digest(value: str) -> str:
+    """图标源数据的短摘要，作为缓存键的一部分"""
+    return hashlib.sha1(value.encode("utf-8")).hexdigest()[:16]
+
+
+def _open_base64(value: str) -> Image.Image:
+    """解码base64图片，允许带base64://或data:image/...;base64,前缀"""
+    value = value.removeprefix("base64://")
+    if value.startswith("data:image/"):
+        value = value.split(",", 1)[1]
+    image = Image.open(BytesIO(base64.b64decode(value)))
+    image.load()
+    return image
+
+
+def _open_file(value: str) -> Image.Image:
+    """打开本地图片文件"""
+    with Image.open(Path(value)) as image:
+        image.load()
+        return image.copy()
+
+
+def _open_url(value: str) -> Image.Image:
+    """下载网络图片"""
+    response = requests.get(value, timeout=5)
+    response.raise_for_status()
+    image = Image.open(BytesIO(response.content))
+    image.load()
+    return image
+
+
+class IconCache:
+    """图标缓存类"""
+    MAX_DECODED = 128           # 解码后的原图数量上限
+    MAX_PREPARED = 128          # 已缩放、已加圆角的图标数量上限
+
+    _decoded: OrderedDict = OrderedDict()     # key -> (源数据, Image或None)
+    _prepared: OrderedDict = OrderedDict()    # (key, 宽, 高, 圆角) -> Image
+    _pending: set[str] = set()                # 正在后台下载的网络图标
+
+    # 超出预算时先淘汰缩放好的图标（重新缩放只要几毫秒），解码后的原图重建代价更高
+    _prepared_memory = MemoryBudget.register("icon.prepared", _prepared, priority=0)
+    _decoded_memory = MemoryBudget.register("icon.decoded", _decoded, priority=2)
+
+    @classmethod
+    def _get(cls, key: str, source: str, loader) -> Image.Image | None:
+        """取出或解码一个图标，解码失败也会被缓存（None），不会每次重试"""
+        entry = cls._decoded_memory.get(key)
+        if entry is not None and entry[0] == source:
+            return entry[1]
+        try:
+            image = loader(source)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning(f"[epmc_minecraft_bot] 图标 {key} 无法解码：{e}")
+            image = None
+        cls._decoded_memory.put(key, (source, image), cls.MAX_DECODED)
+        return image
+
+    @classmethod
+    def _peek(cls, key: str, source: str) -> tuple[bool, Image.Image | None]:
+        """只查缓存，不解码：返回(是否已缓存, 图标)"""
+        entry = cls._decoded_memory.get(key)
+        if entry is not None and entry[0] == source:
+            return True, entry[1]
+        return False, None
+
+    @classmethod
+    def server_icon(cls, favicon: str) -> str:
+        """解码服务器favicon，返回缓存键（解码失败时返回black）"""
+        key = f"server:{_digest(favicon)}"
+        return key if cls._get(key, favicon, _open_base64) is not None else "black"
+
+    @classmethod
+    def group_icon(cls, group: GroupConfig | None, allow_network: bool = False) -> str | None:
+        """
+        群自定义图标的缓存键，没有自定义图标或无法解码时返回None
+        网络图片只有allow_network为True（在线程中预加载）时才会下载，消息处理时只读缓存
+        """
+        if group is None or group.default_icon == "":
+            return None
+        key = f"group:{group.group_id}:{_digest(group.default_icon_type + group.default_icon)}"
+        match group.default_icon_type:
+            case "base64 pic":
+                image = cls._get(key, group.default_icon, _open_base64)
+            case "file route":
+                image = cls._get(key, group.default_icon, _open_file)
+            case "Picture Internet Address":
+                if allow_network:
+                    image = cls._get(key, group.default_icon, _open_url)
+                else:
+                    cached, image = cls._peek(key, group.default_icon)
+                    if not cached:
+                        cls._fetch_later(key, group)
+            case _:
+                image = None
+        return key if image is not None else None
+
+    @classmethod
+    def _fetch_later(cls, key: str, group: GroupConfig) -> None:
+        """在线程中下载网络图标，本次先退回下一级图标，下载完成后的请求就能用上"""
+        if key in cls._pending:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        cls._pending.add(key)
+        future = loop.run_in_executor(None, cls.group_icon, group, True)
+        future.add_done_callback(lambda _: cls._pending.discard(key))
+
+    @classmethod
+    def global_icon(cls, value: str) -> str | None:
+        """全局默认图标的缓存键，没有设置或无法解码时返回None"""
+        if value == "":
+            return None
+        key = f"global:{_digest(value)}"
+        return key if cls._get(key, value, _open_base64) is not None else None
+
+    @classmethod
+    def prepared(cls, key: str, width: int, height: int, radius: int) -> Image.Image:
+        """已缩放、已加圆角的图标（共享对象，不要修改）；缓存中找不到原图时使用黑色图标"""
+        prepared_key = (key, width, height, radius)
+        image = cls._prepared_memory.get(prepared_key)
+        if image is not None:
+            return image
+
+        entry = cls._decoded_memory.get(key)
+        if entry is None or entry[1] is None:
+            if key != "black":                  # 原图已被淘汰，不缓存这次退回的黑色图标
+                return cls.prepared("black", width, height, radius)
+            source = PictureDefine.image("Black")
+        else:
+            source = entry[1]
+        image = cls.round_corner(source.convert("RGBA").resize((width, height)), radius)
+        cls._prepared_memory.put(prepared_key, image, cls.MAX_PREPARED)
+        return image
+
+    @classmethod
+    def preload(cls, snapshot: ConfigSnapshot) -> None:
+        """预先解码全局图标和群自定义图标（包括下载网络图片），会阻塞，应在线程中调用"""
+        cls.global_icon(snapshot.config.mc_global_default_icon)
+        loaded = 0
+        for group in snapshot.groups.values():
+            if loaded >= cls.MAX_DECODED // 2:          # 留一半位置给服务器图标
+                break
+            if cls.group_icon(group, allow_network=True) is not None:
+                loaded += 1
+
+    @staticmethod
+    def round_corner(img: Image.Image, rad: int = 0) -> Image.Image:
+        """给图片加上圆角效果"""
+        if rad <= 0:
+            return img
+        circle = Image.new('L', (rad * 2, rad * 2), 0)
+        draw = ImageDraw.Draw(circle)
+        draw.ellipse((0, 0, rad * 2, rad * 2), fill=255)
+        alpha = Image.new('L', img.size, 255)
+        w, h = img.size
+        alpha.paste(circle.crop((0, 0, rad, rad)), (0, 0))
+        alpha.paste(circle.crop((0, rad, rad, rad * 2)), (0, h - rad))
+        alpha.paste(circle.crop((rad, 0, rad * 2, rad)), (w - rad, 0))
+        alpha.paste(circle.crop((rad, rad, rad * 2, rad * 2)), (w - rad, h - rad))
+        img.putalpha(alpha)
+        return img
@@ -0,0 +1,164 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+图片缓存类 ImageStore.py 2026-10-19
+Author: AptS:1547
+
+ImageStore类把要发送的图片按内容哈希保存到本地缓存目录，发送时只传file://路径或URL，提供了以下方法：
+configure: 设置缓存目录和大小上限
+put: 保存图片（相同内容只写一次），超过大小上限时删除最久没用过的图片
+source: 按发送方式返回MessageSegment.image可用的file://路径、URL或base64://字符串
+path: 按文件名取缓存中的图片路径（HTTP路由使用）
+register_route: 在NoneBot的FastAPI驱动器上注册图片HTTP路由
+
+configure/put/path/source会扫描目录、写入和删除文件，应该在线程池中调用；缓存索引由锁保护，可以在多个线程中同时使用
+
+发送方式（mc_image_delivery）：
+base64: 和以前一样内联base64，兼容所有OneBot实现
+file: 发送file://路径，要求OneBot实现和NoneBot在同一台机器上
+http: 发送 mc_image_http_base_url + /epmc/images/<文件名>，图片由NoneBot的HTTP服务器提供
+"""
+
+import base64
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from nonebot import logger
+
+from .AtomicFile import AtomicFile  # pylint: disable=relative-beyond-top-level
+from .FastApiApp import FastApiApp  # pylint: disable=relative-beyond-top-level
+
+ROUTE_PREFIX = "/epmc/images"
+_NAME = re.compile(r"^[0-9a-f]{32}\.(jpg|png|webp)$")
+_MEDIA_TYPES = {"jpg": "image/jpeg", "png": "image/png", "webp": "image/webp"}
+
+
+class ImageStore:
+    """按内容寻址的本地图片缓存"""
+    directory: Path | None = None
+    max_bytes: int = 64 * 1024 * 1024
+    route_registered: bool = False
+
+    _files: OrderedDict = OrderedDict()   # 文件名 -> 大小，按最近使用排序
+    _loaded: bool = False                 # 是否已经扫描过当前的缓存目录
+    _total: int = 0
+    _lock = threading.RLock()
+
+    @classmethod
+    def configure(cls, directory: str | Path, max_bytes: int) -> None:
+        """设置缓存目录和大小上限，目录变化时重新扫描"""
+        directory = Path(directory)
+        with cls._lock:
+            if directory != cls.directory:
+                cls.directory = directory
+                cls._files = OrderedDict()
+                cls._total = 0
+                cls._loaded = False
+            cls.max_bytes = max_bytes
+            if cls._loaded:
+                cls._evict()
+
+    @classmethod
+    def _load(cls) -> OrderedDict:
+        """首次使用时扫描缓存目录，按修改时间恢复使用顺序"""
+        if not cls._loaded:
+            cls.directory.mkdir(parents=True, exist_ok=True)
+            entries = []
+            for file in cls.directory.iterdir():
+                if _NAME.match(file.name):
+                    stat = file.stat()
+                    entries.append((stat.st_mtime, file.name, stat.st_size))
+            cls._files = OrderedDict((name, size) for _, name, size in sorted(entries))
+            cls._total = sum(cls._files.values())
+            cls._loaded = True
+        return cls._files
+
+    @classmethod
+    def put(cls, data: bytes, suffix: str = "jpg") -> Path:
+        """保存图片并返回路径，内容相同的图片只写一次"""
+        name = f"{hashlib.sha256(data).hexdigest()[:32]}.{suffix}"
+        with cls._lock:
+            files = cls._load()
+            path = cls.directory / name
+            if name in files:
+                files.move_to_end(name)
+                return path
+
+            AtomicFile.write(path, data, sync=False)      # 缓存文件丢了重新生成就行，不需要fsync
+            files[name] = len(data)
+            cls._total += len(data)
+            cls._evict(keep=name)
+            return path
+
+    @classmethod
+    def _evict(cls, keep: str | None = None) -> None:
+        """超过大小上限时删除最久没用过的图片"""
+        files = cls._files
+        while cls._total > cls.max_bytes and len(files) > 1:
+            name, size = next(iter(files.items()))
+            if name == keep:
+                files.move_to_end(name)
+                continue
+            del files[name]
+            cls._total -= size
+            try:
+                (cls.directory / name).unlink()
+            except FileNotFoundError:
+                pass
+
+    @classmethod
+    def path(cls, name: str) -> Path | None:
+        """按文件名取缓存中的图片路径，文件名不合法或不存在时返回None"""
+        if cls.directory is None or not _NAME.match(name):
+            return None
+        with cls._lock:
+            files = cls._load()
+            if name not in files:
+                return None
+            files.move_to_end(name)
+            return cls.directory / name
+
+    @classmethod
+    def source(cls, data: bytes, delivery: str = "base64", base_url: str = "", suffix: str = "jpg") -> str:
+        """
+        返回MessageSegment.image可用的图片来源
+        :param delivery: base64/file/http，缓存目录不可用或http路由没有注册时退回base64
+        :param base_url: http方式下OneBot实现访问NoneBot的地址，例如http://127.0.0.1:8080
+        """
+        if delivery != "base64" and cls.directory is not None:
+            try:
+                path = cls.put(data, suffix)
+                if delivery == "file":
+                    return path.resolve().as_uri()
+                if delivery == "http" and cls.route_registered and base_url:
+                    return f"{base_url.rstrip('/')}{ROUTE_PREFIX}/{path.name}"
+            except OSError as e:
+                logger.warning(f"[epmc_minecraft_bot] 图片缓存写入失败，改用base64发送：{e}")
+        return "base64://" + base64.b64encode(data).decode("utf-8")
+
+    @classmethod
+    def register_route(cls) -> bool:
+        """在FastAPI驱动器上注册图片路由，驱动器不是FastAPI时返回False（http方式会退回base64）"""
+        if cls.route_registered:
+            return True
+        app = FastApiApp.get("图片HTTP路由")
+        if app is None:
+            return False
+        from fastapi import HTTPException  # pylint: disable=import-outside-toplevel
+        from fastapi.responses import FileResponse  # pylint: disable=import-outside-toplevel
+
+        def serve_image(name: str):       # 普通函数，FastAPI在线程池中执行，首次扫描目录时不阻塞事件循环
+            path = cls.path(name)
+            if path is None:
+                raise HTTPException(status_code=404)
+            # 文件名就是内容哈希，内容永远不会变
+            return FileResponse(path, media_type=_MEDIA_TYPES[name.rsplit(".", 1)[1]],
+                                headers={"Cache-Control": "public, max-age=31536000, immutable"})
+
+        app.add_api_route(f"{ROUTE_PREFIX}/{{name}}", serve_image, methods=["GET"])
+        cls.route_registered = True
+        return True
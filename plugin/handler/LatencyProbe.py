@@ -0,0 +1,130 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+延迟采样类 LatencyProbe.py 2026-10-19
+Author: AptS:1547
+
+LatencyProbe类对已经确认在线的服务器连续测量多次延迟（mc_ping_latency_samples大于1时），提供了以下方法：
+measure: 按服务器类型采样，返回LatencyStats
+java: Java版，握手后只发ping/pong（不再请求状态JSON），计时不包括建立连接
+bedrock: 基岩版，在同一个UDP socket上连续发送Unconnected Ping，按回显的时间戳对应Pong
+
+LatencyStats是一组样本的统计：样本数、最小值、中位数、p95、抖动（相邻两个样本之差的平均值）和丢失数
+
+Java版服务器回复pong后就会关闭连接，同一个连接上只能测一次，所以Java版的每个样本是一个新连接，
+地址只解析一次；单次status只有一个样本（基岩版的还包括创建socket），采样后~ping和状态卡片改用中位数
+"""
+
+import asyncio
+import socket
+import struct
+import time
+from dataclasses import dataclass
+from statistics import median, quantiles
+
+SAMPLE_TIMEOUT = 2.0        # 单个样本的超时（秒），超时计为丢失
+RAKNET_MAGIC = bytes.fromhex("00ffff00fefefefefdfdfdfd12345678")
+UNCONNECTED_PING, UNCONNECTED_PONG = 0x01, 0x1C
+
+
+@dataclass(frozen=True, slots=True)
+class LatencyStats:
+    """一组延迟样本的统计（毫秒）"""
+    count: int
+    minimum: float
+    median: float
+    p95: float
+    jitter: float
+    lost: int = 0
+
+    @classmethod
+    def from_samples(cls, samples, lost: int = 0) -> "LatencyStats | None":
+        """从样本计算统计值，没有样本时返回None"""
+        samples = list(samples)
+        if not samples:
+            return None
+        p95 = quantiles(samples, n=20, method="inclusive")[18] if len(samples) > 1 else samples[0]
+        jitter = sum(abs(b - a) for a, b in zip(samples, samples[1:])) / (len(samples) - 1) if len(samples) > 1 else 0.0
+        return cls(len(samples), min(samples), median(samples), p95, jitter, lost)
+
+    def as_dict(self) -> dict:
+        """JSON格式（HTTP状态接口使用）"""
+        return {"samples": self.count, "min": round(self.minimum, 2), "median": round(self.median, 2),
+                "p95": round(self.p95, 2), "jitter": round(self.jitter, 2), "lost": self.lost}
+
+
+class _PongProtocol(asyncio.DatagramProtocol):
+    """收集Pong数据包"""
+
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        self.queue.put_nowait((time.perf_counter(), data))
+
+    def error_received(self, exc: Exception) -> None:
+        """ICMP不可达之类的错误，等待超时计为丢失即可"""
+
+
+class LatencyProbe:
+    """多次延迟采样"""
+
+    @classmethod
+    async def measure(cls, server_type: str, address: tuple[str, int], count: int, first: float | None = None) -> LatencyStats | None:
+        """
+        按服务器类型采样
+        :param address: status使用的(host, port)（Java版是SRV解析之后的地址）
+        :param count: 样本数
+        :param first: 已有的一个样本（Java版status在同一连接上测得的延迟），计入样本数
+        """
+        host, port = address
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, port, type=socket.SOCK_DGRAM if server_type == "Bedrock" else socket.SOCK_STREAM)
+        endpoint = infos[0][4][:2]          # 只解析一次，之后的样本都不再查询DNS
+        if server_type == "Bedrock":
+            samples, lost = await cls.bedrock(endpoint, count)
+        else:
+            samples, lost = await cls.java(endpoint, count - 1 if first is not None else count)
+            if first is not None:
+                samples.insert(0, first)
+        return LatencyStats.from_samples(samples, lost)
+
+    @staticmethod
+    async def java(endpoint: tuple[str, int], count: int) -> tuple[list[float], int]:
+        """Java版：每个样本握手后发送一次ping，只计ping到pong的时间，返回(样本, 丢失数)"""
+        from mcstatus import JavaServer  # pylint: disable=import-outside-toplevel
+
+        server = JavaServer(*endpoint, timeout=SAMPLE_TIMEOUT)
+        samples, lost = [], 0
+        for _ in range(count):
+            try:
+                samples.append(await server.async_ping())
+            except (OSError, ValueError, asyncio.TimeoutError):
+                lost += 1
+        return samples, lost
+
+    @staticmethod
+    async def bedrock(endpoint: tuple[str, int], count: int) -> tuple[list[float], int]:
+        """基岩版：同一个UDP socket上依次发送Unconnected Ping，返回(样本, 丢失数)"""
+        loop = asyncio.get_running_loop()
+        transport, protocol = await loop.create_datagram_endpoint(_PongProtocol, remote_addr=endpoint)
+        samples, lost = [], 0
+        try:
+            for token in range(1, count + 1):
+                stamp = struct.pack(">q", token)
+                sent = time.perf_counter()
+                transport.sendto(bytes([UNCONNECTED_PING]) + stamp + RAKNET_MAGIC + struct.pack(">q", 0))
+                deadline = sent + SAMPLE_TIMEOUT
+                while True:
+                    try:
+                        received, data = await asyncio.wait_for(protocol.queue.get(), deadline - time.perf_counter())
+                    except asyncio.TimeoutError:
+                        lost += 1
+                        break
+                    if data[:1] == bytes([UNCONNECTED_PONG]) and data[1:9] == stamp:   # 前面超时的Pong迟到时直接丢掉
+                        samples.append((received - sent) * 1000)
+                        break
+        finally:
+            transport.close()
+        return samples, lost
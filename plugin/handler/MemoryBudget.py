@@ -0,0 +1,195 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+内存预算类 MemoryBudget.py 2026-10-19
+Author: AptS:1547
+
+MemoryBudget类统计插件各个缓存占用的内存，并让它们共用一个字节预算（mc_memory_budget_mb），提供了以下方法：
+register: 登记一个缓存（按最近使用排序的OrderedDict），返回CacheAccount，之后通过它读取、写入和淘汰
+register_probe: 登记一个只统计、不淘汰的占用（例如发送队列）
+configure: 设置预算，超出时立即淘汰
+enforce: 超出预算时按优先级从低到高淘汰各缓存中最久没用过的条目
+usage: 各缓存的条目数、估算字节数和被预算淘汰的次数
+snapshot/diff/stop_tracing: 可选的tracemalloc快照，对比两次之间新增内存最多的代码位置
+
+估算只计主要的数据：PIL图片按 宽x高x通道数，字符串/bytes按长度（base64图片就是它的长度），
+不是精确的进程内存，但足够看出哪个缓存在增长；各缓存原有的条目数上限仍然有效
+（tracemalloc只能看到Python分配的内存，PIL图片的像素数据不在其中，所以缓存的占用要自己估算）
+"""
+
+import sys
+import threading
+import tracemalloc
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+
+def estimate_size(value: Any) -> int:
+    """估算缓存值占用的字节数"""
+    if value is None:
+        return 0
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    if isinstance(value, (tuple, list)):
+        return sum(estimate_size(item) for item in value)
+    if hasattr(value, "getbands"):              # PIL图片：像素数据
+        width, height = value.size
+        return width * height * len(value.getbands())
+    data = getattr(value, "data", None)         # MessageSegment：主要是图片的base64://字符串
+    if isinstance(data, dict):
+        return sum(estimate_size(item) for item in data.values() if isinstance(item, (bytes, str)))
+    return sys.getsizeof(value)
+
+
+class CacheAccount:
+    """登记在MemoryBudget中的一个缓存，写入和淘汰都通过它进行，才能记下占用的字节数"""
+    __slots__ = ("name", "entries", "priority", "min_entries", "sizeof", "bytes", "evictions")
+
+    def __init__(self, name: str, entries: OrderedDict, priority: int, min_entries: int,
+                 sizeof: Callable[[Any], int]) -> None:
+        self.name = name
+        self.entries = entries
+        self.priority = priority
+        self.min_entries = min_entries
+        self.sizeof = sizeof
+        self.bytes = 0
+        self.evictions = 0
+
+    def get(self, key: Any) -> Any:
+        """读取一个条目并标记为最近使用，不存在时返回None（状态卡片在渲染线程中也会读缓存）"""
+        with MemoryBudget.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+            return value
+
+    def put(self, key: Any, value: Any, max_entries: int | None = None) -> None:
+        """写入（替换）一个条目并放到最新，超过条目数上限或全局预算时淘汰最旧的条目"""
+        with MemoryBudget.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.bytes -= self.sizeof(old)
+            self.entries[key] = value
+            self.bytes += self.sizeof(value)
+            if max_entries is not None:
+                while len(self.entries) > max_entries:
+                    self.pop_oldest()
+            MemoryBudget.enforce()
+
+    def pop_oldest(self) -> int:
+        """淘汰最久没用过的条目，返回释放的字节数"""
+        _, value = self.entries.popitem(last=False)
+        size = self.sizeof(value)
+        self.bytes -= size
+        return size
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with MemoryBudget.lock:
+            self.entries.clear()
+            self.bytes = 0
+
+
+class MemoryBudget:
+    """插件缓存的内存统计和全局预算"""
+    budget_bytes: int = 128 * 1024 * 1024
+    lock = threading.RLock()            # 图标预加载在线程中写缓存
+
+    accounts: dict[str, CacheAccount] = {}
+    probes: dict[str, Callable[[], tuple[int, int]]] = {}
+    _baseline: tracemalloc.Snapshot | None = None
+
+    @classmethod
+    def register(cls, name: str, entries: OrderedDict, priority: int, min_entries: int = 1,
+                 sizeof: Callable[[Any], int] = estimate_size) -> CacheAccount:
+        """
+        登记一个缓存
+        :param priority: 超出预算时先淘汰priority小的缓存（重建代价低的排在前面）
+        :param min_entries: 预算淘汰时至少保留的条目数，刚写入的条目不会马上被淘汰
+        :param sizeof: 估算一个值的字节数
+        """
+        account = cls.accounts[name] = CacheAccount(name, entries, priority, min_entries, sizeof)
+        return account
+
+    @classmethod
+    def register_probe(cls, name: str, probe: Callable[[], tuple[int, int]]) -> None:
+        """登记一个只统计不淘汰的占用，probe返回(条目数, 字节数)"""
+        cls.probes[name] = probe
+
+    @classmethod
+    def configure(cls, budget_bytes: int) -> None:
+        """设置预算，变小时立即淘汰"""
+        cls.budget_bytes = budget_bytes
+        with cls.lock:
+            cls.enforce()
+
+    @classmethod
+    def used(cls) -> int:
+        """所有登记缓存的估算字节数"""
+        return sum(account.bytes for account in cls.accounts.values())
+
+    @classmethod
+    def enforce(cls) -> None:
+        """超出预算时按优先级淘汰（调用方持有lock）"""
+        excess = cls.used() - cls.budget_bytes
+        if excess <= 0:
+            return
+        for account in sorted(cls.accounts.values(), key=lambda account: account.priority):
+            while excess > 0 and len(account.entries) > account.min_entries:
+                excess -= account.pop_oldest()
+                account.evictions += 1
+            if excess <= 0:
+                return
+
+    @classmethod
+    def usage(cls) -> list[tuple[str, int, int, int | None]]:
+        """各缓存的(名称, 条目数, 估算字节数, 被预算淘汰的次数)，只统计的占用淘汰次数为None"""
+        with cls.lock:
+            result = [(account.name, len(account.entries), account.bytes, account.evictions)
+                      for account in sorted(cls.accounts.values(), key=lambda account: account.priority)]
+        result.extend((name, *probe(), None) for name, probe in cls.probes.items())
+        return result
+
+    @classmethod
+    def snapshot(cls) -> bool:
+        """
+        记录一个tracemalloc基准快照，之后用diff对比；没有在追踪时先开始追踪
+        :return: 这次是否刚开始追踪（刚开始时基准快照几乎是空的）
+        """
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        cls._baseline = cls._take_snapshot()
+        return started
+
+    @classmethod
+    def diff(cls, limit: int = 10) -> list[tuple[str, int, int]] | None:
+        """和基准快照相比新增内存最多的代码位置：[(文件:行号, 字节变化, 数量变化)]，没有基准快照时返回None"""
+        if cls._baseline is None or not tracemalloc.is_tracing():
+            return None
+        stats = cls._take_snapshot().compare_to(cls._baseline, "lineno")
+        result = []
+        for stat in stats[:limit]:
+            frame = stat.traceback[0]
+            location = "/".join(Path(frame.filename).parts[-2:])
+            result.append((f"{location}:{frame.lineno}", stat.size_diff, stat.count_diff))
+        return result
+
+    @classmethod
+    def stop_tracing(cls) -> None:
+        """停止tracemalloc并丢弃基准快照"""
+        cls._baseline = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @staticmethod
+    def _take_snapshot() -> tracemalloc.Snapshot:
+        """拍摄快照，去掉tracemalloc自身和导入机制的分配"""
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ))
@@ -8,12 +8,14 @@ Author: AptS:1547
 MessageDefine类用于存储命令的帮助信息
 """
 
+import time
+
 class MessageDefine:                                     #pylint: disable=missing-module-docstring, invalid-name, too-few-public-methods
     """定义一些变量，用于存储命令的帮助信息"""
-    private_superuser_command_help = "喵喵ap~ SuperUser菜单\n--------------------\n~conf help 展开本菜单\n~conf status 查看插件状态\n~conf reload 重载插件\n~conf scan start/stop 启动/停止服务器扫描\n~conf get 参数名 获取参数值\n~conf set 参数名 参数值 设置参数值\n~conf qqgroup add/del QQ群号\n\n--------------------\n参数名列表：\n   enable\n   mc_qqgroup_id\n   mc_global_default_server\n   mc_global_default_icon\n   mc_ping_server_interval_second\n   mc_qqgroup_default_server\n   mc_serverscaner_enable"
-    public_groupadmin_command_help = "喵喵ap~ GroupAdmin菜单\n--------------------\n~conf help 展开本菜单\n~conf status 查看插件状态\n~conf get 参数名 获取参数值\n~conf set 参数名 参数值 设置参数值\n\n--------------------\n参数名列表：\n   default_icon\n   default_icon_type\n   need_scan\n   server_address"
-    public_vwl_command_help = "喵喵ap~ 白名单管理菜单\n--------------------\n~vwl help 展开本菜单\n~vwl add/del 玩家名称 添加/删除白名单\n~vwl list 查看白名单列表"
-    group_help_message = "喵喵ap~ 人机菜单\n--------------------\n✅ ~help 展开本菜单\n✅ ~ping <服务器地址> 查询服务器状态\n🚧 ~vwl 白名单管理\n🆗 ~conf 机器人设置"
+    private_superuser_command_help = "喵喵ap~ SuperUser菜单\n--------------------\n~conf help 展开本菜单\n~conf status 查看插件状态\n~conf reload 重载插件\n~conf scan start/stop 启动/停止服务器扫描\n~conf get 参数名 获取参数值\n~conf set 参数名 参数值 设置参数值\n~conf qqgroup add/del QQ群号\n~conf export 导出全部配置到config.export.yml\n~conf import [文件] 从YAML导入群配置\n~conf trace [clear] 查看/清空~ping各阶段耗时\n~conf mem [snapshot/diff/stop] 查看缓存内存占用/对比tracemalloc快照\n\n--------------------\n参数名列表：\n   enable\n   mc_qqgroup_id\n   mc_global_default_server\n   mc_global_default_icon\n   mc_ping_server_interval_second\n   mc_qqgroup_default_server\n   mc_serverscaner_enable\n   mc_picture_layout\n   mc_prewarm_enable\n   mc_config_backend\n   mc_config_db_path\n   mc_config_watch_enable\n   mc_ratelimit_global_rate\n   mc_ratelimit_global_burst\n   mc_ratelimit_group_rate\n   mc_ratelimit_group_burst\n   mc_ratelimit_jitter_second\n   mc_ping_cooldown_second\n   mc_ping_multi_max\n   mc_ping_multi_concurrency\n   mc_ping_deadline_second\n   mc_vwl_enable\n   mc_vwl_file_path\n   mc_image_delivery\n   mc_image_cache_dir\n   mc_image_cache_max_mb\n   mc_image_http_base_url\n   mc_trace_enable\n   mc_trace_sink\n   mc_memory_budget_mb\n   mc_ping_progressive\n   mc_ping_render_deadline_second\n   mc_rcon_pool_size\n   mc_rcon_pipeline_depth\n   mc_rcon_timeout_second\n   mc_rcon_idle_second\n   mc_api_enable\n   mc_api_probe_enable\n   mc_api_token\n   mc_ping_latency_samples\n   mc_card_prewarm_enable\n   mc_card_prewarm_interval_second\n   mc_card_prewarm_concurrency\n   mc_query_enable\n   mc_scanner_state_enable\n   mc_scanner_state_max_age_second"
+    public_groupadmin_command_help = "喵喵ap~ GroupAdmin菜单\n--------------------\n~conf help 展开本菜单\n~conf status 查看插件状态\n~conf get 参数名 获取参数值\n~conf set 参数名 参数值 设置参数值\n\n--------------------\n参数名列表：\n   default_icon\n   default_icon_type\n   need_scan\n   server_address\n   backends（名称=地址,名称=地址）"
+    public_vwl_command_help = "喵喵ap~ 白名单管理菜单\n--------------------\n~vwl help 展开本菜单\n~vwl add 玩家名称 [UUID] 添加白名单\n~vwl del 玩家名称/UUID 删除白名单\n~vwl list [页码] 查看白名单列表"
+    group_help_message = "喵喵ap~ 人机菜单\n--------------------\n✅ ~help 展开本菜单\n✅ ~ping <服务器地址> 查询服务器状态，多个地址用空格或逗号分隔\n✅ ~who 查看服务器在线玩家\n✅ ~vwl 白名单管理\n🆗 ~conf 机器人设置\n🆗 ~rcon <命令> 在本群服务器的控制台执行命令"
 
     bot_is_connected_with_scanner = "[epmc_minecraft_bot] 机器人已上线，已启动对MC服务器的定时扫描"
     bot_is_connected_without_scanner = "[epmc_minecraft_bot] 机器人已上线，插件未启用或者未启用扫描服务器，无法启动对MC服务器的定时扫描"
@@ -25,25 +27,139 @@ class MessageDefine:                                     #pylint: disable=missin
     logger_reload_without_scanner = "[epmc_minecraft_bot] 重载配置文件，插件未启用或者未启用扫描服务器，无法重启对MC服务器的定时扫描"
     logger_reload_without_server = "[epmc_minecraft_bot] 重载配置文件，未设置需要扫描的服务器，无法重启对MC服务器的定时扫描"
     logger_reload_sth_wrong = "[epmc_minecraft_bot] 重载配置文件，发生错误，无法重启对MC服务器的定时扫描"
+    font_missing = "[epmc_minecraft_bot] 找不到字体文件 {}，状态卡片无法渲染，请按 resources/fonts/README.md 放入支持中文的字体"
 
     args_do_not_exist = "参数不存在，输入~conf help查看帮助信息"
     args_error_scan_command = "服务器扫描命令格式错误，正确用法：~conf scan start/stop"
     args_error_get_command = "获取参数值命令格式错误，正确用法：~conf get 参数名\n输入~conf help查看参数信息"
     args_error_set_command = "设置参数值命令格式错误，正确用法：~conf set 参数名 参数值\n输入~conf help查看参数信息"
+    args_error_vwl_command = "白名单命令格式错误，输入~vwl help查看帮助信息"
     args_error_qqgroup_command = "设置参数值命令格式错误，正确用法：~conf qqgroup add/del 123456789\n输入~conf help查看参数信息"
 
     command_qqgroup_add_exist = "此QQ群已存在"
     command_qqgroup_del_not_exist = "此QQ群不存在"
+    command_vwl_add_exist = "此玩家已在白名单内"
+    command_vwl_del_not_exist = "此玩家不在白名单内"
+
+    vwl_is_not_enable = "白名单功能未启用（mc_vwl_enable/mc_vwl_file_path，或本群的rcon_address）"
+    vwl_permission_denied = "只有群管理员可以修改白名单"
+    rcon_is_not_configured = "本群没有设置RCON（mc_qqgroup_default_server中的rcon_address/rcon_password）"
+    rcon_auth_failed = "RCON登录失败，请检查rcon_password"
+    args_error_rcon_command = "RCON命令格式错误，正确用法：~rcon 服务器命令，例如~rcon list"
+    who_no_data = "还没有在线玩家数据，需要开启服务器扫描并等扫描器扫描一轮"
 
     scanner_is_running = "MC服务器扫描器已启动"
     scanner_is_stopped = "MC服务器扫描器已停止"
     scanner_already_running = "MC服务器扫描器已经在运行"
     scanner_already_stopped = "MC服务器扫描器已经停止"
+    scanner_without_server = "未设置需要扫描的服务器，无法启动MC服务器扫描器"
 
     plugin_is_not_enable = "插件未启用"
+    trace_is_not_enable = "耗时追踪未启用（mc_trace_enable）"
+    command_trace_cleared = "已清空耗时记录"
+    args_error_mem_command = "参数错误\n~conf mem 查看缓存内存占用\n~conf mem snapshot 记录tracemalloc基准快照\n~conf mem diff 对比基准快照\n~conf mem stop 停止tracemalloc"
+    mem_no_snapshot = "还没有基准快照，请先执行~conf mem snapshot"
+    command_mem_stopped = "已停止tracemalloc"
+    multi_ping_title = "服务器状态："
     conf_is_none = "此条参数值为None"
     conf_get_args_is_none = "参数不能为空\n输入~conf help查看参数信息"
 
+    @staticmethod
+    def multi_ping_line(address: str = "", information: dict | None = None, error: str = "") -> str:
+        """多地址Ping结果中的一行"""
+        if information is None:
+            if error == "timeout":
+                return f"⏱ {address}：超时"
+            return f"❌ {address}：{error}"
+        return (f"✅ {address}：{information['serverType']} {information['version']} | "
+                f"{information['onlinePlayers']}/{information['maxPlayers']} | {round(information['pingLatency'], 2)}ms")
+
+    @staticmethod
+    def ping_summary(information: dict | None = None) -> str:
+        """渐进式回复中先发送的文字摘要"""
+        summary = (f"✅ {information['server_address']}（{information['serverType']} {information['version']}）\n"
+                   f"在线：{information['onlinePlayers']}/{information['maxPlayers']} | 延迟：{round(information['pingLatency'], 2)}ms")
+        stats = information.get("latencyStats")
+        if stats is not None:
+            summary += f"（{stats.count}次中位数，最低{round(stats.minimum, 2)}ms，p95 {round(stats.p95, 2)}ms，抖动{round(stats.jitter, 2)}ms）"
+        return summary
+
+    @staticmethod
+    def network_summary(status) -> str:
+        """服务器网络的合计行和每个成员（代理、子服务器）一行"""
+        lines = [f"🌐 合计在线：{status.total_players} | 最高延迟：{round(status.worst_latency, 2)}ms"]
+        for member in status.members:
+            if member.online:
+                lines.append(f"✅ {member.name}：{member.information['onlinePlayers']}/{member.information['maxPlayers']} | "
+                             f"{round(member.information['pingLatency'], 2)}ms")
+            elif member.error == "timeout":
+                lines.append(f"⏱ {member.name}（{member.address}）：超时")
+            else:
+                lines.append(f"❌ {member.name}（{member.address}）：离线")
+        return "\n".join(lines)
+
+    @staticmethod
+    def who_server(result, state=None, limit: int = 30, events: int = 3) -> str:
+        """~who中一个服务器的在线玩家和最近的加入/离开（result是扫描器的ScanResult，state是PlayerTracker的PlayerState）"""
+        label = result.backend or result.address
+        if result.information is None:
+            return f"❌ {label}：离线"
+        information = result.information
+        lines = [f"👥 {label}：{information['onlinePlayers']}/{information['maxPlayers']}"]
+        names = sorted(state.players, key=str.lower) if state is not None else []
+        if names:
+            line = "、".join(names[:limit]) + (f"……等{len(names)}人" if len(names) > limit else "")
+            lines.append(line if state.complete else f"{line}（服务器只提供了部分名单）")
+        elif information["onlinePlayers"]:
+            lines.append("服务器没有提供玩家名单")
+        for stamp, joined, name in list(state.events)[-events:] if state is not None else ():
+            lines.append(f"{time.strftime('%H:%M', time.localtime(stamp))} {'➕' if joined else '➖'}{name}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def multi_ping_truncated(count: int = 0) -> str:
+        """地址太多被忽略"""
+        return f"……另有{count}个地址超出单次查询上限，已忽略"
+
+    @staticmethod
+    def command_trace_message(summary: dict = {}) -> str:    #pylint: disable=dangerous-default-value
+        """各阶段耗时（次数、p50、p95）"""
+        if not summary:
+            return "还没有耗时记录"
+        lines = "".join(f"\n   {name}: n={count} p50={p50:.1f}ms p95={p95:.1f}ms" for name, (count, p50, p95) in summary.items())
+        return f"~ping各阶段耗时：{lines}"
+
+    @staticmethod
+    def command_mem_message(usage: list = [], budget: int = 0, traced: tuple | None = None) -> str:    #pylint: disable=dangerous-default-value
+        """各缓存的内存占用（名称、条目数、字节数、被预算淘汰次数）"""
+        lines = ""
+        cached = 0
+        for name, entries, size, evictions in usage:
+            if evictions is None:
+                lines += f"\n   {name}: {entries}条 {size / 1048576:.2f}MB（不计入预算）"
+            else:
+                cached += size
+                lines += f"\n   {name}: {entries}条 {size / 1048576:.2f}MB 淘汰{evictions}次"
+        message = f"缓存内存占用：{cached / 1048576:.2f}MB / {budget / 1048576:.0f}MB{lines}"
+        if traced is not None:
+            message += f"\ntracemalloc：当前{traced[0] / 1048576:.2f}MB 峰值{traced[1] / 1048576:.2f}MB"
+        return message
+
+    @staticmethod
+    def command_mem_snapshot(started: bool = False) -> str:
+        """记录基准快照"""
+        if started:
+            return "已开始tracemalloc并记录基准快照（追踪会让插件变慢，用完请~conf mem stop）"
+        return "已记录新的基准快照"
+
+    @staticmethod
+    def command_mem_diff(stats: list = []) -> str:    #pylint: disable=dangerous-default-value
+        """和基准快照相比新增内存最多的代码位置"""
+        if not stats:
+            return "和基准快照相比没有变化"
+        lines = "".join(f"\n   {location}: {size / 1024:+.1f}KB（{count:+d}个）" for location, size, count in stats)
+        return f"和基准快照相比内存变化最多的位置：{lines}"
+
     @staticmethod
     def command_get_sueccess(key: str = "", value: str = "") -> str:
         """获取参数成功"""
@@ -52,14 +168,14 @@ class MessageDefine:                                     #pylint: disable=missin
     @staticmethod
     def command_set_sueccess(key: str = "", value: str = "") -> str:
         """设置参数成功"""
-        return f"已写入参数： {key} = {value}。插件重载中……"
+        return f"已写入参数： {key} = {value}，已生效"
 
     @staticmethod
     def command_superuser_status_message(plugin_enable: bool = False, scaner_enable: bool = False, scan_server_list: list = []) -> str:    #pylint: disable=dangerous-default-value
         """插件状态信息"""
         scan_server = ""
         for server in scan_server_list:
-            scan_server += f"\n   {server['groupID']}: {server['server_address']} "
+            scan_server += f"\n   {server.group_id}: {server.server_address} "
         return f"插件状态：{plugin_enable}\n服务器扫描器状态：{scaner_enable}\n服务器扫描列表：{scan_server}"
     
     @staticmethod
@@ -67,6 +183,62 @@ class MessageDefine:                                     #pylint: disable=missin
         """插件状态信息"""
         return f"插件状态：{plugin_enable}\n服务器扫描器状态：{scaner_enable}"
     
+    @staticmethod
+    def command_export_success(path: str = "") -> str:
+        """导出配置成功"""
+        return f"已导出配置到：{path}"
+
+    @staticmethod
+    def command_export_failed(error: str = "") -> str:
+        """导出配置失败"""
+        return f"导出配置失败：{error}"
+
+    @staticmethod
+    def command_import_success(count: int = 0) -> str:
+        """导入配置成功"""
+        return f"已导入{count}个QQ群的配置"
+
+    @staticmethod
+    def command_import_failed(error: str = "") -> str:
+        """导入配置失败"""
+        return f"导入配置失败：{error}"
+
+    @staticmethod
+    def vwl_load_failed(error: str = "") -> str:
+        """白名单文件读取失败"""
+        return f"白名单文件读取失败：{error}"
+
+    @staticmethod
+    def command_vwl_success(action: str = "", name: str = "") -> str:
+        """白名单修改成功"""
+        return f"已{action}白名单：{name}"
+
+    @staticmethod
+    def command_rcon_result(output: str = "", limit: int = 1500) -> str:
+        """RCON命令的输出，太长时截断"""
+        output = output.strip()
+        if not output:
+            return "命令已执行（没有输出）"
+        if len(output) > limit:
+            output = output[:limit] + "……"
+        return output
+
+    @staticmethod
+    def rcon_failed(error: str = "") -> str:
+        """RCON连接或执行失败"""
+        return f"RCON执行失败：{error}"
+
+    @staticmethod
+    def vwl_rcon_synced(output: str = "") -> str:
+        """白名单文件修改后同步到服务器的结果"""
+        return f"\n服务器：{output}"
+
+    @staticmethod
+    def command_vwl_list(entries: list = [], page: int = 1, pages: int = 1, total: int = 0) -> str:    #pylint: disable=dangerous-default-value
+        """白名单列表（一页）"""
+        names = "".join(f"\n   {entry.name}" for entry in entries)
+        return f"白名单（共{total}人，第{page}/{pages}页）：{names}"
+
     @staticmethod
     def command_qqgroup_success(action: str = "", groupid: int = 0) -> str:
         """QQgroup命令执行成功"""
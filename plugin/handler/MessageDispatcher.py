@@ -0,0 +1,211 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+消息发送队列类 MessageDispatcher.py 2026-10-19
+Author: AptS:1547
+
+MessageDispatcher类是命令回复和扫描器提醒共用的发送队列，提供了以下方法：
+send: 发送一条消息并等待发送完成（命令回复）
+post: 把消息放入队列后立即返回（扫描器提醒、状态广播），扫描不会等待消息发送
+reply: 按事件回复（群聊/私聊，可选@发送者），等待发送完成
+start: 启动发送协程
+stop: 停止发送协程，丢弃未发送的消息
+memory_usage: 队列中消息的条数和估算字节数（登记在MemoryBudget中，只统计不淘汰）
+
+优先级：INTERACTIVE（命令回复） > ALERT（扫描器提醒） > BROADCAST（状态广播）
+每个优先级一个有界队列，满了丢弃最旧的一条；带merge_key的消息在队列中只保留最新的一条；
+提醒在队列里等待超过ALERT_TTL_SECOND后作废；发送失败按指数退避重试，不阻塞其他消息
+每次发送前经过RateLimiter按群限速
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from nonebot import logger
+from nonebot.adapters import Bot, Event
+
+from .ConfigHandler import ConfigHandler               # pylint: disable=relative-beyond-top-level
+from .MemoryBudget import MemoryBudget, estimate_size  # pylint: disable=relative-beyond-top-level
+from .RateLimiter import RateLimiter                   # pylint: disable=relative-beyond-top-level
+
+INTERACTIVE = 0
+ALERT = 1
+BROADCAST = 2
+
+
+class QueueDropped(Exception):
+    """消息在发送前被丢弃（队列已满、已过期或队列停止）"""
+
+
+@dataclass(slots=True)
+class OutboundMessage:
+    """队列中的一条消息"""
+    bot: Bot
+    message: Any
+    group_id: int | None
+    user_id: int | None
+    priority: int
+    merge_key: Any = None
+    created: float = field(default_factory=time.monotonic)
+    attempts: int = 0
+    not_before: float = 0.0
+    future: asyncio.Future | None = None
+
+
+class MessageDispatcher:
+    """命令和扫描器共用的发送队列"""
+    QUEUE_SIZE = {INTERACTIVE: 100, ALERT: 200, BROADCAST: 50}
+    WORKERS = 3                 # 同时发送的协程数量，限速器让某个群等待时不会卡住其他群
+    MAX_ATTEMPTS = 4            # 包括第一次在内的最多发送次数
+    RETRY_BASE_SECOND = 1.0     # 重试间隔：1s、2s、4s……
+    ALERT_TTL_SECOND = 300.0    # 提醒的有效期
+
+    _queues: dict[int, deque] = {priority: deque() for priority in QUEUE_SIZE}
+    _merge: dict[Any, OutboundMessage] = {}
+    _workers: list[asyncio.Task] = []
+    _wakeup: asyncio.Event | None = None
+
+    @classmethod
+    def start(cls) -> None:
+        """启动发送协程，已经启动时什么都不做"""
+        if any(not worker.done() for worker in cls._workers):
+            return
+        cls._wakeup = asyncio.Event()
+        cls._workers = [asyncio.create_task(cls._run(), name=f"epmc-dispatcher-{index}") for index in range(cls.WORKERS)]
+
+    @classmethod
+    async def stop(cls) -> None:
+        """停止发送协程，丢弃未发送的消息"""
+        for worker in cls._workers:
+            worker.cancel()
+        await asyncio.gather(*cls._workers, return_exceptions=True)
+        cls._workers = []
+        for queue in cls._queues.values():
+            while queue:
+                cls._drop(queue.popleft(), "队列已停止")
+        cls._merge.clear()
+
+    @classmethod
+    def post(cls, bot: Bot, message: Any, group_id: int | None = None, user_id: int | None = None,
+             priority: int = ALERT, merge_key: Any = None) -> OutboundMessage:
+        """
+        把消息放入队列后立即返回
+        :param merge_key: 合并键，队列中已有相同合并键的消息时用新内容替换它（例如同一个服务器的断开/恢复提醒）
+        """
+        cls.start()
+        if merge_key is not None and (pending := cls._merge.get(merge_key)) is not None:
+            pending.message = message
+            pending.created = time.monotonic()
+            return pending
+
+        item = OutboundMessage(bot, message, group_id, user_id, priority, merge_key)
+        queue = cls._queues[priority]
+        if len(queue) >= cls.QUEUE_SIZE[priority]:
+            cls._drop(queue.popleft(), "队列已满")
+        queue.append(item)
+        if merge_key is not None:
+            cls._merge[merge_key] = item
+        cls._wakeup.set()
+        return item
+
+    @classmethod
+    async def send(cls, bot: Bot, message: Any, group_id: int | None = None, user_id: int | None = None,
+                   priority: int = INTERACTIVE) -> Any:
+        """发送一条消息并等待发送完成，返回OneBot API的结果"""
+        item = cls.post(bot, message, group_id, user_id, priority)
+        item.future = asyncio.get_running_loop().create_future()
+        return await item.future
+
+    @classmethod
+    async def reply(cls, bot: Bot, event: Event, message: Any, at_sender: bool = False) -> Any:
+        """按事件回复：群消息回复到群里（可选@发送者），私聊回复给发送者"""
+        from nonebot.adapters.onebot.v11.message import MessageSegment  # pylint: disable=import-outside-toplevel
+        group_id = getattr(event, "group_id", None)
+        if group_id is not None and at_sender:
+            message = MessageSegment.at(event.get_user_id()) + " " + message
+        if group_id is not None:
+            return await cls.send(bot, message, group_id=group_id)
+        return await cls.send(bot, message, user_id=int(event.get_user_id()))
+
+    @classmethod
+    def _pop(cls) -> tuple[OutboundMessage | None, float | None]:
+        """取出优先级最高、已经可以发送的一条消息；没有时返回最近一条的等待时间"""
+        now = time.monotonic()
+        next_ready = None
+        for priority in sorted(cls._queues):
+            queue = cls._queues[priority]
+            for _ in range(len(queue)):
+                item = queue.popleft()
+                if priority == ALERT and now - item.created > cls.ALERT_TTL_SECOND:
+                    cls._drop(item, "提醒已过期")
+                    continue
+                if item.not_before > now:
+                    queue.append(item)
+                    next_ready = item.not_before - now if next_ready is None else min(next_ready, item.not_before - now)
+                    continue
+                if item.merge_key is not None and cls._merge.get(item.merge_key) is item:
+                    del cls._merge[item.merge_key]
+                return item, None
+        return None, next_ready
+
+    @classmethod
+    async def _run(cls) -> None:
+        """发送协程"""
+        while True:
+            item, wait = cls._pop()
+            if item is None:
+                cls._wakeup.clear()
+                try:
+                    await asyncio.wait_for(cls._wakeup.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await cls._deliver(item)
+
+    @classmethod
+    async def _deliver(cls, item: OutboundMessage) -> None:
+        """按群限速后调用OneBot API发送，失败时退避后重新排队"""
+        item.attempts += 1
+        try:
+            await RateLimiter.acquire(item.group_id, ConfigHandler.config)
+            if item.group_id is not None:
+                result = await item.bot.send_group_msg(group_id=item.group_id, message=item.message)
+            else:
+                result = await item.bot.send_private_msg(user_id=item.user_id, message=item.message)
+        except asyncio.CancelledError:
+            cls._drop(item, "队列已停止")
+            raise
+        except Exception as e:  # pylint: disable=broad-except
+            if item.attempts >= cls.MAX_ATTEMPTS:
+                logger.warning(f"[epmc_minecraft_bot] 消息发送失败，已重试{item.attempts - 1}次：{e}")
+                if item.future is not None and not item.future.done():
+                    item.future.set_exception(e)
+                return
+            item.not_before = time.monotonic() + cls.RETRY_BASE_SECOND * 2 ** (item.attempts - 1)
+            cls._queues[item.priority].append(item)
+            cls._wakeup.set()
+            return
+        if item.future is not None and not item.future.done():
+            item.future.set_result(result)
+
+    @classmethod
+    def memory_usage(cls) -> tuple[int, int]:
+        """队列中消息的(条数, 估算字节数)"""
+        items = [item for queue in cls._queues.values() for item in queue]
+        return len(items), sum(estimate_size(item.message) for item in items)
+
+    @classmethod
+    def _drop(cls, item: OutboundMessage, reason: str) -> None:
+        """丢弃一条消息，同时去掉它的合并键，之后相同合并键的消息重新排队而不是合并到已经丢弃的消息上"""
+        if item.merge_key is not None and cls._merge.get(item.merge_key) is item:
+            del cls._merge[item.merge_key]
+        logger.debug(f"[epmc_minecraft_bot] 丢弃消息（{reason}）：{item.message}")
+        if item.future is not None and not item.future.done():
+            item.future.set_exception(QueueDropped(reason))
+
+
+MemoryBudget.register_probe("dispatcher.queue", MessageDispatcher.memory_usage)
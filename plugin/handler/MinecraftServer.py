@@ -7,57 +7,80 @@ Author: AptS:1547
 
 MinecraftServer类用于处理Minecraft服务器的Ping请求，提供了以下方法：
 ping_server: 发送Ping请求，成功返回True，失败返回失败原因(str)
-status: 同时从Java和Bedrock获取信息
+ping_many: 并发Ping多个地址，有并发上限和总时限，超时的地址单独标记，不影响其他地址
+status: 同时从Java和Bedrock获取信息；有endpoint_hint时先直接Ping上次解析好的地址，失败再重新探测
 handle_java: 从Java获取信息
 handle_bedrock: 从Bedrock获取信息
+hinted_status: 直接Ping endpoint_hint中的地址
+resolved_endpoint: 成功后实际使用的(服务器类型, host, port)，扫描器保存下来作为下一次的endpoint_hint
 bound_information: 绑定服务器信息
+query_players: 用GameSpy4 Query获取完整的玩家名单（扫描器在mc_query_enable开启时调用），替换status中的players.sample
+sample_latency: mc_ping_latency_samples大于1时对在线的服务器多次采样延迟，pingLatency改为中位数，统计值放在latencyStats
 check_java_server: 判断是不是JavaServer，是的话返回JavaStatusResponse，不是返回False（会被ConnectionRefusedError捕捉）
 dealing_icon: 处理服务器Icon图标
 """
 
-import base64, asyncio, re, requests      #pylint: disable=multiple-imports
+import asyncio, re      #pylint: disable=multiple-imports
 
 from mcstatus import BedrockServer, JavaServer
 from mcstatus.status_response import BedrockStatusResponse, JavaStatusResponse
 
-from .ConfigHandler import Config         #pylint: disable=relative-beyond-top-level
-from .PictureDefine import PictureDefine  #pylint: disable=relative-beyond-top-level
+from .ConfigHandler import ConfigSnapshot #pylint: disable=relative-beyond-top-level
+from .IconCache import IconCache          #pylint: disable=relative-beyond-top-level
+from .LatencyProbe import LatencyProbe    #pylint: disable=relative-beyond-top-level
+from .PlayerTracker import PlayerTracker  #pylint: disable=relative-beyond-top-level
+from .Tracer import Tracer                #pylint: disable=relative-beyond-top-level
+
+QUERY_TIMEOUT = 2.0     # Query的总时限（秒），服务器没有开启Query时UDP请求只能等到超时
+
 
 class MinecraftServer:
     """Minecraft服务器处理类"""
-    def __init__(self, server_address: str, plugin_config: Config, groupid: int = 0) -> None:
+    def __init__(self, server_address: str, plugin_config: ConfigSnapshot, groupid: int = 0,
+                 endpoint_hint: tuple[str, str, int] | None = None) -> None:
+        """
+        :param endpoint_hint: 上次成功时的(服务器类型, host, port)，扫描器传入，跳过SRV解析和JE/BE同时探测
+        """
         #一些必要的全局变量
         self.server_address = server_address
-        self.global_default_server = plugin_config.mc_global_default_server
-        self.global_default_icon = plugin_config.mc_global_default_icon
-        self.qqgroup_default_server = plugin_config.mc_qqgroup_default_server
+        self.global_default_server = plugin_config.config.mc_global_default_server
+        self.global_default_icon = plugin_config.config.mc_global_default_icon
+        self.qqgroup_default_server = plugin_config.groups
         self.groupid = groupid
+        self.latency_samples = plugin_config.config.mc_ping_latency_samples
+        self.endpoints = {}             # 服务器类型 -> status使用的(host, port)，延迟采样时复用
+        self.endpoint_hint = endpoint_hint
         self.ping_success = False
+        self.icon_source = ""           # 图标来源：server/group/global/black
+        self.icon_key = "black"         # 图标在IconCache中的键
         self.server_information = {}
 
     async def ping_server(self) -> str | bool:
         """发送Ping请求，成功返回True，失败返回失败原因(str)"""
         if self.server_address == '':
-            if (self.groupid in self.qqgroup_default_server) and ("server_address" in self.qqgroup_default_server[self.groupid]) and self.qqgroup_default_server[self.groupid]["server_address"] != "":
-                self.server_address = self.qqgroup_default_server[self.groupid]["server_address"]
+            if (self.groupid in self.qqgroup_default_server) and self.qqgroup_default_server[self.groupid].server_address != "":
+                self.server_address = self.qqgroup_default_server[self.groupid].server_address
             elif self.global_default_server != '':
                 self.server_address = self.global_default_server
             else:
                 return("没有具体的服务器地址，无法建立连接")
 
         try:
-            mc_response = await self.status(self.server_address)
-            if isinstance(mc_response, BedrockStatusResponse):               #直接使用默认端口会出现此可能：同时开了JE和BE，会先检测出BE，但正常来说应该返回JE的数据，所以这里需要再次检测一下JE
+            with Tracer.span("ping.status"):
+                mc_response = await self.status(self.server_address)
+            if isinstance(mc_response, BedrockStatusResponse):             #直接使用默认端口会出现此可能：同时开了JE和BE，会先检测出BE，但正常来说应该返回JE的数据，所以这里需要再次检测一下JE
                 self.ping_success = True
-                mc_response_java = self.check_java_server(self.server_address)       #对JE默认端口Ping，检测JE有无开启，如果没开启扔出ConnectionRefusedError，放到下面解决
+                with Tracer.span("ping.java_check"):
+                    mc_response_java = await self.check_java_server(self.server_address)       #对JE默认端口Ping，检测JE有无开启，如果没开启扔出ConnectionRefusedError，放到下面解决
                 
                 if isinstance(mc_response_java, JavaStatusResponse):         #是JE的处理
-                    self.bound_information(server_type="Java", version=mc_response_java.version.name, online_players=mc_response_java.players.online, ping_latency=mc_response_java.latency, icon=self.dealing_icon(mc_response_java.icon), motd=mc_response_java.motd.parsed, max_players=mc_response_java.players.max)
+                    self.bound_information(server_type="Java", version=mc_response_java.version.name, online_players=mc_response_java.players.online, ping_latency=mc_response_java.latency, icon=self.dealing_icon(mc_response_java.icon), motd=mc_response_java.motd.parsed, max_players=mc_response_java.players.max, players=PlayerTracker.sample_names(mc_response_java.players.sample))
                 else:                                                        #是BE的处理
                     self.bound_information(server_type="Bedrock", version=mc_response.version.name, online_players=mc_response.players.online, ping_latency=mc_response.latency, icon=self.dealing_icon(), motd=mc_response.motd.parsed, max_players=mc_response.players.max)
             elif isinstance(mc_response, JavaStatusResponse):                                                            #默认端口只有JE的判断以及数据提取
-                self.bound_information(server_type="Java", version=mc_response.version.name, online_players=mc_response.players.online, ping_latency=mc_response.latency, icon=self.dealing_icon(mc_response.icon), motd=mc_response.motd.parsed, max_players=mc_response.players.max)
-            
+                self.bound_information(server_type="Java", version=mc_response.version.name, online_players=mc_response.players.online, ping_latency=mc_response.latency, icon=self.dealing_icon(mc_response.icon), motd=mc_response.motd.parsed, max_players=mc_response.players.max, players=PlayerTracker.sample_names(mc_response.players.sample))
+
+            await self.sample_latency()
             return True
 
         except ValueError:
@@ -66,24 +89,59 @@ class MinecraftServer:
         except ConnectionRefusedError:
             if self.ping_success:
                 self.bound_information(server_type="Bedrock", version=mc_response.version.name, online_players=mc_response.players.online, ping_latency=mc_response.latency, icon=self.dealing_icon(), motd=mc_response.motd.parsed, max_players=mc_response.players.max)
-
+                await self.sample_latency()
                 return True
             else:
                 return(f"无法连接至服务器：{self.server_address}，服务器可能处于离线状态")
 
+    @classmethod
+    async def ping_many(cls, addresses: list[str], plugin_config: ConfigSnapshot, groupid: int = 0,
+                        concurrency: int = 4, deadline: float = 8.0) -> list[tuple[str, "MinecraftServer | None", str | bool]]:
+        """
+        并发Ping多个地址
+        :param concurrency: 同时进行的Ping数量上限
+        :param deadline: 总时限（秒），到时还没有结果的地址返回(地址, None, "timeout")
+        :return: 按输入顺序排列的(地址, MinecraftServer对象, ping_server的返回值)
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def probe(address: str) -> tuple["MinecraftServer", str | bool]:
+            async with semaphore:
+                mc_server = cls(address, plugin_config, groupid)
+                return mc_server, await mc_server.ping_server()
+
+        tasks = [asyncio.create_task(probe(address)) for address in addresses]
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+        for task in pending:
+            task.cancel()
+
+        results = []
+        for address, task in zip(addresses, tasks):
+            if task not in done:
+                results.append((address, None, "timeout"))
+            elif task.exception() is not None:
+                results.append((address, None, str(task.exception())))
+            else:
+                results.append((address, *task.result()))
+        return results
+
     async def status(self, host: str) -> JavaStatusResponse | BedrockStatusResponse:
         """同时从Java和Bedrock获取信息"""
-        success_task = await self.handle_exceptions(
-            *(
-                await asyncio.wait(
-                    {
-                        asyncio.create_task(self.handle_bedrock(host), name="Get status as Bedrock"),
-                        asyncio.create_task(self.handle_java(host), name="Get status as Java"),
-                    },
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
-            )
-        )
+        if self.endpoint_hint is not None:
+            try:
+                return await self.hinted_status()
+            except Exception as _:                                            #pylint: disable=broad-except
+                self.endpoint_hint = None       # 地址或者服务器类型变了，重新探测
+                self.endpoints.clear()
+        tasks = {
+            asyncio.create_task(self.handle_bedrock(host), name="Get status as Bedrock"),
+            asyncio.create_task(self.handle_java(host), name="Get status as Java"),
+        }
+        try:
+            success_task = await self.handle_exceptions(*(await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)))
+        finally:
+            for task in tasks:      # 调用方被取消时（例如多地址~ping超过总时限）不留下还在探测的任务
+                task.cancel()
 
         if success_task is None:
             raise ConnectionRefusedError("No tasks were successful. Is server offline?")
@@ -114,39 +172,100 @@ class MinecraftServer:
 
     async def handle_java(self, host: str) -> JavaStatusResponse:
         """A wrapper around mcstatus, to compress it in one function."""
-        return await (await JavaServer.async_lookup(host)).async_status()
+        with Tracer.span("ping.java_lookup"):
+            server = await JavaServer.async_lookup(host)
+        self.endpoints["Java"] = (server.address.host, server.address.port)
+        with Tracer.span("ping.java_status"):
+            return await server.async_status()
+
+    async def hinted_status(self) -> JavaStatusResponse | BedrockStatusResponse:
+        """直接Ping上次解析好的地址，不做SRV解析"""
+        server_type, host, port = self.endpoint_hint
+        self.endpoints[server_type] = (host, port)
+        with Tracer.span("ping.hinted_status", server_type=server_type):
+            if server_type == "Java":
+                return await JavaServer(host, port).async_status()
+            return await BedrockServer(host, port).async_status()
 
     async def handle_bedrock(self, host: str) -> BedrockStatusResponse:
         """A wrapper around mcstatus, to compress it in one function."""
         # note: `BedrockServer` doesn't have `async_lookup` method, see it's docstring
-        return await BedrockServer.lookup(host).async_status()
+        server = BedrockServer.lookup(host)
+        self.endpoints["Bedrock"] = (server.address.host, server.address.port)
+        with Tracer.span("ping.bedrock_status"):
+            return await server.async_status()
 
-    def bound_information(self, server_type: str = "", version: str = "", online_players: int = 0, max_players: int = 0, ping_latency: float = 0.0, icon: str = "", motd=None) -> None:
-        """绑定服务器信息"""
+    def resolved_endpoint(self) -> tuple[str, str, int] | None:
+        """Ping成功后实际使用的(服务器类型, host, port)"""
+        server_type = self.server_information.get("serverType")
+        if server_type not in self.endpoints:
+            return None
+        return (server_type, *self.endpoints[server_type])
+
+    async def sample_latency(self) -> None:
+        """mc_ping_latency_samples大于1时多次采样延迟，采样失败时保留status测得的单个延迟"""
+        server_type = self.server_information.get("serverType")
+        if self.latency_samples <= 1 or server_type not in self.endpoints:
+            return
+        first = self.server_information["pingLatency"] if server_type == "Java" else None
+        try:
+            with Tracer.span("ping.latency", samples=self.latency_samples):
+                stats = await LatencyProbe.measure(server_type, self.endpoints[server_type], self.latency_samples, first)
+        except OSError:
+            return
+        if stats is not None:
+            self.server_information["pingLatency"] = stats.median
+            self.server_information["latencyStats"] = stats
+
+    async def query_players(self) -> bool:
+        """用GameSpy4 Query获取完整的玩家名单（服务器需要enable-query=true），成功时替换playerSample"""
+        if self.server_information.get("serverType") != "Java" or "Java" not in self.endpoints:
+            return False
+        try:
+            with Tracer.span("ping.query_players"):
+                response = await asyncio.wait_for(JavaServer(*self.endpoints["Java"], timeout=QUERY_TIMEOUT / 2).async_query(), QUERY_TIMEOUT)
+        except Exception as _:                                                #pylint: disable=broad-except
+            return False
+        self.server_information["playerSample"] = PlayerTracker.sample_names(response.players.names)
+        return True
+
+    def bound_information(self, server_type: str = "", version: str = "", online_players: int = 0, max_players: int = 0, ping_latency: float = 0.0, icon: str = "", motd=None, players: tuple = ()) -> None:
+        """绑定服务器信息，playerSample是驻留后的玩家名字（基岩版没有）"""
         if motd is None:
             motd = []
-        self.server_information = {"server_address": self.server_address, "serverType": server_type, "version": version, "onlinePlayers": online_players, "maxPlayers": max_players, "pingLatency": ping_latency, "Icon": icon, "MOTD": motd}
+        self.server_information = {"server_address": self.server_address, "serverType": server_type, "version": version, "onlinePlayers": online_players, "maxPlayers": max_players, "pingLatency": ping_latency, "Icon": icon, "MOTD": motd,
+                                   "IconSource": self.icon_source, "IconKey": self.icon_key, "groupID": self.groupid, "playerSample": players}
 
-    def check_java_server(self, host: str) -> bool | JavaStatusResponse:
+    async def check_java_server(self, host: str) -> bool | JavaStatusResponse:
         """判断是不是JavaServer，是的话返回JavaStatusResponse，不是返回False（会被ConnectionRefusedError捕捉）"""
+        if self.endpoint_hint is not None:      # 按上次的结果直接Ping了BE，说明上次已经确认没有开JE
+            return False
         try:
-            return JavaServer(host).status()
+            server = JavaServer(host)
+            self.endpoints["Java"] = (server.address.host, server.address.port)
+            return await server.async_status()
         except Exception as _:                                                #pylint: disable=broad-except
             return False
 
-    def dealing_icon(self, icon: str | None = None) -> str:                   #icon逻辑，如果有Icon先给Icon，没Icon再看自定义Group头像，最后默认黑色
-        """TODO:future:可能会加入定义【Q群默认地址】支持自定义图片 正在完成"""
-        if icon is not None and icon != "":
-            icon_final = re.sub(r'data:image/[^;]+;base64,', '', icon) #获取服务器Icon 并去掉base64图片前缀
-        elif self.groupid is not None:
-            response = requests.get(f"https://p.qlogo.cn/gh/{self.groupid}/{self.groupid}/640/", timeout=5)
-            if response.status_code == 200:
-                icon_final = base64.b64encode(response.content).decode('utf-8')        #TODO:这里不应该直接用群头像，建议使用自定义（mc_default_server_group）
+    def dealing_icon(self, icon: str | None = None) -> str:                   #icon逻辑：服务器Icon -> 群自定义图标 -> 全局默认图标 -> 黑色
+        """
+        处理服务器Icon图标，返回服务器Icon的base64（不是服务器Icon时返回空字符串）
+        图标都从IconCache中取，已经解码、缩放和加过圆角，这里不会访问网络，也不会重复解码
+        """
+        icon_final = ""
+        with Tracer.span("ping.icon"):
+            if icon is not None and icon != "":
+                icon_final = re.sub(r'data:image/[^;]+;base64,', '', icon) #获取服务器Icon 并去掉base64图片前缀
+                self.icon_key = IconCache.server_icon(icon_final)
+                self.icon_source = "server" if self.icon_key != "black" else "black"
+            elif (group_key := IconCache.group_icon(self.qqgroup_default_server.get(self.groupid))) is not None:
+                self.icon_key = group_key
+                self.icon_source = "group"
+            elif (global_key := IconCache.global_icon(self.global_default_icon)) is not None:
+                self.icon_key = global_key
+                self.icon_source = "global"
             else:
-                icon_final = PictureDefine.CouldNotFindQGroupPicture
-        elif self.global_default_icon != '':
-            icon_final = self.global_default_icon
-        else:
-            icon_final = PictureDefine.Black
+                self.icon_key = "black"
+                self.icon_source = "black"
 
         return icon_final
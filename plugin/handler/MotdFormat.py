@@ -0,0 +1,19 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+MOTD格式处理 MotdFormat.py 2026-10-19
+Author: AptS:1547
+
+HTTP状态接口和扫描器状态保存共用的MOTD处理，提供了以下方法：
+motd_text: mcstatus解析后的MOTD去掉颜色和格式，只保留文字
+"""
+
+from enum import Enum
+
+
+def motd_text(motd) -> str:
+    """mcstatus解析后的MOTD去掉颜色和格式，只保留文字（已经是文字时原样返回）"""
+    if isinstance(motd, str):
+        return motd
+    return "".join(item for item in motd or () if isinstance(item, str) and not isinstance(item, Enum))
@@ -2,138 +2,304 @@
 布局处理类 ParseLayout.py 2025-01-09
 Author: LatosProject
 
-ParseLayout类用于照片的布局解析，提供了以下方法：
+ParseLayout类用于照片的布局解析，将XML布局文件编译为不可变的渲染计划（LayoutPlan），提供了以下方法：
+load: 按文件路径和修改时间获取编译好的渲染计划，文件变化时自动重新编译
+compile: 编译XML布局文件，布局用到的字体文件缺失时抛出FileNotFoundError（不退回PIL内置字体，内置字体没有中文字形）
+font: 获取缓存的字体句柄
 _parse_icon: 解析icon图标
 _parse_text: 解析文本
 _parse_text_groups: 解析文本组
 _parse_motd: 解析motd
+_parse_rects: 解析静态的矩形框
 """
 
+import os
+import re
 import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from PIL import ImageFont
+
+from .PictureDefine import PictureDefine, FONTS  # pylint: disable=relative-beyond-top-level
+
+DEFAULT_LAYOUT = Path(__file__).parent.parent / "layout" / "default.xml"
+
+# 占位符 -> 取值函数，编译时就确定好，渲染时不再逐个replace
+FIELD_GETTERS = {
+    "onlinePlayers": lambda info: str(info["onlinePlayers"]),
+    "maxPlayers": lambda info: str(info["maxPlayers"]),
+    "pingLatency": lambda info: str(round(info["pingLatency"], 2)),
+    # 没有多次采样时最小值/p95都是单次的延迟，抖动为0
+    "latencyMin": lambda info: str(round(info["latencyStats"].minimum if info.get("latencyStats") else info["pingLatency"], 2)),
+    "latencyP95": lambda info: str(round(info["latencyStats"].p95 if info.get("latencyStats") else info["pingLatency"], 2)),
+    "latencyJitter": lambda info: str(round(info["latencyStats"].jitter if info.get("latencyStats") else 0.0, 2)),
+    "serverAddress": lambda info: str(info["server_address"]),
+    "serverType": lambda info: str(info["serverType"]),
+    "version": lambda info: str(info["version"]),
+}
+
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+
+@dataclass(frozen=True, slots=True)
+class TextTemplate:
+    """预先切分好的文本模板，literals比fields多一个元素"""
+    literals: tuple[str, ...]
+    fields: tuple[str, ...]
+
+    @classmethod
+    def compile(cls, content: str) -> "TextTemplate":
+        """把"{field}"占位符切分出来"""
+        parts = _PLACEHOLDER.split(content)
+        literals, fields = tuple(parts[0::2]), tuple(parts[1::2])
+        for field in fields:
+            if field not in FIELD_GETTERS:
+                raise ValueError(f"Unknown placeholder {{{field}}}")
+        return cls(literals, fields)
+
+    @property
+    def is_static(self) -> bool:
+        """没有占位符的文本在每次渲染时都一样"""
+        return not self.fields
+
+    def render(self, information: dict) -> str:
+        """用服务器信息填充模板"""
+        if not self.fields:
+            return self.literals[0]
+        out = [self.literals[0]]
+        for field, literal in zip(self.fields, self.literals[1:]):
+            out.append(FIELD_GETTERS[field](information))
+            out.append(literal)
+        return "".join(out)
+
+
+@dataclass(frozen=True, slots=True)
+class IconSpec:
+    """服务器图标的位置和尺寸"""
+    width: int
+    height: int
+    round_corner: int
+    position: tuple[int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class TextSpec:
+    """单个文本元素"""
+    template: TextTemplate
+    font: str
+    font_size: int
+    color: tuple[int, ...]
+    position: tuple[int, int]
+    alignment: str = "left"
+    max_width: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class MotdSpec:
+    """MOTD区域"""
+    font: str
+    font_size: int
+    color: tuple[int, ...]
+    position: tuple[int, int]
+    max_width: int
+    line_spacing: int
+
+
+@dataclass(frozen=True, slots=True)
+class RectSpec:
+    """静态的矩形框/底板"""
+    position: tuple[int, int]
+    size: tuple[int, int]
+    radius: int
+    fill: tuple[int, ...] | None
+    outline: tuple[int, ...] | None
+    outline_width: int
+
+
+@dataclass(frozen=True, slots=True)
+class LayoutPlan:
+    """
+    编译后的布局渲染计划
+    static_texts和rects每次渲染都一样，会被预先合成到底图里；
+    dynamic_texts、motd以及服务器图标才需要每次绘制
+    """
+    path: str
+    mtime_ns: int
+    background: str
+    icon: IconSpec | None
+    rects: tuple[RectSpec, ...]
+    static_texts: tuple[TextSpec, ...]
+    dynamic_texts: tuple[TextSpec, ...]
+    motd: MotdSpec | None
+
+
+def _parse_xy(value: str | None) -> tuple[int, int]:
+    """解析"x,y"格式的坐标"""
+    if value is None:
+        raise ValueError("position is required")
+    x, y = map(int, value.split(","))
+    return x, y
+
+
+def _parse_color(value: str | None) -> tuple[int, ...]:
+    """解析"r,g,b"格式的颜色"""
+    if value is None:
+        return (0, 0, 0)
+    return tuple(map(int, value.split(",")))
 
 
 class ParseLayout:
     """布局处理类"""
 
-    def __init__(self, xml_layout: str, information: dict) -> None:
+    _plans: dict[str, LayoutPlan] = {}
+
+    def __init__(self, xml_layout: str | Path) -> None:
         """
         初始化 ParseLayout 类，解析传入的 XML 布局文件并获取根元素。
 
         参数:
             xml_layout: XML 文件路径
         """
-        self.xml_layout = xml_layout
-        self.tree = ET.parse(xml_layout)
-        self.root = self.tree.getroot()
-        self.information = information
+        self.xml_layout = Path(xml_layout)
+        self.root = ET.parse(self.xml_layout).getroot()
+
+    @classmethod
+    def load(cls, xml_layout: str | Path | None = None) -> LayoutPlan:
+        """
+        获取布局的渲染计划，按文件路径和mtime缓存，文件被修改后会重新编译。
+
+        参数:
+            xml_layout: XML 文件路径，为空时使用默认布局
+        """
+        path = str(Path(xml_layout) if xml_layout else DEFAULT_LAYOUT)
+        mtime_ns = os.stat(path).st_mtime_ns
+        plan = cls._plans.get(path)
+        if plan is None or plan.mtime_ns != mtime_ns:
+            plan = cls(path).compile(mtime_ns)
+            cls._plans[path] = plan
+        return plan
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def font(font: str, font_size: int) -> ImageFont.FreeTypeFont:
+        """获取缓存的字体句柄，相同字体和字号只会加载一次"""
+        return ImageFont.truetype(font, font_size)
+
+    def compile(self, mtime_ns: int = 0) -> LayoutPlan:
+        """把XML布局编译为不可变的渲染计划，同时拆分静态层和动态层"""
+        texts = self._parse_text(self.root) + self._parse_text_groups()
+        return LayoutPlan(
+            path=str(self.xml_layout),
+            mtime_ns=mtime_ns,
+            background=self.root.get("background", "Background"),
+            icon=self._parse_icon(),
+            rects=tuple(self._parse_rects()),
+            static_texts=tuple(text for text in texts if text.template.is_static),
+            dynamic_texts=tuple(text for text in texts if not text.template.is_static),
+            motd=self._parse_motd(),
+        )
+
+    def _resolve_font(self, font: str | None) -> str:
+        """字体可以是PictureDefine中的字体名，也可以是相对布局文件的路径"""
+        if font is None or font == "":
+            path = PictureDefine.path("MinecraftFont")
+        elif font in FONTS:
+            path = PictureDefine.path(font)
+        else:
+            path = self.xml_layout.parent / font
+        if not path.is_file():
+            raise FileNotFoundError(f"[epmc_minecraft_bot] 布局 {self.xml_layout} 用到的字体文件 {path} 不存在，请按 resources/fonts/README.md 放入支持中文的字体")
+        return str(path)
 
-    def _parse_icon(self) -> tuple | ValueError:
+    def _parse_icon(self) -> IconSpec | None:
         """
         解析 XML 中的 Icon 元素，提取图标的宽度、高度、圆角信息和位置。
 
         返回:
-            - (width, height, round_corner, position): 返回图标宽度、高度、圆角和位置元组。
-            如果找不到 Icon 元素，则抛出 ValueError。
-
-        异常:
-            - 如果没有找到 Icon 元素，抛出 ValueError 异常。
+            - IconSpec，如果没有 Icon 元素则返回 None（不绘制图标）
         """
         icon = self.root.find('Icon')
-        if icon is not None:
-            # source = icon.get('source')
-            width = icon.get('width')
-            height = icon.get('height')
-            round_corner = icon.get('round_corner')
-            position = tuple(map(int, icon.get('position').split(',')))
-            return width, height, round_corner, position
-        else:
-            return ValueError("Icon element not found")
+        if icon is None:
+            return None
+        return IconSpec(
+            width=int(icon.get('width', 400)),
+            height=int(icon.get('height', 400)),
+            round_corner=int(icon.get('round_corner', 0)),
+            position=_parse_xy(icon.get('position')),
+        )
 
-    def _parse_text(self) -> list:
+    def _parse_text(self, parent: ET.Element, alignment: str = "left") -> list[TextSpec]:
         """
-        解析给定元素中的所有 Text 子元素，返回每个文本元素的内容、字体、字体大小、颜色和位置。
+        解析给定元素中的所有 Text 子元素。
 
         参数:
-            root: XML 元素（可以是根元素或其他子元素）
+            parent: XML 元素（可以是根元素或 TextGroup）
+            alignment: 对齐方式，Text 自身的 alignment 属性优先
 
         返回:
-            - texts: 一个包含每个文本信息的字典列表。每部字典包含：
-                - 'content': 文本内容
-                - 'font': 字体
-                - 'font_size': 字体大小
-                - 'color': 文本颜色（以元组形式表示 RGB）
-                - 'text_position': 文本位置（以元组形式表示）
-
-        异常:
-            - 无
+            - TextSpec 列表
         """
         texts = []
-        for text in self.root.findall('Text'):
-            content = text.get('content')
-
-            replacements = {
-                "{onlinePlayers}": str(self.information['onlinePlayers']),
-                "{maxPlayers}": str(self.information['maxPlayers']),
-                "{pingLatency}": str(self.information['pingLatency']),
-                "{serverAddress}": str(self.information['serverAddress']),
-                "{serverType}": str(self.information['serverType']),
-                "{version}": str(self.information['version'])
-            }
-
-            for placeholder, value in replacements.items():
-                content = content.replace(placeholder, value)
-
-            font = text.get('font')
-            font_size = text.get('font_size')
-            color = tuple(map(int, text.get('color').split(',')))
-            text_position = tuple(map(int, text.get('text_position').split(',')))
-            texts.append({
-                'content': content,
-                'font': font,
-                'font_size': font_size,
-                'color': color,
-                'text_position': text_position,
-            })
+        for text in parent.findall('Text'):
+            texts.append(TextSpec(
+                template=TextTemplate.compile(text.get('content', '')),
+                font=self._resolve_font(text.get('font')),
+                font_size=int(text.get('font_size', 80)),
+                color=_parse_color(text.get('color')),
+                position=_parse_xy(text.get('text_position')),
+                alignment=text.get('alignment', alignment),
+                max_width=int(text.get('max_width', 0)),
+            ))
         return texts
 
-    def _parse_text_groups(self) -> list:
+    def _parse_text_groups(self) -> list[TextSpec]:
         """
-        解析 XML 中的所有 TextGroup 元素，每个 TextGroup 包含一个对齐方式和多个 Text 元素。
+        解析 XML 中的所有 TextGroup 元素，组内 Text 继承组的对齐方式。
 
         返回:
-            - text_groups: 一个字典列表，每个字典包含：
-                - 'alignment': 对齐方式
-                - 'texts': 包含该组所有文本元素的列表
-
-        异常:
-            - 无
+            - 所有组内文本的 TextSpec 列表
         """
-        text_groups = []
+        texts = []
         for group in self.root.findall('TextGroup'):
-            alignment = group.get('alignment')
-            texts = self._parse_text()
-            text_groups.append({'alignment': alignment, 'texts': texts})
-        return text_groups
+            texts.extend(self._parse_text(group, group.get('alignment', 'left')))
+        return texts
 
-    def _parse_motd(self) -> tuple | ValueError:
+    def _parse_rects(self) -> list[RectSpec]:
         """
-        解析 XML 中的 Motd 元素，提取其位置、字体大小、字体、颜色等信息。
+        解析 XML 中的所有 Rect 元素（边框、半透明底板等静态装饰）。
 
         返回:
-            - (content, position, font, font_size, color): 返回 MOTD 的信息、位置元组、字体、字体大小和颜色元组。
-            如果找不到 Motd 元素，则抛出 ValueError。
+            - RectSpec 列表
+        """
+        rects = []
+        for rect in self.root.findall('Rect'):
+            rects.append(RectSpec(
+                position=_parse_xy(rect.get('position')),
+                size=_parse_xy(rect.get('size')),
+                radius=int(rect.get('radius', 0)),
+                fill=_parse_color(rect.get('fill')) if rect.get('fill') else None,
+                outline=_parse_color(rect.get('outline')) if rect.get('outline') else None,
+                outline_width=int(rect.get('outline_width', 1)),
+            ))
+        return rects
 
-        异常:
-            - 如果没有找到 Motd 元素，抛出 ValueError 异常。
+    def _parse_motd(self) -> MotdSpec | None:
+        """
+        解析 XML 中的 MOTD 元素，提取其位置、字体大小、字体、颜色等信息。
+
+        返回:
+            - MotdSpec，如果没有 MOTD 元素则返回 None（不绘制MOTD）
         """
         motd = self.root.find('MOTD')
-        if motd is not None:
-            content = motd.get('content')
-            content = content.replace("{motd_str}", str(self.information['MOTD']))
-            position = tuple(map(int, motd.get('position').split(',')))
-            font_size = motd.get('font_size')
-            font = motd.get('font')
-            color = tuple(map(int, motd.get('color').split(',')))
-            return content, position, font, font_size, color
-        else:
-            return ValueError("MOTD element not found")
+        if motd is None:
+            return None
+        return MotdSpec(
+            font=self._resolve_font(motd.get('font')),
+            font_size=int(motd.get('font_size', 80)),
+            color=_parse_color(motd.get('color', '255,255,255')),
+            position=_parse_xy(motd.get('position')),
+            max_width=int(motd.get('max_width', 1297)),
+            line_spacing=int(motd.get('line_spacing', 50)),
+        )
@@ -1,8 +1,83 @@
-class PictureDefine:
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+图片资源定义类 PictureDefine.py 2026-10-19
+Author: AptS:1547
+
+PictureDefine类用于访问插件自带的图片和字体资源，资源以二进制文件的形式放在 resources 目录下，
+首次使用时才会读取，读取和解码的结果会被缓存，提供了以下方法：
+read: 读取资源文件的原始字节
+image: 获取解码后的PIL图片（共享对象，修改前请先copy）
+path: 获取资源文件路径
+missing_fonts: 资源目录中缺失的字体文件（不导入PIL，启动时检查用）
+PictureDefine.<名称>: 兼容旧代码，图片返回base64字符串，字体返回文件路径
+"""
+
+import base64
+from functools import lru_cache
+from pathlib import Path
+
+RESOURCES_PATH = Path(__file__).parent.parent / "resources"
+
+# 资源名称 -> resources 目录下的文件
+IMAGES = {
+    "about": "about.webp",
+    "Background": "background.webp",
+    "Black": "black.png",
+    "CouldNotFindQGroupPicture": "could_not_find_qgroup.webp",
+}
+FONTS = {
+    "MinecraftFont": "fonts/MinecraftFont.ttf",
+    "ChineseFont": "fonts/MinecraftFont.ttf",
+}
+
+
+class _LazyResources(type):
+    """让 PictureDefine.Background 这类旧的属性访问在首次使用时才读取资源"""
+
+    def __getattr__(cls, name: str) -> str:
+        if name in IMAGES:
+            return cls.base64_str(name)
+        if name in FONTS:
+            return str(cls.path(name))
+        raise AttributeError(name)
+
+
+class PictureDefine(metaclass=_LazyResources):
     """图片定义"""
-    about = "base64://UklGRojWAABXRUJQVlA4WAoAAAAQAAAA/wQAfwIAQUxQSDsAAAABD3Cj/4iIQCZt0/n3vjcR/Z+A9S7/8R//8R//8R//8R//8R//8R//8R//8R//8R//8R//8R//8Z+7AQBWUDggJtYAAPDmBJ0BKgAFgAI+nUadTCgqJiYkctuYsBOJY25P2a3lzjZbdr05hheALXXl0y8Bwc9N+F4cmp3zzmaX3jYozF8P/K86uex5GW1B01Y+Fz/7PuO8CuTfov+X/V+ovyf5ffcpPPjfOPyhvm//4PYX/Y/+T/6vz/+iL+uf5H1vepPzUf1r/Z/sb7p//t/dL4E/2X1CP6//gvWn9bT+9f+b//+5F/QP9z/7PaZ/+n7zfET/aP+/+8XtUf/f2AP//7c2/tep35X9zfI38v9073Uzn/6d/h/5L94f8h6cfnPwL/cP+5+4v52JZji/3d/Df8T/I/kF6rX/B6u/af/w+4L/Pf7X/zPXT/n/+Tz8/u//V/b74B/5t/fP/L/j/9T+7Hy6/9v+o/3P7je9H6r/9f+p+Az+df3b/sf4z20v//7if3H////M+Fv9sv/+Tyi3Dpzb0Xudgp/4xwSGRVAG/f1/na1xu1xHSdW6SrzB+ugKMo+nbuGNIa/d2KqWhv2WC6AqBMSVqGTSfXoYcSi9KwSRUyaAV24wHE5SzoacyNxi/Zy8qAP5AUviLEjG4XgHqbsRZruortREKIuTaitk18ZUVtjZBczyje5yROPV2hnca1oto2gUnN4owtVD/bJumutn+ZvQTGrXWX8USFZBa/2n0rWmNLtsfcp8Cn67flhIT/7Chee+pP7MtqFHW1tKc3rbUGQfPaho2hC7pe4iHvXprjiPEMPcwIHJ5abW3x4HuN5JVaFAxkd7sg+Jif68qy41AgJIlRE2m04DBXOaa9vOUNKLehP/jBltxqCJTyvqJzGf86RbMJ9lpfV5H++e/ds4cRDhoJSfNPdeQGgSYMw4YNXw6SNyEvn0HtsM2DO2YXAQOt8WSvGAXEgdbwJ6wRItkY0ocmb4P38I6AYDukZeIl6iifH2VAspqurBb1+rJDiiCAUfYmgpU6rHytQilxmzvtSRAZ1z4z6yR6E/ae7Q3mviT+YU9TfhS7c4aCiczVrZ8UZjSu4fWOmfcaYSUcrd8dGGJrzrBvaF3h72WrTcGFSD3tciWm9rf1ibthSZVal0Y9zasDgD3KTRED2/79Re+24Bj4ttXPH1lIJhe5K+5vxZctNvnANHn3d8W7UXULUrAGnw/CpV5pDHCGaUoZZsrchPDImQZUTrIrj6YdsN0QkLr+buRdpGCxwMNm+nLxwoYaQURRovtRvJtRz38R1v/pfpH6Z3ebORkwqPhlaEuY8a8zo0b1MUCugS6uiUNmCAA9/y9dcit/Y1bhQPcr03V6LR+nH3MgtDA9tik/V2xhRu8j5yjRtiQbDfsimPAibzUf5KlaVsh/vfi+vQAoAXXQYr4p6y9AxQ6SeST8P93WJS4qh7n5zdzoEd6H2hzbOJghOvUJEJEn4OycfaPbqXYOThezqSDCP154QHdRaJddLyEM6x6bT+Ye8j7C/B/ZQ2L/RSeVzv7VzD/vFZsySAWrO7OWfGmPXbVMABShZ0hHxhvCj8BQ7I22CuYmDNRtPCUiYzsSToNjQ9I+kunOoHK3k51RI48KzMjHq95e5leV5CJo94JyWW6TYAWQP/tiWYo7MnmTB71vGScl8n8ESdM9hPz09VqyHBRJbI2E+v2JZhKuYCeeRBxKVhEcsi/76OzlrulvPL37QbZO9zA3qSmXg2xiaAcnUXyZbm91BSD7d8yJEJBmmc98YRKw3SwxSPxXO8OdHOwC7iBnnWjLhy9aViOTQKdOXrkRSTK3Gt9N3h8GO/gfk9z/Zu8d5R4tADe8C1tNyxx2wkbwgQHtAYu5GgwuIqOAnKjE936u9i34LkUSpZZFGnaHfVDm9joGv6JouPJ1q98jR7PKUggEMle+nsfgsWO3dfgkYsXwVMSVA4mIRZvBlyv7XQXZZcYt/V1hmLKtOs15Y3PChIyD1rN3imx+NmEcFW4SWHAoyThMM2bKkCZv70HZr5CMMeY6fS7F+hzQDUzKq/7Sv75l9kTKiXoJEZorYJLwlhR4syFmIa9wed9WXvc67MKBM0FaT7NYaW9vGs/Yb6RcMrlghIxk64/64eE2PzRZ44xMNM38wwkBfxhmr+Hg4mKy5/77HT91atmaLaNFIjN8UUOlWR0TPkeQ8Nb3qwEuq9TsgKTHmNF2KRlyCqm0w3jPRPDul1ZKnUPtw2Tqg2m08W2/L+Zf0ZGL55Q5nHeHZgyGk/2j9oBdOf/4GBhH/2N9Oce8RT8t0j9eBr/nyW6hxT4IF4d6L2EgbgxmOEqJthZYSOpQf2ULCLVwS8QbLKhYa+CiVRyVFSpLiruwoJQemGjc/4DBLZD/Qh0gO6mQcaaOaSjW1ESO/nW7uW8lWPQV2I1Dewq06piwF3BLk8ALOvKd7SSt0WvpmGWzE4xNZ0M0rpo3MaTKY4ifKlFrRS6PPdippZ2Ai+F60axwwwDcYrC1QZ4oqUOac7YRP33TeVCEbD0G/iCFC3o9B2s9ZMN400X7fZjiQHOwBn42hfA0TANzdHsKzpn5Dmg4Xyz/T/hY7TKZyKmLeHCeHddgZpWYk367RLbMQgdqV38hrNj3r+YbfDbgdPXxVvyaTzMOcuaUJQVPXR7lxNjeaXHdLhcKaFZNBmMAvw757LCDSWJBPeUeL0rjx3hWDQJVk8PCj5nGxA1eGRSQoO3IhxnjE9YtnEXJPu9kuBOd1mZ9jEQFBOGpQUt+ZwLFjrZATvmFvaYcUp4A1WSY7b5WwxgCwHj85RrBlDrYTDAOPCbE9GYjEvAj63QTWw56QOVRAoszpRszJSVfBnm7KiKopGiczPgtH3O/D1FtGjKjV02M5n9/Hsm/99Tc0CcftnV4Xc3TYuywvx7a3Ep5tAbfYZZ4rnM0XVKv1V2kS94yff0DwTZfruxncKK1E5EnmbnVx12W8RlYvYhU2MZaJtU10EFh8OT/mZQ7/OjLjB+fioqGBK2DLd2jQXs3W72CfB+O+bUK4khHwCxvwU08lefzf7+uGukjq4NIUi5llOjEWm6NsPIboWqZEGSkK2gqP2t+3n2t5VM0VMR7yEwEZgL+0qcSQV9AM0Sq5pN1fuPE1BPM2+NSfrhM08opl8ANFkvHpTkOpo53+e3hXfGTZGwmWfPq6HychyIWSI9s/Xm7B5vHX3zx/gtvwwHnZsVLrimJOheq038KPFmkqEZWy70XMFFdFXyL8gvJX/kGAvIVi/qF2CXlrEI/am9tPvEHCMJb1mX4oBmK/lWVHY/NDMMju78d+86HEwHNHn0eh2V/Frxa25Ca58mmDfGZMeemOT/nUFcA3IEA4IXDg2lejZiu1xKfN0E1wSZzjY4lZyPTaflY4DiCBDLCCmWkXpVXNRLji1Rp09MwMzxevG59yktc9UXjhvGAPUHp4BmR9LBOtGMQhQUbenrFSQbWW1LJzpmX88M3HoYmTs9E146z57booekllrROAtf9g50dg+LUmcUQrFd8w+Y0yCNzG9ytcCOm3rLB9W4kJPWpMgkwwwxWDm9WjmSMbTdPjcl+2lYnXCxeBDFuF92ESj6EYE67CUkzy0RpsUv97pEWgr4U19jZSHIb8Zi16HBsEjQXT8v1ZdYhaN+Px+Px+gHL2z+svAhDxuynk4fUOXe2yJRlIFcqjtPB2WMEfvFdFjjsVb2crrH6SA9oxurBXUX3/tq6XdV/4XHSFVvBzoGUpQMMaN44xnvCbyltF696XXbCw4EBXmqx9qyp7g/68qiTr/8kVyThQ/2TQHCRkrtM+l1fsxcK+LpByHAcSc+2sSyvvOy3AUIZfM+yhKdBRvpzNeSpSBxhrMctej2AcfAVyfzkLD1PQzpfpfWsxWKyiyAyGse9QoSa0S8tBs2ni5OCDqV25cfdedOLs+k/QOJCP7JIuUKWwe/X9CWXA7pJhAWmQLjPbrLY5q2vH1wrHCBNl/oe/igbatFY3OxNO8dKoFwdW1TeHRKuzU0fQA+tK91NS6XZ8tvy++edyo0aNnLGfIiUv72xFiGriC49hzNqbrl56ryks7dSQQyPfN4U8oooS5sZhYxyZHvCGbpfzx2ESLa2uRlOlbifK91migJKiFVdrRUlosZc0005Y2tsAfUk3G2EE3xwy0k9hneZ9A3/tJQMFpFOIwaXAbEZUhFPSy1WARf/j1jMX7ZZIUlq22khj+aOEzYfNz2H9iVihFDG374Yv6tvoWmYNdDiUZ2gDdEQgJvnOufosJ8VkQLVG8v1OO6eCuYwoVlF6cXCir45y5tsnsX/hF6Kf3W4oTIgcCXpc0CY8CvnNPxFLtyAWymw4xG8657zxWGmVscPss0G2Q+PdwHHfZA6xPvSLHDTOy4aq3T13kTAjXLHLk2FZpaMdpFDWihHn3o+nLham5XpT7TDIGsil3tfIvRCIeddDSagYdM+anEo52UF7UJ6pOmFYgc/mC8ErWA5/zJOfZP9K2RYJfTsxtJzhdTGJZ6o+eNnV+VNmLgUG6JLSRpnFm7o4rcFXITfTvjn4C1u5NakfjNnM8PUBNzS4GxcF7IHmGheurJ7qcMfCdJXYJP2uzBxF1A9B8Aed2LZjzFFG1uo+x7af0F4gBpoKQppxZ+GMOgDY73Lr4ova1WmeEuzyjCTmf1isMwkEGSZghCFCjbmEEgmHYb1DY9/llrwmDIYi3LighiPq8fIt6ZC9x/StJG0nP1cfZvKnq1E/gYen814Br0XV++bHBL2kitd8JECjkeW1TFb+ihocsr/gaQZEtrpFw1Z+BJae3JadPk1maa32h7sUcyvzjRs6Dtz1GPb0jDOo4trT2ahO1yjCytmSyMdrLqCfZsX4JJ/YK9KCbuhVuaF3yGzynkns2Fvezg6i7ukGrf/8Ip3sZonsmV9YcSEascljjgLDjQ9QV9aw7ag/HmlGzaPNPq6M8e3HOCXVJy3ajdFz6mRqgVi07p8dSW84FwLjBh1kcOZKi2szORDfdcgAwjLFpDtCxYh9AMILlpL8LoGB9O6KUrzWnP3hbVDtjhOKvX1EDYHlswexQYBLexZougSApl9O2pv32byFPyKsoPhmLMa+srcJK8s1l8+6KPnnUvMlrK2Vjaxi1CLT8yIt6qAMUF9hxBecbCgBMupNm4+RvW0T1DtEA2LIIq0hoQblcmX457uXNI/NxLAGS2y8dMr54o1QgwapMA5Pm8MFS9VVHfuDv7nD0bhvtc2/7nrfC2HMHjJVp1+hDrypEIaYs8SxlxGYTVn/9/V6Q//vhmtxya674ZFUxzTIsyTOJRIn5De4myrRSrqA+PsqbOGViaSuADhwywuMh3pQoZyngICoOXyXHEu0V1mMLZS8kda/VnOMsvUyDvH7mTs/xfMNsW1IiTJHNdpmd7Z7RE5ogjed9GiL/yvylQB96hZPM4lyxB1PP2eiyqQSRanRQvpD42khtkAxZEqCygslhKl1Hs1WPhbkqcBuHIvLl/QazZFQ3dTLiVKaAKfs5USuc1ARfMUh9/2DlMNNLFzBJdMkXnvm5NoQtpLEYIF9WR80eIARmnqdtw5kzBs/wj9g+XyKX9E8uSL/2lDlUi855XjUBnF3cqi8BZ0FnN9yTgigk4xW5ZAd80JLqUqtozLuZUpSRor9iBDNFXjm38QNIW65NDGl45lK3vFvYlOIArNtMUbzxad65WgK87Nt1SBPWQBoM8KOE36kFEcHAJ3ouwex7ZMZMhNVJGn6zytZ2XTKNyFYIogsLHHc/zKr/Zzp3CR+I5oMrt2RrNyf50DZYb/8laPa4vs+94PbthekTbz+lOQwgtV9jOI7tCcB5BdnKm1h8/vSgqMWAq8uyb0R3QUbnO0J7LzBG9SD0E1Tx69odqsMlA3CNX2gu+lxibSqvljCWyDgCySCehw0P7T0uzbx+G4gOBJ/RRleO+JqRhPkPtEBxBAGFcarcXs7sAT/O0XNhkXBZ37vqkInXzW7P421xxmBJVPXW41WRD85JobBvdnqqHWibCj3+w+e6jtxP7gI2I2eLdEWArrgDcGRKfJiT1bEn5/PIBvcoDQa67v7SArCwsk6++cI4tlZrYB2l5D2dJvdTWd7W3h/ywek/JR0W2Ug5O2Np6/ZgXPocjLJGwIHZmtUo6tgEohaxVb96IygvFFv83HRmEp70C0Y9IFbehtDlH/hi1xlU1KUrTvPTSkUaSxnRMLV91IiBTa4h3ANuzBzFeZNADnV8KDE9ClkRs+1q31odv5xWejuzADUPpWCsQx8iLod7JPifwRACnk0IpipmO5y6cotkuBBln80i+Pb2moINweEiPM1L9vKxW4vqP1SmHakJV9J/MiT8gIJ8xccsfg9JmisAR/okAIUyjznYfzIyfYmwxgp8Y1sp1CaYapzlsIsOVpGt85NO2+10YP0DkrrGP2HrsDp9C711elAuKHaD75knWPa8MS5SELJaEt+IcEOkOVdfhtN1qbVYmbKwbhAdmWGr9szWIcMcb5KsLJXQ3YS2ehOnz8Uy7VZjb5XBuQShYEF1BVx9BwxfNClnlpo9pQNu+HDsjtUk5hs0JNd5qV6wtsEpkdSe6xkusjQ9oIppuvKxIZjQrzukeFsUdKlL1Ou9YD4OpcFub7pHhlHOVBiKEhBUYzwaMgFB7ZEHHVq5Ps3at530S8nI813/fvp9bLJwnNWEIL254E4W3Auzkix1GDza4o64ZRzipt2nHU/cQCTt4fc3rOd3XxFnaiSCtwE2LmJz1YRywP3M9m7WcoqqO/5kEsN0yqGlJi+MednIDjrIeJRgikJXHuJGN7ha6jlYxRorZlb8qSx1Nm9V3Ob2fneG851dxYI5ccZWnPo5aOn+u5pCf71J54ZvmywJtGZI82l4EdUHyl1JJlRzjWbdddL8kCY5aDrdH4moav2L0CDwtYZ7t2p+qNS1XtTmLkRJRygk88lBZikMDXfeGg1GqaaNsgGgmrR6Wz+P7ZRrITcm8zjVjcPLzrvMf/Gz4BWXq9RbvER97oCBD3t9E9tF1/9k/nSpA52YLl95Dy7LdMkJb/YC1KKGyz9rQgVZ4/gaJiEX2vMBkvT6M5QnFngZlYxdrqZhGodCvQ3iJPba+j800+aqGYVaBRSFOJaspCppezkDVbe7JNSR2XzUDOji0VzhN1YW7XCpSeZxZtZGr0Rtldp29BmL/BC2Lw5nIeFpBeIgclAdBtwDFZgwnxKlspMHNGmkTb8hJWfE90QMbjTilopo+crScjpSciMf1ScmjC2IIYZlaUGy0P/kLi7C0b9JkZVha3ZiwNqJvo6ZnpkuggsEAsvK9L3UUqDNq2n24lQNHHAAjI+bX4SOpMl30zU3fvDSoARItv23dVoNJomvVFi/yuaHk/CWHDy00G5YCDHGIcuKv+RxswbQ8oDja0okFzWn2opHMle6243zouGO9uGCcUHdoKT+R6BZVGH93nD3A75KXhKOVDmkU5oJN4NW77MdQ9UGkhCmy7+XTtbjkFHJmPof9tBbRcShp4Afi0G/g+UhCPNAYTQUQqSniz2B0TYle6alHYjRxdILPQqofOVAqVXpZTM0GijsDn9rIes9Q13Blg/8gZ7a+2ol/tJnzHyFv6XQlJyF6D8g/Q+t4mxBM9y4IkxMRjMuU+6utBGuKZ+MGHTvbF3k76JuMXTMeuNCkQi0i+ppfj3uvSilj4RWVy8ya5VuH5GwwrLdKMnPYES2j3TGos1z2UBytkO34l8N0H5m+PyQHb+1sM8q+u9sT68HbHAgPBJpKwzRlXxQesxDreLs35XfmIjf88+sjKDMmtKwb+AxhzTEg+nmwYJ21jow6S1jgS+0jsCETYFWk1QIdHlQ5TVfj+HrV9PvqlEUB+iVFhAexAfzbF7FiLV1fk3BELkzAcn2fOhy/I02qU0wBQLOf2cU2a/gjtfCuVZN/Y55WlAiX7sbbQz2aul/TAh855u25nc8EuMO2GUydM6rh2V6g0O+NUofladTcvM+iQCLdSpC+lvJIgx0+oWaK2C4feCGapux4H9UQDthb6jYDYrZjmeY7MquE7AYMMWmn+MFrSBEOmMYOHiQfaB66bs2w00b2M8EgmL6JsrkjNY2HJ4meTH0n6hC7yuATn71z4lTvHGOsq+LCRu2Yj2+NsNupouvuyGQ7so0l8R2TXqmWtpxZsw6G3yjuOJn645FCuGVdmUtFoOuvBy8WkVD0IB2+7PbDUbJ/YpW4WJ/Tt1IQ5LH0p47FAmgBxK+lrS9hg+ZKqS7uyHaZhO7lZLsObN0xrHRfrdDHxUTaWo9ktgbqwgcBhbTdFmYKA7jQfn9vGlhrCbxP/p+Jjpx10VK1n71VTzN/T5BGrYmXKUsThCxLTpD9cD5i2Dkjv9QN4kvDWBZCsKO9kxRu95WlF5YR0ovHifnWrLYA2TaN18rw+03Qkjh/FFCXYY14Ra9YBQ5Xg6ECnXqNWi9eohgZw8L092dglkFf4shDFQlvaZB7GminHT+xEajfxbJdOcKUUWYYs9YcUJQh3ZA+yT7Z4AiSyyK1tIyVjiwAiKhvk4XWfpNrt2Ai9mLZjGp7cW4wMejuwwXc94QmsE1Dvgwr5IP5BXdWx1t11lKuPJYxZr9XrM2hY2YGNGP6huq1expao3SgPSz1r+5V/ajQFZsyE38UBdeLSJaEkM9M6Z7oMnmeQHFrqq7XbIdkZAU2fmrQUFIhUpXPl1R3LXep4NmIct/vbneCmRMvYFffXFvGpuJYAK0hcsDk4+aueJGll3sATgBrPk+Jq2zEq/z8qBYDlX867eAgqqLhtNZ9L7+pPYTLbY6Rqf0GzUcRIEmjliOK+eqRRD5xxNPKwids+9TvbP/TZ4pEy6s+zSkQPbVtjAv14rhYJUEWXVqKMfou3qbn/iFSW8gfxo5Py5ESgrSIOh5vBJLNGaqyUyJEM8FE0JtK7GNBG/dwxQ1Lhuu+Tdt4hjXWSBhUT3kZYKM1wneom1YfoSFCFKhDiQp+TidaUBsQ1s8HpsdfSADn4UA0pNqeGvQv+X3/0MOf7osY8XvcFn7Awy1EYkCk1IN10vVR0J8jZb8u7XdlyXo0rDlNpz5Le1UFG/dN0HY9rUD1mQNUnPY//s2J4TEhKFycE3iGiSmaCNnU6hD+tYNfTwqD719SYe3XixW2HUQl+czEaR7mFGAvZh3NYEdys6joutvwlXIxDIfmoEd16mZ/FwqSiQ7RRjoRmUB7UY8YnKU2ZfXKxnrbD4JjB2HXO2cMuXjLPAbZk4Cd2aIHBwyiYMckZZPF4WCDQBASsSEx5vL2sGtpEdWClzkAfWI6s8m75Qf83p2HEpp/l/DS+TSbyP9N8699JVpRF9W7zULErD2cZIzRbOk1LpqKTS1+kFnH+dBDDVM0YIphzg1Xoyl4LJf/oropfYQzX48uKVIQfdiHEDT6Fnqs+N7iyI4/Nab5apGX+MnKgRNH5dLWN6Y08y96vhXip749cbU8zVfMCM2ssXVlOOxZjUjK7hmG9RPtj3H+kmrgCCe3KI2WmRaLFw60HQWYSp2QZFyTWrlRKJmTIgQ24/4JxvXt2dNannapE/YFH2cIaVSQCBsHj4RfFp9bIek/TdV4TvWTMIaf5vT8IMndwhYjF1BHnXUkU0p2ILp759XvlUSAOrqoo1B4Cv4LBP2cqi+Ta5r3Vvd9XFLJ850le6f3TLXJxQl5UVYKcVr2E5ENL2IboE5ZsSOH/JQv14nbhZV70ViGEQP/mIg4VLOIbYqQLCi07DV/8ebaST89SP8LtUvpUi3vp+pIlddSJuDjq8cKSHsGDX2AlQTVnoXvESAPh430rVh8XHkZu++cOxHfvAKHboi9vkbwygbxYb92JP2mK8fzKUtb6CJUDkJpTzYxwwniJcwo/mONf6jeQtO6YkCo32vCaSPQxVdY3FUkM2z7CDvgyYXg9a1sSetfnYDurL29+mGRothghqaXrAak7Xwddh+EIgncWR1TsiUtM54r8WpQJKHF4YUcNyOj7Z3+4gwHpeYg1wxxs+gbgRg9wMYLA7vdEJ77Gg00gBTgkztP0LAFtENQF3Ano3Xn5b8Q0uNbSwn7t/MIs4LlsxfuFPX6Mz/zrYokrYYLAWYHbT0mkAWLhmugUxU/NfZTiUlvxw0RmMUaOcOFwbswxyt8d0oWwKKBdCjAGbRj9gqNMyQN+qjwqHlER5CzvZGdzeN3QeMOtH5OQgSCHraij3ywog2pMQuXFuiickLs6XjclckFsOdxWrFN/STaj/G5a8mnoXuCo752eVQy9bwfDiTsvJKvf7KzIve8J2qacWsUGdKDUNC4P40zz7CnW4YYMl4umAwJNpP0pERk71G83UgYS63k89ceZY2+wvpeNQcxb6Dv4TQatGkNmVSkwwJvCzjADycCwiBPc/DGqs58rRDUi9ZcaMTjTvyvb7HHUz48KKSGd3SsWiSeKYB+TyhUB+TVEJ+IKRnNRs3nUZlBChESW89Vq63LGAveMU98Qa9m6K6pf6MYFDUxdAD+3pmbgWxauEaFJm3KdT8X5b0LzweDJzYYEczLluY1hXT1ZytnZna0rbTNAXpGVrfDHRVzvSyCGgNUwXgu8CQz2cKhwxsx7hXwOLmrrXKlzVcA2fKZC0F18GgVL7T16YE/xNJGkjwBphsKNwWLln/A4FQeMzEqnziu+WJhsg1YmnF4KcS+fbgH390QFicnZzqefUdKNe2I1CdQQZyKyAjtBlIGr+DORDPLPi77Qa4JVAvajpco0/hgTqoxD9hyggJijVuKjlpVQ1AWDLiPomQKr4BNz8tPH8u++YOiocMqlXW/EHV1uijVqXcdv3SbMF6uPnpw68VV/weUhmNXToHrrVBQM5C0HL1MGB+EndaJgdbCIRBuM3TN/7Fk1N+aO53Y2GiKkbryo/0xm9FC1pc/639jcaVicz5twbFCbt6f6xD8q4eDwALSbEiJmyMZEuiJ+Cj64uqFs7vv9/mxkQT1C2VvNVwmyIZadHWlkLr/NoxHdhcGlPoQiZbT0rpYCHdl+Uj0WVCjHR6+pZFmHYwYzKyG5H+lMKeL0rg1jTidonXj6jsNTXWCV8wosp7ap0pceHhbQogyzzo58IfIYXr/w2KKeFfG2x8hGDgE3KLtuhGNEChKM1Bwigp9fNi6RFXbVaemJ54hLGNkh4ccbXU1OuUK0bz5db4vCqbkeux1EnnjBi+tr90NCxS11pCDVCB9j8Mrj1CxdJKEurcKfqTRzrfdCf937Peb8vZ4ubNfy2sQMJARHXOFf4mwN0i9ukPSLemOkrkZRkYMqW85IvBmT1KzgionUDnr5ehtRBAKbonLN18jExCTQJ7gA70Hu3tTxYsBfeurpTh2wXdeH7TVoUW2i5ZwlPlq3nqLqW7Lg6FSVZJKQlLVPoukuV/RpH9+b5j/B8b+SPTfK55tY94w+nCIfNOMktCEPN3exDVbRXY6BQ8RObOG4wHuSLI947cppuO8oKrTc37fndNa7tpLVBHuvWqDUNTA/HMcsfQa1Q5xFqkOrhtAAL/FRxsnIHOxD2QA1rCmMyIMEPF9WWkubkBtUufKTLghG3KTGnMS/VPonQN7nKRlvQCvLEO6Su5qA5WGmDFUE7rV8b/zkS4ppr/EGuD4uJqUMY7VEd52KDY+XKlKNC8eDh7NBP/n8cts5PE5e8MznaD5kN+THBjp498IkQvPqgL5S48sbTbcmPXK8xPpFfZQY4SdZ7E37bVuC5cXnmOP/Y0+sJzrZHavr0KLb+RDGdy38XmDVZU9X35xwW7vmsgk7cFSBO/aATAh9VaGcvfg2BYVEzUck0oJoj5M5njVP2I8QITs042rpVC+ZjlZtOe5xf2aGLxz9ahu0XTKtBuHiQ0RIxYl5Tuh9F75lV4Ilm5uKaCTLITitr0/l579oDbjEC6obSU/HNDf/tuHoXHC85yjHwcA5VeCDSBzZfaSbviF1gGPvFLby+kTLY1yoSrqsuuGwlA153DnkC82v9N1lvqr2j55z/qJAdqj5ivuSBMqEJb5WsKKMZgPQkm4Nc1iGJaxGaL80gcBmD1+G7sEcrWDlftmdxlvwpwInFn5mmWfFyybPzNVnBp/RdPZaY/ujN7DBj/2+GpZl46rlOY8Yacr7eukGTOQNw2aH5PKTk8hB5ZOvAGQAlQN+zMPw5CfIrkk2KMPa31AEPtcZXuUCkiRq7q/GYO11w9aq+S1PWVlD0iqvbjkgaaqBny/v78ClVUS1nXevKgljVL+VC3QQ3qJLsMDmY8wITCu/pxznOJvgmp2NDcRSCM5TJXWHQ6ps0uUZltUv8KgEd+Mh4s1lQwSCes+60aiDAKLTSxjEsKUgFlvLQacWHeRIwL4OSFaGjnXPuEYdjEk8Y30vBH80R+Nf6tOSn3HjccF0JIwELgivR/MVp7nUZ9VaizzY1OvxXNYLU8nnMWzFXaausUTCZTi4J+5pXFbTOVxxreL8SLd0JLZlMfk32FkAw/bO3Z0eWiaQnLn+ZjAMOFhDFRttCPR/4ng3T5ftXX42LI9ZFTpFzJ63HvesRLDky2DOhOn/f9F7Xhwns6xT99ro/PQFMXBStGfxoJFGuPJdoZi8WRIGZm4XUbn/U5wF59alqsy2KqsjpwnxGWeuEK9kPd5nZlalO+r16BzWvd5ZSAgWF43OiSPTbcJrVkZcji1AaG3J31v+gUzNFK2amLfOc2eJKsqquryvPOf8fA79HUlXgbDeBIvaMhRgpfiqG16dvg+clWzcGVGuJi14OXWgycBc2YF8ky7lI5/XEznIx5h3mgiuKbwPmPc2hTEDPY0PQdTrWcaKbjIUxLt5QDpMF9e8ZGpEYCmKFSYRM8KHAWWnCyCPZXneT/CuZbWyZyBsvHhkXOwqgW6Q/t2tyYAaZwblsfJLf4R9pqoDy+telaAKnF7IOV3RWhGMHDdxpLdkjeIZfkgv5i4pPaHSm6fXaPiqgeZracr/wH9zLGoFQS2k2tb8h+MRCfLbiEi8daBSQHITs4k0u87vQ1IZag98bw6cbGgMyU1vQJT1Zr/YGRPnkE+Rd5ylQI0beuJcTBTzLPL2SHnBv0hzr2pHZZzgrX6UHkHK8vzrLonoms+c0WHw3l1CJBjpHRDIcnvyFpIpS7oTpeTFKiesp+J3nltgjQ5+0M9Jhj7ZRXjbZ2wjsiQHucSdjxggqJIFLQpEBJY2P3LIfLN7nY62MiLmOP/xLOY5jPyLWzQthL/uGrWcoItUWZ1qXnaSH6A7fo7StHtCrUIEfEIb6P7PaQXEBwzqqyi5p5yKI5kVafX255m1n6117ewp+DFaBLrUf/qtEDhWhzYevaYNr66qHBa/TLlQ0wFwC3dlOgJTGQcgEKFWtRk3ec7d2NAG3y7qBjwOoZ/mO3E5b4VPMVKe4Cy4oKVZc/HkG7SzuQqQzSszdqzspJmvrWCbg6bu/FRsy5FZwCHhxZ1WxpBPWs32I+fAYTttcmK4SP40oAJdIVyT1YhsAA/tqwwceZaeJFQSrrxlFF6P3wp/H19zRq7LNJu7noMhpG6L6NOi5you+XdOfJBSWkSXc8M7TOmXWuGZ44X4vjgFOxoedMNj90MwMJoX6+3M1LlUJElf20Oxt/RpD5/ZCIRrY9fyEEWw7aNqVzZbLrkMF6hF70ecW17N/jYBsyoIigLZ94bDqk2Ddadu3z3BVj9e6fZhV6FqMfiSJTFmBMeBoIqManpqEHV72cDg6hkSj0/yqKFMImhkXNLlOlKwsuGzPH2xWo0x0AW8z0DfjOMsHP+0qNjlfa6saw+SSy9JjZeIoPVCX7tC193AGvUOfsRuhPif3DUch36JcXqtzFpcJ8pkhEYsBNhA9TxiocQzrRAskg5Zd9YIj3BRVg2fF8IbmjoTueDLdTyIrn02yzN4dJxI8SMAfs4L5kwVDzmWxRNLNJ74++uLUAm02qzCc8Nj6JZAI/Eqtt8JEpWaHP2eptBiaY0Mg+D1gBcyidtdOimwErxSRewQO48yQSLIE8kezrW0vtrENpNbeJmxSJT/wB82aMkjAprpi3ea9jscoQGUFztx1oCE/IZR8MPfU34BGxThRNcNb3uxqhbbbFBJIozhNLP+DRB8gGUuwE8HhAnroRFlVDA+rA2tXCe4dtPscBE1ISTFgwLcXXg2cyT+I8Fi1qNaj512f4hJfCKC/nTbCceCKilil2O63kvtCLzlOm5Q0qIsbsZ9BH1vy48LYRXyPCPzZd8mDZeiyE6VXoLI38lfZdgUpuA/6TuVHfg5PeagRz+UhcVrW60Iyy7AqWHxXMOfYRUKOTzfX0ozLWuQhdRdhbbX/d44ynKEEBe2yNrw2Je7/g96t3A33GB43RhKc6Z0/oD0r6TBdX5IXsNpX5KsLaIlmXUs+mZIWqR3jfBfSSGJcuYZXTnoT4xp/V9xCYR/k53+3mQ55JwuvOy/QUuRacGuQpu3PpxIPNBu+H0+eOjx7xi6eAmXWPbOeOaQf7JeOA7LefherLPXAMwKUP7UXbDiPc2XCtFb20KSppqVm0JV6OTTVH20BeFAcsX8eY9ICMPTt+ldoeL71d3A0pBD7pNFwhMb0bfJMIsy9mwqVKJvs2Nn6mPdfozTgWeQXjUg/MnFbz/ztRISndxdrXLVZIRJxEdEzraKDwvOCeQ6B4TfWWfPR4Ua8dPf6HckpGgxwgb77CaUQQrDLTh/kBTN9hENPAnWXciuZ/vSKwprdN2M1YsB3cKgXOFtqzZi6to1CdN4p9QmT1+B4PjFOgTRIv91WaDMvx73d00CXmW/lSHckeuac5VgPKe7/7mEJNCHlFzf2ghVHojrXsYe8k6Mdx+fIpx5eNU0Ca7ZUbDo6RZsgrpzal7wTjbyJGaVV42ujko3AxD750hxwqXMUJR4I2y/LxV7ao5JIX37u74RbQbFwWCVji7hWouOyN1rpg2N+lmtPNtxNlXEWrEMhcqv52e+50QTkBoTIJlQ71BumAaauF77SVpdQJNIX8FfwFpnObuAXLx5dUBZWuB6JW5yJMT12EtqAiRXsjiqUW+FHj6+WekSp8nxF1Tki1WrfpHTsbZ1UpWQP7qqmvOoQfi2QQPWLX95YFTdtPZd97+ad65kCCextSNyeNFBeF4pwAKY5pCsY8mSOFp/Veqd/pi3nl7yNT3uZ3PyYleqkd340a3m5O65t7wDC5scNdcAQNHcMzOALItKVkrtaKZ8vU3jaVEk7gaMXyOVJqmRbtarLtyfMPGjX6wYTCOE4i85tmeiy+KExhqx4nX5uUI3SAfGdMcuLoNouGYwgjECve7JAm1PBjF31usGMtq6lL5zwM5vDtmhlApwhpHNe2uNSfEwLjenMso9t7V0wTQZ2NqaoqpRxPl7OodQfNYOb3kmKyfkUbbZ/lyOrQfvRq98ZaTuGgZO9wzXrvKfg26mxAAiWsfhW0usdft/f1pUC71EMiWcrLL/CiIADhTG+gu5Bun2cusoHj7Lit3fFx3zdHoiv1pMxB+Fc6VrLAokR6Orwg4ITm20wYJtl6y7GSryISOq7pvK57SwrngInO/dUOvtLgSC4ZrnJzLdB3hKr7fMm8jZJWvvH0G4718UE+Q/nPM6GGS5L1opQjM7Nys5sOiSiJS+rE63o33X0E2+7GVQN9lVGyoNS6jiXc5ytMyQW32+m3aARpuMwXoKM5MiGSlEqfCXZJjpXdEskeplndJbxNfvXXmUIXjojnEU77siLRtI4z8fuWa9EkYG6heH9NQ6eTcvUjYg0Xn420FahCMdgurjvxbBrrGQheZjpnmjqPqG0RZ3rxiCaqr39bKrXvM1IyERGDrTGPF2p1MoWLeaQNLKuPh+zooGF3DxXFeILVpqgP/H81Ov9aSNI3eeyPoXyzwVmHGEaY7VbldAuoSr40QuFUw/06jHByNpiCkLd5AZWzjynJHNaLkkYWrJzFrUpBek/tZMKN6ODqB/LXchbV2g6WJAtD/YhIz12OEBEoHlV4uIDJ95exEwMfV1CkdCG1PSxriB/BtPyf1SCG9VODZbWRYHjMdVZg9Y1iO/IqITeXdlVV4sO78ddJyocA6Q5GN3+SsSSS45nR0fujsIn0M5isqycS5pplg0Ch1EvjrcvBkz5+uCe/g+4pwMO1JLemwtZUqtA5sp2XwsWiX6YVTGhwRKYk7S8yHbZWMDl4mUD8jtu+xyFwzeAahdfwxXyaTEvt7S4DQfhriaDJsjWAWlBI8Zw/7+U2tV0woqXhk31nNsIjI3QDrvRHX35GB1dynrrqbl0Qo0uEuKVmB3cyqJH4ahRB+mReZ9I/eVy0WT+BlwIMTo+ZP34dOXgtfG1VBZEn8SfGJEjjMwtSTlvDw195E+t5U3KQFjT2Iab8u9TnTZ9JYzmq/QSumiwVIEwoYD8henS65tfdd7cUCge8o8fPDXfrkUSweXzSbCRkCd55o5ncZWaqq+FMXm/DQDCCBE/5srCSepIxaV/KEDQ9BQH+yGLm0QrLaDVEb+buAAydymVDgH3k7xkvx7tt0eQZVk9Dqi15hIpZTnqjTJFTWHK3zxbn68jAquFG/EgnSeGn3568eUlewLoUJ07K6LsihxbLvUdlLVYnEzsv7wuBBhuzCBt16+oRN4DipIF46+f75geXAcZ64AejxUaImHUfGhwHsDVK5Kkk9484JPYw5mHMr4z7fseCV6IWCjgNnkRkgdV8tjnqwnktxgX1rsz/hk0MGcyyT/+0BPWe0lHYovrZkJKFNO/hGgnC7ilUdLR7Q01kDs5NvkKnw7sm/QBNJO9nLSnneaweGeZHHxl16gYHfiylP2Xl0zQZDeDjXDyOhiHVJF1xFt25zvchifRR5uJyJdtI2d/7fw/x1r5T4jqhXeoAw3I6jdZjrTw4Cx2vnOA5exY+izhXiRiRXecuv2l1GXgaTRmmrdC3cGKq4px+EQX43kvMCUn6muehKDxjHgrcMGLvFKUu1OH6Q0kro+ysAxqX3lCjZLMWCTArmZd6dIdBs3v+P8MxcE7mwKWyTP7prfcp1/D532Cnk/CcdE+vcRAp6zScSVabzdl5qaWxsSEQcsfeTER5wMh+T+jYGkjVzWzrqSjpq+NkRUMKjcK4mFyqZMSXAoLOQy1EyYCbKPKa5h4u1m48UBA7nLOJquvJB8h3WB5sbEml164XkAXlRP3x74XRUD1+vU0Ah3v7wYedHkwt+JbKTQpdwYnMR1G5FIpZeMBrlcb/1Q+TfeIbjLbiLnttMYhmOLHdBKIisJDMAU9Mbwhs0zUxBzBoeM/kW4IWiXBFGIAHOqANy0ZPutK1TlLvSOzjbXnOdJmvgjWD+uDZKn2Hqx71EKmpulg0XzhghcgKH1tPW2mfaIymrd88SLx8gIPFzQSk4iXdRj9L/gVUKZrTA3Bwd7Rn6MCvyVqHeDnLESMO76MJQmgJI67s0o2sIqZdE9+PrI+nponymGADhAKfL5WmV6U93Ay7ham3VGntHDq3HbCgFVP6oTYSr8AEObd3h4FTp5pK8GqmghIyXGx+GRKsddyLh8URWTN/hRwmF2xotVZXvaYhUfZyTiUYnvbo14g9hcu4yfHRicahip671UY/qcLRzINfOt9WcZ4rpG44vEwiLyy0z4xcYOAzaT4cbwQzuTPgM5T7r49qiWW6QXgyZKV6k8uRbIAXFsR/atV51ZgdhBSoGb+WL2+0Y5c7U6/4tSE+GI4V6z5IobBfeKfFGXDctNQXZ0q+cattM3QvBZxSNwWNsrFVmjSVqAiQ1NIuuCY5wuoQcAJr9IjcfuLLUyBM+GnUWriawJBQIYpHA+gILG7ZqFOYvWyIPCsZVnjkldDtojddcOjpdJCuQpijZ9HELrVm6W7sKsXNJkm9eXLmb9W4XLyGhclP6IL5V8skIMasFa/y0pO+W9xeaA9VhtShlVR32S6gWEVOUTQj17zO4kVB9H5j/QRBf8R6mGrdzjTHF1MG+rwGj05ZpAYI5mPZrm/sBhMdDlwEWbsRtflhHVDy0YkIZQHzWqM/6oJhgOOKMskYDK8R2Lk00JqLyxQY9cJCIDytHDSH0xs+/HBXf7n6zaE7AgmqzMSBn/zFYLcZbqS3iCceGv5szD1eve/daUy9MCRAVjIR6dP36B9o71BNOwATrVsBcC7ACe9GFjfNAJpmrvel2ZR35YxCkzcCZfZCbgMdscDRGbIWJvLpVR5rfpOgdgL1+GvmpIU1i+lhbVLlLlnTF3KDQGsfm6QqsuyxCQaOpr+2vSrekD5TYnmL/cwoU4azylfy0mCZHMTT6AaA1/HB5L3pDDTi3sog0xQgQLsuLL8n1NFCMk1zCs5orJ9mWWOi8HcLaoChND3PE47hztBhbG481GlSxoyxbB/t04O3XpsZ4nmfDiwmjkxmawBpJVqD1g4rLvtm5jYJ1dh2SucFIcYdjemSM/RRxeBGKbgdyCntc/FA3vV68LLRNIkCNg+8IM8BjHe3xq/f/+F/6BDn73Fq3MZNmQ1oWa4QpgDSXXUCHyoTn+UZIOxoKp/GB5rBA5/udtKg88twCEyPFo3XQwCHmpgQSUoneaXmefJRJomnGatuSrUAAAAaTZPp6Fe6fw2M+4Y5FOT5mwixW047dnIaK6FsIYEAepXkrSzwng+1Wo+aQx2dAJlu0cJev4Qt4CncibYB/yQwli5kSUITy3S9ZyjkDEh+f8NjVmcKjuWEbYezXbHMhivpIy/6jS7LVmWxVt5fF9ANlM+mwljrIRFODpNRqWFu3Hy8XK+ZAVuOb4u64q0PA0NQwSEgl1fcCQ8HWoUpKgPKvK0f8mn6LL/HPIgdHjWB5zGpwncr7BHP04zOiTQip73FKKQpgXqYGv22QFgryYE8oFcTNHv5cYo65KLcBHa7IiIewnGQSAuVHXs5dLrtwQtCqUN67mmKBibsqMaZrPakoliWlKBS3AMfw2v8N5aMBJlnmGCCJOHyqpS2JIL90WCc1Hytw0Z9pthMv1vrZskBda8QmCBGPTKxVeAJhM9KMK6RLfx9ZBWpGRlwVTgFCC6VRHgLxBtygwrcRXfBPujlzS2G6yuAg0m0THsGnCfys/Ff/jXaKd7qp5kEdrw6eYcci2SGITuMrG12066lev9MqxeT+E3JGtqV9VXJDDL5z1zY+Gc7wzmOvhBBDSFKvpRNTFIJg2m3vWdcSd1Mv4BnPHoaviZdpo+2SQxpk0F4VGCIt7/One75qXwQ5/9lqSODhJ+qrbK9mS2H9viMQqYEHUmtLJjVnELmX3gK4EelOd+bAWvYG6AYlu6yJDZhdCQd9rh1CEMnbWPVGddiS1m4kuv7X9b9KXmBUHu7I8Ph/p01DnGCM+aXGtga+HX4FzOABHuJ7NF5ppVwmevFj2jD6qf8OClOHtOO24yjSa7ox+/MvygQ+/0Gts90m0ib0mbmUJyC0JgD0fz3hVNbEbNk5KKiL+iaxHBl9thUl85/z0M7MPoP/izdYG/4YOlBV0IoF1HpYOAQLXnobS2+cv5160auANo2ezYiyiTdaUME2Sn4lff7eS1T7sq8+ubfkethPhn2nrCW7F4WKFKD/Cu4BC6CYcCrsFoHLnpCPMGNY/xoOI5r7XI14VxOseuPvABjLsodF1jXdKoJHUU99ia0xpRs21jiB4HKhXLyHCREhwEGiF155I1e6kCyW170UV9hp29Xob6SIzmXg+FOL8+9sYHoCxlcVnXA2x9SJD/p110ymcfNM2R+xdnc1+Nct6aCIPGlPEq7clDHSnHL0XXN4BdiABT5PewHvgRK48a62TScBlKkB2Di1vQo+k5pLa194qMmjyQHGYQCxO4P3ghzT4p6bD9ruuubAlhw/+08M7M7Uy8EerbXhROKZiRzTf46LjVO4i0lSnroO00nFQFvtMbNNhMffsvEmVYOPY/pGdAAF64HQIhCJpZ51CgVgGds5W6sHOtxguSpYamBb9uVgA/h9x4Vhwh8iO7IACUN7OwmiXQzk4vu/t9Yv8gKmoA2YVsEOv5zwjD+3iNmiOS+DGDfbBEXN63H4pom5J9EVQt5HJHj1ypbllPqD5RDHjj8Rt0vm95fnYEgAvCVsd40rAGe4hh0DGmCxaSCjy0N74ohPwnqzqnOVM50/bZOH6OSNaQV4PG2znXusW1n+bB/ApsJ6SnaWamQeCNLUR7rgranCC9Fpug2ih766bBRCNoC7e1AO4SvS3HaaIr4kp4sA7E5+k622jhxwKBAulrllXeDPMQOvMucu+HM+5qYl3Eb3aN5ISJBHq6vS4sLWfltXFVCUJGFEctDodLGBCwS4qjGPlRjEBU6+4dKUVL8O2bdc+iXGH3JmnUGrH3gECofcFgILeWtCw11fLbabx6c4c/DqlMSa+qgGbvNmwirplpazoFzbtkrP3aOpRqdlCflUog+9L8AwTU1WSqVq/t1HW/VhcldelFgnuJzlYVWAXtgE1usX5gM9Yag3JWXPNX/QzCh8/bfikJyEuyp2/11BjmhqYzLbgtTm5Q7ZzrHEYZufxmwI5AC9IQyRTnHDVtXKXhqikb3hJItC8ekQa6eGhxh24rac400AGEvBbb9W/OGNR+p8jAqi0NU2StD7XBQ4H6rjGRoboAYYwxBaMaEFTwSGe0C/MNXdZYFHnk1Sf2bgC08wgTdM8y3I480z3tgpyes5x2j6ibEBMMxumKwgBndGyRJG6C7GICKWoWSUtr/u55FYhQ8I9dPpnw3DSsE9vMM2XYzWxhjXPVRsPcKfU4Bgx6GqEVJ83jKIJ7mQie/iUmochTdx93MO3b1BiWx76yUoaYPRK/gJd5dK/EBGL3awlSbPwcgtjjJG3ZsBc9TLA/qUcEOek8UtWwxSVAK+tsmHBR2DWNq/ZxQUjZVCICdevtdErrugSC7dYeKG78MS2PmB8RMFqTA1ZpWgvyQZp/R6T6osOsTnJdqei7AZfimPTo+TdHjL95ZsZ/82ytwzD7Ari2DheD2E8+DMjom13gkN8f+NwMaZLH/fhBSemz94uxYmMIf4Vt5uLDG3y/VvAXP/Vo/eseMoS2BwPqgD8Hc1f8Spg1j+jmtb8srp4ziti7PYM86IXLeifTeF7Z8N/6fY+ei0pIm+4W5HsVoPzARQRV+lSAjrAnQCH5/c4+L0peVSKPYjUn/0IWUzVqMAHM0CB8k1ALuiNVI9y1VWgzxsmdH6BjPapzANGXXs15esAMey6UIZlCs7x+SLnh0f3ZRar3Om5UBQ+XoxcvKExHef0F799KxG4ngua/zHikrYBXl0auBcjDpv6/LbTn6cqK245FIUKff6pDnlxI+xJYFNZtJ5RYZ28Xpy8tK1b7IEOoQ2v0fe8kWcN3cN9Fw5MsLQWvd+DE80wtxmwCOTRgUNo6xNbsI4BfgpTL5mAgPh0pfiP8Dls4nmT4bA4a8X//5LbGwXqOxd8SSfGKAIUgvPKfG9waoPpUPp1UA+LSS42NKZBKUDvqb1k1pfMvUX2YMITtkumfochuT5oXEPlIjEGTLEUHkuSY1j+r9fDEfTEfhkBTuT8zmjLuFjIFu2DJGMU4Ii1mgRghBRBEnP3dq2YRwVqaWklxrlqigUkOIbB4x6FxkQaFc2NoAAhhJNt6BS5720nWNgWRBMtkhHkOHXzBtAYkFm6QyUdBBsAulJAVUy8Uwmi6Chl4Jozi+Nn8PcWtK/4YIWNwM5xSwjBM1dgZsv2g3ljmKzL3xSRKxjIiuccYLjvo2yxOBofN7BJ+RTDl0lxvAVbmjQRQrg5fT6aHtrO8EQtgVs5tp3IxPY6O6k3jXYt5KhvsktbGacCpzykJJq0eELjNQ2EuM/68F6I3xUZSCpg9EQo+/Fkt5EGYrzpw3CenaOzkHJTYrr+pv0PA+M7xhv/CYZQYSthztLYGrwwKSRKAtiyVrLLME1phij3hIjDLh4/AAqzghE/pgkUXd7CU5YLUUXuqWkMHTw/6PuIjMqSMh9VhhcX/ZgEfS664B8bCPSK5uEebOospTR2G/0xUOWJQ2sR9LBb36O2gKdiPLzK6r+uozUJRuRfHaY8ZzySKm3kP4t9exAQfplp7SBGiIk7507NyXdxixdwH74yae/4lVkf4jRkt9nQU900r4wBYc4XCy0EjjWunJKwBHrim9Z/QKECQOGQvdrIpwEPcOkCAjV6H3diSv129N1AYyugUmRAHtLqVLeQn64jQkVbt5q5IJISpgvc0RHJSUdHqz99HU2VAYZkfRHZEnzWT5ECAwCmIhmn98Y7BCQDA7OydowaL1kigDuf3HKW0idECLzUA3kS5qY6f6+TnPYvpA/d+vvG/QuFSEWjq9UGl2Svy8Pkw0G55tLgPhQ0Wv5fS6l4E4DhMo/xKAAqE3ri2653/ncFK6NAIxI01e/DSR8p8QXowmMfqhT0X6BK7nb6fNNz8LqP9YWoPpLvCj1Z1Ydp2YC0XgIe/RUmrlxv+dtF6YfhhFkQdhxLvrL5+LTTz10Kldwzqd3oZifhcSaPJY4GQx9cDD4qXQ3dminDgo7+2/Ox8Qcw2unX91b/x2E/V3kbPzif/kblNZ+9r//xxl/38V53/L0/LGLBNywJ55DF+/+4Tq6Dv58rTVluExKxfJzk0exjzYv26tfO1hlm8CDmhgv/ybYR9qj2CzHLP4Z3dR3Q5+bU07zPnnHrYeGevrv7TqANHsJMQgJvP5+2xmaTCi9vXNFYBE0xgXuCrKsZ+zt5jhfA7Hqct1R2T7q0KqsyTrOhCqPMNP2+pU//+v5i0OU5h5DSWdnFQrNyNJSk+Eov6U170+C3H0flE38dSehIvyEF+pLiE3mAqzl6I3mvPxqUAjV8blgJtPMd6QEdoO+p+H87pew0gfxSiqP2UdZfKSc71JKgWig+AQvFCo7rWkpRVE+LMLH7nyhrVbWO/HsNnDOVdaOcnPd8T+Zyw1fhLh57HbQvpRWZDY2iiSNNw6IEo96ieOPdhUilmvljmmKRCDWdrR9kr/8jdkRie4zDpDtwd92pvJ/LAezO+1JdnzplPgzQgsuqw2PI9Df7WaiSfclbOn98YX8aT4P/xRTHZLeIaJX64dxVIOtW9S3dG2eKKt83EeA8x1ZUJ4ptSX+QYPotpK5Bh3la27dQZwLae6INdN7n3ATgw4gbNH7qdiSfPYkqp0xexQU7b7JbafEJ+ZDiNX3McPuFg+Le1etoOJqek0cQtsd+Lk8+dty81+AZp0JQuLLpfGPC33aR40Gvn/yebtgYj16nCBP4b/Icod/8l7JLdabL498ok0hurvVCMx65H823LkPbv8VljWSnq1kTq0rG+Tj9zNm4bOmQ+ckYcFDIQo2CX+1fWPdyIOvcefEwsxYnWzMU+mOv9pI2CNHiZpiJaYCt86DkhNt6hY4OweZq76hmbw/A8FBiHCOVQ4Bbkd/wwxMiIENqpcmrCVFTUPrN/3yxDp2MdWTNteR+Wo1WlARfmdVTPx96xUYzNhptbaFcvCNhqJ4IOSkGvP3f8OMDZUkgzRG9Q2SoNG++lhlAHBHwM6rGfj9dXchwd7fJtZr4d8QtNVrqltBWnDChSkgRpPeSJ0L0s8sCqoFALEM3b8nmTyo9Ita3YeObcp3hD8R8umDO34y/70tsjDTlUyvgtoi+fJO3K+hxzGNIVMUu48fulV2sYJ7vkEbnHUc/OKzK49BpvScryTqnmcj3HamVWlbI2Ps1IpNUlCxnbyZQGyhL6/4raROYR1lusWi3aBBPH8QJF9ucvV4fMC6mkOH8tywc+TcnD4+BHCIWLamP4Aa6Ojsn61Em8LePo4voUGPFzNofbKpQZ7DRv7plAueBlDIFe3Nnc9xNwKNk/S6hFG7pRgoua1/BlBNP9E8Bml77omUnzCGO3hTg7zawFmXDRNu32jSSrAD1tHVLKfOnzcOF1+oEXSCM/C3qND2ruAFVLThNEeaPnOf4doz9G3DwvXqgIlAP/1KajhdM4bBehbTKW2n7ajETCZF2n7X5oM6CnxnaB//vNgt6Hw+tyS/4JrBuwjnnb7TzTWcjO2IvzsrtVYJt5oa3/XGsQfMOrLnvAfKJNBkaV26yetqaneGWTa1coaTVvfQNURMpAiU6Zs4CEmvTRJ8qN3LqdRmoPaKKugsiDeVbfGHsiyWR4/7Lfxk+oNVo3HePjoqaMp1bE6Ls1v4zky3o9vt9NVVrGzvy8cmcLdVgnbfORyJrSsgLd2bpFEPW5vczToVKzRmlrA2t+CpM9WWhbLqtPmfBZBra5iUMib07MnlI1a+9bi3mgkTksJIBFXLnBhlk1WkHKQS2TL46VuyoqvdBnKSzRKczEZ1xWsDTHIpIkJS2QgoD3ACx0q4XkrjyAALKJ05BWQfBsNj0WQ6EYGO+Q/L0954uqDn2uJ4bDLC6u9Le9ZXZn0jWebTDzlf0AUnm7uy2wjrP/7zg+LIH1if8MgvYBCUUa3yAB/us1mu7dOCzQ1mFAqfXQTuFLgbu0g2Y3TdFDR68SAjWXwHJaTr4IX3uNmyhgLWzonaSWlVRbc6eMD7eN93m9TMiSXD6O6wT9dLACjcixqLnFdy0KtHJePw7mpAzhcdijnIq1fN1PoHvdEXHb3bdYEfXqS6m8SPiiWKAOWcQxcwB0T8usLDJMScAeLUDtsbQfWKFTls6FFwbPZEZyuCnjoSFQtYJ0W6MpvFFptMxIcnJJ93hjqzQVd7n6wVVqWALmhSOev0tkbEVAh/+ev22kaXgKlwS/yjc+WkVj2J3gJF+SQyJxhZaQPRcJ4QH+Z7lcQfmSCUCv2C/lpGJmgYAVHsu4pSr8PVAiymUmrKCEpBzBMUlThWn+plO83vKRI2sx1fkN/bWQ6UDVu3RV+zY0TvVqdP3zlbhfVder5Yt3RD3p08UF1SgtuIdbO8cBbCRrIf06QsHBire14YizQSpHtuSj+IgeUp/wj+z/V89gfUFJoi10fQdkZ/EHQQVrMRxwJ7c1wUTaPyOwEmGgPT3hb1rZDlmbEy7AhOh+Gj7nUFXPIsgQNfo5VCWudE12OxT6Vj6HbpCtmDxakypxiPO2IftR+HScXBKW90es3MvotQ4zy7Fz/WRzTBCrGfyTFncg1xd6QX6wsMuXO7B6HRkLHEz7e9kWYZrje2209i3IFsSR8tCNJf/4NJgPZzFwin/WXm1CcLGtE97TZ5e5q5KNLWEv/8RfvuzE0rhQliqc8PgUZS6AC3e/rMJ/YCv22chMj6E2aOGZbH30/j9LKraYsuFkr3wVmXheqfp7B6Ob4t3VOdvCrOV3qc7g0N+H+dkfhBKEJTP9d2n3S51cbKs2Cii5Wy/Qu95Ew9WZab6UaReXLCIfOvg1T78S8a7qXALdZTplTwGazqN08umP5kz9YuHfi5jzvAsea5jN7UjR47sKzcc1uLdgTKQEWylDML/RJp/cQ5FCD5Uf0+g28ckaQWurWqdbtUc7Tr8gy9jPu3SlFvVvi4eJ83qYZi/sCFf4BN7LwIu5JRt+WetolmaIXG5EDe0Bz7oIlgWdxmbpEVXQB6SJt6F1pOLcDX2a/GMrNMSlFwBNQMeZrehRhflm/YnXfLYSBHKWEH+vQqQOMwGpeoRNoRwbONFpeCx6zMFzVVMF/GTcrxAYvjl8OV+BRr9dQG9Xh+hM7flOLwKRhSraVSZDAHMYLg8i/NUGKsHqNRY5RsP2Kd/NUnHUrVjvSvHg8KFco1SjJTAAi35rLFJWDxmwYCLwWWqhUC4ssUxCox6I3UBGePrJfiX83xm5UyBGNR3/y+NACCw0urrLx+XB0QyWS6lTU523i/MMLpodeE5GB2p4AAADWAABUXm2WAOC3gAFUEM/NwKfZs5d9vVKa5+p9LuKPJPD4aBUL53wo1Ay/7yR3gzfjxbA9ARnUt7XZicRqEu51A2wD7TUfWSH9G2hkOJmaA25rHzyBYKMv+dmR/2xM5WH2vcPNJ7QpCO0s4xDmvbtTSba1dB1ZIWmU+SM4iAa9jxVegB8SuBmD4SrRbIPRkNG2KhuW1AI64c/eI8cPUY9QMsqVCGmIZYDKJaZyRfCkDhIeD9heMmOUSEKuxRi71iFE/OxVJnRMDodF6HPTPs/MM5gsLpo1MRuLU4JHGPqBBV+3WWygBL+6wxxmoYZgwhnn1WZGqTxtL7Yp040wYC2Ge1oqAnIbtnQiZlVopXYSckRSJv9ex/ftCKFaYyXpme8y+Sun3ZziRgq7gC/pLdjtIIptyxrLjL7NTtzPModzQvSTC2TDaCBmAPAkz+ZH+hyELOaGOOjWCYYCL7L1wu6/P4pP3POKmngT5rSQJWtfh5PD8PIK3cyXGVcRri0DERI345T6NRX6WhGcU1jucidbLwROEIZLVtDSEQCXIIdrDvet9Jpyp2eeHhl9bYfuY5vf7DjikNa9TmWC/azb0IR4k0mOGwYpiQ4SDSHc8kLHBTb/U2hH23fAaluoUa0UAw0VyWUdF6P2C/2OaNA9/9srZxyeEXLgIHK45pNXfpmxGHpV/g7zc+LX36d64Zx5n937WziNyJa8q27QflfLLOOgqwNaWAJqf9WPPikmG9eHNv3ws//c1YCcTLAb/8cMdcvqHvR/82jqCxVhYbnVGU6F/mO9slD10Jg64Tz9KW5ZSpODg+QPBFKKmhI0/+soiXA4P1sH68pzCC7Jy9dgKBfvwxiaaJgRfyx68/TFmQVeRM66yOCciNsbLOf0QrrDMlHWdolpZjIpJVRYszHEo8+DEJhdIPxr4HeiiDrw6hGWBKdGDcSzqYHGQcyEBNp2bjpZatWrXh6pKhKmyolamQN6t13QpE4003CdIhBvQs2ubecd+PM2FbWrIcsO6S2YoaWFYPfJ+ZMjaAI0PsMyaTL/4+aF6tX7hY5G8IyFi5p6f+8YZ5Y3VnL6Ut/WWo1G7awe7HdqBOkNLWnFQR77MAp9D0IUlW5cjL/anZtWeRd41utarxsk2rYtH6CrUpxkRZ2+3JVO2eCbH//g2uSCXNRLAJNZLYSOMq+FwTqbMRBFLBoDtsiaefN7OfDb8S765yRQv2T9CAIxGcunjfXQEy0JPjITD1Xb7ghA16d4dlALngaeu3U7C8l5B4Ysk9K3g6ZrDFxYMXLzPxqZn/4su38V+A0lmglj8N9C1Ax0qwNauXGBmySEKa2P6BvOwjHJnOcvwlV5n+heFqZ2W/fTiKt93zzqFr+VmqFuVyLeIHYdn8d5FUVicFTU02/YGyXPfZF9oK1+ECi+rs/i3CJOrg8DjOG4IW8eJ6GtjLwaGXbummI2wZOFoZGs83osEkfuEvtLS+Rr+J9Zw+f4y6u92XNUhxelIt3cGC3UsfpClHGuuVoUr/e66/qAAAAAAtsjMM5AJVx6FAY//OllbRugPEMNoW2ph+aPCVuSB7IsBGxTxb/ZZPW8+ffqcZjmeHfCqmdkVa1dJ/ynbW6+VBy2MuqB8IQG7vX0HwdOPkezLIMUZATwajgQenMbnUpnnIPXtKNb2TFM2lWVRtWBujb5DUQbmZaSlRBOJs3GbSWIBDZjFhy9sY77WGPMNx/8PPkqiJyz7PLKpJAXRkCwLXNmWbOWXERzip4TpIVc4xmp7LwfxOwly/4QoWU68qGQFsHUWLbmS4QXG85Z0OnnsL1fHc9kER6bBGn/CUH6x/nsSeijlI77NilYvz05HU5jw2zdltvggCg7VL6nEiKC1TrrwXIcHIcCCmZUsAgElvkf0QX5dpPk3FMV9uaMOoQ6j9GZ8eDyTDst5xgx1txuNyfRFj35MldKlN59DGV7ZCUYXeDrc4mKi6QFphJUPMRJdfLIl8LsJm2JGjZ9Z2IvkSqKesuyHs7voW+j2kZfYCyPi5CyxDQGGOgtkLVLUUAzQZ/4Zrj3uXB1Ja+jobDOIYiQNwiVLjNKhNIknfUYT05tr1uaTcrRvQNqlQzQpsR5H8eTe1ytVlta+lYXP/GQ2Z2g5cNzv82jQe6iUoitalk2m0c3CPMyZMsdKjGUpnafd2aCDpS4sVvK92imJCBhnqqriKjAVGymoeYvo7ui1J9/TMKoPuyIS/DNQbqcQOISgkBUVjQAVFQIE6wCxyYMye9AoCLTqRjhBmcayMqYvkYNf3Nwk+NBdIedgj0/W4a3zo4WFyVK48P7AKnZEZP3nInInjJA+ev3aCCzTxlmM7MEKcJb9Ud8rHrl26x4JzjFRJrlIBC7h0sZWdwre/PXnfn0OfyKtU1yCnUUd9u9y6Y6YGTemQ5gsPevA2utKaJmzjr92R1NE7nsLQMG3CZ1WsDwqlucgWBs2DvAEKYATAD0bX3bIso5/PQgUyMpVAiaJ9KhEoEKytnVS5O/rql7rVqESFS8gogIb4ePZi9hMDadK/kWQTqomJkCEHhw9Ejg6hhlvZ9fnL8RzmCO97ZT7i7MfduQITBJUleUXKbeQOCe/9Q0XIzmI71MM+XvmjqJdPGvlfq8uECe+blE9aTnH3blCL+ja0+aYesqrDHux65+ddSdHXDKi9mufps436gtTNjKSuXenp79Dx4BocjNJ8qZSdF1hAFEttvgWlPZC/EOh0kK0xlhuhUe4eEVXJSTVnFBn3Q0VjzMZZyFhHlAfY5l3xTALBjp4i+vZMMasg5XX490vf6WDNCzW2Yky06DpMl3elEL0ke6lH2hzYbh5yo7xHPPFs7AA0svH/7DP44M6tq8g7zuj0rJ+mtdEm2wYLu24ewkzaWpBJcBThfJjN4sCh7TLlv+HSASpZ6QgjOp2NOay+J2/i/2P5aDvtxNRjs3aR0jnjPKeQr0jV/nJ94kOEDLd8yBS3gAAAtQAAAEa0cSKxZB1WOqIpO1zmgULwTucwNHyCCipFbi6WE+JC6V9wOIBVwpPk7TlApc+ldQqpOWUiQB7YnEbG2h5cTu/+WOpxjuodreX7krLcO4Z321g0+lN6iEC4kQ3vH1SvEOaKfe43FNAvuOAcvfq4R23l2hAhhVczlQMgDGEmaBhByTwmu9uf9KDkQkNsNSUtdieGi2c6WZSIe4c+7gsw+Oqbn3ddek196hMMu+CQGHDfYiQjkKzBM7pTZy4ttdIaXrfePC6OULIAK6STDHdzCSjC+GdIL4IFBw3KF9h/O9SjkonWpQ4pjyFBoKAJqNb3cgeoObjQ7HNCfJiPMtdJuC4Qb8jCo4pte3K09W15c89tEgb9uGk5jtkQxOP0tQKbjg2WIzEYu+VWFzndbJs6u4yZqg+GEYb54MhMMCLhsrAzwwvBHqUFvibtvFTg/vRr0a8IyuHsRPLsUsx1uY61uigb5dIQ7luvD7n0W334rrbRK6lY1xOk3T6PIuGiAORBahBFEhe5rKcVSmnEZD5QErR7Ca4LBY2UsnOinFVxlPszdAYimoOs6GuGBH6N5Jy33JeDxl7TIZWOHk3+TgNP2IJo/BM0ZlzRv6SFhKYRrxOE2orQMAV94YYsP8pV+CdVTmLGAZXAPHoAbM0Y8HajOGVTGP2ZSpzqv32WtrBsb2GB95vN9oNA16D99untLY9Z4GXzfiVJD60hBpD86oxjOsxT1LHDm3zNABbPomJzKYNpC3TynTmvfbHabP1yFRF2GZGMrVZiOVeeMEkRXG5ubd44/EaFECpjrf258bjnT30c42IsG1i0zMwIMec3wyLsDAa/wjZ3F8I9ZSL+md2NX3RiGqbVABsZClYYY/sQe0eBcbe4EE4U8voiRRd6NcxoSYjds3MqGS5MPSSb5uNe3OaIZ8saPDsLp8ZUevdCLiHnxyGT3yyxMI5kAQY9F95peSQLeKlRS2D2tKS6N4JOn6wgWQ/apfLWuIe8yNfkUkmBDh0rGFfDMcsNvK/sS1nLoRA6odZR83KUGH/qqjm2cNdZ59YrqfnpHyXS+vF/ilS/vu2HZs3FJXDwiCh9BMf478AWeGSEIHqfbY+1d29swB9nTZwrNUesZPhCMz+vVvKYbDNOgLaojeUnKWXHR2dWk+q3Vb4L6Vhra7O+4zcpiGR01S/lQBAf/TqNOoVFhF8BIjH/oJWD0XJ/aWskn2z/O/4KeAu8WL5TgacnFjTdz7XWzIV848DNStPojWBXSv5I/oP6RbR0kIGF2PG86dCUkNdY3dD4lpQJr4bDvFRWsX5JCaqE6/WN4nf5zYoRIpzISPULMLMLMFQSjMA3H4YnfCtfFpyu8wErkQsNPp5XNP57TMPqJTwt5SnOhw70AN04OFnQW7y9NdMAMWfFNjMEPNwZYryMAsbxFqRKfZQf/tjFDUr25k73uvLLp64ZKr9OwZtq8FYm3QWy31etLKR2YosXCSKd7qeu8NdpHrjiKkOLHI8Zk+futVj4XGpTjSMBlTHiaP++JWC36dqTJJq1PPytoYRbbjP20tog01FHdezUCaiiSWzp4QokxhuKCA1ULOLM8qikGWye6DeU/VUiwzVetWVwRJ1wXhrY82jtQfkf4QkRd2Xa3BdMOqAVxqxYyIWrpAt49CIHz4riu2Dk+K/YOaQa34/sN8KRZ1ByqLXOirJDF5+mkup1m279wnAicStylFgMoTjWTUc+F1yIXmMYU16weTy4/47+nyXSiI8AQD74Pdl+Hll1awrGUrvwLyqPNbV6nGGqEAUpaBNnsoC9hmkY2hugj5ZY3SkjUnjxo/pUX1nAeHDgaLgqVisBhPV1oh8RM0krBivnR45ugVaawchNH5tsqThg+MFJHBs8SCB3K2DKu/CJuZp12dj48LHo50pzOyAcr+72l0bf7epXTTKUHXNnGe+qCIDHZ5qIk5WZvF76LiKdsn7leVpUb4PyrZ4lFbwPYzVCvr0PBb74IxwEjQjd7KNAe71XOrky4QTztgoIryUJ4F4IIOV5zdy62qK52hFmBATnNXu2raI7SOZn/y8W3Tacy7pOxOG+oZrBBa6naULm4T8tNAxsC3k/J/mMs6JUb2AWEppETW4mmFLus4+GJ2O/Ad4fvJyVvocL4JodwtCYMREh1AlY7SdZkCyhsDk7pS1jDVYOi6hmx9iYjmT/NeKFY9tOfhbermfdfmrLd1eeQzRSmygoFx0re9dV1shBKTqEI4uiMdwMrmWO0Cvne+YsbJpVWlSTlSec6zGCcc0tuH4w2J1hsXCI5v01FfNdl15Y6o1kM3ZYDNjHKskwG2v+lttoz4cwDq692B0R+wcTWzIAH2L1T+BUhlWF6g+IqhHT/xIz5H8KIzGmqrJyhCY27xyw7jP20uUPtKgLm70RA+zKRk6Ev+In721qdajNPg1kHgmf+pk8C3BaKA6NXyTwqvbJVOhUbgF9kH3OhcPjqEH4oEWFpypbOoJDydqaCEGx046UfJgy43cUeNSB2cxOf4MkECwG6RMIVO1809v/g/u/fbnp8RX12uylDDF+L6TqitWYlN3AJxRvQJPMENbpuvyVDZworXZOMAZZbEF35bJaGiXkIINtJXlHP8B4LebPjnmFi0eTEiLDIMgc8tFBAU++2AnZxPsNK0ififPVDjdPYN/+m2zD9T5nXCaCXRbi9zjft2AL6D88slhB0r6jiA4REBzuhcdZnTxqnkIptrRlZHPTEPfpxO4/75UEYFApSxOlvxqPRnD93s9xJ/RkWlfJ9bL97b/TCYk2hR8CJAIjmkj3U762xmw+KcActLCz+qU8j0AJEQkPX6qkM2EjkwTW3YPEHOYAp6Rwlj05Y2wYPT1EPWwaJ+0xy/3gU3477cYQMqP7m5ixoifWTNaffeEpr3fsx2mmqhhWY4kKXZFd1pkWygAFLsVmbd4VhGSyBcMA0kVZQ/oEaFo5OITV6Mvi3BTCsoW61oGbmwViut8MFCuTLzp8K8ACWqAq/yO3restIBW65Q5w8xXpV9UAZLhj8c5XinUMlsdiMaiitg7FaDsx0ff4WvffIn8yihYS28QHQ5jE4SxRD+TyrvkOeE7piT2G8LiAtyxMRy0BrTTAGmPFDbSPgSHsO/sX6K4W4SSKcz0cwDGVfdaqPHNgHdKRSw+sdFb00m0VHdgmA9XmMxv6jb8JWJkOL7xuF8be63nNh73S+FEvqX2wDrf/N9ic5hEXiud7pMdG/clp6+y0CD25KkE5fbrseBjwKHA9p+bRVaW8voSvIZi5FAkPGFT5YbJLMhN5VSK2T9icqXaVFYQOPmMv93tT0g/feUa71FHRqeDU76yDg4J154OcHIqOgeksYA6+uHEZOYsAQSBsQTpXLnn31i97PX5utbsXIub+kblyniPBjwT1AI827kOx/Y3mn2KTICd5DGy91jkA5huKLMMsu9KQ0Mz0M4o/nkunpOcIUvV7uQtbHKHqWVDmMp7kEnXj+PS/9eTAwlkCGiCcviz9qg0wZRH91lzPdIIz7TktkePAaRpXzlp7gc54WUBfQpqyazEHpPRi/sogdE8TcCgp4BA57qjDP2QDJApTOFT4ugwtugNN9rOg7JvhuSmMmh1NIK1BjQtba6dWAW2NoRtOrv16UG42lLkyjgZQEuRc0LqGoc+o+MFStpSpaaWZuMFFHYuQK6aiavMhb/9Jk7AS8kNAeLABYt2mMmW2ay1BzqYRZ12tTPUGsgkvsvONilpmsZRIPvXFvqqrm/lMOQuG0W1R8IY4OhTSarRVquiXtaat/GqbR5JS6YuzNTUCjUjSACIQSGcr/Fa8cwIrSDQ9qu7pVRRoa/1NrK9uYA6QaB8RasT5isQmQdDWguXth070dasI7qOe/Jpwa28vvtbc3/IKwZpEw++JqPy3ncvyZFAZ9he158qH1dITfv7i8ewn3U2Hr/WMpHX+mIfoIrsSsE2XokQ+d6QIDaDqn7jK0W4Lk2sLoK+pjCat9E361REO9botKdWuKYtSF0dwc71ixoitiDbBDbqrkXvF4JQCBM1LPA2xMPPwsDS19y2dsAyZdmMuIR3GmmsK7azj7KMp58uQ5L/u0U+DgagHPUjwxY9V5SzDA3P5N0sLCDAKLN+DwtFXvh4NAzSwdSU/s6bX9OTZjATobEBm564ZX/7lvmV7v8Ed/b+Z1LZoNvXu72oOce5GcmWpNsELIBW1uuVFc6apxDIAJkEPLj56Yo10JrPAouEq8MezQ/kcfx4AASBptSJR0OSN9948LRfdTjD8quUJ824H91xTVwrsclFfz/uCm9B/BIM8QELjWrz9CZs1+rQI1PEzzYJPnm9RYfxpaWhHUdr5y+MRY9Ae4LuWRbyFMleRYn1bo9gC+d5C/tlWqfi+t9AHmH5NyhQoliWMnQgdd5RKAPYKsaUIEyYvFiZkzF9HSVtkTQ1iokDqevh9wo32GKbKn3yuSqyIT6/BqV9z8tAfJaR+OuUZqGNqKNGqhD7HMZ77GXRrmWaDE5pvR/fkb3mFDyjiDdf8se7JOyp5kV0bAKHLwcP/XGLmV5rneI6g6tPki/mAJ83dgyqzVmSfRW3rskL82N3os6INCr3AnQSELHNvugONL8zC0aeEcNmOVl8SWwTGREgdUkC93ADh/eYOuDC9RiyDtktnvtTKAf4uydp6+OajGqZQmr/8s35du4roWgnfbG8WFgDOIkRm8ySjfjIAhtMiRGgTV/dYBHR1Krid9gbyq21hZfVR/WpyQvsRHA+slahuyiaPrgcY8/ByQqGncOtRn+NDSAoCg0veNy98tQK/ndnh4axQ2u2u4gMKsn+eN19CtEjFH332cfCYEqszR8vOmpmnHdl8gq/F4qbv6G1lpa8utnA4f1UR/2pxTLI1wcL6uFnn9ApmnVCji2AQ6BC0Z844rby4bwewK/J7opar0/K2WwCBjngX8ag8XUjLJVpQP3s17DJfrTH6pBNWd514IHRIhMkyXar8bwluZVi59sULY5uB8r5HpbG6MXBphyu1Gu49iXz8eh8Oo1/kjfiIa1AYcSfG1NSb6zTAYLTe5f7x4DV90qSHhBZI7qoWBgmLpO8L0waMJSRh4ON3WKwJk/1U6O1Xg0apMqGEJ4cq+GHwpra3lTJiI1hyDCJnrIkzBipipslvp2M0aKb5WsqyxvrR5B1j75SwXTT8E+S0+DyDD9UqPILzocsksm/0q7xsypkYPrfvlSPGOp5G51j8Qwy73UfuFWWT/qmHIG2cBTVAeobAso5eKycy8bcp6xABM0yRBDFDTR+UPNiFhwn3EIARTbhYNikvXsSrFDswgZ6OhWB2Nsg9ysKn+f9OkO9eSo5YT4UYN2NuD6KQbCSZe9Yu9hyAaqgTcmSn7N4h4ADTpVyORxYpdpnQvGZzyqKotWRAH6A6K/khWHFss+9BZFHtXWqKK/paeTpPt7Eybt3h/E8PRauLsAANejRxc2Huv+/WzElJphfCGnsxe0ksL0lE+dJ7KpcHpqAozqbeIsFVbDmmLt4QDntfV0PYWCKeGiZMm/My7ymK/mwm2Kjgdo3tZN+KSj2c3Q6Th6fgfUJaK1uVje6f15xD0n8i3FLM5plkdJdSMB3lmaJ6Y/NIrLB+CsgqSmjAaocXZXo/Qyu0HtxfrWIHI/egz7Mp+5zMyb3CyYrsQw910egbdTzcRMAQ7LfLmMN32I1TsFj2I/5ciI0u//btxK5V2qv2slp1XIHL4NY2By48QsTXD1FNVdGinJi8XjLNAjn0+snYfhnvv9juN/bHl0rrENzYK8E66aYb8isqVLspaSGCFRJ5pasAOC+J+8R1T8fACWtzl3/pEm9OLLNdvLEwgR6YhAnNhNuXy+4e8toumrVIE4t9ELivrA63W+jy73URX5pIE74GL66Zhi9mesOuoc6RZnyfjE7RZGSE1s1/ttgbD+3RZzLgLX7rrEpzPIcOGP83SbM2xMFgoZgk+z/ZSQV1dysQerGUkAt3KAv2AATGbHHgRxadt+ytyK/UpAmmvBoSYJ+va0qyZ5ayn6fH/JOeqGoy/ujFTSHaCImAs00VpCrNYikGMvLGjz5h+QewitKwpPsFhePXRC8Shn2ezbdZ7eAaHcPczKz10+8mSX5bFA1Y+vQbfxTMSkg+Vt6iwfgMHHmjBsS4gnQOnOer9Pyd1u4saUpLGM7cTI7fqePCYvmJu77HL1nrq6avP8qAFD8/wAyDtgECS0zLx9qYxklzeQJKqwG4XBuPWNw2vU6OBOKHX7wJ78VOEYZOuQ05/ihLtvY/ArX/vTWIlGFv35RXKprDGqJ8iTKS/sBRh58xwDXPAi5fYtTLiiawgc2gRk9NY4uJoqPEFa4T1WEcBN3bh05fhlAaQE35boIFEXSFG/H517YB32dBfb7TdHYcEs+82SQnZgB9Ak83S1uZ6snVEowYAYy087ByOuZfAim+OCSyFlp6BsN3QeFc0GDpchcfw6Egiz8TtrWqY4IqYt2kP6vRo/MSvS1UNKYTvbOTgjVKMGxSf/JAH39u8R3lD9Uw0jVeX9KwOMm87tLAxUeh/a0Mq9VowVrygzgw6g6px/vgGTJtDP+il0Yg8/W4e33DtQBtlodUJV09l6C3vUzT4FlGru6hExmV4pSGtvQvEi7EGM+2fGv8DvCyRVy0jdVzVYjdBjkBHTILFvTYUNN/n7cm15KZCvOTHztFc8utpTbmNuhAxu4dB3YjG+QNUNkANcLWgtceNro9avdY0WtbpA1dCLcFdBwGeQNTJ2IXrInLtCFEa60i1Ll1COLaPAD1/8cDJkSxInBRT5pnyQiKBu2Kp9262qe5UMlWzdP1Jf1Wk/098Slp9l1BRHiH9gb7e40+XB70ndHZqrzg6qreyF3O5ujcFy3IYK2+318lBi9Kg7fys1ZkXu74uQcYfxVWPHwDXV0jji3rA+6YYrri8joAm82pCGvJzQ7GvZ+QzKFBEcuseKyjbRUrPei194ZRwTT6l0bsxqWWqoLqe/gnXWwMvvt9QSsCy3heUPtWrV+j+m1pJ7SCECsXqdxTMcTGqlxngRAeAu8U5ORWPvT1UhZztaq9TvsAMyb5QQAW5uraU3kny2KdN+YzPp6bgSN9kvXQwadG+sGZk8yaE1t7dd2U4uoXbVadyc9SC9jh0IOn2zvOPk0LF1xJUcBy4b5QVCAjM4DSJWpw09Ij56OyHlHCaYh3ht4mSysJBhKFdnUE1QdipjzyK26RGS1oC7mNJJ5xqv2s2UkHrMvlQgP5m0dX5zqv2DOoc6ebpIQUWB3JfBGvZP1DUDOn+K2QNnui4qxRNiw1tUHn4thcnkWJfsZjzXKm8aIxNTH13kAvXAR5nBJ8FVdOEZj8FMoopU+t4QpBj9rWjstam1Yfd6TXSV27vyraXkFo8QbnXEuYRiQPbvwPSnMzcXyDiHhgwyJqZqKtSNLnhs+mDnwJMlg6PPjIRYk42PwJUStUzrGpRYoN2oZ2ZpyeJcX8k1f9UYk8GHvAEIrovCiK5COo8k0KN78icniC1ydXL/wZejCQVD0EM0bKhxs0xVS6U1TXak07Y2QG3FgD5feli1XafzlCZRoKRm9basi/b2t5yv4QjdazpA6jel87HWowsdodhZuN5UxvARAldjTZVhufUuQ03RUbg+xayr5k5/ck9xb0v2QLf2de8cbsczrz5++VRoy07Xu/OcXJFSTbJSb0uUL7IPe+oHuO3Jk8yZKLyiXiFUirtBM0I09ZIYs0lLYsCR+feJpxfVzEADIY4FYAB2AR2NK3KQC0AtTjD+VM9aUbRUls0etBYK9s/Vjvp5V//ogNlbs8A5bKDv5OQaSsrMNAyrbh9YimNmN9R2YGvzC03rR3AAu/HLkBvo+l7I4Ha1seecFCO7AqMEYV1GHYozoknAGqNzOwVu+wMyv39spo2fURZoLn4uMrx7jTDob+kOaLoVTqid2XDZi8s2W1Hte9Z4RacggrVx5Ugu/EmpnYlk+E86unAo39hPiSn28ddqUzd+mMIL8jfkw8v/tRHT245tmN+7OOAFYTcMiIo54gicivG199KMCI/i6K5HHsBJrqTeWcpbSDDlt8JQv7QflJQGRirArThc0mqx8eC8bYyMI5ODwhi7IQ31BsR3jNWsWeogE5nqBXmxaFIFYxRQZzwenHVeUIzq6nSQgtVceBWHIBjkY1bRqtuNf4r2FQymd1IorKKbD4xTwnuSyOcAWfoTdZxxPDNwGBGWMK/yVG6t8+vQmvHMDFLr5dy3f5QuUst1SX1VNFhccrOKowmFNruSPinH5bxSj8DM9vsIiXmDizFo1uPPqFb+PY3eF7FGXeqEYNEczttmHsUmn0MApEtvfDhk89rq7tBjUSuXZx3k1MLI6PrtBySqXHGTLiQTjozZdvyFAAun+pfNQWYiqZbWHdAAXM5zVTXAc0DszEBmCSNRJX3zJfyJ4VGtbLcNAuYWxveWyHRd5gPsvQkzBROs0s1zHn4eB9sMj7ox15MgQMT+tFUP+vciuORO6CYPFZPachjyMn4Hon66PUiVbD+GVFH+JBzJkj2+mUaGE3JhadIjLbOzqjPW5w5lJl0k3kqZUECvvKUch4/T7lQWyk7Vnz3LDPced8oNWCFJkn07fud/x076wYVYLlJA25/C3UGy00gAa8D/HXRtdc/lsqEUAzcC38gQgguT51oqcywvt5PrxXsxQZ6jXKniahXE+5jKfotuh8tzzEQNtX86mZATo5VSe6niG4EuW65KIeKW8iYybtSJ2tScPGbpik3WE0nI15TQrGIAd7BUyv1nRGJoJjQzYZO1/+7DXiNVZPdERzPeT8jEcUZ/BGiKfYLL9fNY3gwg0Zeq9GkOytZvpgyhM3aK9PAwN23B1MSUkZn/VipSV3WjFhgjfKWyQ/QIP5zOto55cFUgHLz+pSqxHXRkrj3648mSJbI/CHZXE8HzW2UCbp+rxshBcsV7/8t63qoYq4NASdTSLJ1rTaTh8yhVytzf9Fvbuv6s0KJFth7H1uIrmHJgGcq1F9YLVHhppO35nOT6+lKukLGayzUHyGmgJMYkZ4AzEfNwRBPf1vaiBQaHEMs9RNL3xDqyE3m0+9ywKc/7VWo0iV79sEw5fDc4rbRlJP9Jb0eRGtn6Pl/JuFsHqjDYpFqSIJ6waOmhkWEux8dcLx7LNOKGnPmaw8AnGxo73VuY1/9MnzPVuN3mpZn/TOZypxTnDH9LB/ExNQk23bhxkbnh6tFCPvE1WyW6YsrECK/vBzBMlThWcDR4ObqN4h1kPJAoAA2GC19n6DibHUaIa6Ow2khzENjZld1eap+RPiSLwiC3uGydUOmcqTiTLa/lhMZiqUVJDw8b+9v69us2Kq4HzrFj5hPbGnEunAWr90MfBloa2awMq90us7Vqi/e5wQ7XrFphCZHxQiF4GqXa9mqf+YFWuVQbyRRk9LYvsTlYVqHx5qnuSIYN+Yc7Keea3TWFNIQyBJ9WukwE/Rr1MzeKdzrtRKW+EvPiPIJnH2pZC9IgRaDPMSI5nFazbsdnDm1ImevzWvmcW6Yc8Idwu4fcxk8VlyIZjQ31xyKQrBm8SQd0tZzhQNnmKSjXzV7BchmK6x7mVrC48fz5ZEXry6PXjM3gafz7bCd/980DlwFpg0TE1oT5MF6qhbxQxHcFWaH0kKYuK42YkiFCcKy/MYjL068lnwiaHBv1fGuX2hC+SqYoj6SUqR4L6mn6/wyMN0G39HmvHzeYUArrjEoIeHj5HezJ30OEBMkEZklJ8UtD1i2Xh5itEluQda+bli5PkiHSkc7ZNbyYxKfFbihpdBFhjW68k0j0+/g0A4eVOjVZToFl9a3RcijIcLmH/6TK7Pd/gkH5tGXIr0Tlgv7XEhxpTZOrQnJu8Vvq1/2Bta/ERFzeARfgBStSW9duxs2hSf10i5FDaqya/Vvb0RcqPIvooH8I5CgNaUDrp+3dlLNqKUJnvEJEOWxAVX4LcdWaHtDkiGPbjVHk2N7PTlruk3fehVCiKNlLwmax6wTzz3C5oKViwnsoX8cUyMGxu7buBFT+dIsTRFusPaUbTlbWPxjelYPdURzk/gWgpAddKj1ECU/nV5sE4/1iKQIFAHd2ljAXZnBkYnmH6kdpZzx060sPdrlYQ3Y0AGx7EWAMX4qZf/xw/J+qRrIpNskTJcmJy4BcLAFQGSRNk7kSfvKDXNH3fXzMdFxZZGvpyBpV6KNxn12LddOxjy04gqLB8jSHqQTwrsPeeSMyCFo/gGpK0zNbpOKHNzaT7JOv8ODIpSsir9lmbhNoBItA1N760v2gq6CHu7A8hSXKoAEzBn9dqb3GoULDd6+qz9BqxrIdxBmUxWk4z1yYl7v2EdSApn806BNSQaCoqVsI9ECK+udG+MILNJfnz16yAvKZBvB/im0VgWDv7QG1E5XWFoS6BED4vHeLWDGfaLsY/AkxPmMuS4Ar81VZuo1DIHzzvWfEMh8BnqEbO58o01Rx+10bgV6RM4nrAIkQ63GgtRnv+h/5adaQPB9xc/b4/1/VmTaLtnq/yp0268q2Hph1C/zqQIbNQv62uOCFZ7FTjxYYNcaI++jSEB/UpBdcGcLwShIplRpr3jF5+/H61gHb9Syy7wdL5H3zhcm0n8tTTJLedcd1DkRNwy7Ilf3QYW2eunx/pQiPAaFLOhln3PGk6Za4Do4SBYYl2U4Sbro21dMdqwxDSp/knMdKB1NrHzqw2XJ8GproeodTVfwMxltpVUpoN5FzXBK+cPER7T2f7w3wCVsyA5t24A9jLBFIrOPLqNk65cZoYmsczMmefqFC7C5iAGNbNutDntXz3CcGSJ43bIq4fkMEBlQDgnIJYLavMxgaurYa0Wmr/wKA+qftHmj+Sj5NheOQEwRxbBxNB+AZyEFRhAvd09A0O52FO8xF+eVgl18dXy1ykIFv7Aii6s4sh1P/jxkEpVAAvF+tkz/B4ni7cErxX0q7qIlcMFNknResjK4giiEZ4dGVkMzpR0nERXiipG/Ty/r8OD8gzo7qakFYNdfmkuIJISIMz4xjWVJcOP44YnDJ1bndQEZAxV9zXWZV+KVPVpRyN6p2Y1XD46/2W5NixN1EuegdGQU+k8MKmW4n5cn+As8iymo4DpXd/F0lDf7d0MP0QAPmwWNH63TTtCb/D9uhA0dOxvPHGHcA3nhjxjegj3fGALX5vMl3Ag/22TNUKobqNrRi46i3Hibf/0/sXlov0dJ+eDRtIg45n7uEPq+HyfT60VNVit8+JhzJvybLytPeXehgM6IzwR0IIjV68CIyMioqjpi/7YN+9j8+uZ3QeV4D+RlwK+vP9MZ8v1Soz9/xwuncrazI1bdWNGSkephUG0GgpMkwRQ5y2g8vG14d4CzTS5ewub+c1b4TnMB2W5uGL4gTGqzxNjj8vWgg1W3aQNT+H/NYRyMEQ9FrRLX+kjlEDgdrI396JtbhFHTMtOOtYHucLFcrxNhhXBJNoGuyqj/dTrGjT3ExaksrMBhmTbYbLMSlu+YZ0Plrb70qNTpljZjUgvUjkJ7uQ5kUAxaPFU8Yb2KcVaKLlx+s03iw/xkjsuT1ZsosYoppiKLgLL7JkUMd/+E9PxJVUj0ND1NaXEGs2vD84TTXk6VTxR7VOeWaShdPa3wG5Yfa1sYeSl7zE4GVHsYSZ8Uknmkase+D6wiT5dqw7osmxpDyyJ3bgDk/rq86nAcIagjXoFjo7LZ1CkFIUPMUrFPJAX/Q0KqG09JRGHoGMsDIb2E9zKw6RU5q1r3apRo+i2fgciWYRutpeu5Dbb0/DSpOKaRAkD6dua8yWF7jEYgu0spD+wITLfEGvzl/h2SIJM4u4DxZfPPhHlyFKBcJ41QifszRFc9loHz4gy/hgWOzNDG9hg5hZR2+WY3U3lhJXU4nXZRs34+ZXSceyRCc+KOgSapMSb3xQFyE/rdN31s3rIEsDgDjaU92j0iwo+qtVz4XfEEYBLHy25ZR45beDpzaykp9K56uqtcXLnFrkLpQmbpT446zgXKx0HSPCv92Pt0ZA9URAqul8yqoaKNz/9Ncl4TlV5uesXy66Xof5+tSD1Fr2KzDNpP4Z8wlP4v0jpF4++FwIDQGX2cON6UZkWD9ICNpkjiM4UqKu8fnKcgG3XLkmKh5CD65ospxYzqgxS99fwJ7idH0ofcKxrwxp+IB5fka/ylfH1mMNS4OTwPToOh7QWWS7SlDJ9XQdiOiRz95oL14Sd854G+fXuxnTzWMaDVDDX92pQZUOjxmyGWkz5BQqh5s67jTkGVzS9pWA19aImlr0Wnl/oZMfDgnNS1lX085ACjDJfqI9Ksnpdwn+eIgIUwlJEtkjrWqio2Tolovl5hnwOHViJMRvowF8D1MpmFxotqlnr01ao5eQapX1cZHYCWjYyAVwC/BkaKbRAm1fgDhWRLfLDAkiVqByIbbpwcsfXNUiP69PkbFGfk3mPsb8eNhNVh6grPlcdDkdYa86zi8E+qqlP31wlKvvVj9VOOfvoZQvM0f2s5vhwUv4PxdxqKW3PHgf+cI4r48ZN31FcSugaZPyUH1Ve970vXtrlSfjjAUOPLZQ5x3782uQGd/jjNyULNMsMdQgnI1RyY/5R7PrkbXtagMt9Ab69x8S8HKRBOXmv1UnSGv07Xs+Zam8GNeDlkYn0aixqjyFFChzmAla9omxU+fw//39fxTwv1uM3I2CqMaHB2Tx48ba37zQiRHR5ZX5BqQL6/GmBi8lIhbTsp2oLTdSIvrUN+spZAP2dH4+9yVvUTN7KWOXxMONYN9prWTX3Pzn1Fmp/MfwG6CQ8O53SwoU5shw50LJmaVMMZx9UdhSU3GRbzLj1D70yi94UtPBh4KgGl+MSSLAyhrgL5akmazB0C9ryBn1fdCY7x3XsjivvgrrA4YOlCeItHP3n7l2zgpXayGxr514dWYfRjYLN01wEWh4nuxyfNrDVwMOvi5QZ56187sXyZO8Pvxw2AjC+dz/TMSpZ0AREtBDFjHk+N0XRab5a99nsuqBZECnKWg8FzfFxKAjcNGhGYSiCslCLOTqjLHFpYUAXWNyRnRh+Rg8V7kpBceESAwGG4ItmQ0vgWqUiIJ3Kmy3N1SClebjaLvwwhjSU1TKZqwLEL4B0M1nTv+pnoYqDHM2DQRXdzZ4R51GxNR/BA/9mPk6yK4gsg68bnlDAdasFDoZvrYpxMBCX8ZNFN1gZnDuBK/AQQhpJV84sJrWGT+vX1usVp5SZRlitRutJ8wb8B1+4cgizLP9ad0O/ApCcS3qZfCeLmEp7s1gcGnvzVx5skmU5xlM1aeYduAycnufazhszCypyUl98xIZaVi3oGYBZ9/2YsVg5+KKZyG6hVjduY9ClNOLvVsjLTCrRY4C0dmTo0sVmxaNloHDqLhJQV9UYQFGZmDPaKkBIsmfN02ehW57yONkRyJ4/W1NjvP/zAC70gkTT55G3C4R5IKNQRdvX5MPm4IhZ25XbPpzYLkGuzINOH+2iHDnKV3HC9Q9r+iETVUCBZoA0PkdjhVZ+WzDSJtbkDIEhDQN7QQfCKkIt7TbE3B8XPjmXi4IVVtYM+3QrsQha0yU92xaCpqpAizd0LfKOWnv3oSsSWl0wCA1ZVoniBnNlmZ4m023Fq1yFCyBBtgPedPzkbIwau0N2AdDZ9qJ8bZorem07c06Ksy2QmNwTpgY1mcw/b/kdRsEchadB4efj6vdFxBCdw2bNgLXTitsAD60ssZBxKwyNQC6GJDRdAoxBtcSAXW0iteOJN2XlREZgjRJGniAmo+8R0N0WI4LazDcTFeSenaL5rjjJzw0CQYK1uUEsex/hbcPws6tvS5oollQJEz0laGVIMc0EsBwPLL500IT33IixAItx8XcvkfuCpnm12CsElWWf7prhiuKdqHwsa7sN5rKkQIeWFtEsr+94lDOi7+7cgZjzDjDNkOiPWKbG4sPKm4emYWHegx95HsqB+LgiGIZh4S0D7lin+Imnkl+Bl8hcmWSoxLxeJjQPaZTA0yp35YoPqHUOS/VVQiQtHo1xwO+pQ/JbBDR+CgOtX0rY4KqFHkN0tYt950m5eHZNN9AwrqEGhaJShgM31tYvrrdAnvhqemjrd5dAMFMgugv+Mj0AYSU/KAEfDp6GA6IhFQEYMjSgPGYHYsB5AGCo4GDpfz11Y0/ofgHGSyFGCpSV86PAK4HSf/71qtPI+gCNXFLVFbF3Y7YKVei/VW+Kgfv9TFjxn03IwyzTJBM4h/H9EIVMH2gPZAE1WpOgjXZ1YVFwD8CMpUGwuhN4g47dCPa5SfEvX3dXHYUboAF0GS5XdJyDliDZK4IXfcZmspg3zCOZSXdugs2AYxmHix+OXy2J88mwnGjzOONS1NAgMDaQGZZYBcmQ8upmw6Pgx5PayZ/SbM1ZxF0Swtt4G0PakUabLIagoGZTWZsSt5z5XNEK/D2QVoiFiM6nKMlOYhnafWaKPmB5wQIGe7GGAPeaCaKGptgkknQVouXJiexwItoT1IU7sNkwGKjHd+IRdkgkFSRtWAEq3OynowQJnzUpo0XWZR6mggzglEL+Es8O0AJ0o/y25fHmdikEa9xkF1DyQubgMSM9tmIlSV54wzKGOqTve90UL/TeS0P1NC4EbgIgoOApvRKptGnb4vv/ksOzdBjuSrLEgazx0u6g+hDn4CHx/PTXnLdjobRq01gku9+Tc/pS8S1eALIywiHedBVKe3JObUwKp5cOOwmFBh+9Uk5rsRV58J3fsq2no+PUmCoKOS3rBT5BSlRqLgLwBrXm8Z3IShoZyDnMJKm7Hv5V9j2VXibs0n5ycMugixHaaOqw8SSOvD2nZcm665kKAgrIV97o1EshuQpo0I5vz+jrkOTTG8CX/Y9pBEtSMl8yDwLME0tW5CzD7gcHgRG210GI3cUGokOojmNKStM69khFRhjOXMJHNWo49TlnezGlYg0Rr7+Hth0qDVXcfoqdZ0XAUP/cWfWT/cwuypF6p63itrVJ/cZwgiqB9Zv6Zc+ifMYU7YRW+1lXg951toFKBIAyxXfcI38cxlcSCMuoiLQmkPPdDOL8UCP74nzTMbT8PFWZGlfxZ/lm3fnQtWlovNPAZUGptLO4bfVYs5wVC+OpeHdmlHKYqera/rbe8ZSgvGoH76G2BfRHs8mdviKwwm1r5s6ZNuFv5McjDDistopxso01PcwOEiviIn99vkHoewbwLFJxgj4FVvwhnFXJP6CefKKVSt516our3uAv73rdtTXEPxcD9v1p4nIc4XqX46T5yO8LBZy1so064yL41P4i/yS8LLTNSVSQAh0bcDKH7l/zI7HaoDVIksfSVOldzoZTEy1Fbx5vc8SQauouxAoVBSmZVTJYlNxTp1xNkWM96YmU1zlovtEMirO/Dl/c6+TAn2/9V1nbOjugtl+cjmfoOSeQLanIvKSgE/j/LKEe+uGGTgn9eSYeLcmV9wi8Wzzdai4c4FXatmb4XrfuH/ztAvfOpyNPavltk5hQMzFFdqm96wBo3NWBjTf169nbEJIM26Qa4sIANdRiRJXa3WByLseRnx9hqViw9ipC84oa1aDa5+F4oWbQAmAQjCif3f/o11/ACh3H92ybyItHAyHI7+j+bbtMq6vOGb9p3IHG3CDxIlC+ne1gkymJvgAoXShdXqghMRgvW6ZvqrgHCUkEN22eyZxpp/n4gg33lTaR1WViAJF76nBCHTwIBmJfiknkoCj1vKv6SXWrM0chV/jYBhf+S2552j8bWINJJ21HPoCTiPOm9DqHxvLP5v2+gHyEkVO4AXYr46lvcNyOFS8DOFblrYO/V1eGpm9Eces0zTVgFwd7Idh1AKtCoEVpuahL3dV06XaAWItDvu3ARs+o0QgJEQAtaBgHJm7XbsNF7u3CV2gLObqDRO+Rg8BPoq46UkxmDVvQsz1/brc2rG1wbDdVrk6oqRE+XrzQOb7T7Z6g5ebZQFDMAADne4JFK7vS71SvIzyGkXotG92OiJKYe9ymeaQtWxrwgB26RnrnzcL/V8nMorfjU9G7pQ4FB84zHc3a1sPgyQMwrnCzBtWL2PyPMiBIY1/YstRw5g/g5c+c7ROkwSiFTUr9MxPm3PPpken07kskfnYFjU7X3TwK1a80WqWO/1pVgbR6ZnewOGvKO9HamdZMZW+yxptyTnRjS7bLEkFWq8fpdGBcLfaMWE8PdMKO1mJaTXDt5gBnKipQJDLtZwhgNZ98iKPetw8Vog5q7WPrNYnmEISv4ecIqJnVtqTMcHWO7WU+WC2FTcpoAEebibWRSRe/zhGOA3aUKjNR38dF/6e7RtnDIUtY9pw6rQL0ghSmgkUFVJqwEN3uTZmoTFK/tdtfc+XAadzE7qo93hNrNaLqlm5ZJZVD/OLnuZ6efy+MMCH45qMngUuwPcN7MfaEJbSRidQZFHQPv1ykOqNbYSmcpg8020Qt/VyAEZ7Wc6p9U0b8OBjU6/ofUCU0PZoQXTrNT+2YtvlVeS2oXXJlP2jT73WbVWdPMnwqBYdG9soiBJtzS8CuJC+vs5dhj6jj9UtCxf9pQ0BSszY3Bxvp4+iWuMKMON/NVoXu5WBtz5AZYLXPwPExlI/DfMZdLSg4/KQrlzN5Ox+Y8F+UegHOZyw2gAJpS0OZmWyeTvg+eDMXxD1F9Xywj1zSAD9KxyWtkNkY/tc3Z1yNart+d2U9YGN7xxi0XRPElz1UXQ2CFkq+fcyROfaslMLEUxwjbXRjlM7FtYAEaw/RBb82vGivTEVAsPxoDu+oscQwOJ0a+LJx/EyJnLfIry4eqDSnYQxkU6Xa91SdaPjX7mw12B6/PKXCjfG8IPPMaa3P/qP99pS19fYx+kZ+2NCC2I6bm1LQJO/dZ1ECiMqDho0y/69NmbTobBi48P+mVK9ETA+6hqrVd98y3TannOsp/d/Nhkd+P9W0CNRrikBK43w7PYAFPVjsqP7/bQciO0ef1fCmtX0nBQQMx+RK/G+zW6fvKEYbJkeYNqZeQP1ygUHnA2IHzIrtJkBWtJR2whizEY0U5mPAQ/OD4aF5KA/wtozqfqeNTbxc3wpwMAxhsDez0HH6XXYgwpZejbxB40TmVNeD0uO6ybR+ju7wH1hZAywtVkRdpUYpeoP5xRIZeZsqfDTL7l+Mah6sdoXi/QxNub5hzqoSPQGbhVNax9yhGBnmxJ3dYSzJuk6v+YBH2y1u0GtnJitHoua4KD4hxP7QTgxdzh+1YtNXbu+QzqBOWyOHAH3RxJ1qOD3TM601WbDp04PAcRAQdwyqwH0B5OgbxLecvO5bIzHtR1nHhsawpf95DzmnCm1r/Eb+SXZzRKVZhIhjKRm1TPZqeg8NfJPuhvs20CdASpHYp82Dj2GcFcYtZwKN2LLEKkhyqOdf5v4zxm/eARw90KPZpf2Nt3OQR4gEMGLbo41zDbT2i5JcJmPV5nqBqX7J8fWJ8p/UanbsULX8Mokl0pmZAVYqhp0Wj9qN9jghmi40hnedRKrznn2J8yDC/SX1B/qpjhDlqnvnGbgkZs/vA5qnUnht6sTGYYEp3oYpBvvGk0aEgf2ZF/JDIqF5YwESeyk4gzDvLzspqXSv96K/KNnN1OBjCDfdf10nl33cwm8pxP0VkkSovz2R7UYbHQhFJFJ9DVIlvxBAhWZmvOvhOrUZxOqS5I7aRcchEhx/z0tqN1mzSsu1nAzUTyIpd7w2ggIXqLw8IO8j4bVz8nAVMgt5LNyqNTviUwGZYrv9cm+8Q35BGPOxwq889bE48XxBr5deO8v0hqVvC0fKd79++Aqj9n69bEPToyD9D/weGxf4msTT+81CF7/dqmgiMEyIZa1lZY5PDqj6AmMidhIQhYHWVMzslD+IqW4scZoX0e/FpoZerUiCeWww+vusGZVhEGoB01LMoD7EpbTaBP7OF+nweTw4O2j2uLUb0/+bHgO89kiKFY4zM0c7t2GPSe7awymq/oahvE9WkqgJ2oum/HxcfMZ8oLhr9RCC2hHpXari3Or2ddtVUXYdVdKX4n9P3sLe1tGuu+NNKMNFptQEW+XsicByAubqwn1wOgdJ6JimwJbze1sfdCb2aCtlWBLGo8KPIMMgE2bESdx/ZnVCN4E5T9dHmUCxNm5c0841+LEsREv/ASKnR8adyqdvFKSuuAYlUNAdVzvdykumKNChBB5qYv+hzz/gK/HT8D+UtXF++uyAKkriEM636pywNW+redpROsTnnZ3WAPwDTvcvDGGIvpt0yokb/1AqauKbVe9oGFsq1cBTFWUpgb4usyRZV/b0v/sR+Jkd6U+TCPaed+CACq6pxcw1wJXhsUMFa3LcToXvOPh3HgpK3cozXggkkA0G+OowRnlps1ewhY501URgKi1R/2+TWu5rM1sj2YTfyH+VF5eLkon0oarQEG2j6XYCtUikm5WsntbnPtSTKzRGCSeLponhKFo/Ae8tltQFRT2W3tvqm45JVJjo9CAE2b1v1624+vb5lXgsfwzWk8GuFQr8diYqd6uP9d4rnpjoucqmfHVpIe8a17zGSCg+R8qVetfz54+PDYqY1Fhqbto0f4tZF4Th00hIH1xfdvY3EHQ+53nxkfdTaCyE0RJMqXmFu6F1mIoHGNVH2mzEO3DWqSj6hDwJ6krpHy6v4fjAZS69hSoE68kPgF1nVV8jjOADm3F2bv14L25KXWRdMG2PNOe02/z3uTFGlaJcmW35gsWoieRfzOU6tfFhvewto6SrFi0Ej9odrwz1UA0oFIW4yx++OZH1qeIRhKfKshE0tLKF2RqxJpB3+kjoyy5LK1rUdiPPM3ITJiOcOwQhxsXSIWTdsuRSyOP7nuACrMBFlxIscGsSHKXWYbvWwpRfxe9opepJYDXcEAyj6swPNgOwj42fxtTaWVS2a3SdkFyZdkf/mP7TMF1p2rRHXttQTjwtUDvEdfu17qoR7GrR2dR3LN1cgGLREDGQepkIp4nCMwgSbXTEoeXTwD4XqHi+iOxRs3QdhkhtsfwKT6iGbrEayeYabkMe7Ztc4Io69zZgQ2e0A8xcIwlLVCKfmttIUPY423H+UXTpXVf7LbOA0fcPcdSGm2sWDva1eXRncMOvlEzgEWENKmrmRtw4I0fEzamZOuOTvqj7I+CVQ4dsr+wPgLtEMwaScDGARTK4APrwH3kiXpM4c2VT3L7ogv61o0NWVPxi2l2g/p7R5QncumHzvdMBAzVZWEKmluXC1GJ2vCWH3PsFva3APqSlBzLSDqkJ8/9T5yediGmXu+zZ0w46NhN1toHyF5pJ4JiUSETkZEGyuaD4NXamqOPt5PrnDvjXM3Oq+PX7stnJ8BfuOxO3gm3Mumk3yrOye5Ih8+OzUcTbC+suvoiqe519Us+PC4QXs0GGOkBVa0v9tTWg1sq4pbBu8TQGAZZZAGPC3ZyC/Ac+2JQR4fgs6Yf7+Y80PYTLG8+MTp0VhqvJhhXKFzSiGlRcsfEPrfKgZI67XZAXEpix8hHing5sIfrmcQAQMvgiPVeSSSHsKKV23Gh3n8+h8/IRUyaZUORXrFCi1QeJnwnYi6Uuf36SstRxG3zEYF5+pj0PCMz1Tr+3kKbqO9IriwbdIU1AZt67ukOXqcFTdO2w5yjDSPWr/TRp5Svm8UrQews8TT2AXohwWYtm6SWowgcxvIY9818M0+kLUW3I/c0SxHhYEKnd1CpQvEOURQdi+3gddNCDpiI2I42zFvdAiXcwWf3sPY2xb55RNZxMM7jsx+eCOCF4Vg29i+2Mla7/XV8zPdTqbq0nsB6kjrBlxjG4vJzYm/6W/Q2VNuoqrvvDykXOuCOfNJUC98fjsXvEAvSwW6NzhsnKVPqq5LMvfhutAGh3GoEdcBz9baADfSj+gO/Fza9FZ8rjQftTqbv2ycU5J6d1t1AmctJEikxHsdUc7bFfq1GswJQZsTLxFX5AGPQLOBgHuCGsLtfc0MaHd0XgFpG4u7eJ3D+Z0BVzY9uKnLO0U7f1pMbuI3b0rfES46NZayeyFe3Kxn8IdwF8UrvSkuDJFEMCjQyxxYeZrWz5j1NLlfFjBXU0XpI0WMUElfQEAu7x+4jHEWxwd5b4AFSFh5dURVsO0Dn0kISSHqzDpAcusV/WVLVX/5kaiUtliq0w9VC9I7D4wvxx5CmehBvwyRuEYMuK7hkmP5by30zKVusXToD/QLY/38QE1I+gStssa1PS8YE9VvMIdzPVxUrWjRDIE/XWEfAKpu8/rx7WU9JafDBuGmo/WixkvnBilL3GBCtpSowKjZM3zCW/g572CuyXoDEQBBbBlh4w5tMmC+zV7WeR9JdYD21HrK0G3dmiMiicyphKLd5DxRRP2ssBv8/bMfDxCuQXYrG31MBBxk58RjE3XIPQ9sHsNQEd2suRom7AUhC1N4obP8GwRJBMXbJZ+D3SP/vXyntnAayThHD1RMTHkB3i4tcC+M7Y/PuNwtpu33g2YtjdEtSFhEcJmM2TIhnrggDER2heyk2VxUoHCYGldlaEzVElmm7Afr3WehOYK3uRbwHaZUagizf8fLRkcgDVL3hCv4/Q1w1QfAauOu+navI6AzN/5P/xzpCmdK+YB+lwJTRwcHWPkVn9je2dcAFYSOmElXFKUmfTSJxN7sKl1yYf5PYehQvm0FLhM/3ZyKNyZ6i8t5fjUb3g1+UOeKQ8Uvg90c8MowwqUyW6Vo457tfotZuZEXb3TyMJ5KqZz6Jv1ADOVK+fjxhaRStx6hMLiQOQkdYsGOXQXvoJC1t6aB36JbCFxPiZuVz2+H4ypAdZcT4nxP7/kLMrJAHWwYdh9LLgw16yek1tLnk3zCZBxFfyM3MjiUeVxXUMlR0Hg4DVR/rSGEYkeSszJRi6/0ah8O4FZBBHjLy3MpLoac5HaTmpfqCogSWPX4MI13MvCBsY+UNKFONSH9p4xiBtSiSgeskeYGszcx0msfj/beLGn42MlHjvP/tKmDTDf+KU0Wro6lXtRDvUG5Oc2Jj8j3zj9mL79xIozl8WdP4sjvGgjBmgPLl64pnOLoL+mnWBbsMcUqvSO8mqxjBr0jr/wvVPkyeWPdikVRdf6l+YETYIlN8OB90muNSVM9V+sprNHUvkSjQHroX5zgXkzCnqnSy6E7FfxeeDAoNUUERmklrW4ylSpgCPVX2MHBOPUU4YV9GrQFBiAHhIo+N5asRf8+Ows4JJVZ2fEnyWGnPKaqkcY9B5Yy5xbns8q1fJ+ZT9R1TOBnCrEiIPv1YhjZ/VZYcpZtk3TQSlJ8kFRLDhfR9an2w1kkyMoBrQnHUG0oYzY9XXuuuX1+teFXeSA2JZcZSDKCpMroK5CEVhcULjfyojGZZUNcAPGwnMHBEDOUponqCfp3c2yABFhirFMKptDnpmRtngYDgbyNolp3J/h07AxMRAT4ZFkuRyJTvUXnXwWXSZwC+ec/x8SSoMe5JQKLH3ClhGdkGt2DUIJZ4cd7cSbNFquTkQ2h9MvAx5CSJn2c2tBR+AN23LzXPqD8lHedURpnc02l38PkpEGt7lCOT6aKME4M/S32jApO1z0St+7ROdJCP0yvKOaz8LkwRL5FFWBo/ntnothT+VRepmXMUupJu3kIsMtrVP1FKZwfYhb7E10a8Om6sP/wA539+lpdkWYNM1VLOjhFi5/CIrc14H0XxFNaCmEbR/4Srouz8WGeVyy0wd/vfC2XuZXkMtlVnLAnGcbMpiJ4C7cRq02TiaWtV5E3pkh8+cHkgUc4p3LEH482TUaYhxncLeE2UjRUYFUAGjxc90CkAbvu1HN8tM5IBtJl7G4tQpG/Xnfk6/orP/VBgxUttkg4fOc0SYWbMal7PenLe5ZU5AVmFMS46JO1TBRCLyzUZLTfBwHcVw0mHx4MI8KuoxMC/+s1bPwrwgcYkl1t1Xh7b6iwWm9OqDkr8QOy+gl4x3p3HcD8xYndmelXGUGx9eHt4QGh6sIZ0q5mV8cMCRmRl/nBdNYUR4QeH2webbniUOUA39JWXNiHeUUni+lV/t3RFr2uoaqKGMEgFa/XAjFEk/v18UsQBtW2Lz2hdLzmRl4xmMGgg+0jvh+2b0BJwL6tg8Zvy3lTIFsK9qJcoCXy0Gbnzu16rUPSvcbSMLtLPagSTyA8BNFseZ5nr/6sw+4J9WwsquanJqieOOhSjNj2YeIGlTnrju1wctohrXLDHbiDf5iAwmhjNrz+bHn1/M4SG0eWBLxB2allhNGhc2UL3pXXO3x56GrsA2OwWiIRa5Q4l33jPn2FZLc65iwkiI5hnbaK+HHCIILoqNBp2HODGViGS+xSR/uUxghgCyvZDC6Ch4J7b77OkaL769/zrpSSdkE7XxXX9TnlZNSdX7IIMfRM82E63d6FeKI2WrhK0BVhFaZLZ3l4ObNBQfP2FRcynO8Ob/uHmcZhUF4dEQY13CHGpJcg4CU0mZvprGM6nkAuCwmr6XopItRenAJSeJJmc4dzTkx9gm0T3Y0zfFbYUF2cy80vRkAMQRBoB98vmAuBYnaVqo9/gdkI6h9Aod8ZfrcSu/80GsnD1F8rKB8nWQ+yAEIvl8fyDrYNYkCL0JUDHGv3+MSsFw7cR1UfWkisaV2jb7HX1tkxZKu5WoXyuJbaoNdlaP7fIU9JHUv1DUWbAGu9yqdkRZcfhJhBqqFFFmAcZHbo10YS+gRmP0mMTQDDGmmf0D4DbHgQXiCX3FGTzhzryYaG3q03HCKO9Wz4hrFuX4X/kJm04giS3KJ/vWEWgBMZc/i9fMDWBtzfjrQ2h607zlgSf+viEy8qnEzCKhHR0PtO7hDP2Ul4SFWau/sV11ujxXor0+hjkUNMtfjqh8f9T1nG0ctH97JoSHMUDq0YUjp1wZzP/ySvXiBDKFpuIsx3QLNq9YYMTHVudz++UyCPkW0T4DZ0qGDTQGEj25Pk3TWfO/5pPCkfaZpbZpRINUTqFtG3THEVGZCPEdDHbssPub7abz58v+KmFQwy4kq6beZe44pOvK5hdMXTX0RNTm0XkkzFKHn3FkJ1nngmXJXUjr2WDlu1Y5wNh8bOyJHNALVQtKSTuIJtV29sO+gAEFzcdwU0MIJt+va9oc06s1iVYXzmX5XJt/wnuackd98cG+X2CNaHWhXWpVoaefNdzJhG1XED89ojBHcQYR+gjWyTYAD+YjAHlcgOkE8aYV+haJUOQpUOBPgmae0E4lDjzwu5JOd+0QFmvHajel8NlJqO3iESkXRwjKCKHYrB8YjfHWHuQLFVymtXfe4R1N9DavOUShSty2qoEK9qo0RfMo0v5OPFW9hbxm+eJoxjtgk1gAoLa4lso2wYMGdXnsXx7JZHhkcsheCCs1l0kwGOgNwTk1mS/gtzcZWKuTqVogevE5hdl610acXxFG6WAUd8cH0pEE+hRXAIcURsgbrCL46U53kVGCxhSbJ8HP27GDdwc4AoxgyIoliv6zis8qiza9rZNokFMosODRHLzk1JeXmgmZRmQAKJjeR3wbc4A9mX6uNuA0XLDsXKXud6KAfnWVdPQ4SIXNGegNi0q0C3WUpHRqg/qV1Ebulk249SKIaiS2MEDVWsABOM2wr8Wg6MQjgGrIHW5kL1xFFpkJpmjqMHRmzA5INEt2Z+K2/bwigmyfKjkkTI1oWAXyzhChcqMk9IaOuz1JnFx2dHOLwcQPAsGyTfB6abk9bkRX8k4m96kYBbKiutyqZCew4Bi9RGsGbDzQvGRrK6/cswCUf5Vb1etL17SjBmgrT9fGWN8K0RZldEKMSEbH1t/m3hPUXyyFBzDqLsfBoiqpcYs5TiB/wSqrLqbjydQw/Fj3K2rL6YkgNP4MkqUi5XF5xNOk/C9OiQ4/fobeOwPDSvQteev4frC1se7cgmgpkgLEqevvatObc2p22iUlzo8CL+kymjeCbGs2X6nxr1adysq+l8It8+nVqrP9azgBRv/E1tPCi1qG+q+wkuAc+gHtyR5JkJhQ9wKve+1VVZ4HxaZuxbZ10FsaxjjO3U/vSsrpGsC95en6+KDBU7AdiGPuAJjjruz6lU9xC7SXDnw5iLxJdAd2GKLi8Odbwsl3K6LeMXEEEzelFSfwSe25UXtW3pyctvQwou4pZZF4+s8eNU/BN+SfmQGeQDFRG0QcBMrZyeTaQYNmN1gRWZ62KKuD0Q4YS6wbm5xmBDV+MYnHqHxADsuhcxl5hDNo3kOqYOibvChZslWrQKvtF3pIUa954PPjNVjeQxxWFcKme7QnXRcTDWz+GI9x+dIfcdOg/MnzBE4E90Uzik5YLQJ2KbAf+MA9vEvVfcBW2E5FgfBSPJbPaAYbVT3sAxG5nVOXnACTsgK3OOhUAUqdGym08aNq/Ky6VMDECUww60bI92NaW2oBrXBSz6cp94CCwCWwn9r69Lz0nkwH+5w0pY9gXJ0wNFkbGiV3rlPo24aUH5FMIUy23KPdzUwTKunAWzZvJQWdppU+kmTdgIv7hVRsVG30e1+Cyzrf/kfz/x2or812oqqP6wWex/sZBqi6yMKlF+YitR7T2hugINsUeUxUxMCrVfT5ZOqAt8FvzPTTuDuQBsOlSE8pvoujvUCHmTOlbPe5JO0rVGW89QgCFevJW3RJJ+IlXBXZZs73azBBVo8Qc6EcFoV3DPZQ2U0vaLfF7UC5e5xSzkVHi79NKJVPGKzB8bdYnJQ31OAp7XrLC31+K/c2/casKMJtR6CHU3IV5A0R3XhQ9D7EHzEHpcHFL+vGFnu0Usl+0pS8WbAzMlxvZlxYr3a9e+HVuuDciiSAnFfsTYSn+d9US3GCfZslrkEI/SFrbyO3d2QhTdNMNK9DXQmqjU2/HWvm/wosfWdCjzUUUzFKFl1oUDOHrqbRckoB9hs0nDpRCPkUR+Px23qh/ySIh7lU0wVTXgbbQtpQvm+xCeMxzA0CAuM/U+Er+dLkaamw7TQXH+HES8E8nA3vb2yQInARTo0P4nPiPAVOebTYp9O4fR0Yz2miRO6SGGytxqSZfN2dK9IehWjfxvIpApoouH66UN3RHIgWeppKpMHWK9QVhryVxRl5Jr/T9Si3ADwpQFHy+NnXCdwj7WQium5Qt2bl3DcCupDsmo32U1cRcRi8k7XSya2M308byDv4iy3/nc1qTOHJ+1zyqATtO8HBccoznXvwmegv1b4YXfgcrJBFRQpBSZFjZl6Fgx5I4y5Ne8P4kBsQz1P2Fb4YHNlkKJevG48id53CUgb6FGFRZMMXYcDFt9m/yKNtXpVBLZcsGMaiPCgnHdcc3ozEMfVxlTudjDbSGAuigUXGYB2aqJfvOXwDRR6D6mKGWvnsJ7X/Eb2YH6dZYR8tWxAVvFL3jw1oIzo0Pf0ePtfypbAOPr0nrTfmLI8iIGgetRBcfc1sHuFrU2Q3aBEz+xxuhX6+BSvkIj4io99yP4MtaaFOAnucEV43nEwiZ/oQxAyl6wcHGYP7kkXl6+K/hey3tkmpHYn1b8//ErSkS479zDNj9CfiRS+NYtLodNn9GX/MqF5MyY/Jhwdo69Sj8/h53k6NaTN7uVGx010/PJarY+l68HOfIbCgn0XCq8//c9X1xCGW4dm03j9Y7ASrmDH+BVb8tLu/haqFZkDiN6Q0Kn6m4YuxhhWWvEfJ4ogjK/Fu65MltH1R3VCTbYAze21GZW833j7lviTfLrrRWbdS4aa2Eky6gAP/JMXrWMT4B5gj9d54EtvHvvVRcy0S2yJa/pB5UDgLdCwxGEq6lr+Ie4Wj5xZU/KJ9k3rMZUbAztJkNAtr4NazcPXq6jy+AcRvUpYyBvdvmMvz/Q5twTP1w8L4DxRo324rMbxc6xY4+hSd4ZmUvfCOrMEK/EJqk2zMkjy20NZj5rZGnSh568yDyB681EUhS9xtkpVrLL0ph5M24Tu+VYT8vwYFoiVC3Rj4Vb2K0iYkTmAvi0ODrRZtTfjRAqLu6RaCtYYwjUUWHlEx2syuDGk/7UvMC9fkOaiHO0FyVjl7TqCDO7iv385DoZ3dTebx6QaoZaiDfq5D22takpwR5f6Pe6yeFxuieTudGTcxLf3UPVH70LnLxRzOPXRJS3WWNYEGPEROjmoQ8P87c4aT2XJK+qE0q3h5d6pF17WbCGVncFD3uZSGFsN2M0rA41TXcdODdz8X4vSJsP5WbbetThAR/enp0+0R1os19F1k8XtpgmXU3WgW9MjhDbAAmJyS5pxtkmZ82Gaw6qqGP0pyHf0D/AprrQ2KdX8rCjrQnddkysDBKVABqTCSVnO8SVKmV+OKS2cSohGgW85W0Kty2nUqIMAkiOAGeLXB967wSiRcv9VeKbPlb3EhI9+pJk47CRUWgQd2ay/fnYNCogQpPw+rLShwQu9rcpUl8qkdqV5BD69ndOH19OBVM61ScSCGDGaBPScJS7DA4oQxgjQdNicgHlfIHhs+gsGnhF9mKBatMPkPvdJlv+0eGox/FZdFeIqZwQswygIg/eLDB50YkZUN0Ma7AEt0IRuqAOv3UxEvl5fVjpnQsqjJFFpHJTrDcqPmy1ccs23J7TLR2oqtC/W4BYUHuRhre2no7+VoH7CrwZ3MywRFt1N73k9JR9Lf6ytcIh36F96MERU/a8r1xcEk7E6bdRgrFq3VbD1RlbjQjYxCb9/+L2o8C8kWpy2o3s39CeNYEMx2OlaCPhkhddZHDZDeIS5sGyuifMibEBYli6ypwtFIUYOoBbbc+61kS6SvJ2SR11ErC9CN0C3M0r4jY4OeROt8LgoFBVLCqiKlSfPr6Mpd7E9grmdoH1n+2f3LqqI0x1xQBQ4XReGvjMh4Vcq2nMvd41Y+1wSxRSmYgp2zqcJjsDaRQ6vsG6Sj/nbw2rlJkX9zV73ecP9bmL2WbL+hJ1hnQZQpOkStcGrUQhNABY+3NQji8nhTdFeiKoNBgnAC9DHwy9y5XS1MUKx/3OwjEyfVf98KgTzt8mJVlrySHk9hl46erXpRQ1LI+Gk7DnGJLsYDfNcVbDw2GBYSalHnWpCSOnq0zt/Cvs+bM0qbvJfb08Lh+M5mSP7dfVJBjQcLkEx0pJ2JGpii783D+obYjaYeaguPtgVqKxB9d/oaGeuMSJxlTCDbO+9Z/gLm/Fx/sSqnTvHeLCwpQO3o2HP7bDdPtaZoZVlzxZfxxG26KuQpht4k864V3fGU61WIg8K9sqgVld9nFfKVbNKXnytnkzLrTdG3AQKhCqTjJ+/X93/D9T8AhhtzQntqbP+hFUqn9+F/l0yYmrVsHV9dY52Cb1Pgt6T0+Plcb6F5ougJgJdeDcIaDyojE482kUueHCC6gBOdlznRb/52v0fIUkVftNEUn0ooPirYoXq65pJ1+KaxOk5n2iS/C0bPr2hoNYqpWvnesVa67FKS6KI7qS8Yx+rTwAUsLL7xGOOCixw4R5qEF4dHu/ll017XBxTYVI7NJ2Vfa+4/p32uCti6fBViUp44tdvF13+Z0vz+2flCX3bW4yeaOAjJTmtp0CSNh3cMTExIpFVyGyo8h/YVyMg988Eu95AZi56PyETybumKktG/KNF2I8Yl5j1ylCnYVYyMhVeV3wENTHsK+3tMFy9TIV+0lnhvL+7tQhPgPMZS05Ez4VbYj8grcFvORB+PgoCOpRoWj0/mM9+hKnB56ADEx3zE2QBIx8KnTb9l4gl+u9eV4zBxBJQXBNmgbzh4ZMhehloQGbMpG2Xh6hBhPQDxqbyAyeXY+KsQHgMKadsf2xMh4fyg7Di4b5pCbdNKtSOR3tt7xyThg0B9BeLWJc/EvtAG7upewK35QymWCtJCJvi6XSo3f1wlsvp4jUX4F1ugyHUmNVeRNfvMg5aTMxsfxjYsMDy05rC83aAPUNEJUBxZK9Den59UOVvA1lncQuR+KcfgtW7oAAjEzMQm7UC/t1S58n3nXaBEAi5uXco2PZndis8xjrtmVq/tQV4lCVsWGNHUEWS0GKYO5Yz3DVq67Xkicq7j2B0IAMaTvKDfOz3ijReEKTMkbZgo6V5u19Jcr08ZP/qFQMLUDxgJaVY02X079pkwZ5LcsiYtXkB1rdbIQ3wRd3jYoQ7gfPBe9bpt9PQeNmoGDTuGYcHnOq5yyqfr+beEWlHhbH+0FIgSAFAre95zJQsXANm3Ds1WsrvR+0Hk/SlC5EVJ6WalDHj4s1eAOj3U4kHyziDV7HI+UTz8fqEHbbVYrtF9FVo/nq3vpI08JtMNapKYKLsxnJVcxjOrN+lNkEOfD7LUxDWH3GKwF06iMjvjd3VNnBAFJCMbdXJxh5LSBP+wK3nLKLEZJ59pYvZ2kKeop5kQ+xXJJi0VQyO6EzCTWZx1BEGwdw09PVFRZGuk2JT1lN8IsowoqDhxJRR55VIkafonePO7oWZ+uIq1o9WbsWdRsew7uIDlozbwl50fepkgkazb4vfvc5U2mjm0Q6NsgidiexYWD7qJZPWSULi//jVeY69vn6FB+z5Q6ST/8Gvjzgc3T9DcReuDMhvgCa1kkxk2CpPsH5ieNcLPpdxOVfSd+YBIUKrUBUjOsgv+GEdYrIPkX8YCz8PFTtGTu18fPODVkF/XVBpAb+skVDhZtBGwrJPUyTfWa735Mm4SqTcppQibaH/bxzwfmT+WlfA2OsQnZJYJOeDJ6c1l6dWnOF2zS1BtKOgx1JVARIe+sTy3gmrl9L4FwBErKXUTgOclu9dUpH1SLga+s/yUL273I30pqaHyq1YKBm40SVzAs8cP6Z7le3LYswzNhhtcazpdXC2egPe7WGzxTLYv+cx6BV07ASX4h2eBL2uN4s5iOOd7zbmBODcXAleN2ZYcQjOLXD9eZJ6TWoNCkVBzRQSHKzwGlRbhQ8iQR6/WOcmW+XQW67JdKcunQjg1K014+eA3N7nZggEbuPZff/B1X6p2wwWB1pneZug8CVnho4W27++MRyNAM+VGsQ7Jg4UePCPqK64AaRapOS7qcjHgwLWlOmJBX0PbbXT+ixmRgMPpDnvERHkRasaJ7BU42JEg9lW5cmQxd4uaKkgyhlYEu29zukE2MvU2jCAQzCXHHZoq5vn66o518d+hlJun8Tb1nGorIlFicPBEQyhznTccxbpCYuI+SuBUdE7uc+LjXuOc5JQecqEkRU6GkvciZZuyHmzvaN4ILw+qTJ4VLr7Yf7B2kb0J1CdfHJo0RWb7K6npemORKO5bDTk86aG5+aE2xYj+Jzo04FflZTABPsTHQnwlRv1uZ08ZtmaNrpDZyFdFw0F4eVxn3eiQsBNDnsjyOiNuDBNYHiufIJ1ejkSNi32/RbrD/oRvnDCfwCSEdeSVXZEXiErBVH5wXYjw359/0PcZ2SMb+TgTDpEdd3Y12l54k4SZi1MXilW/K2ohot0f87E4FBeE/9jppIyI31MD+Up4z1P6rny/1LdfJ//7PH/4pgkPytoM0Sbi+VBYm5eHDED5vHOT0TLtbnVrx5qdPmjarPtZhDYdKfwI65vqz9LcCCbEc0GaICPCyajmoHA0glIWZ+8lVZablxlKDTAaCJNwDbNUoGw76nvIqwJafmH6pAMYebTeBM0P5SpC/R+Nu5t1N8EdJsPEphxPJ5wH5DQtlRUjdYVusfbz/knmWQhaBZKUfHSCUnboaTE4cAx/AuZB5McJ22+1tyLWsORWNXkcxrO2rujcXZVVdIYe0wwEhRBa+if/FuLwY9ZostAsmjY/T7bkhgpBuz/yKz+fhRmuwkalBC9Wx588i8k6wpYDUKNd9GM9KO48ihY/TcnsX7bqm9qdfjtVHR/NZOMTN37tS5ggSSFPABu1SWTY9Lv8OzKJIe1zXcKe1q/V+VpusyMb/bYsQDAekz5wB2onBMiAQzyGMpUsHhUu10N7LWTnoDaHm3bNnI/quMoqPnz2zjd1xD3XvHPUBTezAuF2HbcXnBavQkp9tGpt9Mi3jH++pN84HYPaZoMVJ9MjTNOdcmSBvRy1JWIOnlL7VALlbJcdccXcVEsS+Qii5PqPtMtlLry4H/VJB3RTfcJiyoFJnsibSZrV8lBJHzSMdH3Lceao71LjLyH2FfEHWEVjeTgKFwVH4AkvXP5nTnpm8ercH23Tx5EYYdf/z/qT9/XgYi6J54ogD/vdz2YVXXAHLUjlg6ld4dS3iPFfevKY+mkwrEtA3zfP91rlB/3l8WBK2JLWYmCHtzpDfc1lcBqfNxNyQwlKexZ+L+aeY6W+ZD1SuSONbdTNiw2adj8PDyZNV0BUz5H2kfCZXK4NYSZgZLnF+qJ3+unq0PSRDyfVsyiz+YXwC+CzQV8CnIYj6Lgpj/OgmTJW9Eue1VFOwgmC/VL1jCuxSvqRXoS6NdEZBenNsppVP7KBEUPp0WUXvgkH6o+U7vu6ZIJgWwezQ/v0ywWou2Kw8OS/WTlscg2lH7qluW8EoXgDxcJNFPizxUHL3QFBP1H9hKbPNldBrwJsy3Ly0XoyLbNSlfbT/uz49ddV93GiwBsfAwGL2afHrqTu1EjkkhM6ZTJVjrpuOgUgfYnH+RrlGFdzy3R9uRKk6lBsVtWYwA6I5yyDDduYoUeVo4Ns2VFlKkZU+4jx507lV559fQV9+xH6aIyiYy2y041d57oiKwT3F1LxXjo4WOUmCAuF99fgMt9reIhzR79eda6y1czOUFRnZDwhNRh+CMeAzFB0gCbAJpS3cID+hwMFLM76deGp/H1iBuk2qg394hWoPvUZn8NvcK/ikFl0FkK+JLyJ3lFOTuL5ntr9WbCod/ODbdFbAJjgACBOYumrO2NYV1X00dfk7MtQ8bHpTYCdpVgzbc4gs0xrlHfv88uHr0v03808C0kcFOj+o/sLcxC0ITrmeyBmI0ePVz0S4MWA0zXy9L8BDBa9op5ajmG93UodJrQJzD5dCDjMywovHBQFQwZz0lqmb1NQd5qRqCk8irgvg6HRbdPdT3uO5h/P9uiBU6/z/RKkrvS/3QGK9x2pW+VEY0jtPug8v+1/QgRLZv4ENZZvL4NhxL2un5/CyTXEXse9GAQh1/hAh1YrteF+arShtwlA61FKXE4oarHIZpjmdGByDlYrkKlSpiZ7blHp6VNw+jCURNt/GhI8Ds2HFF2LFI9S8nDvI7t6eB7iNfeEr9I7CUbC3mKZcxL78UmnAHXju4c++3zzfdpoMTQkaRRz2LJW8/k84vYrkEVJJQJl0rLfKOrIUCCxbWsAEHjZ5XPznQxFhJcgnmXe931U0CEJs76jUoLF8Mlv3Gn+Fmy7UaS6Y0MHylerDC/sk7uedlR7o09qLQSLaxG2e8gm2470F17Sz+DX/+02JHMZbvmOVKHzWgj2VIyueHHkm/auZ2lb9p2l5693F8nHG+kzajWnBE1nyq2EmWl+Az0rfw6jdCDZUvlGOQneG7/S0jYm/hOeSHIghpsECZ4OGheDMYTMQafGm0brLfvVTId8lQ5oN/graOV9htEkFpwbliVaCfzcHH/XXBALJkpIY79+62rBCsWCM2R0be2NyNKitThe/IQk06sVBagy+ZVWGifdIVZp8Jpv7bGocE4aDDTb4PqMAADy00Egv2lHQrIemrIW4ZchTP4oXwXm84/gjT4jaoazVk221VvQNrHYUGRmNkPc1FBU/OMuZjdqvHJw1jWetT7SwLvg/DF/AfWfeXWkDsEYcUg2jG8llLHCpyJB1kt8h+DhgyyEVT7KS2tAvzzv8mTpzzsuxvhC3tXYy+6OlmjpV2nvnxyX6jjKokReDyxFiRXBfSLkE9GnHJtWOeZxgoCfKh75j9HX/Vg/ohBJLyN1c33Fo8WHhgaF44YN8DpBUSfL0RktcYYBM4ct35Z4PEB17WzBIfPaRoc0gvJ0E4peirjb1BTk9RXLn2JG4c78gyBqBr7Z84C5ZeHhqT1w54pquhKos8cnX184fCpToMPUS3gQbZLhKaYcIfMBMSAIoSz3HNoZQ9oNuFBwQs6Zb+rQ4vojI/ytVNBkbJrkoseTMVCUYzyeIKE+tUokktAJ8Tg51+3mzsFeKziJXVsUE8rTSDal78/IIKX4AS+PvEigg54RogFiEg4i+iL7OTvWIS0IAQCSNYLYQNp+1l/8KARAZY3yQfAk9NRgfonnnHzN5Aar2ae3g0KCRBTz7bm6jXL5sYr/LVgoTY1uMO38q4dFXUneIylnBWRdnFgql4okr1rWdbkEDzzr4Bg+QEmqRB7thhxPJpFXnl0UmVZC+hyz7/LbSqXSiN7f/P85Sh0qYG8EZyc2qkToZgvRtgyrSond9K7TVboJ1G+xEZzrL9tJ9M52YkgCIctRz9RVPK+HoaJQyKl9mFpEmOAPE6UYjz38qdsRwWzd1LJiy95qM5D/jfexKk5gfBfLdR2Lg7/8JhgtJZzkpmT7AYoLr54GdbXyBC1sRBIIFvkVj8JDGfb2VwAra2bsT3O+miHrvHMWBKaXM9bxEGemO3N8UPynNp4jQB+dVUPgaDKO32SRSyrNuzcea/hBeedCzVPpQCVHEb0X7/z6CRH74sM0RUfvxgdjw2HTJF3Zv8Rr4fDNwmkJhklbMSaxdMzKtLgj4cNAXtwwfbw2AvYcbnKWrDA3mCngGvneiiO9Ltr2j6CI9Z6R01k6t/Gi7lt98fbsQPP3OX8iBS2xdrfh0AD3KTU/5hyp7cImbyhaa6aUZr3wHptKnAmBRVPmgkmCAaA+GyIh61Ve8pF3P6foOiQrCBLmQTbCHNrnPx6ooRBNeF/HPXGgl8I+h1f7ubwLor3c1euJrpXBAZZga61HR08PzO/WIaZt2y9QT/WeaFJ9fw1Wgk7fNN+b9zyWeLDwxh4MBqBLjXqawU8uVHpHNX/x5takPygBFSPe39hwW1uQ7CjJNEoZJT4al1RrnUBxvSFdlqoK3NTE2KJkNyF0rVk8N7u/BHjTIuWKi9wycztRH7X2PgsuKcnkrUzVCyI3qgaKMO40pqNECcGClksK38qrAYZdHlcSiujIkT+Klkg+sRM9lSf8OFpOEsq78RDIMXISD933SvKZoM1bSteFhPe51zVLye1gFGhxRFbkGSCYgnB05ZtBs1JYKJKSAJAZRSsk4nAQOtd/WCjM9vyyHbZbQnGPUVyece0a64WCmJtwR7j9Z+61qMBgU6QlnCGAn9TvnzotyggKF1xeryQnSt4Xc4XbEwf7y77s02G6rZ1LssNNUUD2gAIorxzyi/KltugVVm4zU1x+ODc0AJSrRMyipEbrMYWv6j8deholxIlQE3FFDvBSHv4GEyRgJZBt5AM5NIDg2OL0qtEnHkOIMCEVAADy9/1krBa2oibEOvyvagTJwqh0SIQvcc5yXN6v9eAPIrOJqBruvSOrr2IdZFKk5+dfK2HXANhjPXXEv9tM/BzVh1ziwtQwKtf94yXUeTcHMz7mNm04uRCeLXsAqsK5Hx8e2X4y4kIdEgpqFHcKUVw93U72PqJBCJyZu1EBss+B22S9emhBME7dDs6dMRfi86qlj9EaxsQi6ethIMJ0ARBLAh39s34GyNQTegX+tHI3Z2DCBeLevTD6fZc2Spb4v1kFQCXT9qzAlOURbNRrNZVcXjeUHTU4edNmH+Zfu4N9KfhIwIjLiEBNVVHU5MxHCk4fyF+nmRa/BqAAOwHXbq1UR83/2wDdRJINLoUDjPVEp1NkF+yC2jwp2Tdd6W9PHTcrnySfJ0UJvbwd74c8FeSmo2hT59CzOMo2R42eUqwpGRoMCaiFNnn4hhGphAORejy+hnxRUuw++8PW6nXkIwamw19pErvmyyxt6F2I2iBRl8HIIMMFnpxFkJx1VNehQXWCVP4fYA5bH8hkaN5y7JxBetAxGKARPYwCoFmy+IC2YILmDwvAIN5hRzqNBVmRzPqT4UZc6ws4qg5C/uD1qtQrDNGh5OQa6tVls11n4+EzNObgYJ7Oq9LVMMwA9MwoYjuW+IEdz3+WBuybwbhIpEyFYFuLlKvtwpZTYJhfyIG7m+FCvlZR6dEL2cJV1H8jhYsL2aT6o0iTLOk4VZuhBTz+nNWYEnr8rXsz+mkzOEXeSvmMX75LvW7+qyXJq9BmZJfW6N5ynHuw7uIPXBY4rIqoN4oGjEgZyHyU2IJ7CxYucoDYnpSmIGAat9n8Es5botIMhQcu8O508aRY3J/OQ1iD5p7a8ghHFeFBbQIlrE0HzuLGqPD+RS1O+Ll7fwigAABPFp68m1euFF74JsSqsyMaR3vUPvuGo1vhYSpGmJaAUW48NNka425mzabbW/fmqPe2yKuO1W6u9w69XNggloFrwJp4Ya239zPKWz4CJwSK3qCX0njxDFkcvNz5YyPfpKKIQz2azHkgWPotBGftNgXKP5CFTJMUz4HXNcDg0ocEOux4RGdq8RMVaYo559kYB/cfpRGrsBjUAYulHtP/+UyJ7H7QWhZrmQJnLoEA9OQy/rc4V5Fv75KXbdcD8ogqHI7PUUjj00IHQIdJV9vu620C3So7kdepZUNdPQInJ3cA8aXEow7hWNM2cwAMxAhnYWq2N3NHTNVKr55LWPPTsUsq9vnXoA7Qg9Dul6wJGLPMtCtojre1oOG0ouHJkrv39jQ23KwbfMznH1nxl6EBZoF4qIXGaZUrEmgvf1PfWgZE7gREN41S5HsL2CI4bBHnxRgzFY+C54ClkfQ5nzmWdULrIYHwX96BfZ4qwQsQdmUjXlqEjg4MlCvXsI30iIsiFi6S65mtYMNjWrhP3skd2gimuRrNH1iAZDdBArEUwll+J6fvqhZnM5S3lQB34dUkxtahDpc4T0vnZwboeiFXwWi1QY0x6DT2Onqnyp58Sa00S9TEjqYIxCrXwXeJHYglour31fMFd6fzSCZYIZtngZrCCUsnKYd7XYmip0COoGBYvJ65FuYx2iAayPcy5LTq1bAKnGd9HxPpI28w/iAeNEZjaeXDOM2Z/gVnPnv9LNK2/zLsEnb4ap6Be1MyS+WxTIglUh+thdX02piUAc1AQudfcP6RcoSuft0mTcP7COIG4WQ+DrdfG9gx+6xnjaClKmhMsrvXKg7XoAeKpIr+4rbAHouCcvvZEogOlHW7sZl7pVbBsSI8OhP0GPIVRi+2P4MW7nHK0LHIaslVwQPPyWUZiwM5Qc7dtfOtTWM8Npwok2bznoQbim5SjUN6uY0MGUhiqgYVBVX8RoMTrSLeER8oiXRtP40E5BwiWHgxFO3aLcABRktUceaTwGpzzTn+CziR9VBnS2SjAy62Sa6bO5K/tz8fgwnLXtd5g+nR/wpbQAj7GbNmxOj0UISf5dWKNnAD0zDwkiWdWrLWlqQhKtu+lI2xt/t3EzZDUMBYzWevFnD2LIplTSl8jWAAghrJF18+asK92pX/CnIAqTEJLXezVvbG7XzWOLtJWOmoIrpYe6uBTjGwxMAS2iDqNPPN1zHljPvWXUV5laxqj0rldJ2claXU1+2sxdRLHccvoGGXpeXEXkoYB0jNyPoswKPXnXL8wc7fc0juwQhbwHf633mdR6qRYE9npK6VoOxbnKKO78PmolZkcFVDOo0i1zYbJhASr2nHirs3+mBDkfwuJeWFR2FTkE3yz3Y7gdJ/uMK+X0mB61j9ce4AOyMzbJX8hz927k+ZVJinuFobeL3p8YFZRg6xMT4ui//Pcq2AB7yEBfnsPz5TRLNRHYJN3olVfVQejmUDIyvT//8W1lKOry/cJQ07zjsvYmKnIQxCqC10vj5pX+rzRaUl61BFiHuxE+wiJxsFmuRCfiVCESnElqulmgASl89hJghgwiyXllvk4II3DBwtmJ3SWpU0J5H2Q0ejXnnVoxBT00FJq8DEBhbzBzC00SKg2n90QYC0AJNePHzDX48RPr48deab56JLYxE3jcRF8dZd4MXZuDyxFq5aZIDNQTFaoHd2m0EaKsFCny01nocvzQoM1at0Ix9aP9u3gxUnXAEY0JFZ0qpSyrIc/zvT38DlV4yCPgZI2vFdxqIVMpfP+p5zn3YTv/1XNt+NJCnM15Mh/drQtd4ez9kp/g7tnPOsfWXjiZ3kUa7dy8Yk3OHu5QupfHnfb6JspfFPiWRAlehB7XrBXY9163e0cHjfW2D2ic7cSvim5GAv7BJ4gN5PYeN2G/LiS7Xyy/ubPHO4beAON8MI0P9WIW5Ew5sF7Ng1ds3XbuL/44eY7x2fX+wSXDCDM0uWp0Ncr+SxZ2eZmSSihZDjKjZoUmCEGKs+tbOqq1VBz9eujjcpB3v+PMTsxbRuutW30tSZIFImbCgdAr8iGLQ0drZIWk0A5TQSQB2v/jFweP/ig014RVoaqqlRsPBDILe7r76IW1yyDZhDI5rMu8riURj7zCp/pI6F+nODhmI4Etzb+n8+YZrGJS0Fdw2QYpyYNh3WgwNH/Xzy6kc4Eept1GFS/QRh8iMEHrRxz5oiiXpnGk/VilHjcCNGlnqBzcfPpjP2ox51bEV9ubCj+DGfPlhUnZrWQxYaigeb7WK7lSEBwqDUUADEWrhiHbwMHkNOw2jYEpJUIi5gXksv8Gz6+ewaWhlSUaGJyZely3Vo8r+246byt08fC8EVv1qXF6OJPlfR+p9TCindh32GkErsaDy+nL41MoISiK38hYxCuNpkVdPbGJpw9C2zzvrhPjt+zD7pKAyh0Ze1l1p2agGI8r4OA7oExQ+mwvY8GS6tIkbr2FKLe4dmC3e4UpV0H26tic+G9IBNPi35RIzy9XpfM3AfkUKzw5rxv6SxdPjVKPjjxvJj+Gb9r9hfKv824XGpupeCBaPSQ0fjykkos0/Egb6fuUF7pFmkATSH0Tk6HhGvwPccm6HI43vizugXFhuwGs72hsd5fz/cp8hjWTxOz1LrRew24jjlAs5b+Cor/yg/r7cQs2CLC7jxhuhLOXpVko++r2wI8YS1SzlUoYgzN1WT28jcFTYqhGv1WTzMRTVmlxG3TicKeJ31kUUxhb3c0RPvn+5PNkajz4UF7CN97kj3dyu8knLO3XVeoXRLfL+jS5vwSr51T/oe4o88qK57j+LYqDmBte6QMvYWoC4uZ337jXDiAzuw+3TXuf3XxI+CcajgX/x2mB0BmZyN9bInriAqHGY+pIrvc3k3BZrsFeg9QHQE9XaIdU3PaT+keFndqGDWWopK+eAg2bE0KB7ds7mpIbn5C0NrI42+JqQ3/+64Rg3qmrUnzFhmnpMp18XDSAu11Td8ItUxisOQF6TmHyRkZEXHTHSIzol217Fup4cv3J8cl+qXLsYMzJyiJxF8npY2BfmZ5Dw4pLJPPmJJr07oNrX3ex+ATViqNojM/A8oi93Laq0oXt/oBF7PNVUmcuHpvAVZGGFYotF1zon1Pf+DqQIjGxEGhx9NSPOvSG8SyX2/7W7YxB6fgbnHWk4f5PYBfV94numIUG+rRk63dZ7u20bRk+YVJ/rK1VGoQiWM38Kzss8yIHDq/zE9Vb+gewHCf4te9skwDR0a4rzGZERJmmnWZdA7h3M0MK4i0GZ7VJXvj15HN7n5FDOn7I4vqYdaS5HWW2zJ2/EMSK5Msp9uAZ5NnaP8MnugMvOP7WUvfAjCorxN9EXizX/9mWkdb6IcEp0oDeO/Tlat63DxBTSG5UzhaxbjqjS4U6cjk8UZKGVl3z5fa3GOnbnU2+J4tMPpyS18062mPJG+mOPD7n9XN5TncIykxsqpq3iH5w7rDFXURLNE60eKPLgiVYqln8JMy5MmL0JEa8jLQv6aAZOn/BJRVE+t+HiqqxxHo8v2X6OVzDGqZod3CJCn70IFCH2SaTvHO8b6yCTB8Hbnzh9dVUrLra0uYlwyXAfizBUhaAtTuyZxAePCdI8D3eiO2palzIA/JOCVQm65jZTi+DJothL0b507ivDQ1FkByp2ZsVegjVovpdzTR3ZwjqbNAmXmHCeCpaEl08CtHQDbqGCxoZ9WI/iClyO3HXwjSyeWKEEZS2J0oDvyLAT8AXeSYrHTu/bS3TxkI24+PxBsPLqHlhD1/2GKZB1ibPREQc2wZS5lUvotfOwVPMMcQz3qSZ3V+hcD11RYFInm65yHvtxV2R7/FzbSILmxroz7AX3I3mBwuwSPXSTx1K7jbi1ALNiPsTnRsEFW0pNW5q+pfNiZLd+92Q6Y8l47PYwNtgOz9H2y3QZUSeEZLGdrEzHBAP2zjxswDmudwGV7JfZQbqMiEHIjxmJh/DIoYZO+DrmVPT994PpFwU1vtWnBRStQ78p1aqN9yvkncYIgWfytPhnYA9mTh+QSKsQba0hckg+diFi98FaEjdaPcSFwCWTTYNGK291S0S3j3zUKf56Z6dq5/AqSXf2S5AAIP0Prpbv7ZVRkC2qXmXCDcA/h7Djc1e3t60mNxqg4N7iWBA27cME0NvoBDuqDZx3p/JEH2QBljuggylRD+NPVf+EIt9/Sh18jrZCOQ/Y34fj/lhnY4qhUM1hCI54WT0+m7KAFzoDVJl3N7QLDtbPgcX9IgFfUHI53idzh9A3scRNpYEjcJkTiTn4eaXyUwfdWP/1R25TU5XRWw9BnsJ1q4zWt3sM0U6w3tfjpoi59D1T6uGyU7DapJcO7sKyN/fTYF6VGxrh6KaLky1kPT0n3y0CvUGw/Sh6JW3f7Jl34sJh6B/qByoPBAa/GpGOtwr+bW7K91xAbjTcq6rx0XgSebew5gKuE8u2vcST00xypbqJZUsN6WdsuB1ZPoqL0/TXlA0c86KY8OMDUZ0geSBmuo4c72B/jzdm1yBFuC6o3Q60pHW6DQmUsuUvTRJk/cKwIx779to8b68fr/3eJ3ecTfEQKd9DMrLf+EXaV4ivKVksvOZO96dIMna93UnIxus9EYd8UJ40g4r4ZX6llSC+SSDRP1/Q02nNezWo0b+mbFdERHlVOvkkWsVGwKs2jBMnpBx9YifNlllKtD2U7b1qDEY6wou7U8x2maKgKf3F0NxG8rqqwY0BrgGl+mU7pgE0hX0WLPEHRin50RtrYqN2Dxpribr/MrbOtpEe1+z6O8Yliwv5yZWtnUePbgeCq5C7WmlknEm7MLvZ7ApA/Gv25GZwxqdTqGT3dYAi/0DN+nomwwKH3VeiVa2d7/Ha/HDT1TlKc+6Gra1JbuFxSyBw/YB6T7TZ34H0X3oxqpzdL23SweEVxb1lvXWUt7rE+7sfXHZFkFbvtt092phigmEH0tishZ+cbdLTES5MYIACZEZnaFwvxWq6SlPGt8htj+yqTAp7xL+eHJwEr/BC/+cwYHF/V8aGSt0zZQDDLT24jcUowQr7sfMaihjedd4VaGq/kV8Q5AujEM6cqGqfyNQLxN5miPI9tET7qHdDubO3PZyCWa+O9BmCpCYTMSLU3fF33f/v/ceJ1Mavg0NS/tF3zh0PF7k8o1r65mMDTl3l787X7N3BqLARc4YDW8TixNhgE/Td+rSGzLnFmjepoireApbFGIi7VSEo0xWEQVz3Z+NaNS7H8KocgAklooHkxtS4wFYCuhIHEhn6wM5EfwdXN96RSWyfETseSSejdG8aknPoeS1oKqcurgYx0NfUhCfP5Ok0Nv4PVCK0hIe32dscO0p0cKAPbFfWwJNYhRIPbJv4rRFzjE/2GHC9N1Izp/16G+yUny1WZVduqRyQ+S9TB2DoJ40ngqk5pCq/oEk6ZumtIhgmyImWfcBIi2p4GvmdNUF+ZN+IBU2htJiCql8Tx9Vv0Cw9KTfPHq1GoeSp0bN3I9g1gq0BgZMybRYlHXK4a/CV5wrgC5fdgudDbE9lw79XOkP5UQaREXpnhykm97NfWh9LuSAWVWqAPJoMJlrcJD1W9eZ0DtHbwRD1lTwxMJbZYq1ayxYUijEv3RUkfRd9uVYQWMk9dxs5pHI5pGVbmTj1skgf5yfvgKkkqtdM1xEDzupE9x7QJjWHk5CTJ9xjYeEGVVhfyZ6GFv8GmdgyatMGUuFO1wq3Vfs5vo49ASgao4n1rwdOFyXg5cRGjEfdBvam7SCKItvdMPL56oDhvsX3eG0X/zPub+un6qtVGqCLtSxyLl+x/mRBPtqWkoCuU69O7NNMiYrc+vgaR1kn6JxyU+axmRE8d1c1wU8aWtk+/RrK0OdqbQiRT16TwL6H8MWSbNMfdqmbQdYb/QjHT1Z6QN45WVJfBIOreQnbOKmHgqbDgZLmGZeXDTANmxUZqCcHwKlT+UgKkMNO98oAI5Tkc9b5viAxpsP4kURPqhIHXp5I9RwUnzI+ys6VDepaQ1KaOZF6Z8KrSKKMcGGBRiRxYLSiCsxbKhGhGAhUk0WPoLiBgakxrbSeoNIj7rvX0juObLee/jZAIOj1f0GMWy35rUWniG3H5yMEQLzs3QW12141SUYFi0+yJBfHEP7VgJ003h5CX8M0lVV58OyP4VUJ83+dqDpBpuvHuV/1amr7wit1ZXLc7Tfpa15cA71P62UbWcGjU5ijHKdseeF5PJI+6jseviYnq0Cg+RZIfJeSwnyx8df/BGjOveH68ytemwb7BnsEsRRBHz6zQr98xWt7P7slcabOAbSOr0HE90hWoluBbztYX2TJZcrAQuaynU6o+MRKGaILczH+qv6Kb7LXTPdZIRexdNB4m7FTTfDAHjXMwJRUrk02AN/3kUD0f3zkML/rSQbwXGVj1wnC992xO5966BFOgFYAWRFChVKjA5fY6qAdYMXsJiqq0DxMOOq1qaIamfrp/PjDFktfoJZjq7Jo4Ue0nLE8xYJVv/rV66nxGUfNjB06YAG2lfU97gtmbBinPtSNijlTZCw4l2G+kfbDP4xqiJQ9k/bm8FtH8F4p4IH1gEuSMn3L2lFWt8e+8n1a8lKlNsAOSs6wUudURms+t8Vvh5Er6TPhmyclJkMzECf3JsnqJZQ6RpehcXUY3t6pdNSBlNnk02tBuD2GggdVuj9y7MeZXxKAXRRh6q2OyNUsrN3dyQoPcewcn/Eki2PXdqKXAn3PdELDCI/E8GT66BSKF8g6pS+rcnIMbXS5CnAeZPQUYDKUTNzdTe7TKZfwhx6E02XvQORUvpYeiE+PkyHN8wYmTwACPmQ1dEahEit9WRWlI4sImaaudbdyF/1nhKapkzfZrSHkjxU7lMCNSpPopZb3znYSWrnhtP9fYHmYzvfuBqJSn2MmC13rUu+hc2byayGzISIyOrWH+XJV+spw0wbWC5wUJkwPv9gaeF02yDEIc31VjC/ph5RoGk41cB69SxNjQ6F7LjJC2ctedB2zEiWAlehex3GYizPYlgI27XHexK/JUiFSwJk7kgtgIp2edG3qWzhfr6fKRfH4N9ynPMA6cEo5zwZDo+Iw2CO1bN9x9yBzYBmqQqH8BupX5vxU4kREUBjC8vINlBt75H3CS7GNcb2nKwwunfqQZAuxuI3CDZY9pf3WOnX/eIAE7Z6EVKWKLVO/hMr7e50iwUpyD9OjJAGQw3LOoZY0Xgk5uWDagDouxfaOlBze4ZphHQS8S4YcSZcrndaRjbKqFB9F38+0aRbSixAMjoxM/CG9lKDPKDV4llXKx8IogPtkEMx8WHdQOZ0xxvqTU0N1SwdS3imYqepCLWo+ESQooM68i1FRVUaCMU7T7SKFQyeS2TK676D1fbL3RkALx6hFekfKNIMq15iKnG5OGbVul7bA/dbqJzxRjVg5c6ILeIEd8WFvLTCnMJvaKfmDqZbmHfq2QXwap/UU+NzS/opzQYzTMB89sjHHADq35fbjlC+irjxSu/PgNwXA5YAAAAqyaHqwrmw7clUtWDEThNCOHIG4pWVxTQErOg3Wf4y4nZPCO13zdDVY0N1PBRim3+GWdudbSMKGeK8JBx7K1BJsoGsHkGAt4BEMQb2WR0QPdOrym/Iu1obxbAbiKwSnKDiHRK+KZktwGX/FRcJwzanAXmx1dRRDooBkmkErCUrrmRfkVdaascKGnS7zhzHpq4Rq83JW9Malbnw8US0Ln6COecF2nt6V60Ow2yrqEaYarv8p06WQQxOhSNYYHaSStzKD9xW7GTXflSRzyIJwBTNCKMt18uOS2ly2AG7oVFcC3a0wBDn6iviK4X3ErRUyUDCWENuiq2E66Ps2+aO2rNQ81yWA2jdJzoIf+8xmB1dP6+Ql1PxeWGqgphP3NW9HAAtSigIQYtAMwElpVs2Q4hol1LD27zhOAAE2HuUWNq2OfoyC+FaOb9Ewyzu5wMqBR5iF8GjaAABvWFekkbjUeH0lkAcpxA6m3baEADu+DqchyO/PfCCCKwYYAIFPRD0Omairsio/mRIX0JHv4WNC5zk1sx1O6pbtkwXwR+wI1/nO+T7bUM2lzMhtoDBMzCWuwhjkzhczlYDl+dXjk+hf7hfMxjEshNnFSC5F561UqHhZRhZiOmjjeMVhGgvQ4cvT+SwR8Gi/lL93IvAAAAAD2xMHxnc/66W3zl7aUERQNGjCbwI93wnjW+UkwVmB6EuyN32SEi9ms1YwkwET9DqDicOW8xwhAoGubXFg4beOn9VZZNgEVQj9lCzhxy11B+YDC+fx1GlfVR1IvxpAf0oFzXSashc+igAXCItYbdiqUEon44eYnNxdXORtbIOxrPMz2HNiteI3sxhGW6lwCBV7gBTsq508NXNWh5m+cjy+4U1amsvGlaotSJl4Dj0q88yFzEV2J7k23wx6cun+1PpCVqWjMpbMxRQFoc/CFlLc2D4jjw0nbBru17BuQhuNbehK/iv0A79ptjRdjoBgZ8A804AM1wvhrHFsQpVDlO0BAqdgheiTGXrY4WO07vZ2VplJrjuqgKqJPG26tuHsUVzUyUR4wKHq4fzRBUm1zZ5RIp9CKskM4bCYIYim2N/7wXFekoS6vCDU72j6QiwA4sshEWDGlBrm38AI9wADcbMgieEkqgzeHJNkM2mcVpG2mZsLi0B5JRAAAEeCD8vck5jLBwz1CxCkb4ALwqPDZTs9gqF489Zo1QDuUwKbfeSnnqp4af3RAgtOw6WtvrrckRE34ybjucJHDZ3zqtb+brNlktm0LNwruRt/T9PMAa164B0Ji2dfJk5KsaPCmGHYr+N+hncEoBIYAAbu+GVmzAoGg9eN1o3a6yk2K8QuaNrZlZLerNK9LvdMN2dyYujwFOAWv68kHex8MbKvyzvrfzTJ/UNlvCfCMEkQMpY8conqZ0FeL5tK/x6HaN576lS8NP9+5Ld51vUuuvQ/fRpH2SqLdvadob+ARPi6ediw//ikTq/mzcl3yN3nKsnSlB3BDMtP5+yNbsKu0AnJoDeZlEynTAiWipMbEOKc707YENrjNTzJCYjXFqHHd8Im9vAyUbi3+UqycUAqupp2E5JbR0oG6aBxtGteDioRylaekM1HzowAEaE0xgV7RVfci3Xru+M1u6Qd2xBOcRVzEXKcf1uyM3J+BgDg5Md9TFg45PIgwpUEaJzFUSAU3pOJbO8h5e7V9QNTfrFlCTwW6+SBCwajUlJ6ApOAyQ9P+mpBgG1mQnUt+RT4vLaLnPxO6sCbh6jflzAXqrW6ZF5uQFX6vyGA/+5pQ/V1nRuchggPk82HrGTh06dAJE+EaSmWSRgdL11qpAJKISW4YwcqnfDMVun3lSOZQOZmNo9qKm9rkF2LWB/YgFPlLcf+DbnIBPigNOjp3Xzf0uNSMOV/ChlhOmkgmfkLAgliMChU1faUoJyxXGYoQUmS+nEd8hmVvnkh+/f8BhE4qJD62+rAHeYZLuHtrVljfXop5OMYhn/jeS6AQshsfNS4YmVSb6+/prLk8C0oBHe/A5PuaZ/m3hLBK0vMcz+UwlRv51cg59C6XaK4g6ZZgy0+gumWOkFXA15zSAO+Eh68mqvryb4QnMryvzLdYFjEUc3IpyaVN9v54EbVFd+bAIzqHvrZiyNnwiuRD4PrURmUAC7yip1wGNeJLVUq1DTHICNJpWKNQmFP6cdbulOtfftZjZmXaQyRwDfgGS7R8pfD4DpXaoFov1y+I45Mxd9C0DFkfdd7pa6j1TYY6aqFnGfbi8DxoEnXx+TTL6TIHTYQqZDYgibBXLFCyzhhZ7tPsJ1faL/Plzr2nX7YXd0oUQx6XDI7K8330fVAHZ+VHto+oSGzSUEyJ2k46aThTIZfjuV/yeNm5jatWbfBdxHNMnxrmE+K3SUlxzl+aDGMs7gQHTx3QdB8d7coDzHnhh/Pjy6d1JirScT52cdysuQ7mCC6iW60W+cr9gVW53r/UnID8XI0p963hE3nHwrxXbuUZG8U+NlRmc1qe13YMvYf0gh5wDFM5JEh/srfgYAX9ceTMyLogXB+MJrhaJtMFCVCwWSTictr6sblc24UJBTIv9DkXxWNys2NuZKdZtuawLfomazYTkeDNGR/0Gt3e00QVdvzDUJn6Bp/2WaObHWx/+wyXtCSkZHM+QmXKTMAd882LV3H820L0u8iEUb1IAJxzG22UBFHuSbN3kBa4vH8y7oIiBRW0U/XBSrR8MfmX1ignBxIxNuyjntO5a3iielwLEWgwwHPFPeDVGn5h6EU/AC3hx2E9Ygs1S4xUa+VknWlZdekLlGijj6f+fTeZPp7IjMaeWDD716mGw6KV9Xr6WBYgCKbuZRgi3hvjboTRNjrtxEnhhfNTVNqAKJ0OP9/+SpXLfG/GocoU/tKb0+hCo9no62dlmAAA=="
-    Black = "iVBORw0KGgoAAAANSUhEUgAAABQAAAAVCAIAAADJt1n/AAAAKElEQVQ4EWPk5+RmIBcwkasRpG9UM4mhNxpgowFGMARGEwnBIEJVAAAdBgBNAZf+QAAAAABJRU5ErkJggg=="
-    Background = "UklGRorwAABXRUJQVlA4IH7wAADwcwidASoACRAFPp1Gn024L6sqoLCp8LATiWdu/5zo71Fl/k2rxqqo2PORD7tdfTx4x6+cFtbXNO6F28/7Xi5ek/632A/149Nn/k7TPqE+YlnVfz/SC/+XqM/rnPt7A36TAL8T14eHXCPP9/3f/N7b8/X+19YX//6/fBf//1g/d//zzCf//zAf/7f/c/M+i/wT/6/6L8mvjj8K/3P9r+XfrT+Efsv8b/hfth/b/1++Uj+h933yn9t/zPTP7Kvpf7n/if+t8JPum8j/yb+n/3/+G/Gj5BfyX+d/4/8xf8J8an2/+1/vn9V7E3tf+SHwEe3n1//Z/3n92P7b8PXvv/a9GP0z+//9H3AP5t/a/9564/8bwRfxP+/9gL+e/2b/u/33/PfDf/W//D/T/7X90fbp+l/5n/2f5//W/Ib/Ov7f/1PuY+dj//+3f9xf///6/hX/cz////QUUgcJqraWkMGfdSOBq0ytPu+Hcf6nyqzUREOZdyiIT7I68qXpCeuUA4C6l2yl3w7LNv/eSUKl3w7kE6eOni5kubviBPu+IE/DY8VOIWGvKAcDZ9+3/74RU/5i/w222sK7dzhWdiGiHunqPaUuIt22CI/WrIvikgSAs0zMkifHWXS8/MuPOyyZ0IdhYvORYLS7nuZy45wYd3mYlJwKXm7lBzsj4Fw1MKHJv20tahqPdFlC/oz1CgIs4utDVaU0elJBq59qvppYenQlDoHJAhWXczXMWVhxmlWImE1epLiu3Qj8D4T3x8Nh5mrJajF+Dwodda/J4yj71/C9VWqBg0RX45t6rCgDp3CMMnhpNC/L/JRaG90+EmknVgNpSIfHQqOBP1bUEjVTWGk41nTPbLpBS1+S7KMj8CbJ8UQf12thHTriemslIsJeAQcmJV2Zx1d9ccjLc6qwwN++yADdZA360rU34r30kDrWYp7ChI2FI0wY8i2Qet46iwfZsO+UqojryM7KIJBWy7VGo4AirwCFiHsKGI29qYIplNYt5sJAD7/lbtozpW/+oET+q2RrzMjG35TqpLSWknu3COO1/0n4TY2j7wBVDfRAgH2fTCl/CitBVYx8E5CI/T5Gb97naJTOIBDt0lWnVWjqtD6QDY31Lu1mcCf7+jZxcsui01dGAjssxjFwtj3tGe9i6y4hySy1ZQcLd0kAmXMxID+qTqUVm4RqtOhhxH+2rUIWzI27Eg9P1SeToJlcrNtWDTPo9u8+w032LvckqbrmpYgbGS696lm14oWeq87E2F6PAo/6Hh380rDT1vrk1hRssqfb9D8ulFZvrwU9glNhY8zIQls9lqash+hyDuvlMl1JpbPUAAQF0/2i0XyxDu/C4Bi6iGa3GlOh7bDsHzygKvLKQmpZBVfPpkNlVCchY1A9iC1/93hZRzbRpGiMT8x4twseOfTw5lgrfRB5d8Y6QyA8FbhaPSm3Hwr9seEPevWogMITnvT11FCIPjaSQ5KV4eLEMV6fsNsP/aYquP+GlMHCcPlrr1HVaqq6eZxRcyrgn1/il6n7UCzdNXamXEPp97q0uUGJHZ7cPVa5kok4blIs+dSbmvcHlYFa2B50S3fOU4IXFTVfeUx3zvVpuZuINILyynuLQXBQ4upI6s4g+HlgK1auFXd7dnXinTGctOfmvu5OwnVhZYWrsQN62JAb++FM1sRMF5AZQf8aaeze2mJSSaFlDeb+HB4Oy3NH8EgN/fSWlyTdRzzXEOyIU4TcFL63FjHKyaR5/jgMTmhJ+di+Q8oZqLxYM6OyfIdT1mmjIoYX1ynj2scjbqffeUmNmmtFI4yMi/7LoyQgr+4qDgvD/zc9J8unHnBrKiiF16nrJZr92hDxvEJPRGYJ4dZUW/gBR4QV1ykjzdT2XhwNc923xhIQY3fwSWUd2v04juc3/DtKBA8KvmpOzGKqIh5YLRApGZMsxSiDYYf2VdeMgvoMNtJPZQnEYXvXozbqYZ7wyqPgOieRfRAHjW5FqHCuJBphPzRwMqjlTt9Nbo4Lshnse4XD2SF/YmvSeIkSeI2E8gW2IObuUt43ikp92a77Af6G/Ifr9gGHeaIKu+17Fe10agoimdL4auWZtQehMdz+066Hb/sZTp0SwSTxdjNLXNa2gIPYpseD9sEWe/Jm76YDcr96zczL6UcruoThTAgJQC5u+KAGuEZ9Z8TAz4NQp6mAs9SQQHNZ8vLl2D7Xok+tb2165cSW4cIYAyYft4qwmBuOi8s/6F4ObW5Z6gslF+GMwl/FL6z1QG/1TsmmKcmrtf9HqChALIvzWS3jyDWwo/gv5PFOb1I2ATuBA0fOcluSytG5Bqm7TWe1oBlo5HaXgxHra8nK/GhVeShqCKVqBNCf9nZwF8HOiTS9v0ldr5KFrz7IAMEpDyqOeBfQJyCj3oSioI6tQ5KXYDKU83ZOfGqAU2DtIXX1ytMb73SxvncIP5HVFNzhz3VRRZjVxp1WExl9Rz1jFUBGaBSDuhwvM4zO+fgblNQW4jVo1u/RWa7HOnLD2t36pjP9pTZksxRnP6Uix3ycNS01hqZxw/oXkU7eInvjI/BWQbjJCNgxIqkvt/yYIcid1Jfb/0Ge2Zb/0HMpONDpKB168sc9apZxFaLSF93bq5X0z5iu79ig0i3DCvxosWhJ6LbEndpMlHh/yBr5PnIyaz/r05npMcq3xV+WR3B3hV4sTaLaUP2ks5hdCFd2ev7BF+gdQZZelTZy8G/YaKB21hkY2gEEyGnAguXtt3qJU8KlyM5hRhzZfskr8Kjdar/jDIu6EaWwTCKpBZvWxYHRDOXYamfULcSRQIDIBPfioHeiV3El2THZ/WzRMrNNhyapz8gYV9D/pKCVdCufu+iYDlksz9brTgNo1zD86XXwWAa9KfAteVWIljWEUjiiXSw3G0FFw8+DJORB8MxWJ5pBj3GNGAJIh8ZBexg0ZrLKi2OUqrLJj0NgCLHMxSU+haD0TWshceXAiuy2n0Z5fmKUn0H1ZFNStGaJBF8BucXL28yXndNsVHq9a54zW74WYIVABYpAC+LzzUP51nUsXjXiwd0Y5QkyLEzIKBNft+/oFCxd94qCnFr4YGAqzzK8VIeKiN2KAsrObeNd4nygP593/sNYrlKM81As4VSIfx1g9VkzNMO/Mp1CUExkLDlE/HSnaqkbZuvK3f/zj+EYvP/9puqBERrEja/T0ENZCthSOksKn57EiL/eCVJ1n4hbcT4on/w4h2+VKf+PeEvt/j1xG3KueRxUYhpxOVFXY4ObUTgR4R7PLCjvvb3YP/vTzFjfmuYUOZQ9i1REdsJYp52nm54KEeBphUATlNXW7nMW1w6AZ/1kkDHGoeaRDBmv0w/FEgexlE7kpbZelSXLD2XYIQVu59HjMPHL9KFQFBf5iJCirzYk/XTXFh50qJrS15IwjoiNnNRcQ1bGWbMRCsNjPoVpAe3yQsYiPvnv882ByRoMRG9oeY7LahrH09e3fRu7a15GLNLf/rKNkhlWpoC/OxWasqo983yJbmz8djIhpoTFbo1CDglJ8LeBamwn8OVJ7/3HYsyw2Fq3os6g1KlprhEpRzZJlK+Q07ozomARkbVPOOGSf10IDhFveoUqFN4FlIxvZLdnxH9T2bvogpSqPsuMhc9FehIr5puG3DV5sjLBqUWMkt2gltz12xBxXUFKHuvq7Yc6+n7foXNCe9KCGABvlaHnoihYXRWFArGLz3+SaSVH4fpqJfIWZge5DRrcOyYJwasyhDQvuaPj1nD8Yi8MChjjsssbCqpCoeY/eJhuwMGmJ3an3BjHhs8nNY6yIiKt8ydSpYMdGhxnbTRFFmDPFpm/KqaclXwpoucuTh9N4Au677l61c+ST+t8v95ZvbYVzh54QW2O/L/Os47jLE7Qw+opSWxvDI4/GMJtMFE/mW8w4/qfg6FisYeYjoeywHuJZGDoK6oOMDVOZ/e5nhF86dxuxcHbUN7LC/g4lX7gNnP+ruVC6AyyTV/TC0X3fqAANeSZDmYcNA4+9d4rfGRL7pVY7EDHdcIpRQGy8bclNBNrPH8DysytTD1hJO2boUBZ1DlYCe8lkBKFkO8IHCPMV9z1cL0fIX2XZoBRQp/xWOwg0ofODWGsRu1y0392fEGGEXE5ifEd7uZZyTchRaiUbM9SZLrHbAyokv6u3s98m/PaGdTnfTo/zULd//l/6DwNPZXstZTixRbYQNL5LL96A0P8WkCteyrnk0J7WICLw/WOYc3SKL4smiT3W1mNOnjeRcPmZrODQ6JAVgKftYRkiOqSgOD2FUpot8Ti5QQvpiMKIaasMgfDyiSAPUt1SZCJR33RUZ/NNET8VSIdTj/hIRjwx2eQsP7PyLPOFKrWd2udBWltxm2fgmQGrO5nNHyXaQcWjZrrU+BPBF1qV6gCzM1tCf9ti/3Pv1PoBm6FExcqO2ayDSG/MSOLKZzuLwmTAJUkIxK1pk+az96MvlPEM621XcSO/meUBiUYPVo/IFzVgtMUGj1zWR4rCMrawdOQqlLuT8PL7kdQnzT7lWjOhtH6Pz1qdAYnfoISVlQq3gnHNIcrOu3mb0qsvFpm8lrwKtEOtJ/OAyMK4WSrCb3kIA7T3YoXZj+unRfASbOJ2SiIF+X6f4kNrHPI6cOWnt6ZcEOAmv9fDcKc/lkYFrkJRY2iLH/OTVYyQyc8qofIEF9nvFVbsgdKVggCpfLZP9Ge4jBUII56UvgGu8IZEKKvQTJdtyDVRQByf5LLdmLckyawt1y5WPwPXkwutv94CZYEwLYzHv3XgHDb1OFMvFwrajFbAoIrlFzDyFllbgmTO+bOtvRYmgXvQxh0fYwAB0Nra2THGI3cBUUehGAcy0S8sixP16OjEry4+4OHKZI0MrWlZYJSdAG3czT8k3EhNoJO5Y42Vz0di2iA9fPuthMHQIqjqn+wCZk7GoZ2EnxbgH4Rr+PCY/T0fxCx0ZMkqi6JlQ5SMHZZtpy3HisPZYGDs7IJI/JAwfZ1rZOzxt+HasheGycowsAhCkPohKhVwuHabaAxpSrYs/cuBD3A6cwXrUDkxwMSgk0SloFftn8cwjChyEx6VuQydZr9e5s6U7l1VuI1dnGU8oi3ybjARQyPx+9oIh7xEnKSXlSgZ9FXYVBBUvPLgJiokGBGSljZqU8+3veY6e50EGQfBnjuw0exmC+vK7XiSBnQmJjPVaZdNpbgUxFaf2JhJHqL3WPkHadlEa6Zwb6XcVhTenTibjbmPV+IC8cpbjzpN950g4QoXM5W0GyKwKMFGTaMwRcuKNaZT+0VeMNjYkebX0L3Cl2AzydkOS1qgDJCCCg9b+dvrFHxcc8mzcy6njul2rEUg0glzYpC6x7kIXUrRGj1a+U9SpOF11+Wjzx4LqHfG5Wl1tQ34akGqLt3xoVLwLO0oW0iPa24ODGn4KDhGJzlZjSw8LFrPvRA9VV5+kiCu0pKI1AYVmHj6+coFhRRIUz9MwzLIox+ATbB0CJLBmXC8TenManXUkdIoRMFPBlpy0l9tCvVzG3bRiZttI1Qiw/jnK7E/IJowHx3Gyx9qFY716YFIg2ygptCjwAT1pw89Di5aOhr8M1sUp8IsJhPacAqlUolDji691quWFUmg6Eka5mRp+NfQYynOphCLonElHtyg00v3iQMarTDQ3t2fknGEtIXKr7uXy8JDaPiIcNj3G/tojrGINPIhA084YSPDE8atjvKAApi2i2QdZY3wAgYzhtUAayC7i3DsQYO8NRosee3VMmZ/NqzaHoItVeD6VBb1a3C7AwIJGW9GSqCwcEAtzaPCdgVd6pDORnq34aBjHSWXGwM8/6YD0NfXWi3YvuHK5EFm97x5ZPyOQ4LhDJWSyRK6/TdX3b2O52XF/+xawjWO6OQLHVvRKEfsL3PDP9yGpIzud8ptclK5rz4cOBLwBroyPwJQD5q57wc/F9dCKENMgz64vX+PYg6BFbFAbF7fEUkxd27NBy4jVcqkifWzHBeGafgCcMYtO8nh3ILpVa/kyHm4TCsczEdvSTCYEMChAb3x3WkOEEjUxTaUzVzZaxQcAojMYLEqMvjn2HQaHnwTbbI3qqYnNZ2tlC9Xf3vj9SdWk4VTFhB/6xeLCuxAYxsjVGy1Fm6X6VFFnLNwJHNvSHEJE2L/LUaX811kFW4BpEKrh+YNi/3YaQ/3nOYtwUNFulOItsUvXr/RsfL8LiBOhFNg4AU/MBHYgnPoew6KJ1x3xc/U0JXQuHVjuY/3PLaGwbqUsriCfupaYJbGFuSkPGG6TxgpgJ54dzwGS8AZgFSh8sX6yFP7CDVIbjOKGoKXakMKhR3TNMHX4wiVrPGBQQKjgONJvc81L2pRNW33ZTK0aDXnR66D6WnrCAAGOqJ2nqlmZtCHOMK5KduZ9cPIolsK0zDOkai4LlVMjTccJsl2v8icEGSY8mP2n0T4rTR6nLHMbZTmQDbnKHdKjv9+NTcH+jSW1IRMzrQiC1p0wYimMvQzWhiN5AujqZAelZhmj4CKa+iIYn9YsExxkxD4Un/GBR0JmW8P57U57v37/lJAg7jgtM6siJ7fvc1CS4a5+JT7P/krZC8BB1j4aPMS/o9Zo+GmVp5dtb04aZ+jjbilL2TgzsDagqHxrmnnwysh9pQB9qdrDyUgCgpY/ymOIfzucqHy19dL+m5pYpa3z2WPCMJK6uAQqjzJ7VkmPn9FaFl9dM/zlvjPbtldIbOl3/ilfukFdRlRN9dvHLVDKtL0eIUOTR1PibUxFFVfaxOdU/sStOWRYuY+l0gmPUmnt45e6uplt/fCp2r7hBH5TXKD99Et0899t4zRHHKZYsAdDwiBqz/hP8UWqnNaw7TipYyvW9CYJeX5Fyljxl4ZY+tViZKSI5KxdSRUXUM9z8VeeCTp0kuh4uiuyZ/X8hz01SLKh3Mjfq13y0yqiOl3KSm4nsSAKpCrfPirUh+/Y7oTkAxdBJ3vI64E4AJBFdskQVbex4/ZbqvyIEhp8BdMJEVrnunRZTaX4uqK+NSRb7oxvUWT/m0LrI9ym8Sh1Lirsl9ex/4OXCx9eRkSAKzJc9lxVa7slJhzCDw13O+Kueqz0dxUa5JM4lBsSAPXzK30DtINOLIrc/Jfpx3eS8+uaY+zaxtqfPqhp6yLIXL6Fcv2DYMu3SU5lO+0jg/wuci5RqoQlhU0I9FGzrd5Qnrlx3vzMshA6mKTVK4slBZRR+w4NFPYHa7xjoryOhpkrS6+Dz4GoXv+K0TBEGEeUbKGPh2LqzAyPvMkcUgE+F5/jxjvxCSChff6XZZ5B8NTFD51pfC8DJoK5xUegFtOUND3pbW1gGkHXcRP5MWJ/9M7os6h06gbb3mPUY7H5pBtOMREW0FjhSfic/ODHDV8OOht4sYPag651M0EX+bl8n03G3o8oHT3MtvxpYKJqsHpHMt0zUF/upt607R2W/G7xdWNtVfDvG512pYmxFq/sqpbl97Rr1x0vH/XiKeeBcY8NZtgNkylUSgUT90EybzP9Rdh2igJ7O5cbBOOozdGslyol10o60z5KjHIJZjI3pv8WVf4QClszp6L9qgH5IgsM5EqSoiknJkbXRIU4hNpjUzLrKSD1/2saxmZGYGWWPVnO2+CENFtkchb6j6sMauOZxYbP3HkdjO4CM1z5D8Mz9lZL58kim6i/k1mnn3tIC71jRYYDLVvMJGuEgommULYjC6IarHc0Oj5PT3t1qxzj2D84Z3GffvkkbseiDOdnZQUW9BDL5NSnpLNoZotnFgwDJENgSLSqw4Z/xLkeNi1Vsug87VCIhhGHSMhx8aTuRAKlpqbPlPv++y+5OrufkLHHObmnC0Mzj0NWWR0IFndOmXz2woAvJiogQDJnFKanJx0PPiraYFJ8DdRoUvUWzA5MoLZEFUkfZFxK7AoWsTdld3+C7Bh5hH6hqMl43ZsekSkcoO6Tv7MsVUSVLCyNUUBzdRuVVtlFmDjBWswrracbXblIKb3jkMshVDyO/mdho7nGunPl10aODdWZl43m+3Y6Kn+fZE/epAFT8RkpJ5DKROpPFSkg5+tkGuVOvuTs3EA3eBAiVpV3HDSrgBbgFZQZz/uwjWut5ZkDHL+WFZNUBbh5S9vFhNmVKyT78EVlpdgpxrgZaEa7IxfuWJHrWnJ7rJW6PI6vfEhWqf1ZTX1/79fa3FcU8RI9oUUPGmzip1IgVQkh5+jas2dNnJjii02bjICjkCyQN/rYgQN/ubAPK78yYY45DdA4yGZwFpKyMf23FjFC3bvYXIWsuVHamuGMpFH898JHzyULRNzrB3iC6Gy3e9uX6uDrOboZYFoMhNYLdPQit8oIPl43u3jqTM7OcZY2hhukX/1qxj4+dUncJcGFD9go5wE1Ybxu/RiLN2uAfm3jl/q9a5XKyZaQ+2Wat4aK00fagRovSgiiBUEv2juE1qOCr1veh3w34SYIJOaeZPBUA2UwAPsnyoWSLlzIZ7ZdP8DMZTcRcVujb5yt1DHZoIxeEM3WxPQW/BgbYzlmuEUF80sHwv/do87b6Ot759sy11b2vzBuyacFl83l5kWNsF37AOXu4hkWChLRgDG8s+kofck1T7xnLeNL2WTQqOvUjauicJz2DQoeJbMk2zzlirGJjCr1e6HPrkCt33aU5PASvdKsLrZFWaeXs+gOKTrh7HSY8VbQt2kiOragaGjzQkKHud7+tn6UGpo/nUJXH365VM8Fh4CpH33Elx7tSXESUfG08J7Z0W71VRrYlP0hWnJ9Ig+JyiqA8fFr0h7n6QxeKHpGuRjo8QNH6n9TAKNlQsigL6UIfY3gfE/ti6nzWmfnIhY0v+lxV1tqE55noEnKDWNY8pIiPzkM/17ZFwBNC4M+BpfEVwGr6ZJrXi5TtO2IjrgBAfXZ3gWj3WMMHvbWNXR+Q+wCZ6Otguok43g9XOxD1uZI+8Dl3bhEWXjtQTAf7m9VpTFvAOMmrfe7eKwpG32r021sjaUCRKMaMNKRZEEvSbWe9hJlfsAyAiNoM+tLEVScD6r0we1Z/tcfmkrnfUslRpTxQkybId+kJEIacpHg0+JqOKW9Z3/UwE8j8aDH0WeyAjSQSajUj1+4RHQ4GEzDwTl/zjAvQFBKU50zf7LccGvsURFjeNAUXywdLp/OWXMi5f6otFn+ZvmYAWhB0ACvlQ7TLEFeOH4FSQjySLZfefwui+Y6PyCxdhf5TBSx2x343/sxS/sT7QnGp+QVX55lpLB/j6AYyUeUNhd4NaVqE2NnGKVEoxsrywS2CjnxSs+J3YfdPla12rjN2isKF9ttLTEoUTlrdQYI1QyzLs23TA5n6MG/PcXmj2HIp8cJWRW2S5yuexEI4PBpSVRrjkub3zFFiq+fXCVQ8J262cc750s77XBe/zOTov7CzWzSu/zgeFvJaSTe5/bBJg/6tCrnHXy/LZlt+e2S8AiibUpSvKldEl5j1Q1y4oQNbaOKiLxY42gr7R5bVn6Jp/ANjWnF1XCVD0D/gkMvj9W4sevFlxXL0PylRXm29o5Ra3w956Ozv1VKHVs9L+GX5nztRb8Gpm3QJJWrLhaqqn0+VvllhNPByF+Nu+UxFON1HaTF5vuinkkyDtWB73zOK3K2Dqh8qduTIKqloec30bFfsZpzmOg4R6NmscTouz0BZprNb3/jB6BQUN20g4bkJ+urIGaQUxYbaJxAuyFKjFxLXXDhYcIzyIkn7zSPJ1184+Tp3hk91juV3PwbkUGlCIOXfw3x09V+qdmvdwSmS8ZTuebqE62CRJLMBf9V4uSfuXz/+ToxhbjTIu0uVyxCbzxgq1vg0CIGxfc4vPw3V9hmsBwKDLk8R6AAqOBAGBoH17hNBIhRfDkXGFxbw+aXsC5UNaYMhw0IRL3p7NxiuXp1ArMg1q6l4qu37pUnr6cNMyORLRPWNMk0uSzAFZoE2HMaQrVdiGniQiIZ8px15PSUDWFVeRhCp6+gsWwssN9S07M7Sik6mIzGXtW57dDjwhmXHxTAciLvGeyhhxSVsxVZ5Y+Y/s1fxW5kytsJ5fuZovlPQ4W7ihGZezHVPPkFsACJoVTAHpB355oINSXVaMAB1/GpPnc91I9R2OXajQpQWvtx25Uvk1NYzcUqGIWIEl7eAITMT/r2JIMqTQnTE+KVP///uoA+fEDkZwsMVFM/eUbYB8k/2h8UdzWElir/43baTfeUHEuXyH43xDhuUAXHJiZYMBGCc0mNqU1gV5lAJ9y3BTWdkEd7Xx9E+slTS1lMsGddKv6noo3iMrsWtyOysOzXRxcUoyK6j6sRlU5i14FuJxEvEVLEwxz8eu/M4rx1ePucAIEkVMyiUYAtyMxx+dI8IACJHB30sh4Kls3m6c980uBpmQX/NENr7ZvvAwsQmjmP7CekrLlaZAaNF+Puyj9qY//LdK3uomxYwrUwSqUBkQoGQSEd8dm0V/9mqFgtZK8WBtbjhGla7HeCUu82Zh6H4mGOg0M7XBUcU0ms2QNAvjr+7R69uRcXx2a29I+MVtiXGHfkiwlCopTqg+osNGEgDX5luJ37W9dHq5fpJiq2p7Upu1yXVXhsrjJX7t3XC+c3oaAVGvmtsM8JFbfZNFesriJX0Yue80f9r1NtXDuon/9czjVBMGKj2LdMmiu560UO6urU6+G9vrn//8HxOoYDX/Fk3gQD+vH9TTLoaqnWME9daaFf/l4UGGUvZXsaxCDCw0/Gyih4L8tqdmwGBSWxM7x448UuEgeuQx1M+tByOiNFK7n1oG3i4Q3W6FrN3yrzmbgOqS+1I6DjANbNn/cDjDo+eh7RJR9gt4dGitZoNQU/F9BaDhfI6kfLBvVFdQzAhKm5YZboLhTLqL6mIXzErBMDV/XENvZFpLzqMFe3WO1lFKybjCzEkwczdu326lI2wyq2kJcQpxwONv/////ufxbZfgsdErBDFVeS/ZGXfksxYtgfOsKDr9qCLQ8yGlGM4uqBdE2QeBua+XAvIvjEJDgCwP0zr0Z3jDYfzlZtM7R95ME1B57LIN6Xp5Mtc0kGjzeCj3biQjhFOD/6B216VsibPVUOnGhxkaYrYXMtqKRkXbvG1yFQLLjchxQfNYAPPA8xvU/ll6E/7ovn66n+UYPVI7CnzZY/vuIwiQKrqX5++iU2eFYxTHfcTs5/vz/sbOZF98ymK3k1WWx9+uyjNAlA2kewMMTGXa7qQF+EnDo8xNpWHtbDT85RSi57Euds8X81FZvsIpQ/ObT1TQErcepT3+H8Lptne/S9TcZO78Tmv55ORQvj2lTPKdBsExC/DDbuXCeogP3SuW8C2Gf0p4So5jaHFqrzJJ3//eHErZX3VqVT+CpXK8rT5LIo2Xoix0J8lUTWy6fwdh7wdLZCZqt6+2jxqRf5EyE2lejxnNPwTJWO4UCmIoX5TDzqGUCtdh54fkR6NP/m6gF7BmorvM5KjiDlyDefTO0q9L5iP4AkMQKSqSL61mOx1+Nmj69xfsWKinJK0eI2/FF2CbPtyAehFFGz0SBvnONWP0wRKPbrJPFaCCx7SGfGwZCZK8AZYJuWgD/EwkYsixqb60WyvvJCXd58/DqAoiN+Zrp3zN9CAwZdoUjNk9hb0gNRYdoF4pbVO4EDCDW0Z7s7Ck1g9aFgPuW+PqQN0rYSTBmgq3WeQObK558jIQTvP5XpaOIOQU3mjsDgPUDyu1948t2EVdXYp747S9RRCOZg69yRmXd+YSPm/0KdIhqDxDPuiKbAJ8k2bEzMiE6ZCav9t+eYIxvFAbgbJlrxlCxlQsAogZZKjFlzG6RuuT/YDd7lGJP1aZVppCqop1q2plNBrgxV5Q8krqwJtvTaFAzLfNan/JDneTdBmyjqleKZiHw1yktTrBYvjs548kaLLiLJbHpaqFcf7ya/qdhTDaoQqe1sAwj387Irbt0VYaD+MFDgw37yd2+QEVdsuaKI26DzktpUa0SFsZRPwKoiHIUoGZLpBjoLxp9okN/c7IvL7lDpD68rutS0NLY+RHGXrP/JS+E3Ih3+h2/YIeAocHA6z6vRlXUHZctu4L8lKY2Cg5Ox3I1gtAhwcYvJcTuV3t1su7ZW9E3QP70xnBBXPYb2uydJC/vA/6pXc5r9Bomu4FxvvZ8XrqLBRCZ9tawNCzdczTKxfbfSCCfVQI//08Z7wrmcezLkGL3sgZ5Tpws8xlJlg0zy2inm6aG16Yghw4SPOx9ykRoa4+hfSYIg/4rJXphlmx3ImVJykrvYFilR9CPWIN5hvie5chskz3k0z4011LbnXO76m3a90CIfOLh8ddQEeGqTxuMbTxkqoIKBmk+775Nj2FftdvdTINxliC5sHaBo9MfTvoO2AtMNh4IzUBCHR7CF4uj+7TbaJMVXz3iW5IYhLZvzWenZ8aDml9gNC//7P/SjSgYXmlY5bp5UPSlltaBzQg9Wq52bsNygsdB2lMJLI/sJzNUCeYf+zOWtpBj2PmOtFZLykU05/GtsYELfS1kBe0PGkyrlvW8uyGJ1F4kbmZxzOJ+XE+gH2V/MaPhfSjdixOGtdDfcXWDkshuxvprKDyPinDxlstXQHjG9SMO1Gmc9kVgUKTCv+bUmiBI3SmRgHVqwO2GvfvZPw/tNKnvJKPwIlFcKfN4eunEd+rDRM0h+++GOBIWE3gkbsqHFf0nDUGPRV3ojhsvRfsMPtsbMqVD+dEUtj0dta8ewPKltTdBy6VQjoSRylcuJYg+0XYfGDyDPEiZAEOM3U+7j1+jObf4UnfT55p1LxiRTwI7H7dsqDzslPbdjkHu41JrjWxyL2fHawv4lgAkxJWk9ESRlzEU6dqWukDolUkB0RpsYQ3YRUJIDbVFnqT7vViysjwNS2oqIrKzz1axucdbpkxFkF3a/RJO6PBET3vLujrvasNaeoNNT6KgaHRxri2Us9a8d4dj973klCqZStFVWtSA+0NknGi6VffjfIQQ6MRWH4HNgyMqkBKCkjMCefeIDakHnobCjxFsHec1WK8Yx7Cy0eGMTdCRLOAuhUZlGezPLk+v5YUPivql9yj+nt4UmQDEq4Gu77JusTgG5H+HR33onGDlmls9fPIdLwOP94tXfcvX4K/nB56lgeQoxLo8QIXLJCZ509gPgSrvodm1dgZtjZA2wSY41sbGM39qfyXzSzyq7DZinQ0cNJfs++Ng+W1RQha8lEMkZevyoMbhjvz6/mWGMiwPxIf+fp8PhhJSiyTp5CMKTZltdYsp1GtOVOGomL962Fz0PtrZ+p8uxvNT090qLpxAJQqSrkBHPofIFyBRxfJiMxDH/mOP0tJdK3m6P4pkjSp1RzR5EPVF///hUlWUtd2a3CZFioFDfSbxCrglcuNJl2XPPVDTv9X2awznma1gbYnVNpvuCl/mbJwsXElg0wFmF/GRudA9e3MvkJ7twVLS/w6QeHBhWT6rQcWKLNQwJnS2CMta273IE7+WoCAoUFm9YB3vG3JA8nN/eRtpn8sQNPJRCpJyyOARDiJcbFKdWWF/P5pPJY4MAVWYgjdiN2l2UlLsTqVdilmIsVOjduV3sn81topQBKX4Hdm5gYhXCeu3AlXzhc0SZdtCpkAhdiv4qyo1j1ZnCd68e/XefPzWfpSFL61yQU7OVjCzteDLH69y2a69JDPb9t0bTqAxquuxzbSMB3WEtX8JPCf//p3f84TEDlkldHXTHyjxkBUSAgoha1FDd3dl8phEt3kdEeMeA+pFviLrXnCsqKsvgMVV4RxiSqsnbrG/vUyxc1lVWTrNP+MWV/jNWBFpEjAKhscWktkHvmDMELzxlUySe8IAB/OUyVZkeIKWcQFWngOz/tDwB4E6tcotzDmbFOUh7531WjwP4SAfzESbB1RYPRtKdBQaNhtKXDHFZriVKKc5nlowdBE4RxoYJJVe121JA90M++7MBOue1MQRYwIopAwOVXMEJWIqeOlrfqYZdr5D/LZ4SyDuUa7+pRqYb1vIaUzgskWeHiIrfbXseQNvRv1XZ3nUsOgT/PeXh70+TaISFIMNArkDdyzP+/CU7QQxOcdMcNUmqCy5AXaV5TyCwyOTlf08FrSFakzmv2fa9nHrcJSGGy11dh1n5IQjHNr7HyiFmV1A4tLu4uagIj1uxoXgWVHf0pr6woTNNnZA+l9ozckHk5OGKvW7dfO4fqG35S5TSBwUeKGm4E7qZmpuZU7zeb56MsGAeII9CNktRfJBolY3Ln4yfF8RZbVR2KGv/9EizszzFT9BipuzNFnPBttYUJ7INt8TOc/zGMDHLeSz7GrPtUA9MT5568cyW+dFZzpVHwX8EleOrgNnHkFIacldqa+s4cyuy8+HFGc7p2cCfP3LpCa8joEpk1KLW////Tcac3oHK+N3oKLtgLS0BwPRBoK4BXuEtya8AdTVmkEa/yWBYH49q74WqJSleGIgSxDEyW19ocKulhJG2XTv+zWgM2SgWojbrS/DsMC7FuIcEEy+2xgMt7u7gkssaigYD7KBh5S1YLeYBy7oZpH6/gOAVhLo3dJjgjykpRD4dLDns2ZYHb+Xj5ce58A7hyQTCyvVO8OYGLrNTuMGW99kMDZq0LSU/DQbnKy1Ah9MbHZPvL773XaWVECs2K6mkGLohWAF9ZV8fqjR5cCHguSrWfDbcz6m7EkTlbXG3wv+XM11ssliU9kRdxftcoy4meyPEQR+ISx9/IRZYP5Lu1wBFLGWkrRd5c3gjgRlbtw7sLSJASikRRZcgXYKjuiyeluy3qChZnwHAEeSmr6O9zfktTH/T03O6LQ3HN2ADrDzUAOgnZIbdWa/rffqDGnlRa3in+LDkNK9l3iqWM9Gjrq0bsf2HrzBF9UUC3+cIggCk4gDFMhGHpowqWvQYSa4Na/kzuDXi6pNt0sdsEz7VFx1sUPiMJFlf2fZToTJLcXuIt6C1NWRnjN4uDKPNcP+HxkxL9UVb9GPFzK0Fc0mv+ip7fVw5z016khaPsfm/pBw3P2RD9W+f7WZZubLP7Rd/8zmyWfORVpwdVSTn6A+oCqILn3K2BvqatRasXL0FMbYN6BdOnE8diz0bs230TJgydX74KzOewD0TwW9qZZrT9WxK0L1aY9GuhgSi4xYaVucS4hc7AxnJt2/aszJKP6iwQ0pM+ZA67ALI+rHgxPfI0knKiprLRQddpVqaLp7fb9bDT3WpuHGmMIEQ/IILZMctJULGuMcTkb7fqfh+L0Fpd/DX7xwKZ4aIcWhXwvs4zHgqKywyiYM0SisXbkbGYxsa50R12BtFWiJrGc6d1VRb0cI6UfkIxhaX95QPz+8JA7CX08W9MfNzs+thrNy7uCvYPV2me3DxveHom/llFQ2j25nSQHpVJZw+TZbBD/4tfgw9hRhQc3mAyIbX3X+6L+UDbskhol4AHJ44kghsFG9hz/pkbTMBPqWeuODufVLy4Me+w6b+fIznqlp8znI1EJ/tAAntxjr6fV1nMdWh9RtEdi01aJa5+8S8n3CYeVnpqq3XADCc/XQTPECYq4EcwDTubgJ7zPNx02qG3/XjYSYl3w7ddWJgNtrCHLZcW5j1LjRBc6KQK+tTKxEJ0TmhXnm7nG5iwTZeGxyKi76BUiY3Fpd91Ti6YlP+HmXVv/zu/PBkFEjgiwld6H61igC2ONJsu4O84Rhak7PCfBE++6/1Sxyx7hKbPN18HjVeeYOvWHuJ3RtSsZyWIZOB4ddSJJVTT+9XEWZh4AH5d1c4diadH10JK1Ux4uQvsrW9TSHSpFzFW5qo1PXESGIr6fhwp2jx+VhbhuKb/FWUF0EumDUuoho+Ke9xHrbmYDo6TfwKdhVEbwlQ23mx3juldIMMBUlakYY2fU1kECsmob+hNDbgopQlSHN/m0H3LlbU4K+s/0S7W26469sax1xNfySqIb1NWRaXEExTNhbef/w9Zd6fazJDQiNnvz+J1JMJSdwuhmqToT/+Lra3I2obJD/tnwfSCqfCjQxEyGaTBBAZ2ISD1ur7ryWlOiPkcjMracS30rCjK6FODE421iXhJdlHua36S3X/CPYJV839UF5lMuQV0kQKGrH6bXZpNZUlk0pa3IzaphKnSU63t3XOThp8PO3uO4lslHcdiUmEYNbZupAMSRFIbN2duyVbWsCg1xg6I31xT+rp6rOXHxNo8+flAwuqiXAgph3qkI58jsvrrSAxU3+QnfYjudVtwgZLx6e2mvWprtExCGO5IZcwqM7tLnaUfQD+yLc/xmGGtGsEsbKBNi8yu16rUp2Jf6BvHZtyD87xb7VZywuI38R5W2RfT8c1Zwi+4deJLFAy2A3Zb4N/ZESfqHWR381HZ1glQ0xB+L3YJj7VmOE0uTu54mOd7W9QH0VBjdBW4FJAYWd8ROtEZgGeHjrM/E0jJQsPC+KJisiUKuGsTR63uOB2GxkGA0/6cIzzGavHk0iG5ZNrsglDhGSf+Vo6lEPhk/BCEMfM2hROwzs2sQbZrbz5ju+W8GW3l7OmbmFTMuj/8a+swEnLKxWGJCPjQvzEl85U/qPx8xsCVYfxLcCgEWZElQ50W9KKEwOTwHR202ZVYWqYKMPDqLO6ChKU4wD+AjVg/KQAXflWw0N6wDqcqxuFOWiVJnBrlfrBF0bPviVcBLOjpmYKHEOLA+3d9eKZGxgFszvTAfrrRzqc0jYHZE41T2E8CnmznBXM66WSIJGJ0/rlmSKeWOxtcsAokUBreXS0txUoBbAMflpOQs1377T/Bn95Y3tw3qaJQ0J/z4EOD3tIkXXe9casAgUOt8lpu1ITP1an40BvL4e/tMotT3CjPAEQPaQqNoCO+iIqhGN6jJpfJ27M80XGbve3BhRHOtX4WtR//BE0c0EpvOV3ev5jPtuxgVxZPlngdfr/74qPkgWADDcSIi2yNlIlhweBEcD2pAHa2TpV5fC1J4Z1amzWZspaJhYhh2RvAaL3ZcKg2UJ6NsPhD7qzM9flgoek8be3ecUE5/bCf9v3g3C+S/jUDULd80nxXJfl3leV9PKfCz/9NynltEOCIl9348pu1O70Cin4h7AaDF0sNNkszTdtIzVOWQrY/b+PN8xp2V7naL/Q5bpmlKo12yFln8+Wd6t3/oJmTj0LxG8vvvYtPRev+Bk0NR40KM831bC5p6MgXgTbggYBC2X/nYpZvhquBQoPafMeGi2VGHUgbKJKNxm2Dk9UCtoUb3cMLLtU5Kp1m8PwAjxDgVSHKN69X93JpQWKtwQmqbQv+Z9lIo2wNRTmI+8cnF9oZuUfqs1lD8u790HHoW7YOo9ST8repskgYPi3LiYBHtZEN7O1ssB/j/ZSAezZ3trD0KmBpLyo9jnLg4zpNGx8iEYYrriLABR2ibhG4QDmTG7MAcih21BqVwbagjvfEWMUBSPrfRf/D5QRAz2xJqmN0BoSJVgIWIL0EACREBIYQYvvB7fID3ywy+uPckw8Dgo1bGfWcC5XwzFFG/pdAgt2w7LKi/8z9KDto/RAcSw2q7GJRymkEpq2sT9Wmi7eBwakuiOO55zfvv8nilbxjzFVwGi6yh+JoQcXflNCiEFk51dFzR6HLjysiH+b3mliLg3ESkYKVu3V3gbWW8IRhcRxmb5CjYJra3LNO+Rm1LXElFjImn0tOnWoVGUUwB7YE9XXGz50AG+RhikGd6qiAJzxt36kA0INVF84sbXCMo+7wQdMSx7/uX2dw+ZbZsh0V8A7XSazr0cVf36dqvsyjlRhAnmrhff6/R6P1DyO6iEsY3AtOLS9IQdWf3vcqR7v2D5qUIueZT1McsyzlOLL1k13BRS5cJpLXdolfAeb7er7ZlQqxWz5YUlUPtk45+f1uRUtnDenyAob47eM8sVoLlnIWXCRyEQUkfICDamDrf78WnTESlvlhhNA+h8bjlXhTMN2mBq3/0I3sIRRxsdp1nEpWTGCy1XS/zQdm9Fo77ElGaRlM/uy4RiDqknvjjfVKu+ILEJAEpSXwo6bumnLY+lEHyDVyKFEthawnpndGalKgOLVPA9UbsuImfKbOJV8d4xqAk10VPBT8cNvF4f8hxd1mSZcyZhSrfWSqIPL/ogcTktmJlIe5CFE2K/AZ+25C3y24ag6VpHB16dBqCcQNrhA1FP8DYlyl2qJyBEzQ1z4PpvmIXQH9WBmG6RbLCO6Msz28U4emGdcrg0DCprPg0o4kcgHxQRpJPKvoqyv4sFg7ADjssrDq5ErKdX2qmp0/5iFZ354x4pXRA4IV52buYMQ/27pQFLnLFP0DYpwLKclNQVBa66O1lvUEdY/tEqe3rHg7FBEt288njB54c8p/Ndndpu2iZbI4qQltjUvhL8mEsQ90YmEyKOLodu4GhUhnrjf3dGwpb+k9OG2rOhsAph2BMopBWciN1G5tKHuZBYoE1JU8W/0uI8zvwQAKBLslsa4TM5EmPUM56xR0soaNI+DfHB3GL6UftvRt3+pOpCfcSOyzVQFMrBKbBQB2t/hxYZ2BiZV6J11/vRBoxsvKAtHUPMCgQDZrhlA3T+eNChHZR+VegFP9xnS2wGS6qFE08LY+cyLniHQyR7AiJFYRS+Kz0m3WLrUzZby1gK8afxclxZ82jlgtxFZzyO6Ig+rJS9e+yHhMX92f8uZbVqPa3Nw4dao7iaKyZrZsO9C8T0nbP0hs6e8mtyOYyzKq4xO6SNpDk4ZyaeIJRfHIXw0+BNuIN7WqGDbF+mr6ddsb8p+8f/jv6H7rSG5TlMulNqKVGAxqTlW8k5llbzH04yrHVA2xK5RpOFZJnJxQg6nZsOZokGsGOeWKWDNyEtMPOx4PFjHizB7E57lTJedDdqjPNCqu0JSlqRe+gOItO7VqoRxajcpvAtbgPwFd9hBLmWHDqcibhrId4t9ZIsHPXs9MG6UvB6dITcDnjxnN5bM5RYNrIx2Ec/Xc5Pemb5XeIICZGSBXlO2mRC4f/y7up4eNPLhJh3l57/o7TvOoCvuikHOSivA9gs9dg+UShbGbxMr7h5wvGZTmMWhl64/IVXEMlzmIqK1swv4MwMR+sUeEMZWu7RHGro4/px+q8B3g0nHevX15SAMI2rFXRNec0552ash9PGDKJGKoBBxQQqRPNfMlVXm6oI+0/l4W/nR0j5gxiAieIhSPl7EQgl2//xZzHDqjBYlTCuSM8NcQcaBl9HzYPk2yRiLeIe0zKZc8+Nco6Jv/dwS/FiZlIGPyG+mHz1dsCEkeu+nzEyHnejqsxJEPxOdlQkpAMyVqg9VTBnwMw3yrZsNv7HA2BNsh4IUwdrc4ExE6imZW7QI8PDIeSvANIahmJWJc66fISO4YOHmDWSZukHfvmQy73kzlMubNeosTBf6yTNY/L0qNED9hP70ZJlR+jI5Ns+n4aRTariYa8XAc4hp2wpcsvUXjMV4duY4bqTt0cN/VB7JL6qI/DpNKzmBseA2guZRXafq5hfBOFY0ahWi0rWXGfeF1KdEzPvQaIlWMBYN20rSaWBXMIb4ETyaSdiNijTdjbJO9AKXug5snVEqczPxokAAUtCbz2QuJab6y5nRDsQjhHuGxrIP8H5UC6moq7hG/vndIE+XH5teHnjcP74JFIivV/+4//EdOxcf03CLPvMXUTzEHWObftZ0pET37vzFJ8qqwtiuMeZW+WltweTvFQ9fOyKg844RM6RxK+eARKKixmnYSVrpkCcTsHe46j3cF3+8VIVfywZ/d2Z1zlLeIikKTpZPRNJlcaQ7JS8s5nNPkKdvmjo43OKFXcyUEGQ6J5IfHkWrZkivoJAHGctXyzoGc3qSX5k1ZIlafhFIQ69a8x8X0kYQHVPY1pPbJH7Zh3gqi73t5DQWkhslMfExSlQB7ru1ZTQ5DOdgXlZiEdINyY1LebbFUJfA1taANY5+vPjKUniNq54++67xXtFhjqpO+EYDi+sSwXCxU5VcnNbor9PLNgYKnhjDqsIkkYpC9+0VepamcWIQDFXgc2wI88lVhMyEl4taEm6m38QMCJObOgJqjooD3O1s4QyEehImG+xzN2UjtatSwqtXVPKA3dE7l0M8GTtJ85JLnqvaPHO3P69v/PKr7WQkQXsd8q5fOF94z5X53twY9IaVps0+cWSmBcQpnbUDu1eYPXKwQgyNeER5NPW4rT4k7hF/RLj74b90d/mNqZv8L+vN+g7NBguokcCqvgz3ZwDuXWTzszD/CniBuDxexjIUMy7r5xGqzK6XhugIRrVfKt1yZgODjgK3heWMDCMuqgUSuj+MGtCRMAomSelxGhwZYiEAc9oiHGBee69ylinqY1iOwJSZJ4WiUtlTnNIqczzk3cVymEYkQbYMqARG63uQvQzdJkl2zf8gsOxfALwfxy72QOh56loZ5oNrTL2TeMrKf4e/9SpAOgO9CbcmoQA61oF5JPtSqHjrzyJK2TZ6PCNMvqoRls6+EsuTJ+fCjzKDJJfvXlVM8wb3nobirN0vxgI+qTVzax8TXUSIwTr7cE6kKWH4Kc2unIaXuE4FVYmsm0vd5yzDsPQkzN30XHU5si/LFHxTcAqJX1gIBQMzUampVzEi1FqXRNiUcCponpQxMI/8laBulmg4BdJoFDtrn9ELOwWceRRlGxYK7hsDB+XVoUg8NoHF9s9/B4ly48OzEbNFQcXARmz7gyN4k09CG9DJhrkHeN9azWDMuzFStogVvTYEyXkrazAtG+2oNo4g4v7AvFhZWJq6UJ14gL+q0uDeWQTkC+7WT/oI6N8SoX6GMvON03DGK29U4BsfPxvgxiIgjKzYboQ8GZH/+6eL8DP+UFczwn9umUWX4tlO6F9mhQs0/+uhRkA3PbRmf/IC0CkdOqqHbPfe7mm8AuymeETGRlOnAeruClQv5dq8E2RuYUcn8qeoKQWqI4aX5/1aJqlDBKNuXV32IgQcsZfoBZbkvgjvnv3b/C0DE1xtbSw8Wkl6iO7h/lbIIgrvL5mebSAgVYJ8JTL6zS0zzYh/YCdjDErsO2U7xnwRmk5HNnUkaVIV/F8pZQUuG77OA/1zvoxolCV4PgeoDb1Pa8HFD01QdMz6qVZJ7F5ylza0nz2s8qCeSMPYD2FgHdXbQ8/5NSCTPIwLg2/SFMhbYLIr+ZSckmdOwEqBbnWzOShe6Ed5Iy4gXnxlSciP4dlrDX+NCMYAcVWxqD3Tb/AOxBaZUXA97xo9wjcN2M9pnZRk6Xru0xUZgdhq4fT0W6B7+ol4W6CHcq3VLaZ67nTDVdAVA7yvMsgB7F1L4e0tEw+xR74HxQDl/JDOsU547zuPmSSOVM5Cr9uaZnrAp7e++8QjwH1uFhxQwBBJZMd3b1X72a0bVBpgFz2+Wz4MCLscoI4Nul6r+oBkCjc4ruId0J4GhDbp+UmCKmsxmPAmuw/LZ5M1XeYHTvkP2JUeoIvWMRqyAWkxGtLY1SrQOYUPwJrsPy2eTIRWDA7h9FRBRrnH94rUBkhGafI33NzNDKSXxOomvfo10HMxmgHMxtfoC9zAmwai6PAmucZMxMSz3L9nKFtzrNdh+TzNKtwcvD9LG5hI8Aq7+rZ37zWYgY0dJ+BGPs2eTI+9lwJucPswPQ9Tx/5M2L2RqrcapTu0P2HEYuZnkQLipv/arpIS7NantT2xQraiKq9ulZ2cgBKAYAv/PvdWNiwJmQAcBdOOhAnjVgXlJMBRez314Qs5pJPKW0BQ5iHCaz9N/lr5/4mpGvGmbx9RmXJMnXcSPiS9NdWAmvwUSzAiW5Hp2QaRx72j/SLgbnSis2I8T/l8t0AJf7eH+ob0/iwpvCxGnKSVtrLqRLD4g94hRNB2FDF6cLmWaQYh1dA2XEP0ALmOe9jV1houHhyST+rZVnI4UBQ8Kzxuo9kIKgQON/69aefpK2Wj+AH/yjj3uh6ZT1wMpBIIcUV5xWEr5/S1YCGeVSpK8RsqzXszZymzHjMOW740Kl3w7LKi2ORUWxyKi2ORUWxyKi2FHYCPaNQVtNEJ4DwSKMH+JbgPjnp3gg7ATE9MgJYeNfrq4mOaKLLPv/XoG/UwMiSurSC6z4AZeI2R0HCYjxlkWCMZLTp5ABKBmeCc7Hf3s7uWE2dEXZagcZMSw3GgChqmJQ+kJut89LW8hp0v7eHlm1qrSCkp6bnnUCXoLKfEawrPI0uwoCt2rU+1XDJ7DZrbOSQbXfJW3GFtSiKUHNh5+QTiajqS5ytbnluD8PxlHJwbuJocCDgT5WjUgxvhOsXbDkEUNAeoenqexBSGvdshEIfyBhcyo5wxuWOeVTmjC4Ejc5a/+MBZgdB/5hhqchKIZyE7xzFl7jLYgfLimKdqeTcqy5cOZ5AGbhRlcA09YFq81CeTjHgEwsFCrxY/KYYYMha/orPsUBH747dP66EQA2BKpfaZ3qsB+kK3xhhTdWc+rhRlnaMxc+FiRiPfR0gokkCvFFwin9Qm102t8ZDehQEyOocwsoysCjyHOthHfXpGgiQ5VvPJhKDuynKQV8AZwqevUiS9KSnpuedQJegsp8OkwzZ5NQ5M/eXLC+NCpd8OyyotjkVFsciotjkVFsciotjjooT2C+QG3slSYxUuAQdwsvC1mJXYAY/nSq8W9qfyr3YDfU0A6ISVj80NMaS/ei+0lCluaycCGSG5Am3hVBJAXXMGEAqjiiQSwFSKQqED+QJWurWDEKngDbcyvJ2Yw6szkUwRUKI/KQh8clmTqRAjsnqI1cd0zKILrsGYYGU0kbhwJaxI758CiH+bTAfaPC9jgfSP5xrmOycfJVIoartxWY+MgfcoseIWFGHQ5tDg+OBgiTgBWQJhJ8jO6Ryoc0JPRUzfkT/h7R4o9ZWkLxj3zRYVVYMvD+IgkVpDHn5Syqxd2xBlakXsBJDsFN4b4u2J4SlUatZjwGjYXKACTiZUjJXd+jcU2EV8+36uncKbRsDu0ohkhsJCsQCtDIteCOBdfO/TuTcEbd/gCPPvUemaYUPnY4QTRDGcBFfiVeBThVQAb3JO9jaMCjQ0FFUh9uHcYtlioZYPB1KfuViWbtwUwZkdv7U9DokDv4hGGy6coWuRzpZDbQpC2KEbQJRF71AOyeRZucd0zKILqac3uPew8QYvKsUb5BCK+SUKl3w7LKi2ORUWxyKi2ORUWxyKi2OO1t11w7oEdd+lqaRg7cnf4aaWqK/CUKl3xAlrgspLgbeaQK5zx9PFunb87LKi2GnYcALe8EVtbRUXqmTv9VqXrB2VoAAP7lGvBuU38d/IPyDdD+eu1vZNRHN682jAj95IQ9SCWDnr0nmMqyxUCFi1YLRnidZwcRu8j54lCsn1KBEGNxsE/twTOc3srwLK2LOkP8gSzLhPlxB4iMYfNUFZ6zSeKMQAbsiuT9/M1JkustXrXQ6fieSD4TOhDLKwmOW4+NrKTAFxs8WoX7SRqoja/RLiK06Y7wttPbGCiM9PpyS8vZU1wjL+6C8cJJjCbk92PqRRJ4AuE91XPbj3c+FqfeBoVPWXQTfg3iEUlL2g9NUr3A1kMi1ZUXTq9Ch4S17pDP9pFalM5NLlclSJiHkU7BElxZRY5m3DlTn4M/MkhT2kzzPMZDjnhIlcfBNf26FZKaTSS0Ba96EZFwZAamuj9Lj5NvidCO6OjqTpKLlh+1voLolCUK5KR/dEQyr2fcYkwI4P4DNHEG+ijREk7TZqFCk6t9t/pNeS3kqaTrzl6+cyP9B3K2QJuUquhyoftKzB6LzIXKwtuPWoP6yp/Pajf4yjkApGtzPIARWanBsFS0aYmSQmoF/UDcgeNHzk8hyNFVaU4rWzEjqEHXhqzrbFnUc+9Mlt28oSYozjKQ4r49KPMtJLVvFfufj+ZPpXtxCSsf15dqTOqCYV8ZFH9+vBQ98G3MJnSRzxfMdt1aes6xiMkWazKUro3uqdi7nPubWDckLQWErJLXSShzHfw+rxb9tLEaAAKWiVA87NrM+NZz0au0HOXKsTx7H7V870BaKtcQiZJQNNPB6w+rdLE3kMVar+93kiOm5jMtIIAZ2yIlqty8JM/3HksxUQbbvLwcSoeF+/U1IFNfpmV2zk+1dTo5yO1Uw8+/Qb41CGuW6RTgjFrgAdEFCPiCYe8rKeX0wjKuOR4IWfHxQOe7xVakAdl04txl0HUJ5X6HkdCNEsbInAAuaB50h4E5a+TpcVuKUBDk1y6X7RUyi3dwyco2JSrvQcEqOj/US9a9zVON+Yv4IhtvUphoh/LUUjAGXjACu0q4l3n04hnCq2QlfdmvZhh3yiX06bu7ohjyTCoIn+cv1TQ3vtUF7GC01TC1p9taBCID99aILAdu4gYq+CGoHULRwtrjVeEPD+9Z8zEI2n3QG8aC6KnBBJTO0F1RL6+q97gATMa2DeOPUh19w8OUeQhBszN8SaWZcPZ31uD3IUzPQmbSOHiMwqW74hYd4glSmmFb8OJh3rk+9Viz3vUcpiGCzzwAxTPB6hPWXN1BQk5HVv7ShQVKt+t3dFg50PoDbqCSqIUD/3JgVNFBsG1ed48yF+DtiTgAIRDfH0oNxOD57HJuDwgHEAAJOSoUPyeieSQ6Dml8v3gaItGpGkVBXjeIFaEuBFa1C27VzgEOTHTBKyxI+cbdcAaDxb7YN3n8oLLZweCGiurgN8p9gR7XdeGFiSKANSgAgHrLZufNaHkYR4xKhfmEBx1ESQl+S+HxdRYLFGtJ1BdybjrMyep4U0ia9NpyButPhuEbMgPY89dD1xoxIOetSiYDHJ+jXe+CXXtfB3l3nNZroWYxnubDEAbtFIPvoVIUirrTkk5q+cQULIPEApuqkoByNo+Jej+ZtUF8C8ybQXAABA1lKdFvQunqKABvhBcXGOoe1wOZqe73PVXx6n/oXL4P1McTSa635agFvdpgQ1IfM0uFLpb4QfoJiEvmzO14dbQp3+e1tdyitTwuLEcS4ViQ+eVzF7LiNdAho+OFNnFtDRpX8Qgw6JX7r5g1GF9RVMN1VsVYVAeaKfzi4H2bGiZ3K3hgPA+QlGP04HmjcsRsQ+VYWYNXe1qXtCUsry/V0Dq4AERHp8ZYW8LgaUltW5eUz4BqiAmbo+P92h4NuvXIRocXLAOEQW0dggt4AS5NHBQPmyFAv8oiAIAbVTzOYBx4BNYIYLZyVPlPGKN7+LOAACn+MPxkreHK+GlDTMXI+WwdfvmSx+dUBZKrtYgV9HPkvE3oYzgU4YZC0qqjvZoy9I7VYy0ftsz3v9U9pnLxtFlga1JC3JRFe+sL1FWVYs5HaUfekQ3RDsgb0nCtYBwriQ74J4YnlO6ZpemN+BTZDv19jvPhPQ/+Ehb9Cjk1onEvdULzp/60oGaNMJJawJ2iIj4AQRI+QSPAdkSInsgAqRHjesN8xyd75kYb/ABtR+2TUll+RZi3FgNpLyU0+WzXirmcBSeLOIAEDwcf9y+sT+t+PJxd0CCS0OsAAAH1TOOwPUysVYoA7AMaWfQXv+9hd6FqJxxpufLPnBYyDb+IgnvwtDAY+vQQIUe1ZNzQ2i5Cuo2ACYCLMJ8QEtmXRsFMAAEkq3fsufrqSkrSzAsggrqPoDqlLTvMU9KpVlYoJoMg1UFezldT2QEiJhshvHJV3k9ZSvesczB5FErdW0wwwM/Sm0wiNhr7r4k11JqHcmPm5139TqQVQ9R9y+6+jnehLr9h2mFcKpHJgXbe6ic0UhQMN3qA6PD38Mh3YlPVIcb2YfRWtDfNiWMqLxwWj5P+jmsC48AAAABIZ34CJVMAAAe1cR50lAAG58AoLM9xfgJR316jpuxr9/DrlkiJlLm4W4T7h7K388MSQuiD5fMq2v+onF0O0bejch+xCUuU/e8+BJFQ7KRDmk5KQsqPQk7ube1oAACRYn9eRTWJ9g9ZpE5c/DGQBzAHzIBTbV4aA+XfZiiR33Qja4Y87aY19ILs6LKE53n2Xmj9+Gl0EgYqJL+3nBcCpGy/tr2xl3osgMLYE5ic735JUb2LgWNQd1cRX5XK6y/lVq4hulV0cm01Z+PmZqSAOwFWlL85Nf0DhSVuWA1ZvyVGSJAXxF0vqMu1Pv7J/XkvswUxOYTaD1KvxGf4wY1r1usdUr78EyODZ5PJ1C0klB0pjL5isj2RVhTKI8t7z8S0W0URvz9iGjxf98mTTkdCU/rjXFaBA2MQQABmrKBOZdpe6qojiuwUMWFkoeQdUV89NoDf/gwOBDc/wSzPCb1sgSDdng6odakoTEw3LYvvqltYwQXnQTEMkOde/8zmD8de/Eqs/a3lsJrUiQz1v2xM6TiiWcUQTGGSuh8WSQwq92JbbsunVJqr8Z6QTG75PDq8sb4qi5PsmZ9xe77alJO9NpXtxruqoTw39sVVwQ5Noy375DYxXFPH6pbtCMeskHC81Ti+/CBLJOzoIPjaPP+pJbjzaeK7GQrtG3sT8S28PfiqpYN9zjBHunj9K94XtlRj91eTmK/ZBZ2HMNa2W1SIFj5d36Nf+rpwOD3UA0tfF7a1oMcYlSTL0QTKA2q3YW9iwOy8PzVT4F0juuwBRa6ixap1eCf2b3wyykMb3k5zogUFaLRsUJ9MqaBi8UJOFEgvCHXd2mygvWbepqEaifQLJ1IXIkF4AwVqAAkdhEnVEw3dZoq1Ru/f71HQ+npSylR8V03Vnxcyvi/ivSCbACo+cSh9A3E4bPEZ7VkWxFjd3KX6lLJ0IGWnmK5+rj2v15WXwoiFL6pHHugabMEhEaJ5sF6BgDBXmJKFL19OyVvwbY3SXQc8J2z0LiyADErbwCkaI4EeszIKVI/IVGilCTBxeE8AaHpFqGPo6V3+Ev31xWi+B4hzy7KQQYC/+Pp6rE29uXlbCc6z9FYeOxjZlNZBbwXIos8ivVwQoeEF8VVQcZXsoBRm4hOxG3knhUeehCAIZ8aTPJv/+X71vraoruRlbXMMKxGxM6ce4RAKujXUzkj+YpdFI0v2Wwb1oRoY1jqzJ17b7a/xxXVJHNEgzYRr40hULkz4Vx1u56RjWUPxIVZeB0O2D1LZlPs0akpHavqeGeSFVqTtPqBMeS2kHXNa9utf4Sg6xA58D77p7LhuP1IcmEpMsh3QVCAA0CrXY5PWx7DF9sXUIS7G5wXubEBXAXXdB1xuLXTWyT478OHLLlryuabjnkd+Z7ABSMGviZTuRp/jIf70Q7XlLRcOnRo1JpCUDtTOBDUlOUqCtmE1khqTxzCF0zP3dWGDqiE8Vc4td88+kcDm5LdF2Ge4ykcIeVavnYDkTazrsJgZB7fJRTqCkHgUGuDoJb7N84/k6PgTLp/AJn7l6mWIDLliANwX2D+EJj6+JQVCL+efdg1Nr0PEO+tOS32LrOonE28jjJXOY16huLbwY0y+YSKynZTEuL2vAABcmrDYe/Sk+lek48pwhWNfiM0qQMnwSW3HYwkcmJ+bW769dTwho43WPiuGVYG6cAFcBBZDseT2QpyQ7M9j64idOrhHI8ZdhoFnGQFj2Gzsv1R1nkQaRD+VXx5G7t+JjZvNLKCQ3fwZlyEn2UgQwsizo9UidQR9MPhAAkYZmOg7l+Vy6okB4zLLYq1gVRC09ueUV1PrX2e/ikwqngY7a+dX+5+h5P+fVFGBClfpnUJ97JxlnT4QAWqT54yrZ2LbGgXYSbScs4hDHNa6RmY4aGfheKX2MDe+eJhOGpHWRnXUawlyT1ZKpyHkiOu5PEveLZqKGI8AOK8xHitfLD2zR8wKqSPci9y+v+Yf+IKZxpOgjlV3B5s1IRiDnV0BuT/s/O4rHjKElbEiq3krWfp8c0kQ/H4EsU1CsboPK1v4y3KyLecvKkqVrMySyCLsYJ1YE5qNMsT+M2uW3toO0nN4w+I6WPrYqeS6x182tvSC3k6IIE1DdRXkKHvEmlV3+l+VeYx9yQS9Gbk3iQEBmss3tH21qtY2dO94AOXQ1kQ1odQrqCXDysmsXzUb74WImatVSyXNdYWr+S+iCIftveWBfUfEex6Bq9gDpBUX5gk7RBBCnQvsbVHfIFuF1zYXkbZFlFnFC9XiZhMpdy3a2WnK10AZ7i7hoTu5XckisQQ98BjrQfI6cDy/QdwC/dSfLN5TaDjFUmes/qXASsEaDC2BjkYi+9oAzUn2iwImC3eQ23q/MlZE9bnMUiEqEqfwAMFYXoYxFZSVoG+pzM5xCPkrOjgB/rs5jDFaUEtJEKYW3oNM1MkQKFcvQwQazbo2Sy3caiz02zbp9IkocsODaw/jnsnfsO500zCcE8i+qLy9vflPT10Nl5gKyZpPC3Qom7fzkIfAlDMl0iiaBLAtysG+DHaQ1wfJPcHoYonCfL8K+3iCXFqh8otf0PNz3iLFeZLFisrVhEluKHJKL2sEG01/l3cqwh/1MhvcelWM2c8MO0WiTkge86EmcAwLmviLL8EF1H0HpMeOCBk+/djud7YMpQyIVYv1/NB2MtpTvo2xc0NLKFdbiVzBE00TlgAPOFQFBsIALZITtKA1+TkW7mfPYjQ9FOY14rmCk6s0eTHTmABeerJb/rvsSicbzTKowdxAUS7dQoixdhIF/NH+zk1JR0Z1I4ddfirvAAARNEwT6izrtOmYiojC08mPg//IGvgU98+CbViK4TN3jMAGAE4kEhEseeX4GTzY+iNWISrwDLNBWCHcP5aBVlYIRohx7BURz1Gbv/09KVDrlTMJD7jMsbBf/5y8EmXPDS0b3iUieYtzlooh+B3DCjy8hITpdKzl6SkhI0UqsndypqSXikmJiHEi+EX2OVbU7anNmnEBQDWVCeGglrFulbGSlJoBFKaVpsg7JwW0i/SBQR6GkEvPbWEAX0feyUm0nh+1+6mUhwLwBnz8Avu6JQPojdzP0KfLP6kTBkz1LeIQkyldMBDVvYBBFwAAAoLRj6HDq/Hb5fnagKSYx4UIoLalS7dbvgcofX0ieCMjbmkYDQj3QvZEP3S8FQM/C6Ybe6IR5QkuuncRiPp8NHCst9YlY3QgHpy1wm4okFatadnsgRuYexfYVMy0QbcfarCQGreGoRgT1WVscboZCfc9kn4tpv9C3RPl167+EkdHJx3IVfuRcn/wnFpAOK3/XWBM97O10aDMX9UsPoPEurFpUMytfV+Z3Gllk8zOkGeUtmimi1wDKHh17Qu7x44BhWqs7/jAVYn/KKdz2tWLSd319jmwkEUUFyOr6I/AGlLDZ7HPfGsRHJnZI7G0XZpaoJ9azMiQg0Ul7nWxMPiFgdIDpXnhWNd5y2Ez3xTgP+qKsZDZQ42SSR/BK1GR33KSGq1OTYiXwFmxrpH7IcNA+N2LAw9oDkO/3NU8t8Df38S+bzIGRFRw11+kK5UE4ywt/1anZvvVT6fVpg3ynbWPC+L0BQ6KRQg0ZZ9ZnPBWA5xLoY5wP4aHBcAQT1m2zQAscYkpuCUFXLTqf2OpMj+0q0e4Jc/y3QCR5efrFZM7BQsur6e+oaiCJ1wzgJEPcAaM+90g34sFP0ebV3odzCBVWbdhJsp0mAN3zgQboljuDZXSIWqH7pHi2zbU7JFAd4JE5/EHkIwEH9iNDgiIjS4mc+rGYNERi7b8odIaZE38zfthE5LONWG8lWqC6yvO/W0Jb9YS0fqaX0vlo0Xr6vPVgoT3/mQzuXFmBWs68LCjF3SJBshQMjJ2UBrqWc2F/9cvLtRXoIEb5SiojKAAek4+VlOxrV/nPo2Ul5zf+9jnJcxqZV9Su+Lf7mbOuoMnZJxKz7zfhrfG1Xj3mwivW85ogQHM5y0l4DJ8Vfja+UiyDqmCVRgLY3deg/iIXV+l1gRGxrshNIowRVTtcLoFf/YqDsmth7HEVJ/a9qp4V/3rKv4d1kvuTm2MuLmoK3oDkJmuZtbStpizmm+14hTihyqvpkWejK+Hz1IUc3vKeHIHva/xq0jLhMNDTaZkIIG/AkOtdQ5eq2WzU6ZSM5EljZwIx9edczWBhUAgY7bObBjpnCetE5J74pCZNDZj4CowETn2yDygsk/9Yja3CqaJPu3MeztxJo1eclnYmmbk4w0/FM2IxKsAOk0Tz7/4xSnccGZGeeWSNtVHz3EH6b2sr3wIWfSO+oJzyw7kwEZvRbpuVviv4wH9Es6HUR0ItZE/Z0d7dc2BMUEOa+QgvkHXigqxg9UZz/GECaIslNxhy/md4wygDQVyo+49AapnrxIdsOanUX2fsNezS+SQyW8lE7lDoeSOQwjBwfW2L7VW4RKMHNOWMggpt1EzBfdbFcTLQpR5R5njf9LfxZhYvBmgj8p8Df4TMOCKv8R2eisiNMNfeBkWPhDdKED8p0BssRTCHkPdZylZy3FVW06PskAmiNRZK0gDy7nvEgaAxISItE4Oj6BVq/mi9oQmrSnCbSkP3zBEXLFJj9RtXJ7OyXnHLVB2RGI2PMTTsQueT+foTPflspYzFSs98N4qcIrEejP3+5CZJcU3mwT4FAV+sW2KXojv/qwV6yRo0RH8KJ/0LFMbC1PkHXNYjTJSbGy6E+jJ0gl+iiFwbKthnoRWCVFr1o2Po0eGCHW4/6VL1FDyePQfPkNtEZ47cn4yH+BqCw5LYwqR7eIvMQPv+BrMfcXTw0g/fxX2V5EJ7/iGYU/Ot+Ra7PGWejAayShk4V3bCnG9U4XEOoC1RgY9EnS4WnajrFu1XIahFDXz6D/zKhNRGO3mXxszvGXLx8WY/93TFVrqbJrv+DJz4IpjaSdJ3L1oDsl2xixoW5X8qkFX55qmpyAKS/jujcU64eH2BJ2xcSvoRE65/bz40o8zT3I7nwic3fxLjfDbHed2XJNggKr4bTfpeRWX7mBUqHC292f+qwHnXDKAqjQlFMqPwV7P1wBhiKNt1Q7d62G8vohiICetafiCbLjnPr0sAgNvVP6rHR59eWeuqnUXuc4UOUPm1SsfHwwSh7F7x2iAJoMcuq+MwDR3Bg6kJZ9zfPqXN5Rw9k0EkuC3fJVhWsM5xVVZfpKNWIIItdtPCDToQCBIDuUtMfspxfUbrqHY5jua/gBPdqBcExDHyvRQlctXee8t6B4mJWDVFUPxsJNSeQc3M5tJby/fq+VZ8hR4I/X0oxJ9g7GdWN5t95fLJC3eqCNklIruZ67T+8/EgllkzgqyFw29gywlp7S11jxLzGpcKibPFdSJ6RrM+o3Wc/aaVdcWG7Q61B1mzvfA5+75cqNfFihCwh3RsjAOytdHgsgTIXtsotAUChgZRD0j1Yh5kNyyFTbLSfHDa9Ivd1VcRx/3zAu6Hrbe6CJJkpLc8z4JA6E0o5IDCz3+af8hMCrqcb2Tf3wxrkPiHZCo34+/oMeJ64v33qEzOU6egbHdsMZJSo5kH/uMrmTnffc/QBiLYKve0oald3QeO/LUgUOvuNEqR9enOoFvgob8sPTy/MDCkpq6Y3rx8jdLgA/pfwxCNDpk+F531ndqWhypqxFgW1VsOSOPhsy2s6yemwvgaRYY+Wam7RVkMPs7adPoCMaegsVxKlbhKhwzVifzvMCpF3J+sMRGLPaK6HkVRM1ylOcblf4a1kCqpZI86y4tYTn2ma4cxlopMdcnsC2RWavygBm5/yvD1G9j5WfivAXwlczBZbG5XJnPjrcuYmEWDHV4nP5TgRJoWkDBL+G7tnHOED4Dla7u5YngAJAARLuXaw+Nm/6HtvdznO2PsceBllYqxeqpdJjike7JfP9SgPgaD0mpZWoZZLSL8gy5rQTW6tp264ZykD6ziSxJRdCgbj/fbE94KBd7cza0LimJRgMPc8sbCkdV8qRaqY32ryhQ5cHk4R1iSytcwdqpduzjSBhBK8uTUKqdDtwlGvLTTqbXtxRqU8D8bWTg3wxbTKHG3MI6TIP3vIpg3M6AxOtgGO+80HpELEIbuSlMILRqovVwDKikck3zastOes21lq6VhtCTHssQUT//Jd0jasnXvc6szCeefUwYTOnKfMWWRO42Fc1mhhtRQ7NFDkNnQi2M2E3Sbx7hZX6sTfPgMVyiNSI+QAvCzKpFReniFe0VxClteemjVRMrQ18U3/nwJbjbrzCX4W+eh+C9oumvm+mSVn5MzWYaq2Q55qGBjK1qOFuSv+oiC+/8qSVFiJbEaTmx7W5aZ7Ey0ogU1E7CAGqoBDksuTkbrXip0Ghqqg+7MWR31gmqeTYQnkYw0zoVgRSP6mJ+vD9LUIT5zXWwfaBWzUdFkHbxqIEEIBMIyQwtvwF194b7M8knIlK/z1MoiYq2guFD+nu/G6YOKJ/wzD9FcrYRI3cU+mkPpHsSFGKrNd6xqMYbAg2NRwVG90nlyAXMc846mW/CKL5D/UtbuQA8t6A2AQB3tcZU0Llez76UtOayf1vFv2ZjiZ3WfQyDHiVS4xAY9FyVh5rpo4eYPrKQyng5X6Ei/XM86uNHMjzlSIE29gr/gT/J5WLTYUzdo+jI5gWNu8PEw+7BWHp5VzQ8o5BDvoVOGj6fluZ2ojfFRfviz1F8r6Zexf+XIsA6/0L8XzGUDAi3Ihh3/XuGpoAAQYBQ5KQWosDcuMk5NEDMfPM4XoVbM9NWiCfbTBdzyBc134YEe93RNNiVdGN8+8A8IkUDl9LTH0EoG79zD7v4aOP0d6/p8+RtPm8QT7tfUE37UAtnA27IyHVnqO08EmYgJDpzrbYHKd5nBNDOaW0dMv8fIIrozM9bnfHbW4LtQQa/p9aL5maEodD+Nb5JA3wL2wNCmXIkEZBgyVwE5Ih/t0ulNWxYnu2yC3OMd3U/76dhwLFTuKNM++hfygDetHi4girPbK54iN+JHig0sG1JiaStLE7NZT/TqzrAeBambwduYOU0FRpXUVOqpIxR0cGdCx7lYr9ruZBbpVo7zYLZxM44ZaczJycvXN1gCzSqvq5jvYCzEgAg0mgO+ZLXSNdqbjgE1etckQZ4ZrEkNL7zD4rdwnXbkSDp0gPHI7vpEuRNWef90WkcjAt1H4/I8xPBNqiCBwQJkDYLzBHiU/KJx3hjkgHFfNzhR2zaIAA3vfwymHjVJA4uuqLmXvWhR9YAJ715TkJGyqWBamKzj5tBU++915k0rMml3u1o5Xa4Y61M+fQcaUzsDy+YNgonyK47CLe8JYedSfSUy9PcfStpPUj5GJs0EkrMp/y0d81dY2DiNklP9NPWo0Y9A2r2G3OdC94AVxnMEEvRPVFEZaPEomZuyXQ73Ace9Hj62iU+/3q3LyHGKh0uwHBkrkh9RRJHfki6ChpNoi8Lb9/WUekwmyGBNkB9Xm6ckcm28gI6FgvKJps0K7Ok0qT7IOn6IAsTZaBqA1wIBYtBqNSLqeh+5cjSCGMndnD1fgRsxn9nZjRMyjPKI9L2VXMKablbYidD5GXZ+fiDUjvOgh64illp8a8XqoYF84Dx4ZwU21rWPHdk8ek+T7duIg0dk1Bx9jUbaj7nA68jGHIiAbnCdnFegAvPEeCXMHMbtZzSMRoJhG13JF3325sWyQK09FrHzOBsyddztNrFWUps5nleq2HHw6nEqO3KZLfwCEL6Lg6IDBVH24AwrXUdBhwWvY4+wBqDK4E1CPwMinC4uQY4kwEinudSjK3ZeJlnvY4CDmJWUKqvlZWxEN4TkDCdTLkZKq7oa0fPDCq4pbPnqgXtgStSzgpt5PCoEs2e2B69lb8Ow+nWyb2wS1LUhmoHQFi3nYfO0VzGz94eMjc+jrmo+cjtxdWprHgfg/8a99gYOV+hAl3vck6BHpNjVNDcB4up3Xn2cN58OFPlXbooruV/0rSWYFa3vEsVLanmGTPpNhJvc31wNNML0bMMtdDD9LmBzfVsAE17+OY26qqx1hgfcHoAh4+Ny+dQMl6OUeSfO8s4sQ7MQUDPb7y5RJIdypyFqL2s+6qMoraZA31GDDsYG2xl6LBUcNn7s05NG0iUqn0gPAFlarAQORw3SfsAABgS/4BaBXbPf0NCjo2k6QVEnwEtN+sxX4U3j9nIkf5o1cmuHDX54AxQCjt6zEN7nQCX63tpMmIg/AqhlZsr6TjAgRbPgXa5+BNYaUs+4IXiRao8OUgTvb0Vn469tqRqOMnifUixuDxQAGbcxZExNurI0qS8YEHKdFhpzpWgTyIQ6ZKqOfp+7H73o6FHqO2/hrLOd2CpTXbWSQV1VpBHRyvSBvYQ/nn6k3pXHCf2XsPZxNTz5phMxEJkVwy6Ag6nD+2aJBEjIg3ONkGLt3CtPjgArO0o6aauw3tj3LHpzcefSjN1HLXT/qDbpQGuBOuxlBABXVasbsKBC+kdk7l5P5L5ssz2zsBvaWen6FE9tnp3bbRWqfIDnsQb1XAYiiyq6QFGbsTtS1DR81ifenjMdCYBSb3NNokOmCo9xYut6yU3IgI0okINJ7AJjWDY3bCBTcDheEvDewCEPYzpW9KoCeWrRXA81PWAAABfgWDbk6FJmUgPHbTrb5+diLFPTTZHg1bC9A3mwj/9a7qkW5DOvdnF+ADqvvtQJkCOyV5I0SZcnZeqsHGOsZ1SqHQNV4pQO2DQo/GzXw/VPrFyOn4JNDavjZLeUWI1T0R6VGFb/VdA+XPm/Jo9BHZpYCIPriiZZMmBRiR/8oWApzzSgT6LY+nEQq8fodzRksqVIAD40iQBREAuDxM6bzEQgBhg7655k1kWG6CjacESIgMKkinjC2FHFmMBQGEOMRwpqJBbEGLEpwXjGz869LUDJ5gFIrEoqS5YgkIlJx3KGB8Qt7F/wpdpT+AIHuoA+gVcq/BWdQ4eHEoU3N5ClLGhhIm/uhR9zTcNcbJN5xc4p/VXijPt/3j1txpG9XHsecaWt/ShghNocldZG/P3wtGksoF7lQaxtHCnFjf1XeEi4rJNDItdQMP1qPk26LKqImXVS2gfosvmaxlYWQk93a59wxW2pTYCrx3hPowYN2AHO2OBc9FIa+ssm47JY3svFR23U8SaB+DZgfkX1YGDBrp5oKJiXo0xxK+b5TZICHayI3iEFxyYxwWOopdjS0ZM82eEGQsUhTkp+m5eXLt0wPPeJJ3K5GFenpFnpPG4HhbmTtvGOCo0JQhxGIkv3wR+9gAAwE7nVjrjS3QPMeidxI6VJPXhi6p93FuSpwP2BhvhK1ZfSoU7Sn9Nf0WiioSyVOyE0DAu+QPU+JetAADRyBtteptaQ79Bssczv5w4fj2ZlzCxKHnLT8dkU+jaZrV8yf3Ffcg32e7N8BPZD5jRVrM8w7e94MxrJzaipuhjEifZ3IT0tz8idcXNvDML4DFpV28TRERqKvcLCRVAKy7zq6BiUz0Dz5xh52uhW8attOyTlDYoVxgU7Hw20/K1M8R4cDcTbBa3GEpp+ieW/4b7guXlHDGDON0SliJ1jQwXz9Qgm5Uc8u9qj4j2u4p7Xnd4md9rtTiLoQuqnmko0ILv3igVpGeo0UAe4t8GIS5ZJYDDc/1SDo/4HmRvbSR1BJQoWK5jva1YpXBdqX2GLOL2Ihslcra8JcY7DA7AjfxonAgVLqhPpNzvV+PCUaxP+9Bi2QP3gK6JjnZJNOYcV1ai/6KlS3q50HX8TJ0EAhjai7ElR/ilLPRZ4Z2eaTwkuu6aDcJ4yz1U6tlIs9sgtJi+wNwedcGM4TOncLAjnN384SNqnnp0KJfHctQrZIbMiiNnkNtRSsSnRXU8pA81KMrQZdlFo0bcDjZkMu3aV9v5kXGeRpGdmsX+PDhQcBXOjuFVGIWz0owzLtQ0Qa5z9FK8w/55tZ2ky1Uky13Bs7TixE56c8io1akDzpwfTD3LqbC8+KXJ2uwrVcg96S1KoyCE9qs1zLV9GENrRJ+hjg0PckMlFTZ/HCeiSbk4TZ5hqioOPSkp75G/fxcNWBj9tKXCNSqPEP7LCj3TUhACM609qVTpkRrRGPVbq8WYzE6DZmg+iyXpc1fa6TEdExecNGZQlyrGignQrSYYGnT8FNBsmThNovd2k7JJE6ZQqoGVmzFYZ8ulXA1JO0XwwN5BXFhGqMy+9c2DfPoAL3MOzTeSGKgCEgNvqoq0+Bhgpvv6txc8KyuuT9uadzEhZgB2sdrMzGm0iCc+1MWmcpnnP5pxOiaOwBlnvhiDEo7WaGKlQNr1QrTrrRhg8dlg3mqkwd5txlQSLUX862Z3MFL7dMPjeVa52GA1ylo8X8Gda98/7/9i1vd2VyhfiXxoBwv67T1zEiJZrMuUux+q9fYo3yvL613Th1X6fGtImiWpc9P5g0LJ1YZJzzIZJmXtf3jo0do6busvj/iPhSrZUBtwjuv/MB21v5l27rgi2WrZrIOOVr/1qeIYFM24imM/a2GDKdFyxS5l8jFMj66SeWu7ySURKttrRTQulc383vNa9gsrLiQjPPJ8C7DwvLsY880u7l93chPNO+id68CL7O+tCDCI06hXaau7qklcv2YGtB7e4b7sf9sNJJ0Nfgo2NstIDi09+LM1JyWtvjBdCuGRPr4tESZIngrOcSwB9NTGr4mjMN2NVgXbBfZqkrhsqIpgVpH4EJkllYbOLwtMBYjaY16FGG80tsRd8FCdoONhVzsMhbQX6629ycQ6s9faPnDR4r8GHJB8CmMuE+NeKQX/nh6+YnWYsMLqfmpomF7fCfSsJIWMjWXsj5/LBWEHwetubLipcWeaSESkoJOKKM5jA8zZ5hpqB0Ji6aKxHV+PSgBfd9tZraSZ1Hhk2iCeyefiwrPYMBjIiMzRYuW4l12D+oV0Eu8Z1ZEqx1sjtuYr2Q1zxzRH+sodJrsL6M4RgAbdz6EFD3PU/e8aTD2H/07wm/P3GFwZPKpVAuIAeEzrKZtbQUoxsr9nvz31kXyOwGN4DUBJU6iBH0XrJx1SrMdrdTQfDFblIGNQFl1cfBahZuZGZ8/ke/vYaHcz8Mxnwe/0ToRPONq5eiZreqX0iP0XNKYC6ocmDvzLSetev6x420r1KzhA6J8kZZNBIZOwKK8PHVX36bOVBAlWuabcpOoKIQCKCdBTKUnU11Kwv2xz6odM1y6H1n/GV+eneoRnTcCb59xeLapuAF7BZVYD3pTre15g/T1Elqh4DHI1d6w/CdprgrD0pnOeRxCBET75P6D94/CJfgCUW6DDYAL3F/zBSQASmbJZm2IsckdNKQvfIWJ1hvFFUaIDKUW7CEg98qsK1ew3EQ8Dd/EHgufhHcWYLQPEO9xa+emMRpaMla735NJiqw31GmEHw5T3sTD3XALrvkfrWMjRPQNRe9n6pLtBjP0TJCiXn9OUq9sfJnobsTvBzQSltpWUWNd3EPEbyEVsntKB7EDrwJ1FK0puCFZf64WJxZncPuSexPtBU65XaFcJd9kJs3NtfdyPpx9wBNLGxQXY2BUz/b2FlVs989t9cTo3WnRqRvvpmTU0s9QvaxWgwKRJ9diOhkhxRXSl2A6LPy+OAbXhkelu6+IKDbABRHzRibHvBRREhXaTsw5GqpIbjbSULKLOiI3isYwYue0TTN7nsPxofHjhq8gLAtVueJ1Chpi8L7Dtae5bq5ryokWJlSZc2i6OurQFFdorhef+2otudsYfhRot5R+vXnJoM4cdV1tvg+JJ5zq7g+CwA6L8RX7C3I2Gi03kX2WVUAxXYWAWnwgg7KBXoBPwJNzIx3RvVHG9o39qDU+w5YznWGgtfgcH0NAM9qp/76Nj2gTUghTFdkfRl9lnaIIwB2LtNWnqRRgP9DWPGveXRk9WKx8Ykf67wzpx+cH8I0klIkHeffhBjA6gx5mN4YoPIDjvZJGvRRmj6np1IgyF7wOEu7WCFOnRooD2+umiHL/WtcvYiI1gyQxAQMPZvdc+IOKwN93K/MKwC5eaBkLIcwVc+Yg91nhdy3gWXajDuSQAIQUnj9ji1x+i4pvUKr6C4nd68ESstDn7No+wKVMB84CmdIiP4hCyBqPJL9VJ+o0uQf8m0Rzcd3YY8q96cgDc0Be7Yg9RXtS9nbt5u4oGpAp8BMoDTNl5xpUELySQ+b+/NAObs010Vr5E59BZ0++gTRqWqBXOdfd1nNzfinzmumqis7ocS4wy0M8Va360aHukjrN+a3lK5zgEmUGuAGL5oZdEcgXDfQOaJMqcZ2uIIAM3Sg+UEcCbjv2hP6EaHiXvDvJBirn80HVDhJOxko7LX/PkNGF/JEVDyZA0tG7FzqaV1xzFtqssr+odttldpJJAHcquX0YJTxLdCrm8JMLNGgNCN1KX1fsU1Fkra535WTfjgx7+ycB9V642Qg+etpn/rtWXkY+tRd2rUduIQqemeb2CidpisUr/NZKZjvHN3PddGUvGqb82uHkwqhDhxjTFvg+EVti+2blTmDVFtAlhodU8i0GqCKJJOHw9VgVlKzl9jn7YdHUV6T3uNqqnlU9EtYS4oCKCSZSh9m/aXHiKiU06Z4bJO7MWijoL+UW3SBz3m6zFOc28TDcR7G2xcwqBxRvDEI/tGDdAQ1tBD59vq2YIBwyIGVdpL29T+QLhIuOcgLU2NTbdENGozbPgVI/XYyw9NZJqLKI5LUtwrAJQEnwbbfSU2dmJqnO/Fe+9Yu2HzjRgZ6RD1FSLwi86U6o3RPA97FH4WEvM1yTbD+YgICn1O/D/5RkUqJbpGMQarV8eWtepfzIMFhRW0YnamP9wzSBEmvR1l/0WUVY8KbckUXtoKFbHVgdsqeTQD5R6TlJZ1ITmrO28OkQ3FfxatSo/aPP7GfHsm5Xp6rCPo+88enn8bzMlwAAh+7ki1vUtlptd/UDlOnb4rSL0nvL2oFb+Ccfx53HESOcsM+AYVzKOrO28gGJg/vQsj/1WWVHv+BoqY0XZbFQ/WEX/1WRXQP0c0VDUrM0/g1Pou1DISsb4QzRRe6G5NhpsLfm9vkPiy80eQLE2Ln8W744ybNVuJsU3uKYVYeakfxvcJaYSYRy6TwB7nSj5VehU70aCkhRtiaJuMgCGNukHnR5PNlebkaTyQZ5hk35Dg4LpyIj/oXInlTf0yqgset8wVrjYffdwH6uZ4KGEgG1t8SykuQFjKnUrV4PspkQSgspF+yKuNstxZJue7mrGEm6JicHfzi0MqPkoHO6fwRRqjMWqnuNK/25vDwukZcXDroBzEwNc9AHkxvdWQz6aYsYJ9CCYX1je1y9MyNJfkx7k4JYsdDe/9A7oVdZ3ZPLctqxnavrHZn3vQD3WVpQPswDd3sHkC0HyqcJJB464rt3TKtg3F/ICZysCGtssLk9HDMIwIJB7H6ft2Fdagjx7EQPy4onmRiwrGhuzOqIq1HcSElrrsvcTEHL+gxkZ3IWaY0WE0gq/Ng2pyzg0BDjFgDh3q36oMeou2LM6yfSmCNQaK0IWi2eHJfxpNARzYr/h0PLIQlFFfEi3gNcPbkBCVFA85BwkquEyr2OtRNDCBs51wt+jyOiKGrsCiOUKh0+l//foTLAsi+mBMdTllBtg9h95bZoVaFZeIdVr3Cj8ZwrZpZpAYtINnhgUMrbTiS3yenWrexFu/V2aBD46mesISs8v6DdhLPgBLMCJKYdDJBvd+tAowc8FJlpcX3j4hkV08rxcdXtkA3bfh9iFIgsDMau6r3nsQO7ORH+KbZws+MCTEaII0e3tnTVxLQ3qIn5hkBLaC5IyNq7gb24Ad6mnqLLeoXVUIxvDnIC4NGSH2vUOdJ1khNKoKfj5nXT/aATz/CcX16M34/UpFEHVqLpHkzQxSUOD9czMsTMG7UaBy73EPw98yqzeZk+s2ZhmglKHb/x3oOKfkt66pn+uCum2auQ0uQMznD9HhlCN6SWCVSi8ii7KTjQ96u8Vrs8p425ReoFwCSB2u+RzVkNKPka3ECluuyJa/HXTsKuKyApXImiJqmqxIa6zJ4v97Zh666PqKrnzoT5LfvhFNaXPSO9CioiolAkdpQnRCB2KPJghcr+ZUqUsEODI6OX6/RecCtnRzTuXQaapVlHUcsnvlMybzNIq2U0ezHQPdnPHHh0HmEP7fyuzAfL23wMU0oBfEh++Ngs6tQW/+Es85Jzi3I/ePCOF0HNdTZ7jA09coMFVWYSZKa3KR8fv+BY4eYIwf/ZliMt4fSdbWVA0g8FYN/dR8Fs2ZLF80bq7vziGLMymzTI/ILqOyfZY95GC6F+PHS2Fxef/DtlhOBqIpLW1CsFsq/QZbCCL7Vh9oe0r0OwpU/Ia/CgNptPcj40jJyruRY7DowmzGZqyM4LEj85R0jRbiJ0qK3dY3PgzQx3uP03kTGz9dcPPhi9E6sff+mt7VJauJDZlfPNozt6MxlMgZRDMgbhsNbkxmHl8warKwk/lIkIJJ+u8mZAbrfl49ESJ4H0bH2uVB8Qm770jg1awMWSgPHGOI1davwz3VB4AA28Zotxge7REII+Xbb2XtUPYQFs3vZwcix2avuyZlcZwpM0D2ClpsvDMF1AAf29mEXKm3O/XQrzoTTdCcztvMzKZXJN9jAnRb2xN+tTlHm7XF/aODloqik2nLMg9PFjLK5znE23l2YqlJPPvBtYrmLA+BbATjMB/mlirrRbzL+INF4nDeD04F187etROdrCgUbPTxJPe29vxRWQzwSHDuRDALweXjTZja+6qnUupZy1Z7US/Hsp4kYKYXEOPsCbRZE0ia4MYzXsbZPYiCUby524pJ+cSmgFa58CYCoQO7TBDGCggRA5hCWSZjRKGChMOVuUDIgHDupq50SDyraq0AG94pLUS38dJDRzdkKZbfaZokMNTRBfcTa6LbvTz5LmZ6u7WA7l512HPxV2xc45craTHt8ztN2n/mHlh7BwEpua+h5pSkGq41sx3BHUvrsq3eNtZlXMky35coS7YN1Rrqdi24+WRmFNX+8th92VLg79OjeDC1sfkkedGwY+a5edmd7IFhI0SKEjmD3+5v1uDcD+ReGQf1cqmK01S09aHtIB6thdgPawjwJLdj/CNZSjgMUMvmtswf9B/DhxTd/e0xv45yVwOOo9godkV3xafnmxvmD5lkxbFg7iVdyKyrps9hZ2eeH5MGrz4mdPHd+iqw2h92mESKUuI3UxERuWpb5rjwkDzHvXqHTCthb8oXf4S4zlCtcLJlJOy9woiHdNFqazTO3KkgVTtXdkVMbKosKKdIAJc2YwSuZUJm+mH0Ja6Z4cRMnlu0qvq1rpHcW5wfvqOGmskctk8Is/UbQGSrT5mAwyHasPWo4S3TYlo0pUV9O576SWAVBaAYsJf8QhA8AjYpd3wSyAX/HwnjgT8QQ1VM/mKm07mZkOoGjIZdYy/nsf7yGgfrnkdMWaXJljUAI5G3l2u44tl77vADAeHAj1LjoSvMhM8pt08WxXgOVjpVD4M7oeiSPic9/OTdhH5pYjvnK/1W5QzPTOWm1OR9g/bmF0pbTFcesAxBzHqBWpZVaU/tV2gv5Vr8gBitkUIBsBHxabY+t6cEsI0EwYyUfacfk72l3De9LUGRxWBJ4YZRkEw7SoFqsx45KWQtA9nVcYn4hq4dGW1QEMWEOO+0gA9G2YayVWeZglFolL+KDpDI2RoTw26HhCixMqumf/0HJTWKkPziJ4mUAVe4+b4uTfUocxUxx15CukI/8FvK3v6UNKShKIFtYcAxKr/+/6vCymB96Vt2ue0eI1LY1AY32CMw9N5qkY8pr2HSZfo9LL5G+iazj7DOGUiW754umooIYWvlRUJ11BKJczb8Sv822iHJXyrJ68g8GUrep3ZehWaaNiMbICEKe5TluUEYWkLhT4kGSRiD79wMOAWFWFRNpwQTaoRfYKUTumx5zBi0tiJ7OjisbE8Z+RiQaUAA20W21uFN+90WGQJpPgrR0BgZW5ES2lHTcu+T2B52oYZqDs0RkaTdSJcZJm7Mr4siVHfHKzP7VekWg3TK2P1GGWkwmNHNXyj6jtqqqUHfUilM6unyIRv6wIwZ8c5B4F9iVko5pB9iOOajPAXVpqsjX4MgoIIFS04r/sRMCJmDNxnNITfBhpbDdmpiIfeX6Zhwz7EE/wNS0KdhAoSOVJW8QiXMPkdFz3JS30GA03IUNOwBaA9Ckz154EcYb7HfmcxGm8Px/czMZBveX9plPoWyN3F0MevzuidD+oi6o7zd4c4jhgTx9mExzgpvZCL4yxFoO0WAmNy4yDlu2qxeZcRKJGGg2hXFSIjULVxgF4VJZMtBNF5fNPMsucL5b8Ozb1yn8MM1756woKUlZ+lGnx2fMhfIMD1vecv2SXoI397v7LkeumAQiHGXINLKF4qLGgA/fE1ISzO93SbgzywHdWv5sXyameN8/y25lil9T3nDVoSU/tVDE1fWQPPuB4p+Yyz3Q4OgRjkfKawAlpwF463IfR6VHn4pyTothaKtOSkyq4CrF7F6h9p8vL32Jgj6jLh+uLqB+dTox47m9eLOHDqGpWOubtwrjF2MnTX9jwNkR63pUAH2E2D/WC65+pPLQ+LtFI4WrlM7GrqU4+gYvV4Z9ap7kg3SMi9cU8LdipVKZQOTawBg1hutU0K/OG7l70rp0+NVNJIYmqzJgc0Q1s//k1oXyMt5DTUD8hxTgHUjI82TP1t8jmQFgwZ/VsD5DqyJa4jxK8frtsFIz7qIWBXxJYKKypCcNKvCwFYpVDII2d7wAC4f0CFkDl8RfSP1IfavdSYIm6SmAeKaXZnHWcMyuJFOb1SPtQugm/SujFeh1OHhGErguulwsavRY1xZmZ9XOQgKkhAE1UH3Uf9iY6e6MNXPvtQIi0Iyft43L3i4M9C/34vcGtHk1DMASqVrTRASPq0y83FwW2Fw93TrmQ/LCAapxP4STgqYVulMmVYsgGYMWjPdfFzHBaVN72Y/XdNEFnw5XgEbPYf1EUag9u//Ag9LMJ09/dpqdEWZYsrjKmf134KpVzWrztd4BOPfw2QMUnKlK2wRV1i5fvDrepQWSi80d5ggLFT7nVMwoJ8JZRYr6GXhvaCfv5DTu32JrCNVvhDex1RfQDuaFGbl+p0IVLTja/ax0kqiZIb2qEZvZaKMshb5TpZHm2sN8xziryKMh/fflOt06vC5jYktqmmHoyt5r7s5TSDcF/LSn98JSTUu0Wtc0IaWrJzQQMPlmQeOXdM3se+r+kDoZox7tmJSdH7TkJ2ePlbcu6Ls/jkWgODSGId+hPmjrat2T2DdnYu4kAKpZhWJ6I9M3FquDoUYimkXIcLBmZQLQ4TYq8IEp8lLCrGSqLFj1jMM4ULCCXg508AhuIvl5MwHXicdy/JeEE8a72MMzcyf9apN6z7zTuPvmmpSzYWXrzMKZlkgSYpUT91jjw/F/CcibHIP4OknhA4omFoQAD+nJGkFBpc4YgAChcH+eNUqn5osh0YeFYZHaSQq0Shd1SFJWY83a0aLBQPe6Ip1HR6DPCgj5n/At/sjSgAZzdg03WAAbAyMqrYwC5zXqHdgQiE6SlLfThRDz7Bx0Ps+uJQTKMw97t1HZf37LequOjNsugCB/ZhkK9VuZihwcpegDqqfHC5eHxjZ93gwGS2rMWoAp5l2acqzVWK6OfgY/Xjt63BFm4EzAZx1luxv5+f24eCyiYJR6Ah5pN7wX+psV7vwPdK3UMuUmSbEKpEBHZ5tPhF+p0AsuK6w7pBRskfgT+KAjCYvWIrggxKVJibGBHrBESxEPY+kIaglDJhXeW4bsQtO7YXs9HsbwU7PyjaWT2Y6NbcnMtHLXr7fbXvdsKvq7aBCsj5zXmI0+NThNHhBWHU771F0sun49D8qnMukxS/gePFZx6My5e1RuoxGElWwVkugbQlsld0yKDGIVMaW09Ki6vacLLuOcU0xWd2IeckG2YWaG4+PhZY2pxahN6wy3uJxg/OZjJbucSKvottJj9wXzRpbeQusACooK/ffbcjfXrACjaCvrjK+20miClQwaWqnNykXKlDVWC4QWs1nxzoNghLZjR+jBd3qor5A4ieHyXgE7I++rXgPz45Fjhg4tEYmV59k7AkQMZYkNFZAi5h25rCsHb3kfAl0wR0rN8Rxht2VlwAWGsfNwSFL2yN0I3vfYN2vbgJIsh4NwN6n+pDb5E0KzlZYFNAhToqgA5iT2FQjnWDP5btpe5D+1ulf44x/p+gdobjWkPgORF9nMc2lDKHB3fl4/r1J0eRDGJopi4vTegM7GxBZmERzs9bO9OYs/iDCoh1/w0R1mCKw//ZROebUHaS0EmdcOqp5cw2h/0et1tivr0GokMhPle9qscOcdRsIPBKJsocGLul+jf10ZSmS9J9F3DjQlb10rZxYTBtjCf1xhjfYxsdV6o0YR8hKehxKCcsoa2RLvgBMwB6mCQNgYyiNlZdfomWkHsGgFpKRu1OXDohVdjMpPw28CCBdoaffcyD03Y0GEGvR5vhuN4b7rXgi0F2grySAHjfFPQINF/lIxmlf6W4MrpoCBgMnLr4Zs5R+/UJMOW//QRzq+x9NaBX1qRacrVL6Wdjiw7PG8Q3Pv6Xqnda2lYE8+uqdbT1Hm3SDjFxHhAclOkIglpSx1wR2A5nBsn49Ir6P8Ec1g9fEl8h1B0qdA2t8zAP0qpdRs4fG6a6KJznZh6iuzy6BfDqRWAF55NPODqn6r/M4/IZgI/nE43g4eniKe7Zc+3C1sYG354u01S8KiOCcGwrVnwT78/FoCXDBndn+GO0W9gADGBnbg4eJ+UYCaWFpnU0c7/PqicXRHCA2Te1CBF2rJndhGCcbwf0mW6eGJuOqtazdzWvazI5lWxfFoQ1S5zo6FE0h1z0BctEB4Pn5vD/nBhzcsJKYsvic26DvM8DQx0DQxJT8SgcfrKkRTq0C0A2soEZuQawJTsuYHokWmvrR+7dMJ0TkSv2vOYxPY1FgK0RBi4LfeWm5BfQiJS8E5ZJcS4sk502+DlO2pTcWqsZYXfuKMEOKref2O+RHr2Miq4SpjKlk1x4EfTX5aPus3m3aCxXZUk53ZjbyF8ntFpeQPWPg0mDSzXKlBOM/1eMW8E2Wa1gPpwJ7yYBMJi2aVCKH0cUSLh9k92UJ1upiYdCt4QF2A3Gl231ZW17sFY+BofcgG9NIjAJIb15tP6PBz/No7n9WtaKWQTt0cxP6Cq7QR459E30FEu2nwvytA6eh/+GROgSGF7pH5fAlAOxEDR0HpeL0BnZ6V4genQcWYt6iFyrOY/g6kQ+iNGQrLAZXm9r9oR/bXTBIYUfWCMMfHiNVVvFxCcY4VCi0ye8dcC4Zs2R2eC4E67vO/xKdpkdaVYMSwYAwb/zcpWZb1K6SQXyq//pMgQ2N3g7ozLRD/okav4dpZrnFZEO9u/BLzxOifLToCihTXqyJjQta8JnSSWSQ2pDZ8Y1mek5OltzEnXIs9Z3208Z/VhB9Xyyh/U1pDORofRCuSQEbTVIGBiGvH5CDOLMG5Rua4DV4wEmtgRPqvMg6VRTskXSrmNXRoNtpHdlDZkNZl69kJJgBCXfcwmfT+EfvDGkwQoQD5MMeErnMP6rrOMT7+yrdRQU1pt/nh+kTZpmmtLqJsvrkI7Yfa47dU0tQL2zmNEarg+SZXzsC4I+VsOhchc5rdOxSGb3AJBPPRDnv2VMJT66jNYxyBO7ZBtSHJ4d9zitEFi6kviOQu01LeG3dCzJX0s7wTwlQRTs6X8jjVCkDa8PNSXSwKd8Uzer2P6rPrfo4dYYWNCpWNLWxBfzy3QJxVHvsA7ZYCsXnaZHY4jZjjzZzJOeVF9BNBQGY4y4Py2cBL2mqV8kBcEfJMcpbjtUL3A4cdW0mT9lu1Ua+NjcxK6fJ5JrPfsPD3dSPPApUQ+dtXN6oylxgwcTZn04Qn4P6S1kNux1DAg94r+daku8HoORNYz+/67nTBeun2zkc387XRsizTzdx4nKU5PutRAyHOqO6DQDeE4qPRFCMOybiF7BIqVKwGYCTjhGDbeJ5ZFum/sT573HRGfQU3usH/d5/65y/YSnxqL7xkAKKHSEl3Y2yWUf/Jw4Dfu40yOO3nCg7YC+/g5gpl7jsuPOQq2L6LUJX/S/RKB2YGdjCDXpmj0yDjsbfWEr/+FnRx/EEgvYTQTbA236+pEKFktB3s9TsA4XR9LV7iKq9oXlytT0qIRqe7lKz5k2WiApmtvQ1rpm/MnSS3NhMNHgcROaHSZVMvNA1zpPZfS4ReTyyqrXhbp8w8FwIgRPm+FIgWGvTGHapDr9Ux36LQc/feJEywjFquDadHr6GW+80gWRAsMh2YmGzBXGel05B8Ke+XLVxxdQeM/RmKinJNEW1yl9SFfKmtqmAKJIUrSErOt1/adBX3PrMWacVNxfdWVfI10Jl36WMLWwA5qw+o0cm4YMdCn01T/gjSjyE+WFrMMWkjLynHCARgA+SPfk4zT+9RfwrZ6lgXrsNwonNk4MLJlu7NN6r4ywOp8zqWcNbwngfWILe6pXP5AcDkg2QogK/QzVR8ABT28isHgKIRzBN97maddr1jBg62vx/vVezQObKxZ5lm0kwE75aAeSvxd2Mw+x06A2jvQW4OwK6EK8Nxu5TAQ6WzPKSdkWjz8XXUwyQiaWv9DshBthzPzSK0xpsHogADqnZhq72ZHxYOyYrU/jKHcpQMBhcb4gepVdoOCiOVVlin4qrrzOQbqpD6Q9NNPjB9T5c7mEm+GNcl45mRas0aaU/El7qDmsanzd7UZmfBFt7mKnskDrG29aKf/JRPRgd5nwMlusQRkYrQTCDG/3seBMkbG4oINx+WqYF/NWLbPohPE08vNTQzkOo9q7XVHnOBU8KgS9nJHRQjNJ6MAaZ32BN5IS59DGM/elXKH+NBxBPmoiWaUkElWPAEY/vtN+/tZ5R0n+GQ1Rp3VNeIg7yzdyEevTujOZnIBmBRn1VTWwVj44P87Lq6tsRilTb70kE3P9RJMu+cuStC1+SgFptbBzp1GAKZsi6/YO2x7d6Z5XY3laBLg7xWfP3QkvsXingalpTRcB5JiQu9d9aL3DDSgu5pvcUleT8cuy+wzfIBp02Aa/4q0uhEVpDi18PkC9cm2rcKu3BUxqqZoe35HQT/UcrDqTTzfF94onR2uxdfH5/Xzz9A4EHqomK1bk+DipEhwgHXdwnLryeMrPRfNc/8VBKBfJmTsKl8+o2x+/+lfm+zrTRqUmbDl0VpdknM2rdHliNAryCquI+a0nYwQl+omie+8BAi1vw5FZQQyxgcQU9ZNt/z0fZyddfOqzFFegTTiKR12CfVp0/D7h4Cc+nmmOOOvtt8kBXpxKRTkHQpS5vOcvNQHgGGEZnkZiMuiM/+S5LKmODxNWYc2Gr3M3RLWIMzmJ0B4gUeo9hzTDqft4/3grjWxgBd53MVcu220+4rajQgGaVb1kHcI3BVta9lJw9Rz0peSSEhSlHB5zDKW7k9tqpxugFI5+CZMuv/on0UIqYvMcKk0EXwc1g6PqL9EEeJkfW42jZANUcisBmlpF46VBLc43eJ89ujaCt+7mrmlL6d2hPC3TwAfPxmWTH+YbpaYTqB9P6JQIXn7y6wVq9thnehoviabxE4MB61AU/rea+02fKzLwXu031/Fjl4xYGy9Ipe1ivhrgy5zk/GI+9VhnBqQwos0wSrrcYU0BsAMEuoKGNQvnr0Mk+DkIXVp8XeJvxU7invAAWHIbiRgZV/d74pM092IDEnuC6eoWUUuuIk9veqdsAhIJWOJKSZKZB//Fnzo/TOJ1Wg3UiI8Y3sGRKZuWuazSQgQ5cREbtKFZx9qLbTQTrkgZeWvatH5xN5Rpm75OyadsNYJ9DN60UzBc7rLCNz4d++gM5344Rc7NjyTAxao/ylkCvf/xoHVZvXdprT/KmxDLXyt8k3TFpzHKxq/OqhijiXbLgFMGzN/KzmLSqGxFlqyAkvOoGVQBPPhxB+dC51zZiw7mB/Dk3o5WFwpcG1B4fkqAz0xx49Gjw+BJ1lphigYS3Ev4T6a+J+xRNwfFjD2tAX9pMkwYaIeymZ83acl6Kdrxk7VeowPnhJZ3qERVO+HSFWOSTASZE43icFkUCX8ZY8V/KBrVrOKpXFrCGMNeYNTkZCVMbNXDggME/1dzpPqJj6yrvi3h3LD65HTAb3IY6g5D7q+MgvbdzISQhGiz8s2BRJ418ULU2biaqpiSIIlLrluv1leGxZsAAsKbH/MFjD/U2VoWpEXPwz8fCyCvqfksPXe4RZ931HwQp0/zsN7HS+YgcE5Y0EUaPAeCWoRoItE7NwGz2VxenO/XO5VL1a9pdCkHYm0AnK51kuB8ukr5d5Ji4bVeIyp1NTpstayYQ+okO8HkBgCk2KA8FQ7mrfDj0wa7qvlwWXgdWYFnJqsF3fM/1vLKW2rL6dCX1QZzudooCE5Hi+aEUEAfC1w4MeUXofqDFgiYZzol3LWVXmIxWRRHZGZekyGw+7YFMzra0dkNYsNN8kHZ57u/pxL2heAxrnRSK/r4hG1pzdz7UgmexYGUOSzycUN0qwKOQYmkTOyH6E7Ci19yx9r6MP4dKrYOSiDoSCQVN/wywoopJq6z4QR3K3nuROE6fWYpBGJOtPUFr8M6OHB/s7sbSyVOWyuTr2VPRNh34CW1ifQfn/9MoXyN2fW7Y42qAfsHdfj1J2DsCk0/m/KDbcwZh63h7FxwqAK86+aUMTZRBHUBwv80xn3G1TJj67DSd34/sOe+xRhJECVWQ0+rv/YF0GQ2LtIUjw3dpgtb36S3EAwL10Cc4oA3fuHPudOW3B3SOn6u8q8GivO3yCiw2SFRkf1t7xWwfOXlIbcWqmFoh48vcYS0M++i/AEVQa+0SmObHcVuqHdtWvdVzPZPen4EdwVDNWVUFvbxTUSJ6PrzITa04MDbhJ4vTx+JnhydDfRWEiFU1uVKvOOimVliGqy9jJYBSeGa84r7+9agvrMwM1A7k+ew2l9Q8xTfkIHpphMx+wqjliy6NJuJVm/fLdSHFzrW5VjufMZ6Ec08k3Zha1MxvZgB0G7ZLrUk7e+Ha4lDt8wYi5AqMXzwifRRRgGIMeMxKUvCAbHuMGKc/IeL6v0CPgPewbnJO/WowqEA/LxAr6eD3n6vLRHgUflWEHY6aCDouk/f+1dxKwY/b8NKETwG/5Ct86h3rvK7opUAANB+hBuA1XPwSjhd+IuXVBVyb2HDUQ5ITIzbVpdoozTCke3NjvSdVdPskRoMJ6R2sJNYEkCeBoTn3019V/I5gVMAOIKbhlpEptZdm0p6CJaK4GZ3mIlZc0/ZwtfxWgkaflugngDrIVPTb6Ig0fhYySNFY4T2qUVVDkVbRIM11+qr/pM8DqFijYswMLglEBh91z9BApgAGcHOCd6msKxj2DNaR+Z/pc2jJzqQo/pmchkFmaPwu8npuJhlk1g8XkxYooQlxs0h68at0PcAkS2usTgp7zpySCgX3kU6nIiRhweVranjDgYe6Hu+SOGTBToAtIMSvpr9XM81ZKiAU9mXgidMJUnkupKkX0do36g7iGJXPp2vjCCNEpitYHUF0NylSqUow9JvPVEdksXVVqeAFimmYn5LgXrOPf+eK617LoikMPUgPtCzH56ojxLq0MJAtcPX4ggVlRuq365PHWxZFeJEgIeB/RFFvL5Sw0DLJWtIU0XcNWhHMwxN0RHy/Po+kj1LrioVSfaGFiOLqJjuTRpW95rnHzJfh3XoU4mIVSKomfshp6qJL38hxLhYsWTf2Qs4QkJQGJVrtR2DlaHggdymMBD+LsyiiJtr5J75F1iH53m/xwWDVWt6er2RpdZ1bKPCp1DN/C0+gD3jWVdMEaBhn4C0xQI1/MAi/t9acBaJSRYtD/n8TosCAyd12apoVfTJe5F7XdIYqcXv6dsLbk/x9B1QmbjDxIvFymrBMAEjblmnZsAAAsUyPN5LVa2mzKPLHpu7b55VMfEDOyeKG+ivhruK4vEhTx5mE2HiGPt0E+liu7RFctkFKAz/dM0XU96XmNAM3cnU0HKwq1oX/pLreES8mo82z6R+Fl66Ci5HR1ygNHspatreEDfU1nOCl9r8XnkcwGfKLxIRuf5tg5t2HcRBudbac837KAs2vMJfozplEdzpGxPcqhwtVZ4FZIzt38sJqRr5WhUjcJt0QvMeAe1sV7S8cbCZQV7fFpiuEq7J5FmgN2QIa9SGZSKSA9GIisOv47kVrwRiSFVga1sKTwzJhu40Mt5z/x9obgypJLl8gyQCAou+/5EWhInVz+4wdUzc0tU6H1Rfhf0KDAV1VYuCiaYLPHsymxYM6U0j3N0SggrXBiHx/JtAqyK0Xcl4nL8eL7ykoW9Pz/OZcKJlvuGUMqdVuXfPvIgjF0IKKADFnH14vup8BUII/9szbOBE2V5VU0GexU7xh10sLm+tFExk+g3gmR6QftJ6NTdAQCYSpR5l3niHD57RwDF9NJNr17w3FSmOgOz5FsJahtfE2kl+LrWy9dg+w/ooatLBwpeX1m7oNcUfCiXxIVl4lQgi7JaxSS5w3s8gslDQkwwTOXbeGH0eHJnGVCmdH9+tMdQC5jdZw8rQV/x6ZrXb3GMT8iGT7wAAABqYAHfWXWOaAKTRtDvKOPMLViUEH1Kj0Ke3B8TA1KVIrw08ZyvGywUSAgEr/hUQ9SDI59dLMqaNidBIq4wnjR6ElyhkmMpEDzxdi/aVu0qSEj4CXbvcY0JFLkB7BagnzcbQ9ga7aG/cfV24HFvGXq7wh8d0KRdU1Nj0MkkiGtFxy0z3CR4Ooi7HOfaDruOVFrVh12suQfx+3my5Ov/r2qqLFx9oMjfGNqkeR4ux1WxQm3UOxL0RarT739zo/KLj9RxFC6X8TMfCr4YySFVXiY+Uz1xM/ODZC4u7GX3Yl8+Tfb2KioiW1vb/iEzjytNX/V17MendOQkFVJRcSwayGS0ORnmGEYftaSIsMj5Hr1FZ78dMiXd1sS8uqLPad1Q4Z7LmIsFSm0Z1AH1gNTJ9VNhlyt6OmL65FsJVO2nrZO7FmYo73hx4pGtrnLiCBY/N4xndh1c8ZiZ4Lahn3xfoHEW/05GJLuQpp0C5ZHmqgKiZtupuYlNkBvOSRXxBeiFQ6Naz8RQFFw5EFc0s3DpgILFfG3miL3aUEDlx00M4FptA+aB4hirj+YZi+D4D5YMNfZLCFq/H007MESEwuDRnWTe86gj26B1SeNNkt5cso4j0kzkt+Tl0EnbivvWULmY2Q52aZo+sxeGemV45HjPQAAfoIw0rFgAEeqoLgk8PCVrY1xuzbg6qdp6Ej/JzJKuABt3Yzmw+wYj+aUqyPDOXvVEFovSpjT6jv61eFgZqgRLsm85reTM6PZdljEQfuprBODEEUrYbLafLP7FwO1NapMuBpgF0/i4UvTOVpQSPA+9GIep1vhWXyO3C0n35MCtALmoNaQ6M3mG26VC+wvDbjUD6PLlLTMccobcTvZ+xrnPzptnUF9d2XMZ4wji8REPSCvV1KM7B2wRKyvmIELy+RljBVf0nLrbDGmOSBHh4s9Q7+aJdIReelIj7IpqY7AfK+xf+YSObIpnUFkVXW/wI2+03TihdqwshClQxRIDZ0s7kt+VxCnDImF/JSq3FTL6uyoIZdSKr+twsMjgnDr3hPA7aFxfkqWzYlLsE0ocYuN3RUC5CrQqU8aLBDLER0Sl2sXlRfS2WhUuaIq/NU2ndbn8hrsoXxZewXrDqiTWJVi6NhD26QnVNQdBhGF0zZGrq5OS6hAGKEY5+veyi45saoguoRXGDbOI7l3y1au2Zg7GbUPtZTNSqIJEjZtKoxO8t9yhqma2uL7vXNs7RtG0nwj1ozILPHEsCO69Ykmf/WN4DJTcluYAiF4sYHe6ekTAgmV+0fmLW8K9407c+pK5hr5GWu9kkHk1CzlE+CA9aVLdigWNt5pdSp9aBedZRd7a4PB9PRRM2VTGqrrWTNetgiapda/gZXyh3cQiwtwvxWinibibEfmtyqQUEzjGvQlZUinJ2tkPEYjjyN/12g3VNEgt4E4H67npK9Oo/VnHzkPKnGta3dC1Nw7ZSKA8/GWnL4MhGtSgf+zSRgkTkkD1xbRexA5DSzcW+u6C0mRybi49jWnF5cFeiZDGs2qQBLoUM+SgFlIUh5PfO7NVlNSAGDjbTDXPCg2US1q6KuyGeNKNCHAMlKCd60REEJZIrtPoVtyLcEYnb3r+u4uv1dS8nyezQ2lqyI3kvzL3r6GfXbvirspmTIs4BhhxXARbsRqb9fPZxIq3VErTNeFs2jgqMR+brWUFnJwzgKZSSqTeqG5z9mCpf9PDW2/+nCh6O5FDeDzAkuxKR2Jr5TWp6LppoD2a8OhK1Tm9v8VPT7lsaZrxl6NqtpQkoVecH6c1QytuCbK+2VxnvKSFtvKH74H4MRUiVOr5P6vYevA3GjPqE9Zte3PCFqxUl+bU3MEyJUSoZDstG/nOY4TBYCOwRcKUDLT1nwt6Je1O6vd24y+WeiMayVgnkOYzxZsL9GzW4jaRv9wbTLBJf8ZQ2IKbEA4VkpgakU3yZ4go7FJS1f/Ieu9HXwIVUabxPRpDKCN4TFMRpMBUtb3FouOGZWKExSMMvywt93qwcUB+u5cm9Xez0AA0oUPOADd25Cx5KQhltxMTImjmnU0X7DJ3SMzfAqGrcZfTr+hePFMSrzpJ/O/JCO044uNTBNgy5ou3lQndGgYE30rPhqbDXoxbh45H2ow3SwRFZvF4Gi4LVN22PhLVzbd89/sJ19IPQ+TUpAM/4BjI78b/sZdHg1WjRNCwkQEPbYS+SL081LOmNr2cCCaKNg8tY5LvZrvckrwGGCDqhuCsVr/md6mRNhfYd8bqg93XUy5/7+NJa6jTV1qQTo3kkGYMEpp2aQ1WhkmzJ1UOyA1XxWigGlEWqMkoy0f+MkkdRMiXU3+wWYl/MM4MwSSSXNWQhn3PJADKRzkbVCXIu+M2boQOtsPcp+PlHHF3G9NC9dxvoWx/o8z8HTUy+CUhIwXQxDXv7c57ltj6c8hNE7V/oDczqvgLPmttrEnDYFkX5fQ6sHgPK3rEapeDjsrv6s660quWw2ol9u9OfB+XTAj1dL6qLd0zVI07d9XrzqU6DOoMNqUTy0K8H61ZuZwKsk6WWLLYTqGfg41lPzX/EU5tnYKzR7Rxr47ehg/ZPDNmPHfrXk2dl7j2qYplMAeT9bnq+u7aQG3OTeMN9QHo2rLhph80SjsJD1zQaBP9u8Xh21qAY2ceHKx5pa2MjZjZl50saPpiggY7mUMec+55CZZAcg5OH+6HUhEh/iUMG2A1UD4iLWIxrCf2Wb6B0auN2mko0gLGwFsVVHugsEhrdiB7Se1vMLA6ZPBZJUMlKERXtyGX7551bhT5lIbirig5kOB9V3aeZbWl8F6Bzyc449Z7RRIeuAxyFt/qI+poprTBYjZmMqdUv8QKbIES2aDRXkEej018KoFjeexI7LFQO9/6a3p3+AWdHHuDOsVhVFkorU1CXb3UlSP9O+4P2QFoDeGmU+E+kPHJedX/rsjQhNtDgF2/s+GoUA9UWjKY47AN8/r5yPeMWJNjOiofwmKsRh+3oqlCqdjSSXTvoz2w+zTTegcy/5GQKRStyQT4exWwRtWQjKBKpxxDgsgZfO4wvtMj0S83G8SWPSufKMRfl7MLbjUVrSpGAH8YCXpgth3a4+54uOyJ9YbG3mn52K7QyCmVxDmENtcqG6srSxv2Q027y7FLVmI/dt4kxMYgmPu4Qug5eGKJLczsr/D27Gjik/FbUli8HI5DXL6NZCt2gBca7hHYs2ynzQOQ+Or78ao8VL0x2wD3i7q4dVtf1lzhbVG7KsXhlzxv0uf2YZkyH1aG0pzlNoAEfMyqiFQtJ2daOGWP9RdzTkO90QTveYhdlSeYWrmmYH4e+mIU0JcH9f3mRklkpsCDO3E7ZrrQUpDGbksE6ghyRdDpkco61IlrGGvmW9yIBFcoL4yJL4mOA2D6CHqv5ZyuHtAjzOuAVLYUXbAkMqUA0ywzSO6pP2bjuXn+XocL15qnrlq91LXhbH8rBqhKl9ur0Px2dkXKwR9NPPdJ47ZTD7OBlK1o/m0IIcZPfwcUSWFQ0Hh4AiqGRJZop6lV0qN6iH76hVIMQ0yLhKTv9RoB81x8JCPoLPAY3Ck9d6RYsP8i1YJ/VbO2x2WKKVvuR59Ad+37nfa4nJKiwNddC9F3ydYhvUkJRbIvEzRyR3kel0HCsl5YIjBE3bZpCf3gT1r7CdoVi0q7YLbSjWmUH9gWWypxMQNbzjXJ0vd2/laj9PWGK0ow5rEaUDqK1L7BdqepuXgW9VGbvO12YfRMEb2p3CjeEotj6nlhAPaBDT/hM0qfZkDlpx27eWXRtlt8YMZdftOq0mSGINMvle9IrX3/ofNpjedgxOigF9CxCWwWfBX6s86YEGfjaw0xZWtaf6MAE5zBv2eq7wFQgOKFX+vKxLZm9MQUxOshVSdVGJLrhvrJMa03iQwsPf4J9Xp8vTgZ4KaETdFgQ9Op7p+a3QIhlbf+Xa0ATjbSJt5xRtZ822Mc4NE+4kvdIKFhlbF2X+nkyj1WOyiwBzmqq5GMqvLHlF3UzrhZKNM0l3jauxfe66dex+todPZLvIjns6SobOZNnlZfguPGAqC275W/eE4EPnZjZaZ1aKtq13djVcVkJr3h2hIkwV4QB4MaSeihx1fJc0Ma3ERf/7oKae3+f/l40vqY3gyiEeAc/Lt9g++3DuSB2d3wAAWk/smOf9kYBYd+YQsSN+GRqia1YmP2P0btjfMKvYuoosW75EXa43vhDSh9XFD3v+aTIQKrWqdosQ5ue4/bAEG5JemP8P2pjqWz+FE5oYld/W9iq0f31nVm82dJKGPahqCIgctAnuMNzCblfyo/D4bPIMRwz7ClePb1Tpm4l1rRh+zL9FLOzz/Ra4asdhswnt3gOieSz7oqIbumk1rjfvBiuTPZMWc91Qj7O7Pjc9DB7COo0CKVyHuMdWqv4CAqN5oVorFUUYmtXQa+eEBVD9ozfv2b/gw+wQiGkihSsz8rGSTDQyC67uq6y2nT5/+6Mj+2Q5d5HjwivGGbUpoi/aYqf5uF8UP3UtIULhJFO7PBTIQoYLvAokRTWiVwBog674RVlGhXteHGMVkb/H4v0JCAPrgFr2uiDMTjz12D8Ar1vudobdHnp81pfgd3qjbVTrf4cjpF5Pd40q7KKPX7BYMKuPjSZNWIRSXfcjCQIJCg1grUHSzh2FOdQdMlb8Kl8SWf6cocMhWgq7DL37XxFUPufhqFO9I2u2PofjZnIuFRHBFfWwFL75DfHR7E7+ubbWTJossoEwVY18jnqdPPgO9vdNYbb1RBO9XNkVi1VsjPaO5Q+h7y1buHflNPxdsqxaw+xO/zfs1ylxXesFzNzVJ62R28qsEvPN4JgXbHhynUatJ3Ez3hjIrVGpr1c8ixecAaafI8BI8BJea5MI072fNs5qcuVq8uO95QhzDjR7ZHfv7g9pZcCgI/4TB0FhX6PLnt9/93D7bmAdeVjppQ3UHoliMvliLKJGoSTDiVXyf/0Vm3NQX0peve4YeOOi8CUT6FfRIoYGkpvdMSp0PTyezIal6g+pCMQXs7gCYm2Zj46Rc2AJZJ8eHqa6WjxQOwGN48ei7ZVzMpFvO/GO6Tod/42uhEuz/vWthoibx1zEhXn/gazMiV4jB0qHIa1r0nsom7ZRr3vgyKCG1iwApJta9xodVBOq5FvmtE6Yaj+Y2AoF8uPMKaKyqw9W0ZTLyqAGjWvZgAlMbg/tyT8aFjxTaftsrErImz1h2IU3mIdgoBzQDhlFAyBvvRRpM1yBAyRaXCou19hvnDl7r+BZp8e7WwGXrLqRUbpUmC+3iVR7mtBTH+WjQh2xuPHQPLdonZSMPJkQv53nu3vFN5OVqGR10xODe+vEGqewJZTvWlv/M9idHUH59epJl1JrBjuXxu07iLDxdyv9bLfMvWW+kKJSIU7kg481HkKD4g/nEqQKwG46ItdZ4YoSKmEkpyNVgxGHNiNNKUo92oAWuQolez20kbfhAR1NhZ+rxtZ5VjWnsYzCbdJcO0kposgf2xswLZ+dQTa/QuMCb5QamlK0CUFrfH7xHMj/gf1ApPiSTZZeh1a6bGAqvQxezGt32yS30QaqLTKGuKp2lax98Xdz6tZ4zjFW32DoOqriZxndtsrTn8TyvE3IaAZN+qmRIzbsXtf16aeY7J7zFs7Slo7M1dzAlyjoueJN94kV80t3OybzE8CryD00WxqJNTIgXz9yQYZz/jhZn3Sgh54GjDSV/YBLtyszLiOOxP4MjCNzTfVZSR3Z6rIuXXe7XlJ1VddHGL7ps6LmY++kzgt5U2SZowptzs4wTX2MNT4lXDisvraJWUZ6DQ5O21o2xz4lHgCdu1zRqMRKSSDzlqN/dfGeIGPA72mWebjRleasEk0mgR+1+bB6J88G/dlpGHtmQpSA2BnRz9S7HD6LwHVEd614OI1i9K9YCi0/akBgoCm4pv9JGFqrAp2DvgARnuz3VJo5BQA6nMMFfhh87STyopPpV3T0s7tNodJuWceUFSw27LaoNNpUNDfLNqe/ZGG9aRZw19yZEgXHsgOe0VF5pPbz8LC/O79002vJEOjBJJTPZ/piGdIlvDvuI2DFx2WNAOxIHA1cU1U2vA/2ffm4TFsMUi8K2nI0O+qIiqM0kVsgo9nrLpOF5UBaUeSLQDhqKstgGhlCuNt0Swr9SB9rNe5suogJduNPgwOhVlkGks/bN6MCGWNlXH92IU0ZAlwNih+8+l/xPph8pkrhlYkJqt3tZOuZSghbcEr1X2CT6wLUm7L+9zhcU0vyxJ075j2A6rvZaJFWV9T5joAb9B/ACWGs3SvHtoGpFFIh/vporQL91lJ2ojsEfxTFOaEoeQece4YZvcdaQ+j9iip5oCkv2eO4E2RM2+ZPq62PX1uF9tFxWc1A+q0Uab0HXQyiDPrZ9ndja/Sm4JO/95gv7YehqXyKyqapEN035WEsBucwBDG2ixHrusLcjB0yXM1wgGzOfhnPf0ANZomrh09kkTJ7LaaGck5s87w1yjj4umQrpqXJ2RIRaAE1ff/LQQHyO8ccpckmbQahO0yRK8SaJknpGadMe/2AzXF1nD3bycFUR9ZrgZhV+GlIAywC56GK64XV7Fo7gonB//0WGeTffT1+JoNX4GYrU56h+6+HrSg7jPrKLLQtRCc7R54by1ucJodiizqICnhq2LcnyacfZj6FWiqq7HE0x0MgcHjAnW/y2J/EhY/tqFKvwGxeJHOGLLsb/zeOykEhu2/MlHQ9v+Bb8+tCn4GD7G+CAhB5iXIQRaUENMZvU3QUjpQJ7PXrVCjU7XF5mikJTry20sYbc2L06N7OognUSup/rZXG/X5yczS6jWsQv2zOL7yjwQ4NlSYH25jXY10cJDHCATQcHo2w+UBxmaY5nvUt/lTnkEoUXfItLkq2663td2B22xXv0znOsjIwV9TIHnIY87Sl1+2hp15LCHLB/V8+HiIFjuwUPFl0ZHUOGjxXW2/n8+fSodXQ6KIj3e/cQjXiyQFOJvY70y4mhqp9vcJ7g/uc3P0pZ4bTm2EKnwXLHz20bge/a2oa5Buh7WDFbdtBMmQPkC6agntke0PMJEr1guNH5/+4qNcFEBz55o5pixcYWxnTWc+52R6dpnDo0ow1Sn2UtolBLtjOon8X90oLvpYbByEv2B7UnRvR8YfhbCXpVFaGY+j0hUi0ttan0uu2KTn+Qar8TynV+Y34qVdwgzAQJwsn7zfxoeZ9V4T+P7t+m9itDj5CNI0h0iQzj9+Dh2+Tfocg1fPt8eqqMyLSxFiszZ7F3ZdhsFBrGVVLxN9ONxunXn7CozLWlQ2mxlW/2ZpGfUgD3n0ECScQz+t9tjeiK1C1r8eq+z+2k4KKOfDgs70L2v2O3G6l9F5g1+7LYDVo4sIALuisqEGp6+spboJ3S4dIkBrgqCuLjVGxtjOVN3gjG+VdsmU5eF8F/pyX1Mk6JvIx2qVYlf/UZeXCChIxeT0alt7zKS9VFp+eVf5d8LTmgfuSxkEjQ5+GKZde15vElVYwU+se3oWysNuZq6PifqMXJgRs2ACGV+Y9hAOebUEZvqdboLqChTO0h2cz49Uz+SN7Boz4dB+5rYwylf7ZyQMuiA8xOLNPk1gRvTa/v5lbLQQ6lCEe5zFGspK+vONAIwgpqq/aWsZZdHJjaiw/SJFrC21g1FILJrcVNVZBwmEMWBn7hoElnbbDp5eiwAAD7wmFB6f8D98d8e5XXD3MpMSeVyBm8M7yXcrsKFYXk4dzGCAMQJvRbHM/WyBEBOKFlALUYPDv3D+WzvvaCTJqPzu7odN83eeohuhjLIg14jmskRqFoN3zSARF1LbslyTSDuekDPXopWnOVegLzX9g7oshNktTWVycb4CS7pD6XLhDxKzqZZiE3K2T3XZm2iKNWWrC3gdbJY1WO2REs1PC/wDAPXbLqS91ObfVgxa/PlYs4ocNGkwNPi+ZMYFFnkgJ1KazSycU0p7elHBrtlUxuLoXZh4e0N967PjLIpN1SmhnAJQCXxkVCDSjpayzGj+kouH+2Tux6+kVt4lVMRwtbK6XGx7SEjvdLJ+mkifaLhEVs1Udhr58hw4/Qr4GmFx40oWxi8GKrWFLqCFr19EvmcPfksBZxGRXiJBU2+TiL1rg1zGbZ2zLSrrIrAyRTMvjdXyi+sD/Z7pxjSaHO/16LuFYIrILHrP3hDNyhYbD/Yzr+40Kh8ZUW2MVQE4TFpyk33kVOIZ0dS9BQAWqQxJQXonI5iYeJ4SM7zmwjSbJ7GzRKdnF95+XOL/n+G1MDZGSN4pBNR480n0qCG5VfxjwIz0YKBwWGHl6MiiYy5PyJG1hF0fXgNvtIR4VCA3ihYy8+hn5oaulSdcvUk/V6BlUOR48v79r8bPrzkIcJVVOCcx8+AA+oGm4Nqk5mu+NPzrIwA4FlpLuu2n49hPb1P1QQziwl4R9NXI5H01WAmV4z8uCfRrUadZfzCBwcXjAiW72suFpO/R+U3wkpk8qxqPhMEgNK4vkojLSDDkIlxR1omHOvqy/DI+GMavaD5VIIX6vEsFoTRXPBpYvceXUJF1tHf4dzZ+LJQadY9LSEgk4izAiFpCnbr6SqRF32mChUY+vkmpICjNRpzv8YzAUCmbKR2FoyGbRhYd0fXrlkEt0mqNDExt27coCZgOvkfUGIhaAOdButEhUUsJaoNbqf/BK7U4KIycw6gfCLj1NGe8ArLLhAJU7JCbubC1KI217jjdPOpRiMVgkLHowUG4NlpiqsWcKxpaKNjK58whwH04RfYrQ7F5GVw+E6DFut4KWhMpyfFyTtn4bjZOeKuq035DOezt6Ug1znNOlmUhbfgZOdK3Vl/jhf5wH3Yb4w4LGZaZYi5vDtSaRIYAAArYpLR7rqjt3m9efjmD+uK1vPhyHaT4qgLDolaG6ymwjnjHEGH7t1aHyroJE8RsNACNf2aRvlE/67qmnk7llI+FEI+qN4RbOP4qzNowvDxg9L/YZp0yQVugUN7LurQUZlfDYAQ43drQpWoMsKcgVNGJ03VlxvPQfbNCjeRdsZNtz4Q1bi+7k5X4Vg4eJcTqtZvwc+AooVpRASE+rCfIuoRRHQuOkMNvhbvCA/MeyjYDIIK2NHJDJkDTPwsugUOek5OHAs/fQCdqODCdR+iK4HjYhmJitAPMX7XpLfRHlkNS8ZOl8bWNwAKZ2VYuS1SyhTVo6JrIlHqCFMgWuKoLyC0gyKZ3z6giEz7ORppvX+zArbKXf0XDMqyfdTGSktNeYpafC1hoxjBKfiUabAU+vpvPGMXWbGUOY+01YPR4e7lPMyajIxv38Etyj05ajgyd4vi6TTRd6NmiedR3D0lkoSu8QByaD3G8ds+WUuEkT8EFSBpo6oV++YA4HJZXQoBIZRPdpAkI3ri7li30bvHz74y0gY/Cz7DkM3qzO9sRgnTj9nAvVOEPB0NXXh3A0WkIMurxlBidIwzyMcvFFLOschozUncbXUxBXD5RY+4QuifBDDUqRx+vSoouuLxw1TDAEPcjiJBAWc+KhmV8AAV0p88NIchMOxuDY6MKbbw1Kuwpcz7s2hmdm5SYa1vbvmgDWPZ9SbtTX+584zEpgNx9z7/pTjNqQQQfpPsxCzZh6f1/VauNUXbyxEDDdwH3djEaB7V9Zj/G86diD3rEqam3RwLZVddr7xcnN5pG4byEQf6hcgy2Y+Pl+3BC8HJ74TRAJD4Y4j6kTFwwmcIO+O09wcC12gxU8ayIKvNs9xZM1MLaTo3R30UBLUsR0AAfzpVlzAZRYWrn5tFur2qjdZqmAtQVOCy0GherbUR8gDrZhiIzOakzMXXwMu8yhdVPcBYSCbTHsKE3RznDALghLfV/3gxAHxgH55Z7rC4J8Usiu0PUtGoqx6NlBwdqKshyqU/Ps1pICbym84CI5gaJ2rlkhgekeY31E1TSHAxfZuxcp37BSOU3/WGrgZ8Z2sUGOc160MZJXII8kqYl/cnFYhL6rIWsiSol4YOqxkHQRHl1kGfdjl6Q56mq6Vc7wbCpBOxqt9N9TqPBfthgPuNGRIwrMZ2YozH1mWA93Yw2ZIgHFp96fRZmggzC03lm4zg/eUSXWWDyfWVWO7b1/J/I+ooA4F05T39tRPZel91x2cJ62WwQeWTqnkQZj/qdqg3az8aTV6sXv4Hq2sZIMLaIjjx5sZxIU+I0xneV5f0ttw57zsyKALuVGuxFtWG+gnpHTJbivsWv8I5lM5VhQbBIDpiCy8LC4EH/SkyMIbvaR6EQGUXE0o+GIn33OCD+ARxcCSqBLaA8r6+gCqSfopxAMk3l+/pkzTaIyvYh6kx5ogXYIuuTbxbn/+TeU7rAayqerZqDBADSsJssJQHOOCGVYPF4Zi4c2aaNbjCux3eAXevnWm9O3iLhj8jYlsnsR2FHzDNe3FR+tmUozInom0mMwxIq9B7T9afNAi6CkoSmQr0qtMqQNS1eFIfy0Dw+q4EcIUWzCHOiYwTVgACLKADA/Z7ogX9qbxQtbZpX6zh4rFdUn+ZrozeGkGs9PwhtuoflSAzC0Mb6Sxr/3ciWxfZKfyzTIw0bhlIcb4S0CLBHmi2kCiDOcg+4Spl9nA0uA4s5oMzTlvG1qpQrECDf+8DYsPQE5FqadbXBfW0Bmpz3opIVYBQkPLtn1u5fmuLMSSArIVvUxS/kOzErpzsA+gJK6z/g9BliTgTcCoxyxIHvaE/NxynHYufAISI+ISpZFWCrvFMSH+GH1lW5PwuFjt6g0w9NUlDYTU3Vh/PzOfj/KJxMdbNFjBdCmPqW9IBSvFb2nXRY97u975JqUEQrGWnm/c2a5ZDGjcTQK6Ouebyo11vXrMo75BAPvrkgO8IwX6VA2dC1YcyVTo2DN5DLEpQS8cSrt9aIQblzFYgLzN55kMp4MRMoHMge+MU3QB0nkTZoGpUuJX99lrBd/2YzkA+sISzTIZ6yJS4AGiN6BRuedn8rVzFSSCLLZf7DuLbVOKQqQvzMsjPN/hit7zK5oQCNhqT3bpJ387nuEDavKx3TBVcxASloSFtpP5HVNT/mDYxZGLzu9v5BWIxivin8VOqTrD9fIjC/P4Vzvv+QaYADhYNocX2kzFoViWAX3qLPQYzPxCyaAHGhgp1TUgmUvdF+ncVJcs4AW4zGgBKqVGT7JaiAS/GJAqkZT+YCKFsZMhZDx0HBGwExrIKM2UJr18NVOBXgbSSFGEDP2ntTVzFSjDg4KGvFL46cIHSOVBVjXVaAdevOSg2aS3yTZI65igLnBl5i+jLwGWG8uaa50BOI2b9wJPkh7dhsURumADSnosfGt1hc9jTqH7lK9A5tLa1kW8W6BOJ3mYLmvYHSkzcDPUu8mH/dXo0p2zZYJVa+uVGHJ+0UIsqNr4fDZwYqub4fgy8F+3Em9MWOWW1mEd8wZzpaJ6z41Fo83SZAsu7hkYn4iNjO3Pepuu8YokBbs0v2/xOwn84FqOKuyVpbE3n3AswhMXGp/BsNSftMq0++xeNUHZkRmhETNeliUyiSA7nqXXsTKXrvPcVxsoTM5sET9lGPZXcTQdEEhJ6UOsIa3CMXVjDUyjrK30xsqBFf2cvM/O0YEAYj8U/5nbrHPwS927kJNkkI1ADf4EWXzk94vAmufss1W4jq13ewrXjy9mn5tAPyGekU55yqLM0jD1dGAj3bTaQHG3+5cxNIwhROvGtfjMhBzfqWgIF+NfsQxQ3f0KwKuQpPmX6E0c32479SSNm4X/c810cpuaMKabljmdsDvtmd8H03aoZJ8QtJ/Jb0gXQd6rdU0W+Vrp57XJKAByHtJGta3lxmXpC98SobMmAbF2b3AN2KWnvlVos1BahGt6zQxwL0m3UjvfCjHBDHvK4IneCQMzJa5LFtVVy5TBZ5IJ4gXBBZ8ZnpgaLJiSrCK5zjLIZi0Qu62139SE6YXd1OyGvxBFH0r454ry47SJ4nDdDWuANr+055S/Le/f8GjK0ugdDhooYaviIPZr0TIhWH73d9Y1gfC9OeWdzjtTSgNN1IH+gjGMppLNDb6rEFNSD9JciS2yVTUK3TS7S6+zsxZFs8IHEYVcGjuXCXbcUoZA9PfQwbp3fFlF5jT+sscgdnH5sZH3EpgM7/e1jb/zAUAqMPU0uJ31+ewxWeZd83DfIYA6fuU4j8wXXfACPTnpZxoT6iT+QKZPGIGyD15ONwxbyGGkYHQTKdIOw1o4WjJ416Fkgw6b0eyraJhl9+XvQxiTddi1rhgR7ZtyM42BR5Z0h+VgvkuIOq9f0VCNjI2qrZHIZ9Vd+omMz7i19aKyQZKh9FD0YGnU6pLUITe3Vy1fTkOD3alnN5TaMTJ9GeperbfTyQxn2tRKuvvkMaIFetbMb7FrNTZKDs68nmB2uXwMkiZNRfvIWW7Y0XtpGr8cAvKddLL8kf4zhe3NKfXnIsvZaKTgEIb9+V1GUJbPIeL5CyvDRiQ44JBfhwCZnHmbkW/+CMuUyGTBdIN6HYRY1T684wmXYxv272sCUb+hKmCU0VgNXsgFD4VyaQ2LI6gjK2rMXPTlUrIAbwVzyXFdwgrXCL1Kz/PsWiHAMHVATXPVPKTbR7SLpJ8RI8RdFZfom6oOewXI4lEg9dJCAT5v8ZXCxzsitK97zXiqCpHgfkKraKkDJUfQ0Cw2BsX0THcNIAHZfExkdnXnVxMy+9r1fDLX1s+XD5lnmhEd60dcPmEWKzgsoyYn0tukonHbnd2BQKmZyLGKten8lbdKaOsVHGQ2+MNYWZuzPkdNIf4PMs8jAq6l2nJk5V0tuAJ0nCi80b3GIwGlQXnvHd2+V5WNMfrInPG0gTtUlYLBzQAx519LQNr/vsN7bXw4TsvHxgMHYNshEjkBCAK0sELLdrJBvs5HtvTNTZVZgd3y6NgCYb342CXm+iHaH6FKVETjCny2Ig2VPLNuDpM3nrEfIillC+7bALNRpuk/d4s/7DmUpVmk7Z7JZF3SDjrqMLQjDTTyHT8ifj+r6v3xS0t8nl0obE5kaR/UbuY0lecAkdmT1O4vBC3jZBIcv1771RoQrlMh4UA5DqVObaj+pB2eaMjiZAabugWrz7TqHFFK9LVK8cwI6fMXo/2RbOt6+vAqauXn+eEW5E9WPt9Gt+A5aWS9AD9LK/idWo2qLDbOpG1G31ppStuggd/ruo97ZMyAzROl+JSlOXzyTEQqRQ81IxGm1xsTwBnvR9u4DoS+A5sNPK7v2AzC+vabqzj01JU2MNecqgAva4mYw+qtRU5/7pNpTbyiW0JwZIVLCsWhe0fimGgxQmjIBLNQoZu4R38kjciaPjKJCRoWiZLNlamIpYegJUen9U0gyburYCJRhvIv4v0HA1ebBjzneN9p6vgJaRzhHyzgvZadh6KW7Ri+k5rgjRF7RhenIQKZgqRY6JIQ73DALur30dumOyOL4+2upbsIugw+biN2+9Z+U8Cor9ApPsNSBAsG7rRiIXglbljwoo7gP6fIcru60irWtPP9ZqN7a0OY2+sAdtlRKmVufFuPnvKGCYOgXGkAIiB74RBNaIjPWKjsu7DGtQL6TU+SM5G4AzIjuDSaiORy1FsC0rNVD255V2/TzAeB2nA/wuvhrKuzJf7hHyzHluBMp1Q2OJ8Zxv3kSImYNaKL4qQLnBZBv+BC1TpdlQxWaj41pgkrwNA+5aH2pPgWiytX9N8LwJjewbE42y3U0xPR9vpc65ScZo217noK59MxQTqnngvln0lOYDdRIYuMk/kOrFTDluXQxrjSLnonHPisEQKq12ss1kBUledEHocx6OX5IeBhifzNg7XaVkCC9Gbjqk8tg7ycgqcK/KLXihkSZ2bYOg3SKlfglvahRfJYjl880BD+wPXCA/e+jdVDHyL42qnTm4qbTa5oCMLu72MzHRryhz5nL16UF5TE9gV47ynfBrDf1JOejDM8vbZ+GB/OEv8KJZKq9fLc2g+NMxdxc2cvMLpwTxmiIz0G68cn4BAS301wabLeIv3Y4OkFHPW5nMD9Bp0oQ43FwnBao9/mydNdD1KjmdGWD21lycGF48My/tTasD2Y2u6jEqjnuBnFXTYxS6ajo0LhJGLkAeEkJUjIKM+xtUKZefHv2X33W8D1/c6PUTv1IfwsH5cJkyZqGGUeHHlFbN3JUmFLvf6EhOjCdcgPeQNNQou1AJBSi7BRnRfipMMHmqcvEyyEVdBeP3PHagilZ98BY1wmy6RMKs84m0iEfPH5vWT7IH6TEJarYptsNtPFRdU5intrFFvvfAhy7tX7TiJSApi6rTBB7uVxiaS2dEhQyxuaK1Zu1P15DLcu0ADJLQ4vKR1yS3C7/migH5zIjtU97TruyDwNHbFf1gWzkm4UymgJpeoLLbZ87jGxDU/+YhIyUSI87Rbpi2yN2xK+jwm32NENE2nt/g6LGErT1aOR+8DNOLHgGC481Ycq9kNwaO+K5EMAYTi70Cgq405TsI6ZlXt+PDgvB5+Vqk1PUAdPRXRPRSGutYFGZg6KriBp1rDp6i0LHkp2ZfosJZGWhgKZMYk9ebLog61CihgYnK2S4/p7k8ls2puGwKuq2HDv1wYWu3yH1X6R15bmxJKVjlXrUI2v03woVligFF+SJ1/TWtyNGNf/Ttea1KXpUgQbwqde5upTXKMYDf9VwupnRR/Xf2ocz6cTrmOa/rYPVLOabZN034Bj4v9nNHjl9U7GMYnnzx2z+2/Oemtme3BivTHSFgyMyevWvA5vnBHF0amIhIO1r5sScP1IftBUTziWzkB427JmagB9kAATRTkfMc0vI5/l37xnRF7lSS2BWXkGnIIjnwBAD3M/qGFsSWIDOqcHtrygXwlhIhFMNF1NIqvG0ktHrvDbTjLe0hR5I9w4lAyWJPlj+GQOATlsRng0Kus1h9ztk25TBeRRk95WS6mtFB4Z2WZFC+u122EauoBwu4dJkZKQiEoPUIwQJDzaH+jH5F+biGckZdRB7wNBr1r0KYlXQpAXWlhTUvyYz48M0pSKD33BhvD7KNUvATb4FgwyE1kYEQkNtwoSsvOUdP+n1tehWTqUYQVwFEGDx8DXP40C1GdoOkX/NR3Ktwtwq09siQA3FP0Sc1jN5/oaSbej6o6fAccmC2w/1t0CXoPlkRi8zTqzJozg9wFgbJyfouVOdmyE4QBkpP6OTBmrafVh0HlJBUyE+6VBbBokr8wljlQcotoExhXUETQeHkOeDvfv5rQRIuqLVYs9c8hpZadwqGrrmQSw61R3Joakcuv2xYDXZv1Nb3IN72X99d5gcO70tXQbLNkwDRoVaUj3iDDDtGmcLh32VYm8DQBV+dajFNVMhW7HjAjF1QQ0ALUTa7RPh0tPDoj6tWR9s+yYiP6Z+Z3h5iGCJZhAPv/D/GdP6LxX+LlcNp5U3GECKgRSAfx7Jc/gDRItnsxqpyc3cb2x/GH6CgAJ9G/o82USQK0N8Fd362cYBpAF/9DWWst0uaF8L7rc5wIA+TAAIg4SLM9goK9QBdEx3qOEXS6PM5hPsqZUNvoKjTlXYhu3BdoFXufjyUksno3O4WvXv6ySODoVMGNydvDuyv2v4b05XFBPAb04cK3YCMyYahhfMje++EOWS74X0L7+DO583j1yd5kQVCTIMxUcuZO3K9mXSHUdY+zj7akcG+lz237/Kx98KLN5P/Cxi4yo3pEQT6F5kq518A8PGYKXRWvvarvuaHEc5BxpyWMWg5k+zlRG9OzgbTknmGYDFVNUcGxIN8pkifa5pWgu7NWeCh9YKCYqsgLwgca6plXOlI2ktpHL6gOoZGKnkrVOQM+rBMhQIKHYEoq+m05AJUh4NaA6uorePSsmgPJBABNN6vm9PnRGnXZW5IyOOpwPtHSdpoqPQ+3eHj5AaY1WECHQ9FuryNvJ7j7yWDCBHMCwTFS/K+vKSsv9SDdy+3fcrhS2UI0seavJzcPXa5dJX7zRaJuxm8ZN/tJdWF/7CW787COISe99yB+ACnsuxg7mYCgV/xBOO+xvlQN8JwXJMbTPrDXbBANRQJHGelipFCy8BMtOWsktKE8gyR/hz+zJnL5JQm0jb2gv1mBefRbbFgkS2wAOzxrUoiVJL4dVXH9qG3QNRUoKqSTBOIQcT+AWwto7cVxINW3jN5GO9C+wNqlk9NHesLgH4Vt1wJS+QmNGtNNz4ilCRa1uFJ03UemdV2JBa0pfLuEId+4mqOPmw3B4qkQKoOkfoWt8zYave8tsQoM8lHw5Z0gBIAYIMf0MhVysMcWpgdhtIzDH9E133n23YPeZ9kOCrV2Nww87+ZUioyXqzRZiht0JoGK3WZbr7vtjfly0Mlb0AU1fGVgeAibZ6xrV24sr4iXTd06b05cEqoR4mMYB7JYNG93CJhUycdceGvQ9tB/xqLIeM91oWhK6ODI3Q1H+ckt0V1xiVJJbRz+rsfYv63MvKdtqEC2Q8SsgKXgQBAgjcyicE5EORWe7HJ4BnYvQIribnLp1o5yG4SzKJYi93lcM20Q3ZE6jLRpFm7k3eHyIfbvTAAZFXdgLcNsfSWL0sCKxo/kC4TzZsmPSSAmyGvtJU84ixn4L3u5yBwG3Mo6EqPeyx0P8IoctbmG1z4LS4XUQc/NHIjuFkVDgRKPzpo/JAI+8lzwFhh1wQqCjCOKAMZXj72oJMCM8qAeHPKu3MkJB6udS1oXGwSrxy1TxgOefFmYKYYUz3xZSXGvhn4Rrd5XkAHQFbr3GqQ6hAMZ3nODePoodQkkw4QhYj5LWDJLeUMZ+ZAAvYeNyaRFj+a2Zm2kkO+/R50UrPOYCJK5JounRImhtmhOhoxleD4oMQ+8/UfAX01N+qv1uQTZ1Qpe/qiFV2ZL0NjsiU1wecZZ3Et3XfaVLbkGfDlRYRoUAvTLkyrTOBOZoOYl8E+UPUTGbDYi7enmmtIVXPYXhHQjQZGqd4t8v8boGq140/4eEBIDdd+me7aqSam2QSbmkiIuQfbXjU6tT6KFvfj9nsuOglBQIqQEBQJBSD2i4TPNn8qHvMq8HCL2cFvIxK5nf/dr3rhpbS2lyI/wHIhwMPUIFQHpw+DaUFuAO30OKmKlVlxlSgHUfcGd7UF0vv/0aYelznsd10eM+YpqCUMUKgaA1PqNvKR0Vypm3RMvK1L3tWpL54j/qyAR7fcaYoZDd1EY3Q4VDFiTt4j4Fb543w9c88O3l55mIkyLKCQ9pjoaC5oCPRFq0de7iLDG2hGKe4NGlT0ez2+qQsRWqUL2SqISTu7HjIEprSVOErZyI2H51f+g9kh5NUoRJn9EmWXC8ElQKWYyIAuc6jZV0CWuTax0+qUCqcZHajJih5PkcsrLmZlqgqmVZdbNWmNHlWgnsfe20f4+HrABwZSxuiej4pF9KOn+g4fDD3rdJe1zCNrVI7k7QBkrQJeF+AGfAA0zY6/ixuzMPnGl+nVYCsDkaRn/0ctkM5BqK4OcBl/BeyVy5lE1Brd+y1rszbddTryXVG3EsMnUcRIaaDn49WMBlbGogjlMOoOW30UGcxc8uPI0Kgoi2fEvo/HAqU3NuMTh67KNKFT6OsLZ3mcaXcmF/e9QZcL3NriCwSLHSyzhVpyByj9mIf42xRicU1rqfU8pWvEMVMUC/RTLnq0+z/3xVi9OllI+tbw3FB5yVyThrloU9efTg8jBk3hNPCfnzsDyXH+cTGZaw1tPqH0i+5wKbysJLV29mP9+b/n4BflD+7Kc8ztgy22NEKNk7mWqyZ2uz7azTtuh3SR4FGPUDfYfwe0r9AJln/dBprhHtEbPe8Lv3i1W40TGKkaNga+x2/v8/GId6XMgamaV3qeAgQjM0mo+GwgGUln+pCgZd27E9jo3ogXzqld/uzIgBNFH61exVqSBcrGJKw5Zoj7Flf/SiC6JOuNu21X8akJRM30IAkCIyvgB8LobD6J6TdLtViVqjFUMPtOZWZkGm3Na+yHgntBAXVz40ZGB2cw4MdQwkC4CcUcRJoqqAsdngVN3m3wKuxKsFj9v/PmDepbTN/nLai9QJHRcq84FCx9+X4YMjb/qsj0jl/pC+xViGK42nsHNC+cQSmuq3WMrtUS8c0vTvK7ivFhcBd4vxWoEYmF1wGbINXjs90eQS2r7dzdSICIbON9/mOOTk9IAikG2DqLaPRyn16S88/nsHrcPZXqs/b98e+6vbIMQHKYltg7Fl13gb7h96Zd1dAev4bg5vzCQ3QiissplfVS9T8C1DUNdT3wPQONaCOkLqO+Ay3wYkxCnFv34ZWJ+fQKPc+JrrdTevaCmioR27+sfENaahApTZMa8pmK8VTVCBDpSsLsr18gNjjBxoLkDSDj0f30vEpeNryFMPTIQiIGa5/Qk4hyfaJY5uCrObK8HZ+lGXBsdq8Lv/Ce8ZOI8dJ6LMKAfErXnaCSkwYDBfcC7CIXjRKMoxwkBZKHREirPaHgZIA2kbjBZSWbQX4PmPq9qRk3WhFKYcVuWXZPw7hgJs+vKYfqEpARCQZw+absOSjGEtqHzqqMXvvK77hV3xeUgP4EoC+0Ixj0bAAFxecoBx6R0BtxO3UVWD03yqkD4R1PqVrraZpruZVGwN+MYmncST1ozH/GuTq9hhsxs2aYgWMPGXvAZ6NYAhdQmPcg3WVbXKZFEKU/HzeYf6BPezXPCrVo+44ktrdlXfg2gsbNmT3P/lOO3Cv4Wlfq25VyHNfz9Eu3Ur+ra80dCgwtoAMV6Ezs51Bz5t3OMmcINdEQaqtDYFl6y1I4uFhyDx6/vWaq0B0chVrbk8aubh7kjw3v47QV7u7gHCtvqZLgAW+LF52XIwZTaz+zXuCctZLWVDB6rCzwsNGaMVdExzQBWi/pVVtNP3tV9JzgcovO0mGYQ0HOOr+KVcMifxkNn+0anM1ISuLsUCaANp0q9/Pd/2HRy0lMbco8bm7AIJpUJA5mbeRA5ZymCtRX5jk9ZnwOAWY+MitDqHITOu8VfXi6LLZ6v9lzr5M1c3+tXjY3RvnbHpQrNo2msicqQtpEz000mOov+xSHxdojhV6UCWsyUju3Q5IIhFf6Z0poLUuTT7ZNrjeojgpGAvLNdiZEt6bIty6RNN2Yx4e8rqVh0NBWVsXQE5fdZ8qVTcWCkPgPHfcF8IZGBY3hWPxkyb2FgDtmqui4wTmuOVz4WDNQ98XOgLi9wC/XNOQUBD3MncEmTYIf7oz8DYZFQp3s+p+aFmlqIJwnJR9Du6e7o0QCl+mR51vORP0GGt89+tfBQleeUXcltXesEqUU5l248GyWkx2zRxYA4x1/waXL0fxm7x9TjHohoAaikefawWeXggs2dpa8N6NrL7EiuBtAFLLgFoKctoBngEe7lQtP0AMZIsnAO8gqZlqCXICDF9AFreyMjikg2NAHhpxYd+a1Wp2gDXwGZgx54HJESi5tqUMB6COZLAyAJEgl5NZBRJn2wUFg93zoYxTNOs63wEBMs9fV9b9GQ+ElfISFc51xUh4lIAwwGb9eI7zViY5AiijhmMIPS+NuxWamjsj/Dl+aGEsxSuIng48n3SVrHfWHHwbGdEgwEuONaOUPgqC/Ky2SNW7S9uBp3sSgPxhdHp4aAVWC5NqvkDX0YABUjRIyNZjDviaCKT94AB5lNVMYs5DvlAq7xQbWkPoJmS3CwZHKrFUYrNQLkrhgPEswxKCuUYOIoQDWoGdJlGJvHMOdDhd/QG0uT+EIukJFDP0AWcBDF7saCJAMePpXbtFsWnFpuFv2LrmnVNBqs7s8A3EAcvxRbNlGxZIgAAyB5/X1Kz4Bmjm/piQT6WhrLDZt+GMb7V6IuOBuNoAFhaeYh3vi/Rq1y2EecpYAPEIctnTXoADCUfw7CtZrLrYWDdRRbz3i6BexYcMEdSKsE43E/qDcrnST1QEZh3e7iV5DXCmGvcWB8PXWnImdbgGgi75YpyOiK8tpWT9gQB4gyCpwcADyWx5qwhV42YWHo4ZnQ3RsHGR5sRwoDAFiwAAAAAAAAAAAAAAAAAAAAAAAAAABVu9CfudoX5sAiwWS3t2cbpKLo+4fZqoG6k/RejICXK3xot7tn+xecOgouZVBqOURA2G44zAX7Z4MaqmsFTYlSfTi2bZ5dk38vFWibfSAOSJ4QwF/z3mxEUJU7L8uKC2wHbmS24h4Vp0PZ65txwrNH+pnfndU2Qh/iJY3/jrEbendyNDadNs+JzsR2TvrSE4PE2owkJSbx5n503xhfFSlrYqDWHXoGt6OpjkpREuWf4HgE5zy5PNBdQKNctRLtmndNFhXAxONq8KURLkx47rjBJrG6ciwuQILG//ShDFHEyx+PbLEABIcvm/fQOcpNysOSlANobVQ0HwbcsidiZtGAkAoedK8DO8HIg9fiDdSrJ62AKHjcl9dA1WBSDKxxihtDaqGZsD6e0Etn4M/UMIyszFJHUK2inpon4aN7zr0HOY81ilE0/mt7rgNCcWU0lwUAhtxH648rCzgrflXLN/uP0w6O7AKH1H189OdOAwf/1G/Kooy1873zsiuKYYFAO6hrwfx1hZJiDr3HwvdN2UI//HU5LFVyW6ZGPW1HMTtDFocap54Z/pKLylMiGi0RgHL9M0QQ33frvFWpcPFSa6emcF3gRtXDkcSPlohBm5T0xXpAUEG4fauDfwXZKNQv39SweYi96e4YXd4m3QIWVUYatmCcILFL+dG9F9d9LEmH/qUTatpYlEr3zjBpBmVeDw+Flfp54uvPuX6uoB6ejLpDrrPO9MmwwKLOKTygT9Z9mFyPmGz+G+bT4Mxd0hN6ZanGcVw2cqEdbjXAmTTd4u+sPhpzb55iBqSTTjTE7Anhh/wfe2OeYqucr4GB91/uNW65+6D2XT0+xcMbsEDjj4/KXIi1oEZgcOjA1jvbTTz8GMv8IXyv6fgJrc7mRDsgshu1+nuOkmenuSVN1iEkdInfwF634GBgdrG/1TulOvRbJJlAaMCW++C/cNh1/LhgJTOcbfviBye5YqoqUAlcZj+8kX/bORo4+25ZsvPkhiZeJd3ZORHm7Booy1873zsgv7PobIXNJk/HCEToULYw+XkTc2ORL/0o6yyahIEZTtNMFCudMf0f+FeJzH+oKrqeuo2nc7sYtlrYh+SVtx9rdzH9kx3KQuGHP8zP9rlV19fgBIesuPqh5aqRUFzOYtB03XBXoOnoUx3N9vcLtKSoqUzapwn+d7uGfGEP6aX2qGm7H7m46N0wx7baZBl8oVrslLx7B8j/Hjrzq+D7XbFfo0d7T6jijWqGMYx0tFf24NhbGBCadQa4afDZACiyddkkLP0uD7szS/LsyfDYgc6QbdXJOoxp49AzTEu1drStWDKqNynlDkJRY5PVX3k9+r+yl7B+U+6uf95qWTRhL6U3x/98JuFKsDLoTk9ZZb8QVsSwkcB1PGD19U8TBYoiLRABbyKia8TWG8kOuJTo6qI7HOjL2W3f12vII6UzlifmerMk84vM0NEZ8jWiwnz9/cPFCD8pBxVKOFeEox6gor+XccblEJ9PpCWjfbij4re+7y48AHvjoweJjDf9dABY6z4YvS+lRKEr4s71BdsPQbmhf8sojqxbbNrAKMXomI0ANJ8a8xLffmifj1qYK/mGuaiUAa9ypz8eQuD/d76sLF4Y37Sw6WAJDSKuJuMjxoE4IJSdkVCCzdcBxN4G6ohEbV0Bo0Ufz/8ezO7nKSWB2LLlRMilnOJi4gIFpDM6QZ+nwo3v6mHwlkXv1f2UvYPyn3V0BFapqvamGlVUWZhmarrJTmFkK+JxHodoW09thLLJdexUSuX86QEt7kdLKD/mNIOU0zJMmAjFLDnDagdGsONA9vEx8UmP60ZFzuGHP5N9UB9biB7e4p3PKZzdjjA1ed7QaAd7WUbdz7wwPDqP3VdCCzdcBxN4G6ohEbV0Bo0kcol+umHp0/IcrXL1/gbhlnOJi4gIF62TuoQucH7Wb020Fjht0B6ybAHzDyqlOBu4CAFB9r+trTLbaFLqjR/fbTmipgUfvUNxn7+7nD7LrHx9zt/H56yIlg9O3NpgvZ2Ecp0tmdpQSZLrQzfxS5f+WzxIRdcQgHhSlJz817epHrIHWWeR4f01QQOcDm00/Z/vaetUemCkcyU62WROx9H5ZClzMuLlG9/xEHAnrygTND1bJ+v/gx7bqGqLxqrJ9iWAAAAAAAAAAAAAAAAAAAAAAHTGfnkK1quW+KVmdfT+CLQCQub7oOWKRXZVipW0CAcD3zGbTXfK0VORcTxWA4JTNrgR2gp7pc4tR5S3sLqG+hbR7Dr7Q91qCO//bXe3Lnx7YwnPq5eo4SDBEQkjqf5OE1XD7zMkhKq93fVfEMSAoi7i5wLHh6DB6yc5xzNP5s0LvkWxIWUzLkwavl9ca7VVybbfZYH7ppgUnPCb9YCaHmLMenTm67XhAwGrPpcMCypIp7HhH+OJggHavQRY+5sH0NxEc/BwD5Fks3pWDlhzN68tGCqCC+ogXTPziFEBzko0UJNMgLpAhjtClrrveY3WvLxy0HwNrencM4yTEwgBjDttxQ46vES8xHygjD6rG0u0KQlqpwOjuk0iVkjnvlOQub5PurN9Lz7oWzXI2NJ59JCRDp80RXIW17X7ZccmHNxv2v3wR9xV/JwrGiSgMw8nyEuyZc0pHRFJ3Jc17zahpWtUjflYvftmzWOyHWX8OXFOsGrejEBePpEAPjO+lTXcPk9muYqGkS0/BFWg7xaW4mlYvPyPFoQpFly6XM//5O7TZopUlmR2OrG0uUGKxpk7+w+Bvs8IGNFn828sEgwntzGU3q+mChTqwTfGB0LJCKH3tHzQ+m1t4RBG2Q5xMoLFmCwpZyTLfgw1NiMdd2RLzBiJgDKdUpH3zF5tTcVdSBgRRdtrlJy90pQDgkMqa0UWMNQlTyz51GY0C+xIFWPUYNATBerLdlTzCrgB5J8AEQ6V7icwonv+5RcVzbjmz4W4Jl7cDYj2ZOJE6SEoI1c85tHkcBkPBRNm4vpfIOfsxiMrvt1pOQGNxtJvYdute1KngHDpu+/PgRD73bgn9LgVHQSK8WfHeIu0h17FMppdR2NPG5JclFJ2eAEVk5no/MKEpTN7tG6ntP7kBwoocThWRSUKUBtU25jqxv/uOl7ZEdDtuaqpR0wVOvcY/NYD+Vb0wcnLVcYoeeYKud6816yD8jMzqgQjU523vQWQXHwARF7VRsOjRRpFCpE7hslyuOpwcXb4kcBD/aA8pAvmqZKl/FaRFzgAFgIx7Jt173fTGfXLH9quTRP+MPE+LXsrbCLfnwrxW5bSWHgPa+RRdJ9HSBj0+crR5XwrpwNK/me6erKQkS0gnlN4pHavCgP3KEoBGocLI5sod9nYDl+h9nuxTXfGjLOu5pwG/486P8HbGqxevtzL0HkheYeUO3/t0XbArLKmd7D+uj7lqjLhvPfS5Ljf5DB/60uPrdYgKRV4dPqHFp6SzagHuTAABeA5+1gLTWg85+uPF/PcMYC4g/urJxccHikIBrXdxP9lIAHtLAgYRo4XnJTV0w2NA9NFNCl7HaQdswskSZ0DZXI9XG4gLf7uvyUAvq17oHLHGuw30xhWCPPPYTKESxK1IFdtcBWjyVOPNvu1ik1YQwqQEhl3NOeR+Gd+S9hWecesP1bfTDZYB0ADdiwwfaoOo9XFimCY0E8jhzTveORaqy8BgAgME0XPg8S3QAo1QHkp5uUYQT+Opso6hB/VY930RjBHtEvq2ZR4E+JzDiyfeo6//OoevGhxJA0YF6qlMX9AFwS432wo14GtE/5hy99PtYhnkkpr4wUzkLX0uYxwcWXTh2BhRKVmFzqxEwW32vaj3Ed+4M+SicHie/qewPwh4GvhkSIKxHkIm4F31Y3rum4/aqDVgz8UXE4GI7/hZ0ahipbUMV2nwb8U6PywULUPN4YSkyeFPQTUEkvQGsquHMNAnm6cLQLwpmVtzBC5+6tj1DTWDMTTcahh23nUFbCXXntuOq1EHHJxf3vWErxxqr9sVv+DIMow5FjrJABhd2+JXkuA7Txc75Wrzp4OpYXyaUyAIa337XBN923x3yhC6/axz+1KH1lrLevmyQhAvbyCR0JnX5tC5+8ydw/yiFmupwY4WkRRAF/rVhE0jJh049kdb5m3KumqhOc3FSyukVsQ/LIsZX+cE+5H+PEg7+whisAuboWDzv6F4ZfnfW/Kg6kAbEQKyBjY9l9uMAfdTsSNxFCxsldAxrqHl0rsqNic6ksbgbCoqx7DQeHkW0Tlxs3HxY4qeQiBjlGCKuzdMp7yYIdt7cDnBV6OlnwLH0aSFcYTGvpa/4HGKOB/KoYWnZit22bYrf0PDIyP7Z8nawy+PZ7ERR8MpZyvsxdevT7KBG53rli5Ln1Qoukgi8swzLV5j0WByZwHXTKnlnJLHtBiZ0Zcq0lSP/7eFcx6kV9dgq/6NHJRhJ4WaXeIZEqHoUVCV0pZuoDBFP7SGxbM8ee3jG78JyLyWlZKplygVyM3jELXqa7unbMDfTkalSVJEGXIWV8Kkt68DtcgRphahI4QB98t6q5HbrvH5/tzbs6pkCONQrHtpOyvuQEjoC6fcFm2eyFuThfiZB8+dX1oYTnxTom0DFPzc/2s7njh8auHraaw/AhYyPeX6vlkn4V6+vac7Ur2YoiOj+GyWmPk7mQ1RnJZf9O9uEGL6Hdcn3XZ4SbsR4CQUJcDKlWUNbX/y9NyzTR6e2NORGEY6Fn+uE3YyjG9fbiDmjGmyaW4rBhNV8c7+cOMfsY+ZRoOaVeJr0Ex9F2psuTMjd1ND+0eaXf6GpdMDzRVVl0ozzNyPRbPN8ccI3NS/soytPbeL2BwCR9OlZ4928zkftGTQag/nHT1ugHokzLQuwYY13pEdtyLZrLuhVqdcVIPQZKXxe0wgghXzqNPgSx1m1Vi0Ip3kXc1PD5YGDnlXPvsUYy4sC5RCxaBmopZJT9Xw0rNUrAui9maSSpGCug+JKozXlV0QHEzPZ1Jliu670IreXo13Ikl98bLDM+kWZ3bFVTXOyfq7h1GWe975gFINg4Vf89pm8Eo+DyhkXbfPg88iV3CVsZkui1FlYGZXQ1ZWPYy7JCayO90RUtZPs/FfPt2IqCUPMzxMRvdjBSA+nCN7fGZmgFf7gVg07/2Lduj/VciQh8fZ9P1aqGyPCmRp8YZ1PcUnsf2crR5Ry/O8xDWyW42CVaEku6wa8WhTiTiESw1XWDZT+bhQUPG7tQ50D4rM5pyAzUUvn70BpT63+k6f/i2/eLT1xD+7XdqGWHC0EC6JSJohKH9GlzOXRNW1iPdsL3HYYnBibg2NtxSBMLn69TwiVonN9tqhhycuazZfM1/gHphSWXcKGKJ0sWsTHoQS/jZC9VX45KzveaZYaeog1xZ9xOPi+OJpCZ2Iscr2r6X5NjmdIwA+oPoLsnJfT+L44mjyz5QV/4DMT05meaahrVXeSAOWq93JiVBUvsD356ZO3wjjJb/nbPv85A//0PiBH2Bnrz9d49Ky9Ob+hVKLP8/URwSFB0HTGM9z3mrQf7XZSKnYcn9GMEUpExIAoFJmf7w+VzKkSvIolH291f1ffXnuL2qVo+B9Ly99ZFs6l74Podgy/6Rsr9BcabEZGcYftJmyJSrILY1wsHtIBBhb9bkfxMao/e5Pfx1VG7OQcDxeNxb7wRIzKLaGAs6lPhhM50+2aA39gTKZlb7UxwHWFv/AbmV61pUDDDF0VY1IXKMr3RmeILdWIqMzAmr+TQf/zgNIW1Mp7F54HA1mllPYVnTrOtTeRskBW0XYsLMAJA39ZSXF3m40Ca2pSpjtITvis4pxLgVq1M1NmOXrIB2jZZ4DSIucyhQCS9zCmbhQkteyRl5iJaTJmWGXU1wX/hUtYg12l1pPKZYLU93IBkor6yiaI1iDVLo5p/0b5q8IKnEXa8jMQl3FH3o7KMBo/FX/NuoGupKEHZOy+g3VFkujdb9TN0CyeqRcqkr/9xHB0JwIL65rW2C1v+m8oN20bCuR6FmlSAmqWG0nDGDpSYi5kHrl+4KnaAy7A2KdNwojJFtJ89Xj4KRCPgvlkeyJbZpVPVZcqtsRspPJ6tF2Py3Nhf8CbkzEjxf0+mTRk4TiA+X5q3Yf9NB2uprgZAVBYZTQLg4HSBP1YJlpf0xTdCsu8+/gwuZ0ksnH8WyN7da6lycQ1QsH5Nmhgnc+aYsa4ndTGOY0+iEVSaY41JP4qWR7sgdTKPQTs7/GETVRar0vqBmtF/umVg0QspFTsOT+jGCKUiX20o6tzOuuMwkiY/sQ+Oha7zV383zEM3cbjAeW4W6W+YT075qheZ0rGkDYMFkALm2oyuxL5CWufCX26S85LVLRLlHW9ouAPcoWUmXpgaXhL86674QhC8Ga/h7MornYdqLz00fuZvpsIzynfHaXTypykpBB7sCVkFbfpTMrUoZBrdQDGyykeqJ36GkazIUSyMMtQsURpa66u6NtcUqxTwCWSdlRcdfdPAnOxpAmNKae6F5DMGrBSpDhlcpEp3uEfQ483FML9QzoLSvT19CWEla3rP0uATExhgncfB1S1+7g8qugOMFub6300ljl3YyH38x/iQodaEaL+EjEZlcx/jfkk8G7XjUQokuTSZych3etmZQpN8PF+8itjzPia+mipmG/eERxy7xh1a41bnlR5muWjWrtwzYaGVBQizrmoKPKUQH2vGBVZa9aCpCr7huqJz+cssi97xG7z6Ij6bUXHXT/gvsWci1kx7/QNtUcQRq9+sTd+uuj3ug9oFr9ckm3cM6uKu0kkwoBz+bTwUFxAI0z6PywBqZb4GURYIJGoW3GW1yaxwRrTJJvIQq6mi3PvBsw3H15bZcbm3MMAN8C2OJzUoRvKVEhbhBTDbIPxWYRvwrcyX/Cmmo9tVsUi5MiEFHp0Tq78QgxwcbJe84RZy2sMn4gMB0ujbMKYl8ya+mibOyX5nFpti3oHbehHZjQ89NJY5d2Mh+Ezf4Zte4w1OFaduB7r2FnbHxCOG7uB8ws34HDCFzxsZbd/ehuCE97r1E9BeXJaTRyzh/ATW0euUJonMjXDvC4woPNXStPgntl10WdCR0cTmsX62IdvLpj0UVrkXWdBBipGCuhchmnv5kHLr0nQpNh+SN2QBT72t+qq3XhIDGU4/TQoZXpXjfbNWHEm8zxIaA3U1TAedkahhV7lCr5sFER+G0+mvCz2sw487OyFE6zKcVTT42r3o+dM+tyMCjMgjHjNI6UP+s5sY+bd8LVH85nZUcfdIuTuaVdlHgK9/c8f6CqakCG7CgAAAAAAAAAAAAAAAAAAAAAKj59NTMHxm26fctlNbMZCIWi8Fg1UsvOA4VcP4QbQ8Lem/hV3xtW3bRJC5+Mvvn8MtYYBMJW49HU4W7yK84q1G1fGAPACCOnTjH+cvrJ7n0ZN22yi6V3g08BZwYSFwueNqFAsqcOqm9wzBHBoMOMoKRwGBrtSWkruxtSgFV3QAALT0wSstj3wMngzKZUVKFQ6mVM2SQOrG/D9dJg0rTPNFuS49hdzYlPa8X5tFNwGwIGrko+5HpYzNNeqKUTRn78UKF2lAZoWYW2him7/l+QitR93sYra6ju4CWy8Wus49EJo8Dc5Q1BZsn5iqdoJiKG1bNyZcRoJrwAr5grxEEIkXzWqEYs3NOMLk0d6DUc391icb4YjyiCle2go3PE3S/Q5/bHU40W3wz6bFaJz+Li0JVL4VFH0PiABHTe8Wpzb3SUOa+Q86/Zwxek4Inm/7h06d2lwDjRRZszarOrOCY+p93sBUGZu3VJ0aVfqb9278yV3LDSdOkIePF6lLq3cwt+RE6nhuvd4/lXeKXNRy6/O8GG7bB3fQZWs06uOZTIZltMbblZokmbnr8aG3jpZDxa8B48z4pssmlPZxsdfAB4Aauci6IZKbaOGVn00bodZQPXGGnimwSbi3wHspZes4/HDpLJNbanXNnWLF/eCk8eYJUcMLTGz6/yT3HyO1rJ7crLl0s2T8vnDLc4P6uJnxk58yhIF+AfV+2yAzx9LjhXksqkydCQVHfmSr5D/8HdIelwRACRemeWtV9VkiWLiy7a1MAS3LDEJXmF4uaJG52l8rvqlzxPlGJFv91SE30I1p4qDU6UZgSNb7PYlRv/cOpl5nkzpq353DagWr+tBR2PPcPz+BN/PolGLI0dMlepKJxuoRi4pVB4viqvzZb8TahTWaiMBE+CS+yijqhIcgM6ihm7LZ0Srv5LlKRRLZWw2ykKRVO5o6EqdSotxqpJ6FnfHObpmrR/CEAwD8pNsQCdUrMJknKMMETjPFte31E/ydy2gtwXE7bre536f0ygBsoYE28/lUgF33t4FqJ3bmh3lyylZR6bxVRCEN8jsU9DAeTn3UCkMOGfgS4JaqEeHWJQ4c8z2GMh246RebqbXLfE99i+TlTrYs+A3RjBu3aSxIHLzHjHpnwpHzdSFV6RA8HdqBgxqdeGzjgLa197OLGNSsMOpCezNLYhyVaMo9hCTRjW1W/AYknFDZ6vYHM9rl/+FuREo8wQoayXrK67UL7G/ODTszaVbft1TsX7t7DxbH9f41L9VMg5m1NiaDMdIuqnVe3jWkmh3qMracqriXR1bvu7ZSXDnlKkFVqAV00siAo4mYWQv9OGd6mi9YZtQi2puhXO1lkJ26WG+XnvvTLTjL0CmRpvTTmtJPnQPm9J5aMspSHQeAZ+1VlnbWimHaph020BFZXTMyNYd6Oh+Wscd79DODrGdDq1YKpTTcAZuOXmRKFwUUlQqhM9EbZn2WWEfG/RzPpdSZZ7kE6+BxufsyQfPgUoC3qVazzsEBkpZZMsfWTfsyU/uLQESokwUiLTt4jS+xshv+UzE70J+52hfcrf/hh3NO2iEg+x618EA5oK2XXDNqPv/eKzx88MPusk+6fdL7C5+WOn/aac1vRnrS72L7Uj6p+BqSWpmTj1kMPnePNGXX8X6I+Ux/ZloipROuVHANHd2CCWJi6zqQgw1P8sCoG21dTgBkPTgs6UkdNjv2qozCGMitzTsxD+lQT9DLFj6XglD7zxP2QYoTv4HFKaBuGItrZ/KFtQe5Yk69ig/MqaQ/FZycJtkFs3EpAOyAYocn53kl3PB5RXZSyHsdllgESnSDZUbunREwmPaUX/Fl8kqaMAdIulsHjJT1A+7te6fIADw2zJ59TZcxeL4y326FX0EOvppendcEr+yCOqVAKs2NyxJFEdULiBzmdnZ2TNnlywamrlMJ/Vq2YeqOCjfXTlU8iPJ8c2ogeNJ3FfOKSmH+zf52CtYytPbvX0sdyEOg2AfWIxpR2z41YHyV6ZwCXdpd6xbHNBNLRrTH8VmsS6PM+/eWHD76KT0w3q3e5BvfMq0UXH9slsNXKc0NvU9kCx5bDYfLgl/Bb1YJr2hvyNab0nxwCuSUWDrMtgA9ac+LVoOgWbKJSIalwKwPqOrFuNDqw2BtLTnvh0PqwKxHi+hm2NC0/a5n53ajPddtjrk4ywOVMUbCIgzorzru05182DcXQ0wOnGQWFUTG3jsm4xtM/rNWgPeXQNBVTvNMndJGuj9Hk/WV1rGW/4Ea6jCOkq5dAqWqs8uOKsUJCcPSEOKS+f2dRzfDPhTS9rtruUjaxhtwhOXJ/IjoSH9X/c1zxzJlDvRhsvtdrdlSuRvenqiK7/wNg5avIE1Tl8J/iaj9yBdGc4DSrt+AzCx7j4+YTgB1UlNSPEawekO4Q6T248zV1qg9uoqdeXWymr7gd/GgGFJDa3hxlJu9wcm8MEt0JyG11GVtOVVxH1mIgd802sB1a8/FuSgi2krVQ/b8VDKBbdsWW5aj7VkrmLEDTCOWg7v1T1cZfkuTumkHneZS/waxw6SsFSgPRcDmc4F7eKqDG/zHejQnZTK2Cl6DGjhvTa557A/g3u6v/a1T5+wj5hVohkqZGSQPxY4LSDD92l5zqMbPCbb1REBbVhh6bJ9t2OkNZ6MihkrM/50hx1tpHyC6iDLeA29U5H0A8G7V60Y8Q8KwEycHH4eZzgOk/Wk/2fyF4uoXDQTkAVmRBUARivDSZ6aSJImU/jl8w5aBdJawO9DZfG5v4U7gx/sIHsBeZb/7OkVIVxUPfR6q/m8OF/b9G5ArSSxIFWPUYNPZQ38K8vcuCY+L5hWxwRyq6r8TahVIHwMXlPLLUALKavFj/oOmH0TZhFgUH1FbDh9J1C86MT5h6fYLINK1XJUmW2U5MFncdhZiHEKHvHQ3IszNFmaK+bTbAB6q5ITeukVELXIrn9xK5rvVzeycMknCxgDBBEX4X9njzhKeO7MJvGwRCuGWDYR75W2K8WLl+iK/ilInzpzLKZdIc93fZbLiPN4GS6a4oAoREvXBEfTSnHWn1dJXHvtrPq2ah5REG02LqkFQ5WEigspLWCcDhITXZuyAXDsn2lD0PwU/jDyFE3KRzAvH0K0U8MCWB5nFx3eNpXMT5vkrU/xMUTzsgKtxLckMNE0Ql7y3ytWXRNM6Wm5gTK+JeznG1Q+/tpSEKO0TFQ6RdkGzBMmpsyk4uhRWGBXWqKsBKGpMQRmu6LkDPF9Cb6TeD5ZG6cy9auNfOtnChQlyu1vQOwEvyDHw3zsaDIzj8+kh2wcWZC7kJ3OyPTZQWW+UdZ2/t0yKT6ex58JhA/sBvcHMBax1DKhs8ztRLPQteOlXZrpR59WyBf/ClRxScwDzXFOpEy0hoH2qe0nHBXAEP0mqlIks8hXGIJG9FH6l8RbW5DL9IsvUHEkCidbrJ2xEwFrR+5TGlNch7NVO9NiRv0ctzAwT0Zcbho52KHLXNqiP/rOca6OpDz6lvhoEqOrOlbbwCKw4fsO5m24a+5ZZ2qJlvCQzpaYjayRWNiy0PYsC+IAIF/ZhHLPiGJm+inax01HcZcrEDzO7HT4rmUKNHnoMPH1xkSP/hm8/e7m9AeBGbm3LIpO/+aiv43I+KBTyLByXRhViWHTIk7ydY3e2LrR5jeC/FHI2941UB9bnwqvIGESPG5knFB9AYO+Po7Os5w68CLuyWtxrmhVo67tscnd1I3MzLVqFSPH5r9cbYMgsYOiVBgnIJI4CUngE9LHUD02uRmZWxtV8pRkzXrDC6DcmDaUnQTgS49wzrNlkQXAJnFMuuWS0b1mnyI+MJ/3SycXphY6zadjSS4yCuY1jLJ7Mj4Pu0q3RJjRAkntmQtz5ETg5SG55Uyca/nOmqD5v4a/ui3QOA7DZgdSPc1ei386bjuT8AtSQjuCfvsjjy5kfGWAmgqjVSi0e/y8Zw6ss0rajpa2UNcRrBwOTQTmtGlQ3E7PceZq61Qe3UVJfW4YbmKlerYiDCkhtcj1cMtVIxbT06jK2nKq4j6zEQO+abWO5TuFGCXaI07BP1AaCv34CxBcHyWq5aToKDnBrHhpzgmy3VubuxcbfFwt6KN5tOzjt6Sn1QzrW/Lrc1YKii0FEzpcLQw4HjqYtMe/beZIvS1eETa5MTllThpw1/VzmWg5TGqWKotQS9QTNewngCjIBpW1HS1soa4jSIff9gT0xGKLOTQO57F+7ew8Wx/X+DFS3Gp4tW5uJFXmHop0lhnpjZatsd9NXX/IPLPk8THqs1YI55WH5+KZljojHj5qp1LYD/EcVIP9kYoBZD1VS6cDPgN3fjxvjGnhXPfKgp5hynGYVrQWOJnkAc5gQ/HyR4Acf4eG+KSH3ir+CL/jPK92K1b2PdkZWpwz832MO28j+sNvpToi2xl5o7g0pMpVVpHuLJ04ExI4/qaUubzTqIBWD1r1N4vhPC6m4FxD/Ofb39iQirViWehAAAAAAAAAAAAAAAAAAAAAAYCHUQCfH/ws44iWF59OmnRU+t6bnsLAAAAAAAAAABYJWRZgypSLTAhydaOLqlIAActXQhrrISbCbIAAAAABam5d9JrrkjHITW34Lf+/zQTuBjZ24v3WpPe44SZEWxWrJ54AOcdwl3cwMRn7DyWHUoPKBFQAAAAAABILaaBtMImvYOna0XsZmmubmc3b0//OrzWGWIaqpEa565AZahToXwkc0Q1vobib3AvuA7uJWjfErgAAAAAAAAAAAAAA="
-    CouldNotFindQGroupPicture = "UklGRtoMAABXRUJQVlA4WAoAAAAQAAAAjwEAjwEAQUxQSH4IAAABHAVpGzCtf+U7AiIieTDgCo5tW22r29DKI5ADS5pC8I+Vs2lZVplZzH8Iyh23ehExAT5ubdMkbdu237tycHBwcHLwxsHBwRsHBwcvEJEffRznVeOyIyImAEtVnN8/tfNB3NWfe75X2HR/7Xxw76779bT1gd6e1omMD/gmWiFpfNBvkkWZD/7Zgl9PwP9ZhadgMSPxJEwnooYFbTRmPA3NiPZE1APLBAsg9lTcAxcuXKB6LvQq9mSMczbkDzY8SjaUFRsqxwbnxf/if/G/+F/8L/4X/4v/xf/if/G/+F/8L/7/z///4TaXv7hqOIT8z2g9/h9ypV+vhD9Y4Q8G9WA9f1dXCzfG+BeFdIr/mDZ+lFxy/ps+yuFay76jfheBuPmaf1AZpwgkSfnfoVXDNuo/JMH1g6S2lrsv+yhbknKfcavQ85vY3YKkCNdnBciSAqybXNMba/RyyEBWGFC+SqPG7xLUra38jaU3Bez3SGsk7Tbiq5xzhb5h2wSzN3JYRRKMz/rNBeScs5m3ZW8yjPYor8l6lM9mZm3O9J0BQRL4RyvdhNqDZL9ImDPoXFY6RbM6wb1ZgyXFRpWUgFFehQXEjfDVumlQt5z75En0ybd+PbnMhtvRLekPHcgH4ik8W4xTmLMWqT8r9ht0su5thMMxkiRlGJKGuyTb9P4CsrTg+ugCCFJYrKDjZIUH5w4j7waec9B7ZtBuQ385H6xyuKaFJ0Azs+oDVpP8UaDZL5BxPe32JK+VDn0b24CVPlCFKDnUj9qCLqkwi44Ril4XqNozFH0ZwQ6+7C8AptcKuO1jrfRkQsu7DRjSfJCyMX+CTnkURngCJhmYQp+4FJgr6cswmg7+TRgwsiTHdTa63gewm6lP84PhfxCBqZi3VbeS9NjBtWcABcCHn1u18ANECI9U7YGB59zBS6VtiZX02qxEHb+zxeySEivctBU+UCMfZFlSs/DBtH3SnoQcnhWgSMpA1ZfjTYapc7/0GxpLz7NLCrm5+4JhNsHMUmhZUg5SGfHZAuywPnOfHiTZSrpNUWmO8CAUSbmveEhRUme8SdByvjZL+VjM16zPGkzd2Ce8MainC4u/QcdfCN07FGnSZf5wwJu0gLjxVemrp8uSzinv5kB5IG+SG7YlVpAy5BeCqt2xWGy/cm3enk3IfzPfNEinxrLfYP3FgiyB6cyI+jQDTVL4KszVTbmB72u6e7NyAfbkollfJwOT5Cu98zspao+T8SyAaTcgf+JbrHfOug4B6L8BfwGELd5RvlFhmaTrq4p3KQGSFHCd32hOYIUblxSi3q6bwSXZwYD4KDP0IHw1VGq5gbzKZoD/OFYBs8bQA/9IV5KkCtgHGVaQBERJGdLdCo8KgOmRFMMLh+Vj9UmWct0WVD22lU4Vuj5t4LIxDx7o8hUkTcB+nNRgmBn1H3AeQLwpJZzChJklOWRJBvnO9DQMoOnY7+Yqb1y7bxpFKrDCsxh1dijf2OYQD9cIMqqUAdKvEd+oQ5FkYYs5ZyDn5vZVBJaOYUA/GassLslO/SYUVnjUAerJwSSFC3hTH5VZNOHSxwPiXZj13cxbS1FKkNWBod9wMW7qq8EKus9mDXBvdt2lfFvMzAePh5dDZCWBSQmauwPD3afXYXoYHBas5vuC5TC92/XMsEfqq0HX82glxwOg+7yIdxmaHM8CTPtkRID8I3QIp3aI4w6ajqHoOEHPzZrv1XaAKye99JGktWkSJQcna4/hScdLAIqkXGBaDvqwPIibOazwIuRi3Sf78vtJ1SN7UA4GC+j6EQvY6Srb5TcZLBzGsIO/enkBXa+DJUl+uEy6oGussLURHhyBJkkXkPVp2pJ10B4A09cGdcx8G/T0NA/5ENlX/BUCrHhQ39xujDnxHf4RDcjKvTw794OksBjBmENSBnuRgLEZgH2QrOIDYJ0igH1VIVayvlxcGiBNCAe1zfQzNhjhULNUZrhxVsMkyV+FdX0QAJcu8PTObsKghczKFMmhPAsDYKtwLVp41Th78nlwaNA+clyRFb7oM4ut1q5zAqZ+x7BghC26jKxzYFi9mZ73DjlfZmN+YbCCJAfqq0LdwsCUFl1MGTQ9H+xRkuMyGPFN8DXBs+S+GcMmMMInUCRnhA8kRZh6bADtd1BasKqZNeYqui3kfOf1Mqs+wcxyjvowLMiSFBfQ3mRcUpozKwya2qKudel5Y11AlgRFYcHKL6RklqSbzEzqAPP6ILOClGGkTy4YOce7xALw/DMoDW5X0n2riu20yNoN9LmB6WgA5UU45BIUxsiyuYCk54WZdMpMSRcLypt775JsBCk4gH1QaZLUYOUvKticeDqNNY19tRJ+A+lqPhjdVngwguR0KRuEu/BVgqZbB/yFDrtdUhmeYNGuJ5kedFPJktTGWkz7yCTFoP2q7dKHc8UtLqCGd4OptIC0NUZQOUD+Fe6tPoiSOmt4K0wdC+SPwqLpPgH2xu8kVVYUpAWMHk8pSpKDpNm1hwEs7Lu/vTAdC8Aq4UUEkzJUk2Q0SSoLoOjXDCvd7dGSJOV6yqBv01pFTw3Km/YgOCNpCw6McDofIvGg4DBK+MT+rs9wUmNfLTwqrCCpsEwKNesYzL3o9yzx2fvl3yRa1PPLwpvSb8qiBW1Zylb0vA2WpKT7FPUvjWTdt42hx45pLxb163f75p8Y8o1ZlJQHRH0YOq7/jWZ6ejnT9LxX/b+jzaZvU/gfkfSf/8X/4n/xv/hf/C/+F/+L/8X/4n/xv/hf/C/+F5w7NriKDVXJhvLBhkfOhnzPhr3qudArXLhwBfZc2AOwTLAAoJmgBzA8MBiNWha0uzEkLEgxXXCgwNxfBvxjfhb+MixNm7DXpFi+MyHP7LCqtqHOaqy+v/bhrb/usana54+ydmHM1eWj2CssBVZQOCDgAwAA8DoAnQEqkAGQAT/9/v9/v7m3MiE3SGvwP4lnbuF2sRpAQtd1csU+H7XxEH1kPamnyIg+sh7U0+REH1kPamnyIg+sh7U0+REH1kPamnyIg+sh7U0+REH1kPamnyIg+sh7U0+REH1kPamnyIg+sh7U0+REH1kPamnyIg+sh7U0+REH1kPamnyIg+sh7U0+REH1kPamnyIg+sh7U0+REH1kPamnyIg9PgGtkAJg47waTU98YkTAvPonuWecyGixUko0gMHe34c3jjlRzGZPkRBZfl3eMb7h2DA0kZXAOhgYAYS2QAwjA1d/MiQ5pQFRs9/MpaIIm9YI5PUT0yVvRPb70BNEuaI3+n3IUwPZPW4oQR0XAeYVznkTnObfAMKZyDe3/Rjhg3LbYjZayrIeZAoIXCgSC9+BUYJcl0LyQA/kgUbuq4YmS0ZyZfvsWolQa6V/oJoePZofQJ41jxPYTYIcuQFs9qdh3Zv8OpZAzQiofXxEH1kPamoIT2fkIqH18RLvuQiofZh7U0+REH1kPamnyIg+sh7U0+REH1kPamnyIg+sh7U0+REH1kPamnyIg+sh7U0+REH1kRuqH18RB9ZD2pp8jw5p8iIPrIe1NPkSJehNntTT5EQfWQ+cfWQ9qaTAAP7/CAAAAAAAAAAAAAVbGLiSJBLiSlAtTwhH7oaqnPl+S7jJj/IDo2s8wt/KVfcAjdAkl3Zxt7NPuAblW+A4cw1reT/FRaMtA/L645uWdz3YKunX0XihspMFKQmEGpy8mc2H9CT6LngE/pEk+kDFb6jHjux30gmIV5JyaU4spGt5WFqXibh3FROAqbZe9UovC8cdShJjP9QC1Xa7ALZlxoQINWptxR4PNwmNgCoeTPQAHO8fEQEtGDs3Zc0UknTNh3AMr04FAoeLOFy5Ydr8ZNxXYS3uiHWj5JheFCwhZBc2U7KX3UmOOnODiMcyBZUhY/4OMc5udXpKLoyKYqri3GXDmoJW1jNzgmtumLAiEmlcH9+iahHTpF+wQjJ3qntZudJGXxbIOjkGzqwXT1DBh5Cmp3cpFx5fLMpLwAI+Wcr2FleEb7oRXiKAVXiDPDF+Ag/YFVGsETwS+jidm8yv26BYAAnERpWnDfV7alD6Gp8/FJZomaC7QkGSo+GtwTaQaUsyCeFJB6C7eog7pwEU3K4ryuQxn7tei3Q92DfkAPstxMtStIE/k21/hhI9JpG7DTcpu3sJQpNAipnJ9s/d/XVvArboTNL7rKdqL+0TfDkkBZL7rWhuPy/r6IUD7/1PTBqar+GlmGEOAEAKMoJh/wQECI8FsAgAAA0QIAAAAABQU0FJTgAAADhCSU0D7QAAAAAAEABIAAAAAQACAEgAAAABAAI4QklNBCgAAAAAAAwAAAACP/AAAAAAAAA4QklNBEMAAAAAAA5QYmVXARAABgAAAAAAAA=="
-    MinecraftFont = "C:\\Users\\esaps\\Desktop\\esap_minecraft_bot\\MinecraftFont.ttf"
-    ChineseFont = "C:\\Users\\esaps\\Desktop\\esap_minecraft_bot\\MinecraftFont.ttf"
+
+    @staticmethod
+    def path(name: str) -> Path:
+        """获取资源文件路径"""
+        if name in IMAGES:
+            return RESOURCES_PATH / IMAGES[name]
+        if name in FONTS:
+            return RESOURCES_PATH / FONTS[name]
+        raise KeyError(name)
+
+    @staticmethod
+    def missing_fonts() -> list[Path]:
+        """FONTS中文件不存在的字体路径（去重）"""
+        return sorted({RESOURCES_PATH / file for file in FONTS.values() if not (RESOURCES_PATH / file).is_file()})
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def read(name: str) -> bytes:
+        """读取资源文件的原始字节，只读一次"""
+        return PictureDefine.path(name).read_bytes()
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def base64_str(name: str) -> str:
+        """资源的base64字符串（不带base64://前缀），只编码一次"""
+        return base64.b64encode(PictureDefine.read(name)).decode("utf-8")
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def image(name: str):
+        """解码后的PIL图片，只解码一次；返回的是共享对象，修改前请先copy"""
+        from PIL import Image  # pylint: disable=import-outside-toplevel
+        with Image.open(PictureDefine.path(name)) as img:
+            img.load()
+            return img.copy()
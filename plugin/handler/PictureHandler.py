@@ -6,63 +6,121 @@ Use of this source code is governed by a GPL-3.0 license that can be found in th
 Author: AptS:1547
 
 PictureHandler类用于处理图片的生成，提供了以下方法：
-MakePicture: 生成最终返回的图片
+make_picture: 在预合成底图上绘制动态层，生成最终返回的图片
+base_image: 获取按布局和背景缓存的预合成底图（静态层，不含图标）
+paste_icon: 粘贴IconCache中缓存好的圆角图标
 open_base64_image: PIL打开base64图片
-round_corner: 给图片加上圆角效果
-left_middle_font: 在图片左方模块写字
-right_middle_font: 在图片右方模块写字
+round_corner: 给图片加上圆角效果（即IconCache.round_corner）
+fit_font: 按最大宽度缩小字号
+draw_text: 按布局绘制单个文本元素
+split_motd: 把MOTD拆成带颜色的行
 dealing_motd: 处理MOTD
-check_motd_length: 检查MOTD长度
 """
 
 import base64
+from collections import OrderedDict
 from io import BytesIO
-from PIL import Image, ImageDraw, ImageFont, UnidentifiedImageError
+from PIL import Image, ImageDraw, UnidentifiedImageError
 
 from mcstatus.motd.components import Formatting, MinecraftColor
 
 from .PictureDefine import PictureDefine                               #pylint: disable=relative-beyond-top-level
+from .IconCache import IconCache                                       #pylint: disable=relative-beyond-top-level
+from .MemoryBudget import MemoryBudget                                 #pylint: disable=relative-beyond-top-level
+from .ParseLayout import ParseLayout, LayoutPlan, IconSpec, TextSpec, MotdSpec  #pylint: disable=relative-beyond-top-level
+
+MOTD_COLORS = {
+    MinecraftColor.BLACK: (0,0,0),
+    MinecraftColor.DARK_BLUE: (0,0,170),
+    MinecraftColor.DARK_GREEN: (0,170,0),
+    MinecraftColor.DARK_AQUA: (0,170,170),
+    MinecraftColor.DARK_RED: (170,0,0),
+    MinecraftColor.DARK_PURPLE: (170,0,170),
+    MinecraftColor.GOLD: (255,170,0),
+    MinecraftColor.GRAY: (170,170,170),
+    MinecraftColor.DARK_GRAY: (85,85,85),
+    MinecraftColor.BLUE: (85,85,255),
+    MinecraftColor.GREEN: (85,255,85),
+    MinecraftColor.AQUA: (85,255,255),
+    MinecraftColor.RED: (255,85,85),
+    MinecraftColor.LIGHT_PURPLE: (255,85,255),
+    MinecraftColor.YELLOW: (255,255,85),
+    MinecraftColor.WHITE: (255,255,255),
+    MinecraftColor.MINECOIN_GOLD: (221,214,5),
+}
 
 class PictureHandler:
     """图片处理类"""
-    def __init__(self, information: dict) -> None:
+    BASE_CACHE_SIZE = 2         # 预合成底图缓存数量（当前布局和切换前的布局），每张约9MB（2304x1296 RGB）
+
+    _base_images: OrderedDict = OrderedDict()
+    _base_memory = MemoryBudget.register("picture.base", _base_images, priority=3)   # 最后淘汰，重新合成底图最慢
+
+    def __init__(self, information: dict, layout: str | None = None) -> None:
         """
         输入格式：
             Information应该包括服务器地址、端口、版本、MOTD、服务器图标以及当前在线玩家数和玩家名称等
             base64image不能有data:image/png;base64,前缀
+            layout为XML布局文件路径，为空时使用默认布局
         """
         self.information = information
-        self.left_font_location = PictureDefine.MinecraftFont
-        self.right_font_location = PictureDefine.MinecraftFont
-        self.image = self.open_base64_image(PictureDefine.Background)
+        self.plan: LayoutPlan = ParseLayout.load(layout)
+        self.icon_key = information.get("IconKey")
+        if self.icon_key is None:               # 没有经过MinecraftServer.dealing_icon的信息
+            self.icon_key = IconCache.server_icon(information["Icon"]) if information.get("Icon") else "black"
+        self.image = self.base_image(self.plan).copy()
 
     def make_picture(self) -> Image.Image:
-        """生成最终返回的图片"""
-        # 服务器图标
-        icon = self.open_base64_image(self.information["Icon"]).resize((400, 400))
-        icon = self.round_corner(icon, 22)
-        icon_alpha_channel = icon.split()[-1]
-        self.image.paste(icon, (215, 200), mask=icon_alpha_channel)
-
-        text_list_left = [self.information["server_address"], f"{self.information['serverType']} {self.information['version']}"]
-
-        self.image = self.left_middle_font(self.image, text_list_left, (45, 215, 209))
-
-        # TODO:在图片右方模块写字，按理来说应该让这个函数确定绘制高度
+        """在预合成的底图上只绘制动态层（图标、玩家数、延迟、MOTD、版本等）"""
+        if self.plan.icon is not None:
+            # 图标不合成进底图：底图只按布局缓存，群再多也只有一张；缩放好的圆角图标由IconCache缓存，粘贴很快
+            self.paste_icon(self.image, self.plan.icon, self.icon_key)
 
-        text_start_height = 80
-        text_right = f"当前在线玩家数：{self.information['onlinePlayers']}/{self.information['maxPlayers']}"
-        self.image, text_start_height = self.right_middle_font(self.image, text_right, text_start_height, 80, (45, 215, 209))
+        draw = ImageDraw.Draw(self.image)
+        for text in self.plan.dynamic_texts:
+            self.draw_text(draw, text, text.template.render(self.information))
 
-        self.image, text_start_height = self.dealing_motd(self.image, text_start_height, self.information["MOTD"])
-
-        text_start_height += 50
-        text_right = f"服务器Ping请求所用时间：{round(self.information['pingLatency'],2)}ms"
-        self.image, _ = self.right_middle_font(self.image, text_right, text_start_height, 80, (45, 215, 209))
+        if self.plan.motd is not None:
+            self.dealing_motd(draw, self.plan.motd, self.information["MOTD"])
 
         return self.image
 
-    def open_base64_image(self, base64_str):
+    @classmethod
+    def base_image(cls, plan: LayoutPlan) -> Image.Image:
+        """
+        获取预合成的底图：背景、静态装饰和静态文本
+        按布局和背景缓存，布局文件变化后mtime不同，会自动生成新的底图
+        """
+        key = (plan.path, plan.mtime_ns, plan.background)
+        image = cls._base_memory.get(key)
+        if image is not None:
+            return image
+
+        image = PictureDefine.image(plan.background).convert("RGB")
+        if plan.rects:
+            overlay = Image.new("RGBA", image.size, (0, 0, 0, 0))
+            overlay_draw = ImageDraw.Draw(overlay)
+            for rect in plan.rects:
+                (x, y), (w, h) = rect.position, rect.size
+                overlay_draw.rounded_rectangle((x, y, x + w, y + h), radius=rect.radius, fill=rect.fill,
+                                               outline=rect.outline, width=rect.outline_width)
+            image = Image.alpha_composite(image.convert("RGBA"), overlay).convert("RGB")
+
+        draw = ImageDraw.Draw(image)
+        for text in plan.static_texts:
+            cls.draw_text(draw, text, text.template.render({}))
+
+        cls._base_memory.put(key, image, cls.BASE_CACHE_SIZE)
+        return image
+
+    @staticmethod
+    def paste_icon(image: Image.Image, spec: IconSpec, icon_key: str) -> None:
+        """粘贴IconCache中已缩放、已加圆角的图标"""
+        prepared = IconCache.prepared(icon_key, spec.width, spec.height, spec.round_corner)
+        image.paste(prepared, spec.position, mask=prepared.split()[-1])
+
+    @staticmethod
+    def open_base64_image(base64_str):
         """PIL打开base64图片"""
         try:
             image_data = base64.b64decode(base64_str)
@@ -70,177 +128,72 @@ class PictureHandler:
             img = Image.open(bytesio_obj)
             return img
         except UnidentifiedImageError:
-            image_data = base64.b64decode(PictureDefine.Black)
-            bytesio_obj = BytesIO(image_data)
-            img = Image.open(bytesio_obj)
-            return img
-
-    def round_corner(self, img: Image.Image, rad: int = 0) -> Image.Image:
-        """给图片加上圆角效果"""
-        circle = Image.new('L', (rad * 2, rad * 2), 0)
-        draw = ImageDraw.Draw(circle)
-        draw.ellipse((0, 0, rad * 2, rad * 2), fill=255)
-        alpha = Image.new('L', img.size, 255)
-        w, h = img.size
-        alpha.paste(circle.crop((0, 0, rad, rad)), (0, 0))
-        alpha.paste(circle.crop((0, rad, rad, rad * 2)), (0, h - rad))
-        alpha.paste(circle.crop((rad, 0, rad * 2, rad)), (w - rad, 0))
-        alpha.paste(circle.crop((rad, rad, rad * 2, rad * 2)), (w - rad, h - rad))
-        img.putalpha(alpha)
-        return img
-
-    def left_middle_font(self, img: Image.Image, text: list, rgb: tuple = (0,0,0)) -> Image.Image:
-        """在图片左方模块写字"""
-        draw = ImageDraw.Draw(img)
-        font_size = 80
-        text_start_height = 682
-
-        for text_line in text:
-            font = ImageFont.truetype(self.left_font_location, font_size)
-            (text_width, text_height), (_, _) = font.font.getsize(text_line)
-
-            while text_width > 680:
-                font = ImageFont.truetype(self.left_font_location, font_size)
-                (text_width, text_height), (_, _) = font.font.getsize(text_line)
-                font_size -= 1
-            draw.text(((830 - text_width) // 2, text_start_height), text_line, font=font, fill=rgb)
-            text_start_height += text_height + 50
-        return img
-
-    def right_middle_font(self, img: Image.Image, text: str, height: int, font_size: int = 80, rgb: tuple = (0,0,0)) -> tuple:
-        """在图片右方模块写字"""
-        draw = ImageDraw.Draw(img)
-
-        font = ImageFont.truetype(self.right_font_location, font_size)
-        (text_width, text_height_right), (_, _) = font.font.getsize(text)
-
-        while text_width > 1297:
+            return PictureDefine.image("Black").copy()
+
+    round_corner = staticmethod(IconCache.round_corner)
+
+    @staticmethod
+    def fit_font(font_path: str, font_size: int, text: str, max_width: int = 0) -> tuple:
+        """按最大宽度缩小字号，返回(字体, 文本宽度, 文本高度)"""
+        font = ParseLayout.font(font_path, font_size)
+        (text_width, text_height), (_, _) = font.font.getsize(text)
+        if max_width <= 0 or text_width <= max_width:
+            return font, text_width, text_height
+        # 文字宽度和字号近似成正比，先按比例估算再微调，避免逐个字号试探
+        font_size = max(1, font_size * max_width // text_width)
+        font = ParseLayout.font(font_path, font_size)
+        (text_width, text_height), (_, _) = font.font.getsize(text)
+        while text_width > max_width and font_size > 1:
             font_size -= 1
-            font = ImageFont.truetype(self.right_font_location, font_size)
-            (text_width, text_height_right), (_, _) = font.font.getsize(text)
-
-        draw.text((928, height), text, font=font, fill=rgb)
-
-        height = height + 50 + text_height_right
-        return img, height
-
-    def dealing_motd(self, img: Image.Image, height: int, motd_parsed = None) -> tuple:     #绘制位置（928,180）
+            font = ParseLayout.font(font_path, font_size)
+            (text_width, text_height), (_, _) = font.font.getsize(text)
+        return font, text_width, text_height
+
+    @classmethod
+    def draw_text(cls, draw: ImageDraw.ImageDraw, spec: TextSpec, text: str) -> None:
+        """按布局绘制单个文本元素"""
+        font, text_width, _ = cls.fit_font(spec.font, spec.font_size, text, spec.max_width)
+        x, y = spec.position
+        if spec.alignment == "center":
+            x -= text_width // 2
+        elif spec.alignment == "right":
+            x -= text_width
+        draw.text((x, y), text, font=font, fill=spec.color)
+
+    @staticmethod
+    def split_motd(motd_parsed: list) -> list[list]:
+        """把MOTD按换行拆成最多两行，每行是(文本, 颜色)列表"""
+        lines = [[]]
+        color = None
+        for item in motd_parsed:
+            if item == Formatting.RESET:
+                color = None
+            elif isinstance(item, MinecraftColor):
+                color = MOTD_COLORS.get(item)
+            elif isinstance(item, str) and not isinstance(item, Formatting) and item != "":
+                parts = item.split("\n")
+                for index, part in enumerate(parts):
+                    if index > 0:
+                        lines.append([])
+                    if part != "":
+                        lines[-1].append((part, color))
+        return lines[:2]
+
+    def dealing_motd(self, draw: ImageDraw.ImageDraw, spec: MotdSpec, motd_parsed = None) -> None:
         """处理MOTD，暂时不作字体样式的处理"""
-        draw = ImageDraw.Draw(img)
-        index, motd_style, motd_color = "", "", ""
-        motd_str = ""
-        motd_str1 = ""
-        motd_str2 = ""
-
-        if motd_parsed is None:
+        if not motd_parsed:
             motd_parsed = ["epmcbot提示: 本服务器没有MOTD"]
 
-        if '\n' in motd_parsed:                # 如果有换行符，获取换行符的位置
-            index = motd_parsed.index('\n')
-        else:
-            index = -1
-
-        for item in motd_parsed:                   # 获取每一行字符串的长度
-            if index == -1 and isinstance(item, str):
-                motd_str += item
-            if index != -1 and isinstance(item, str):
-                if motd_parsed.index(item) < index:
-                    motd_str1 += item
-                elif motd_parsed.index(item) > index:
-                    motd_str2 += item
-
-        if index == -1 :
-            font_size2 = 80
-            text_height2 = 70
-            font_size1, text_height1  = self.check_motd_length(motd_str)
-        else:
-            font_size1, text_height1  = self.check_motd_length(motd_str1)
-            font_size2, text_height2 = self.check_motd_length(motd_str2)
-
-        text_height = min(text_height1, text_height2)
-
-        font = ImageFont.truetype(self.right_font_location, font_size1)
-        start_text_length = 928
-        start_text_height = height
-
-        for item in motd_parsed:                   # 开始绘制
-            if motd_parsed.index(item) == 0:       # 设置初始绘制的样式和颜色
-                motd_style = None
-                motd_color = (255,255,255)
-            elif item == "\n":  # 绘制第二行 - 准备工作
-                start_text_length = 928
-                start_text_height += text_height + 50
-                font = ImageFont.truetype(self.right_font_location, font_size2)
-                continue
-
-            if item == Formatting.RESET and motd_str != "":  # 重置字体样式，并绘制先前已经保存的字符串
-                motd_style = None
-                motd_color = (255,255,255)
-            elif isinstance(item, Formatting):   #返回字体样式
-                match item:
-                    case Formatting.RESET:
-                        motd_style = None
-                    case Formatting.BOLD:
-                        motd_style = "bold"
-                    case Formatting.ITALIC:
-                        motd_style = "italic"
-                    case Formatting.UNDERLINED:
-                        motd_style = "underlined"
-                    case Formatting.STRIKETHROUGH:
-                        motd_style = "strikethrough"
-                    case Formatting.OBFUSCATED:
-                        motd_style = "obfuscated"
-            elif isinstance(item, MinecraftColor): #返回字体色号RGB
-                match item:
-                    case MinecraftColor.BLACK:
-                        motd_color = (0,0,0)
-                    case MinecraftColor.DARK_BLUE:
-                        motd_color = (0,0,170)
-                    case MinecraftColor.DARK_GREEN:
-                        motd_color = (0,170,0)
-                    case MinecraftColor.DARK_AQUA:
-                        motd_color = (0,170,170)
-                    case MinecraftColor.DARK_RED:
-                        motd_color = (170,0,0)
-                    case MinecraftColor.DARK_PURPLE:
-                        motd_color = (170,0,170)
-                    case MinecraftColor.GOLD:
-                        motd_color = (255,170,0)
-                    case MinecraftColor.GRAY:
-                        motd_color = (170,170,170)
-                    case MinecraftColor.DARK_GRAY:
-                        motd_color = (85,85,85)
-                    case MinecraftColor.BLUE:
-                        motd_color = (85,85,255)
-                    case MinecraftColor.GREEN:
-                        motd_color = (85,255,85)
-                    case MinecraftColor.AQUA:
-                        motd_color = (85,255,255)
-                    case MinecraftColor.RED:
-                        motd_color = (255,85,85)
-                    case MinecraftColor.LIGHT_PURPLE:
-                        motd_color = (255,85,255)
-                    case MinecraftColor.YELLOW:
-                        motd_color = (255,255,85)
-                    case MinecraftColor.WHITE:
-                        motd_color = (255,255,255)
-                    case MinecraftColor.MINECOIN_GOLD:
-                        motd_color = (221,214,5)
-                    # 超绝高血压
-            elif isinstance(item, str) and item != "":
-                (text_width, _), (_, _) = font.font.getsize(item)
-                draw.text((start_text_length, start_text_height), item, font=font, fill=motd_color)
-                start_text_length += text_width
+        lines = self.split_motd(motd_parsed)
+        fitted = [self.fit_font(spec.font, spec.font_size, "".join(text for text, _ in line), spec.max_width) for line in lines]
+        text_height = min(height for _, _, height in fitted)
 
-        return img, height + 100 + text_height*2
+        start_text_height = spec.position[1]
+        for line, (font, _, _) in zip(lines, fitted):
+            start_text_length = spec.position[0]
+            for text, color in line:
+                (text_width, _), (_, _) = font.font.getsize(text)
+                draw.text((start_text_length, start_text_height), text, font=font, fill=color or spec.color)
+                start_text_length += text_width
+            start_text_height += text_height + spec.line_spacing
 
-    def check_motd_length(self, motd: str) -> tuple:
-        """检查MOTD长度"""
-        font_size = 80
-        font = ImageFont.truetype(self.right_font_location, font_size)
-        (text_width, text_height), (_, _) = font.font.getsize(motd)
-        while text_width > 1297:
-            font_size -= 1
-            font = ImageFont.truetype(self.right_font_location, font_size)
-            (text_width, text_height), (_, _) = font.font.getsize(motd)
-        return (font_size, text_height)
@@ -0,0 +1,84 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+Ping请求合并类 PingCoalescer.py 2026-10-19
+Author: AptS:1547
+
+PingCoalescer类把同一个群对同一个地址的并发~ping合并成一次查询，提供了以下方法：
+run: 有相同的查询正在进行时等待它的结果，冷却时间内直接返回最近的结果，否则发起新的查询
+peek: 只查冷却时间内的最近结果，不发起查询
+refresh: 不管最近的结果是否还在冷却时间内，重新查询并记录（后台预热默认服务器的卡片使用）
+
+群里多人同时~ping时只探测、渲染、编码一次，每个人都用同一张图片回复，CPU和网络开销不随人数增长
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .MemoryBudget import MemoryBudget, estimate_size  # pylint: disable=relative-beyond-top-level
+
+
+class PingCoalescer:
+    """Ping请求合并"""
+    MAX_RECENT = 256            # 最多保留的最近结果数量
+
+    _inflight: dict[tuple, asyncio.Task] = {}
+    _recent: OrderedDict = OrderedDict()      # key -> (完成时间, 版本, 结果)
+    # 结果里是base64图片，冷却时间过后本来也不会再用
+    _recent_memory = MemoryBudget.register("ping.recent", _recent, priority=1, min_entries=0,
+                                           sizeof=lambda value: estimate_size(value[2]))
+
+    @classmethod
+    async def run(cls, key: tuple, job: Callable[[], Awaitable[Any]], cooldown: float = 0.0, version: Any = None) -> Any:
+        """
+        合并执行查询
+        :param key: 合并键，一般是(群号, 服务器地址)
+        :param job: 真正执行查询的协程函数
+        :param cooldown: 冷却时间（秒），冷却时间内相同的查询直接返回最近的结果，0为不缓存
+        :param version: 结果依赖的配置快照，快照被替换后最近的结果作废
+        """
+        recent = cls.peek(key, cooldown, version)
+        if recent is not None:
+            return recent
+
+        return await cls._join(key, job, cooldown > 0, version)
+
+    @classmethod
+    async def refresh(cls, key: tuple, job: Callable[[], Awaitable[Any]], version: Any = None) -> Any:
+        """重新查询并记录结果，有相同的查询正在进行时等待它"""
+        return await cls._join(key, job, True, version)
+
+    @classmethod
+    async def _join(cls, key: tuple, job: Callable[[], Awaitable[Any]], remember: bool, version: Any) -> Any:
+        """加入正在进行的相同查询，没有时发起新的查询"""
+        task = cls._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(cls._run_job(key, job, remember, version))
+            cls._inflight[key] = task
+        # shield：某个发送者的处理被取消时，其他人还在等的查询不能跟着被取消
+        return await asyncio.shield(task)
+
+    @classmethod
+    def peek(cls, key: tuple, cooldown: float, version: Any = None) -> Any:
+        """冷却时间内、同一个配置快照下的最近结果，没有时返回None"""
+        if cooldown <= 0:
+            return None
+        recent = cls._recent_memory.get(key)
+        if recent is not None and recent[1] is version and time.monotonic() - recent[0] < cooldown:
+            return recent[2]
+        return None
+
+    @classmethod
+    async def _run_job(cls, key: tuple, job: Callable[[], Awaitable[Any]], remember: bool, version: Any) -> Any:
+        """执行查询并记录结果"""
+        try:
+            result = await job()
+        finally:
+            cls._inflight.pop(key, None)
+        if remember:
+            cls._recent_memory.put(key, (time.monotonic(), version, result), cls.MAX_RECENT)
+        return result
@@ -0,0 +1,131 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+在线玩家跟踪类 PlayerTracker.py 2026-10-19
+Author: AptS:1547
+
+PlayerTracker类按(群号, 服务器地址)记录扫描器最近看到的在线玩家，~who直接从这里回答，不再Ping服务器，提供了以下方法：
+intern: 玩家名字经过共用的驻留表，所有服务器、所有扫描轮次引用同一个字符串对象
+update: 记录一次扫描看到的玩家，和上一轮做集合差得到加入/离开的玩家
+prune: 丢弃不再扫描的服务器
+online: 一个服务器当前的玩家（名字排序）、名单是否完整和最近的加入/离开记录
+
+玩家名单来自Java版status的players.sample（服务器最多只给十几个，人多时是随机的一部分），
+开启mc_query_enable时改用GameSpy4 Query（server.properties中enable-query=true）的完整名单；基岩版没有名单
+名单完整（名单人数不少于在线人数）时直接和上一轮比较；不完整时只能知道谁来了，
+连续PARTIAL_TICKS轮都没有出现在名单里的玩家才算离开
+第一次扫描到的服务器和重新连接上的服务器只记录名单，不产生加入记录；服务器离线时清空名单，也不记为离开
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+from .MemoryBudget import MemoryBudget  # pylint: disable=relative-beyond-top-level
+
+PARTIAL_TICKS = 3           # 名单不完整时，连续这么多轮没有出现的玩家视为离开
+EVENT_HISTORY = 20          # 每个服务器保留的加入/离开记录数
+ZERO_UUID = "00000000-0000-0000-0000-000000000000"   # 部分服务端用players.sample显示公告文字，这些条目不是玩家
+
+
+@dataclass(slots=True)
+class PlayerState:
+    """一个服务器的在线玩家：名字 -> 最后一次出现在名单中的时间"""
+    players: dict[str, float] = field(default_factory=dict)
+    complete: bool = True
+    events: deque = field(default_factory=lambda: deque(maxlen=EVENT_HISTORY))     # (时间, 是否加入, 名字)
+    updated: float = 0.0
+
+
+class PlayerTracker:
+    """扫描器看到的在线玩家"""
+    _names: dict[str, str] = {}         # 驻留表：名字 -> 同一个字符串对象
+    _uuids: dict[str, str] = {}         # 名字 -> UUID（Query的名单没有UUID）
+
+    def __init__(self) -> None:
+        self.states: dict[tuple[int, str], PlayerState] = {}
+
+    @classmethod
+    def intern(cls, name: str, uuid: str = "") -> str:
+        """名字经过驻留表，返回共用的字符串对象；有UUID时一起记下"""
+        name = cls._names.setdefault(name, name)
+        if uuid:
+            cls._uuids[name] = uuid
+        return name
+
+    @classmethod
+    def sample_names(cls, sample) -> tuple[str, ...]:
+        """mcstatus的players.sample（或Query的名字列表）转换为驻留后的名字，去掉公告文字之类的假条目"""
+        names = []
+        for player in sample or ():
+            if isinstance(player, str):
+                names.append(cls.intern(player))
+            elif player.id != ZERO_UUID and "§" not in player.name:
+                names.append(cls.intern(player.name, player.id))
+        return tuple(names)
+
+    def update(self, key: tuple[int, str], information: dict | None, now: float | None = None,
+               interval: float = 0.0) -> tuple[frozenset, frozenset]:
+        """
+        记录一次扫描的结果
+        :param information: 服务器信息（playerSample为驻留后的名字），离线时为None
+        :param interval: 扫描间隔（秒），名单不完整时用来判断谁已经离开
+        :return: (加入的玩家, 离开的玩家)
+        """
+        now = time.time() if now is None else now
+        if information is None:
+            self.states.pop(key, None)
+            return frozenset(), frozenset()
+        current = frozenset(information.get("playerSample", ()))
+        complete = len(current) >= information["onlinePlayers"]
+        state = self.states.get(key)
+        if state is None:
+            self.states[key] = PlayerState({name: now for name in current}, complete, updated=now)
+            self._compact()
+            return frozenset(), frozenset()
+
+        previous = state.players.keys()
+        joined = current - previous
+        if complete:
+            left = frozenset(previous - current)
+            state.players = {name: now for name in current}
+        else:
+            for name in current:
+                state.players[name] = now
+            expire = now - PARTIAL_TICKS * interval
+            left = frozenset(name for name, seen in state.players.items() if seen < expire)
+            for name in left:
+                del state.players[name]
+        state.complete = complete
+        state.updated = now
+        state.events.extend((now, False, name) for name in sorted(left))
+        state.events.extend((now, True, name) for name in sorted(joined))
+        if joined:
+            self._compact()
+        return frozenset(joined), left
+
+    def prune(self, keys) -> None:
+        """只保留仍在扫描的服务器"""
+        keys = set(keys)
+        self.states = {key: state for key, state in self.states.items() if key in keys}
+        self._compact()
+
+    def online(self, key: tuple[int, str]) -> PlayerState | None:
+        """一个服务器的在线玩家，没有扫描到在线时返回None"""
+        return self.states.get(key)
+
+    def _compact(self) -> None:
+        """驻留表中不再被任何服务器引用的名字超过一半时重建驻留表"""
+        live = {name for state in self.states.values() for name in state.players}
+        if len(self._names) > 2 * len(live) + 256:
+            PlayerTracker._names = {name: name for name in live}
+            PlayerTracker._uuids = {name: uuid for name, uuid in self._uuids.items() if name in live}
+
+    @classmethod
+    def memory_usage(cls) -> tuple[int, int]:
+        """驻留表的(名字数, 估算字节数)"""
+        return len(cls._names), sum(len(name) for name in cls._names) + sum(len(uuid) for uuid in cls._uuids.values())
+
+
+MemoryBudget.register_probe("players.names", PlayerTracker.memory_usage)
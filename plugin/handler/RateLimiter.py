@@ -0,0 +1,87 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+发送限速类 RateLimiter.py 2026-10-19
+Author: AptS:1547
+
+RateLimiter类在本插件每次调用OneBot发送类API前按令牌桶限速，代替原来每条回复前固定的asyncio.sleep(0.5)，提供了以下方法：
+acquire: 按群号获取发送许可，有余量时立即返回，没有余量时等待到令牌补充（加上随机抖动）
+configure: 按配置更新令牌桶参数
+
+每个群一个令牌桶，再加上一个全局令牌桶：空闲时回复立即发出，只有真正出现突发时才会被平滑
+只在本插件自己的发送路径中调用（MessageDispatcher发送消息、贴表情），不影响同一个机器人上的其他插件
+"""
+
+import asyncio
+import random
+import time
+from collections import OrderedDict
+
+from .ConfigHandler import Config   # pylint: disable=relative-beyond-top-level
+
+
+class TokenBucket:
+    """令牌桶：rate为每秒补充的令牌数，burst为桶容量"""
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def reserve(self, now: float) -> float:
+        """预定一个令牌，返回需要等待的秒数（0表示立即可用）；令牌可以透支，排在后面的请求等得更久"""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class RateLimiter:
+    """OneBot发送限速"""
+    MAX_GROUP_BUCKETS = 1024      # 最多保留的群令牌桶数量，最久没发送的群先被丢弃（丢弃等同于桶已装满）
+
+    _settings: tuple = ()
+    _global_bucket: TokenBucket | None = None
+    _group_buckets: OrderedDict = OrderedDict()
+
+    @classmethod
+    def configure(cls, config: Config) -> None:
+        """按配置更新令牌桶参数，参数没有变化时什么都不做"""
+        settings = (config.mc_ratelimit_global_rate, config.mc_ratelimit_global_burst,
+                    config.mc_ratelimit_group_rate, config.mc_ratelimit_group_burst)
+        if settings == cls._settings:
+            return
+        cls._settings = settings
+        cls._global_bucket = TokenBucket(config.mc_ratelimit_global_rate, config.mc_ratelimit_global_burst)
+        cls._group_buckets.clear()
+
+    @classmethod
+    async def acquire(cls, group_id: int | None, config: Config) -> float:
+        """
+        获取一次发送许可，返回实际等待的秒数
+        :param group_id: 群号，私聊为None（只受全局令牌桶限制）
+        :param config: 当前配置
+        """
+        cls.configure(config)
+        now = time.monotonic()
+        wait = cls._global_bucket.reserve(now)
+        if group_id is not None:
+            bucket = cls._group_buckets.get(group_id)
+            if bucket is None:
+                bucket = TokenBucket(config.mc_ratelimit_group_rate, config.mc_ratelimit_group_burst)
+                cls._group_buckets[group_id] = bucket
+                while len(cls._group_buckets) > cls.MAX_GROUP_BUCKETS:
+                    cls._group_buckets.popitem(last=False)
+            else:
+                cls._group_buckets.move_to_end(group_id)
+            wait = max(wait, bucket.reserve(now))
+        if wait <= 0:
+            return 0.0
+        wait += random.uniform(0, config.mc_ratelimit_jitter_second)    # 抖动，避免排队的消息等间隔发出
+        await asyncio.sleep(wait)
+        return wait
@@ -0,0 +1,281 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+RCON客户端类 RconClient.py 2026-10-19
+Author: AptS:1547
+
+RconClient类按(地址, 密码)维护到各个服务器的RCON连接池，提供了以下方法：
+configure: 设置连接池大小、每个连接的流水线深度、超时和空闲时间，参数变化时关闭已有连接
+execute: 在群设置的RCON服务器（rcon_address/rcon_password）上执行一条命令，返回去掉颜色代码的输出
+close_all: 关闭全部连接（插件关闭时）
+
+RconPool是到一台服务器的连接池：
+连接登录后一直复用，同一个连接上可以同时有多条命令在途（流水线，按请求ID对应响应），
+全部连接都满时再新建连接，总并发不超过 连接数x流水线深度，多出的命令排队等待
+连接断开时下一条命令自动重连并重新登录；复用的旧连接在收到任何响应之前断开时，命令会在新连接上重试一次
+空闲超过mc_rcon_idle_second的连接在下次取用时关闭，连接期间开启TCP keepalive
+
+协议：每个数据包为 长度(int32 LE) + 请求ID(int32) + 类型(int32) + 内容 + 两个\\x00，
+类型3为登录，2为执行命令（服务器的登录响应也是2），0为命令输出；登录失败时服务器返回ID为-1的响应
+Minecraft把超过4096字节的输出拆成多个同ID的数据包，收到不满4096字节的数据包、后一条命令的响应或等待片刻后视为结束
+"""
+
+import asyncio
+import re
+import socket
+import struct
+import time
+
+LOGIN, COMMAND, RESPONSE = 3, 2, 0
+DEFAULT_PORT = 25575
+FRAGMENT_SIZE = 4096
+FRAGMENT_GRACE_SECOND = 0.1     # 输出刚好是4096字节的整数倍时，最后一个满包之后等待这么久就视为结束
+MAX_PACKET_SIZE = 1 << 20
+
+_HEADER = struct.Struct("<iii")
+_LENGTH = struct.Struct("<i")
+
+
+def encode_packet(request_id: int, packet_type: int, body: str) -> bytes:
+    """编码一个RCON数据包"""
+    payload = body.encode("utf-8") + b"\x00\x00"
+    return _HEADER.pack(8 + len(payload), request_id, packet_type) + payload
+
+
+async def read_packet(reader: asyncio.StreamReader) -> tuple[int, int, bytes]:
+    """读取一个RCON数据包，返回(请求ID, 类型, 内容)"""
+    length, = _LENGTH.unpack(await reader.readexactly(4))
+    if not 10 <= length <= MAX_PACKET_SIZE:
+        raise ConnectionError(f"RCON数据包长度错误：{length}")
+    data = await reader.readexactly(length)
+    request_id, packet_type = struct.unpack_from("<ii", data)
+    return request_id, packet_type, data[8:-2]
+
+
+def split_address(address: str) -> tuple[str, int]:
+    """host[:port]，没有端口时使用25575"""
+    host, separator, port = address.rpartition(":")
+    if separator and port.isdigit():
+        return host, int(port)
+    return address, DEFAULT_PORT
+
+
+class _Request:
+    """一条在途的命令"""
+    __slots__ = ("future", "chunks", "timer")
+
+    def __init__(self, future: asyncio.Future) -> None:
+        self.future = future
+        self.chunks: list[bytes] = []
+        self.timer: asyncio.TimerHandle | None = None
+
+    def finish(self) -> None:
+        """合并已收到的输出并完成"""
+        if self.timer is not None:
+            self.timer.cancel()
+        if not self.future.done():
+            self.future.set_result(b"".join(self.chunks).decode("utf-8", "replace"))
+
+
+class RconConnection:
+    """一个已登录的RCON连接，读取协程按请求ID把响应分发给在途的命令"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.pending: dict[int, _Request] = {}
+        self.next_id = 1
+        self.completed = 0                  # 已经完成的命令数，大于0表示这是复用的连接
+        self.last_used = time.monotonic()
+        self.closed = False
+        self.read_task: asyncio.Task | None = None
+
+    @classmethod
+    async def open(cls, host: str, port: int, password: str, timeout: float) -> "RconConnection":
+        """建立连接并登录，密码错误时抛出PermissionError"""
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        connection = cls(reader, writer)
+        try:
+            await asyncio.wait_for(connection._login(password), timeout)
+        except BaseException:
+            connection.close()
+            raise
+        connection.read_task = asyncio.create_task(connection._read_loop())
+        return connection
+
+    async def _login(self, password: str) -> None:
+        """发送登录包，等待登录响应（忽略部分服务器在登录响应前发送的空输出包）"""
+        self.writer.write(encode_packet(0, LOGIN, password))
+        await self.writer.drain()
+        while True:
+            request_id, packet_type, _ = await read_packet(self.reader)
+            if request_id == -1:
+                raise PermissionError("RCON密码错误")
+            if packet_type == COMMAND and request_id == 0:
+                return
+
+    @property
+    def inflight(self) -> int:
+        """在途的命令数"""
+        return len(self.pending)
+
+    async def request(self, command: str, timeout: float) -> str:
+        """发送一条命令并等待输出，不等前面的命令完成（流水线）；超时后关闭连接，免得后面的命令被堵住"""
+        if self.closed:
+            raise ConnectionError("RCON连接已断开")
+        request_id = self.next_id
+        self.next_id = self.next_id % 0x7FFFFFFF + 1
+        request = self.pending[request_id] = _Request(asyncio.get_running_loop().create_future())
+        try:
+            self.writer.write(encode_packet(request_id, COMMAND, command))
+            await self.writer.drain()
+            result = await asyncio.wait_for(request.future, timeout)
+        except asyncio.TimeoutError:
+            self.close()
+            raise
+        finally:
+            self.pending.pop(request_id, None)
+            self.last_used = time.monotonic()
+        self.completed += 1
+        return result
+
+    async def _read_loop(self) -> None:
+        """按请求ID分发响应，服务器按顺序处理命令，所以收到后一条命令的响应时前面的命令一定已经结束"""
+        loop = asyncio.get_running_loop()
+        error: Exception = ConnectionError("RCON连接已断开")
+        try:
+            while True:
+                request_id, _, body = await read_packet(self.reader)
+                for other_id, other in list(self.pending.items()):
+                    if other_id == request_id:
+                        break
+                    if other.chunks:
+                        other.finish()
+                request = self.pending.get(request_id)
+                if request is None:
+                    continue
+                request.chunks.append(body)
+                if request.timer is not None:
+                    request.timer.cancel()
+                    request.timer = None
+                if len(body) < FRAGMENT_SIZE:
+                    request.finish()
+                else:
+                    request.timer = loop.call_later(FRAGMENT_GRACE_SECOND, request.finish)
+        except (OSError, asyncio.IncompleteReadError) as e:
+            if isinstance(e, ConnectionError):
+                error = e
+        finally:
+            self.closed = True
+            for request in self.pending.values():
+                if request.chunks:
+                    request.finish()
+                elif not request.future.done():
+                    request.future.set_exception(error)
+            self.writer.close()
+
+    def close(self) -> None:
+        """关闭连接，在途的命令以ConnectionError结束"""
+        self.closed = True
+        if self.read_task is not None:
+            self.read_task.cancel()
+            self.read_task = None
+        else:
+            self.writer.close()
+
+
+class RconPool:
+    """到一台服务器的RCON连接池"""
+
+    def __init__(self, address: str, password: str, size: int, depth: int, timeout: float, idle: float) -> None:
+        self.host, self.port = split_address(address)
+        self.password = password
+        self.size = size
+        self.timeout = timeout
+        self.idle = idle
+        self.connections: list[RconConnection] = []
+        self.slots = asyncio.Semaphore(size * depth)
+        self.open_lock = asyncio.Lock()
+
+    async def execute(self, command: str) -> str:
+        """执行一条命令，连接池满时排队"""
+        async with self.slots:
+            connection = await self._acquire()
+            try:
+                return await connection.request(command, self.timeout)
+            except ConnectionError:
+                # 复用的连接可能早已被服务器关闭（重启、空闲超时），命令还没有任何输出时换新连接重试一次
+                if not connection.completed:
+                    raise
+            connection = await self._acquire()
+            return await connection.request(command, self.timeout)
+
+    async def _acquire(self) -> RconConnection:
+        """取在途命令最少的连接，全部有命令在途且连接数未满时新建连接"""
+        connection = self._pick()
+        if connection is None:
+            async with self.open_lock:
+                connection = self._pick()
+                if connection is None:
+                    connection = await RconConnection.open(self.host, self.port, self.password, self.timeout)
+                    self.connections.append(connection)
+        return connection
+
+    def _pick(self) -> RconConnection | None:
+        """丢掉已断开和空闲太久的连接后挑选一个可用的连接，需要新建时返回None"""
+        now = time.monotonic()
+        alive = []
+        for connection in self.connections:
+            if not connection.closed and not connection.inflight and now - connection.last_used > self.idle:
+                connection.close()
+            if not connection.closed:
+                alive.append(connection)
+        self.connections = alive
+        best = min(alive, key=lambda connection: connection.inflight, default=None)
+        if best is not None and (best.inflight == 0 or len(alive) >= self.size):
+            return best
+        return None
+
+    def close(self) -> None:
+        """关闭全部连接"""
+        for connection in self.connections:
+            connection.close()
+        self.connections = []
+
+
+class RconClient:
+    """按(地址, 密码)管理RCON连接池"""
+    pools: dict[tuple[str, str], RconPool] = {}
+    _settings: tuple = (2, 4, 5.0, 300.0)
+
+    @classmethod
+    def configure(cls, size: int, depth: int, timeout: float, idle: float) -> None:
+        """设置连接池参数，参数变化时关闭已有连接（下次使用时按新参数重建）"""
+        if (size, depth, timeout, idle) == cls._settings:
+            return
+        cls._settings = (size, depth, timeout, idle)
+        cls.close_all()
+
+    @classmethod
+    async def execute(cls, address: str, password: str, command: str) -> str:
+        """
+        在RCON服务器上执行一条命令
+        :param address: host[:port]
+        :return: 去掉§颜色代码的输出
+        连接失败/断开时抛出OSError，密码错误时抛出PermissionError，超时抛出TimeoutError
+        """
+        pool = cls.pools.get((address, password))
+        if pool is None:
+            pool = cls.pools[(address, password)] = RconPool(address, password, *cls._settings)
+        return re.sub("§.", "", await pool.execute(command))
+
+    @classmethod
+    def close_all(cls) -> None:
+        """关闭全部连接池"""
+        for pool in cls.pools.values():
+            pool.close()
+        cls.pools.clear()
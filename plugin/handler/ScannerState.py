@@ -0,0 +1,145 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+扫描器状态保存类 ScannerState.py 2026-10-19
+Author: AptS:1547
+
+ScannerState类把扫描器的状态保存到config.yml同目录下的scanner_state.json，重启后恢复，提供了以下方法：
+dump: 扫描器当前的状态序列化为JSON（在事件循环中调用，很快）
+load: 读取文件并恢复到扫描器，返回恢复的服务器数
+restore_record: 恢复一个服务器的记录
+
+保存的内容（每个服务器一条）：是否连接不上和错误信息、最近一次结果（版本/类型/人数/延迟/MOTD文字，不含图标）和状态指纹、
+解析好的地址和服务器类型（endpoints）、最近的延迟记录、在线玩家和加入/离开记录
+恢复时的检查：文件格式版本不同、保存时间超过mc_scanner_state_max_age_second时整个丢弃；
+单个服务器的结果超过时限或者已经不在扫描列表中时丢弃
+恢复后重启前已经离线的服务器不会再提醒一次“连接已丢失”，HTTP状态接口和~who在第一轮扫描之前就有数据，
+第一轮扫描直接Ping解析好的地址，不用重新做SRV解析和JE/BE探测
+"""
+
+import json
+import time
+from collections import deque
+from dataclasses import astuple
+from pathlib import Path
+
+from nonebot import logger
+
+from .LatencyProbe import LatencyStats                                  # pylint: disable=relative-beyond-top-level
+from .MotdFormat import motd_text                                       # pylint: disable=relative-beyond-top-level
+from .PlayerTracker import EVENT_HISTORY, PlayerState, PlayerTracker    # pylint: disable=relative-beyond-top-level
+from .ServerScaner import LATENCY_HISTORY, ScanResult                   # pylint: disable=relative-beyond-top-level
+
+STATE_VERSION = 1
+SAVED_FIELDS = ("server_address", "serverType", "version", "onlinePlayers", "maxPlayers", "pingLatency", "groupID")
+
+
+class ScannerState:
+    """扫描器状态的保存和恢复"""
+
+    @staticmethod
+    def dump(scanner) -> bytes:
+        """扫描器的状态序列化为JSON"""
+        servers = []
+        for key, result in scanner.results.items():
+            record = {"group_id": result.group_id, "address": result.address, "backend": result.backend,
+                      "down": key in scanner.scan_server_not_connect, "error": result.error, "updated": result.updated,
+                      "fingerprint": result.fingerprint}
+            if key in scanner.endpoints:
+                record["endpoint"] = list(scanner.endpoints[key])
+            if result.information is not None:
+                information = {name: result.information[name] for name in SAVED_FIELDS if name in result.information}
+                information["MOTD"] = motd_text(result.information.get("MOTD"))
+                information["playerSample"] = list(result.information.get("playerSample", ()))
+                if result.information.get("latencyStats") is not None:
+                    information["latencyStats"] = list(astuple(result.information["latencyStats"]))
+                record["information"] = information
+            if key in scanner.latency_history:
+                record["latency"] = [round(value, 3) for value in scanner.latency_history[key]]
+            players = scanner.players.online(key)
+            if players is not None:
+                record["players"] = {"seen": players.players, "complete": players.complete,
+                                     "events": list(players.events), "updated": players.updated}
+            servers.append(record)
+        # 没有结果但记为连接不上的服务器（例如刚恢复、还没有扫描到）也要保存
+        saved = set(scanner.results)
+        servers.extend({"group_id": group_id, "address": address, "backend": "", "down": True, "error": "", "updated": time.time()}
+                       for group_id, address in scanner.scan_server_not_connect if (group_id, address) not in saved)
+        return json.dumps({"version": STATE_VERSION, "saved": time.time(), "servers": servers},
+                          ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    @classmethod
+    def load(cls, scanner, path: Path, max_age: float) -> int:
+        """
+        读取保存的状态并恢复到扫描器（扫描器需要已经读取扫描列表）
+        :param max_age: 保存时间或单个服务器的结果超过这么久（秒）时丢弃
+        :return: 恢复的服务器数
+        """
+        try:
+            data = json.loads(path.read_bytes())
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            logger.warning(f"[epmc_minecraft_bot] 读取扫描器状态失败：{e}")
+            return 0
+        now = time.time()
+        if not isinstance(data, dict) or data.get("version") != STATE_VERSION:
+            return 0
+        saved = data.get("saved")
+        if not isinstance(saved, (int, float)) or now - saved > max_age:
+            return 0
+
+        members = scanner.scan_members()
+        restored = 0
+        for record in data.get("servers") or ():
+            try:
+                key = (record["group_id"], record["address"])
+                if key not in members or now - record["updated"] > max_age:
+                    continue
+                cls.restore_record(scanner, key, record)
+            except (KeyError, TypeError, ValueError) as e:     # 不完整、手动修改过或者旧格式的记录只跳过这一条
+                logger.warning(f"[epmc_minecraft_bot] 跳过无法恢复的扫描器状态记录：{e!r}")
+                continue
+            restored += 1
+        if restored:
+            scanner.results_version += 1
+        return restored
+
+    @staticmethod
+    def restore_record(scanner, key: tuple[int, str], record: dict) -> None:
+        """把一个服务器的记录恢复到扫描器；先解析完整条记录再写入扫描器，记录有问题时扫描器不会只恢复一半"""
+        result = None
+        information = record.get("information")
+        if information is not None:
+            information = dict(information)
+            information["playerSample"] = PlayerTracker.sample_names(information.get("playerSample", ()))
+            if "latencyStats" in information:
+                information["latencyStats"] = LatencyStats(*information["latencyStats"])
+            result = ScanResult(key[0], key[1], record["backend"], information, record["error"], float(record["updated"]),
+                                record.get("fingerprint", ""))
+        elif record["error"]:
+            result = ScanResult(key[0], key[1], record["backend"], None, record["error"], float(record["updated"]))
+        endpoint = record.get("endpoint")
+        if endpoint:
+            server_type, host, port = endpoint
+            endpoint = (str(server_type), str(host), int(port))
+        latency = deque((float(value) for value in record.get("latency") or ()), maxlen=LATENCY_HISTORY)
+        players = record.get("players")
+        if players is not None:
+            players = PlayerState(
+                {PlayerTracker.intern(name): float(seen) for name, seen in players["seen"].items()}, bool(players["complete"]),
+                deque(((stamp, joined, PlayerTracker.intern(name)) for stamp, joined, name in players["events"]), maxlen=EVENT_HISTORY),
+                float(players["updated"]))
+        down = bool(record["down"])
+
+        if down:
+            scanner.scan_server_not_connect.add(key)
+        if result is not None:
+            scanner.results[key] = result
+        if endpoint:
+            scanner.endpoints[key] = endpoint
+        if latency:
+            scanner.latency_history[key] = latency
+        if players is not None:
+            scanner.players.states[key] = players
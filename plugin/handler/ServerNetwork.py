@@ -0,0 +1,102 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+服务器网络类 ServerNetwork.py 2026-10-19
+Author: AptS:1547
+
+ServerNetwork类查询一个Velocity/BungeeCord代理及其后面的子服务器（群设置中的backends），提供了以下方法：
+probe: 同时Ping代理和全部子服务器，合并成一个NetworkStatus，总耗时取决于最慢的那一个
+
+NetworkStatus是合并后的结果：
+total_players: 子服务器在线人数之和（没有子服务器在线时使用代理显示的人数）
+worst_latency: 在线成员中最高的延迟
+down: 连接不上的成员（代理和子服务器）
+card_information: ~ping卡片使用的服务器信息（代理的图标/MOTD/版本，人数和延迟换成合计值）
+"""
+
+from dataclasses import dataclass
+
+from .ConfigHandler import ConfigSnapshot, GroupConfig    # pylint: disable=relative-beyond-top-level
+from .MinecraftServer import MinecraftServer               # pylint: disable=relative-beyond-top-level
+
+PROXY_NAME = "proxy"
+
+
+@dataclass(frozen=True, slots=True)
+class MemberStatus:
+    """网络中一个成员（代理或子服务器）的Ping结果，information为空表示连接不上"""
+    name: str
+    address: str
+    information: dict | None = None
+    error: str = ""
+
+    @property
+    def online(self) -> bool:
+        """是否连接成功"""
+        return self.information is not None
+
+
+@dataclass(frozen=True, slots=True)
+class NetworkStatus:
+    """代理和子服务器合并后的状态"""
+    proxy: MemberStatus
+    backends: tuple[MemberStatus, ...]
+
+    @property
+    def members(self) -> tuple[MemberStatus, ...]:
+        """代理在前的全部成员"""
+        return (self.proxy, *self.backends)
+
+    @property
+    def total_players(self) -> int:
+        """子服务器在线人数之和，没有子服务器在线时使用代理显示的人数"""
+        online = [backend.information["onlinePlayers"] for backend in self.backends if backend.online]
+        if online:
+            return sum(online)
+        return self.proxy.information["onlinePlayers"] if self.proxy.online else 0
+
+    @property
+    def worst_latency(self) -> float:
+        """在线成员中最高的延迟（毫秒）"""
+        return max((member.information["pingLatency"] for member in self.members if member.online), default=0.0)
+
+    @property
+    def down(self) -> tuple[MemberStatus, ...]:
+        """连接不上的成员"""
+        return tuple(member for member in self.members if not member.online)
+
+    def card_information(self) -> dict | None:
+        """~ping卡片的服务器信息：代理（代理离线时第一个在线的子服务器）的信息，人数和延迟换成合计值；全部离线时返回None"""
+        base = next((member for member in self.members if member.online), None)
+        if base is None:
+            return None
+        information = dict(base.information)
+        information["onlinePlayers"] = self.total_players
+        information["pingLatency"] = self.worst_latency
+        information.pop("latencyStats", None)       # 采样统计只属于一个成员，和合计的延迟对不上
+        if not self.proxy.online:
+            information["maxPlayers"] = sum(backend.information["maxPlayers"] for backend in self.backends if backend.online)
+        return information
+
+
+class ServerNetwork:
+    """代理+子服务器的并发查询"""
+
+    @classmethod
+    async def probe(cls, group: GroupConfig, snapshot: ConfigSnapshot) -> NetworkStatus:
+        """
+        同时Ping代理和全部子服务器
+        :param group: 群设置，server_address是代理，backends是子服务器
+        :param snapshot: 配置快照，总时限使用mc_ping_deadline_second
+        """
+        members = [(PROXY_NAME, group.server_address), *group.backends]
+        results = await MinecraftServer.ping_many([address for _, address in members], snapshot, group.group_id,
+                                                  concurrency=len(members), deadline=snapshot.config.mc_ping_deadline_second)
+        statuses = []
+        for (name, address), (_, mc_server, ping_server_return) in zip(members, results):
+            if ping_server_return is True:
+                statuses.append(MemberStatus(name, address, mc_server.server_information))
+            else:
+                statuses.append(MemberStatus(name, address, error=ping_server_return))
+        return NetworkStatus(statuses[0], tuple(statuses[1:]))
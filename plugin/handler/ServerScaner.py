@@ -9,39 +9,99 @@ ServerScaner类用于处理Minecraft服务器的定时扫描，提供了以下
 __init__: 初始化
 bound_bot: 绑定机器人对象
 run_every_two_minutes: 每两分钟运行一次扫描任务
-start_scaner: 启动服务器扫描器
+start_scaner: 启动服务器扫描器，第一轮扫描在0.5~1个扫描间隔之间随机开始
 stop_scaner: 停止服务器扫描器
+update_config: 不停止扫描器，直接切换到新的配置快照
+update_state: 记录一个服务器的连接状态和最近一次结果（results），断开/恢复时发送提醒
+scan_members: 扫描列表中的全部(群号, 服务器地址)，包括子服务器
+fingerprint: 服务器状态的指纹（类型、版本、最大人数、MOTD、图标），不含人数和延迟
+save_state: 把状态保存到state_path（ScannerState），扫描过程中最多每SAVE_INTERVAL_SECOND保存一次，插件关闭时也保存
+
+提醒消息交给MessageDispatcher排队发送，扫描本身不等待消息发送
+群设置了子服务器（backends）时同时Ping代理和全部子服务器，每个成员单独提醒
+results保存每个服务器最近一次的ScanResult，results_version每次更新加1，HTTP状态接口（StatusApi）直接读取
+latency_history保存每个服务器最近LATENCY_HISTORY次扫描的延迟（定长deque），latency_stats需要时才计算统计值
+players（PlayerTracker）保存每个服务器最近看到的在线玩家和加入/离开记录，~who直接读取；mc_query_enable开启时普通服务器用Query获取完整名单
+endpoints保存普通服务器上次成功时解析好的(服务器类型, host, port)，下一轮直接Ping，不再做SRV解析和JE/BE同时探测
 """
 
+import asyncio
+import hashlib
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
 from nonebot import require, logger                                           #pylint: disable=missing-module-docstring, invalid-name
 from nonebot.adapters import Bot
-from nonebot_plugin_apscheduler import scheduler as nb_scheduler
-from .ConfigHandler import Config                                             #pylint: disable=relative-beyond-top-level
-from .MinecraftServer import MinecraftServer as mc_MinecraftServer            #pylint: disable=relative-beyond-top-level
 
 require("nonebot_plugin_apscheduler")
 
+from nonebot_plugin_apscheduler import scheduler as nb_scheduler              #pylint: disable=wrong-import-position
+from .ConfigHandler import ConfigSnapshot                                     #pylint: disable=relative-beyond-top-level, wrong-import-position
+from .LatencyProbe import LatencyStats                                        #pylint: disable=relative-beyond-top-level, wrong-import-position
+from .MessageDispatcher import MessageDispatcher, ALERT                       #pylint: disable=relative-beyond-top-level, wrong-import-position
+from .MotdFormat import motd_text                                             #pylint: disable=relative-beyond-top-level, wrong-import-position
+from .PlayerTracker import PlayerTracker                                      #pylint: disable=relative-beyond-top-level, wrong-import-position
+
+SCAN_JOB_ID = "job_scan_server"
+LATENCY_HISTORY = 60
+SAVE_INTERVAL_SECOND = 60.0     # 扫描过程中最多每隔这么久保存一次状态
+
+
+@dataclass(frozen=True, slots=True)
+class ScanResult:
+    """扫描器最近一次对一个服务器的结果，information不含图标，连接不上时为None"""
+    group_id: int
+    address: str
+    backend: str
+    information: dict | None
+    error: str
+    updated: float
+    fingerprint: str = ""       # 连接不上时为空
+
+
 class ServerScaner:
     """服务器扫描器类"""
-    def __init__(self, plugin_config: Config, bot: Bot | None = None) -> None:
+    def __init__(self, plugin_config: ConfigSnapshot | None = None, bot: Bot | None = None) -> None:
         """
         初始化 ServerScaner 类
-        :param pluginConfig: 插件配置对象
+        :param pluginConfig: 插件配置快照，可以为空，之后再赋值并调用add_scan_server
         :param bot: 机器人对象
         """
-        self.scan_server_not_connect = []  # TODO:这里不应该存储群号，应该存储服务器地址
+        self.scan_server_not_connect = set()  # 连接不上的(群号, 服务器地址)
+        self.scan_server_list = []
+        self.results: dict[tuple[int, str], ScanResult] = {}   # (群号, 服务器地址) -> 最近一次结果
+        self.results_version = 0
+        self.latency_history: dict[tuple[int, str], deque] = {}
+        self.endpoints: dict[tuple[int, str], tuple[str, str, int]] = {}     # (群号, 服务器地址) -> (服务器类型, host, port)
+        self.players = PlayerTracker()
+        self.state_path = None              # 状态文件，为None时不保存（mc_scanner_state_enable）
+        self.state_saved = time.monotonic()
         self.plugin_config = plugin_config  # 插件配置对象
         self.bot = bot  # 机器人对象
+        self.running = False                # 定时扫描任务是否在运行
 
-        self.add_scan_server()
+        if plugin_config is not None:
+            self.add_scan_server()
 
     def add_scan_server(self) -> None:
-        """ 读取需要扫描的服务器配置，将其加入到扫描列表中"""
-        self.scan_server_list = []
-        for groupid, value in self.plugin_config.mc_qqgroup_default_server.items():                     # TODO:这什么鬼变量啊，为什么下标是群号dict里面也放一个群号？你tm当时脑残了啊？
-            if isinstance(groupid, int) and value["need_scan"] and value["server_address"]:
-                value["groupID"] = str(groupid)
-                self.scan_server_list.append(value)
+        """ 读取需要扫描的服务器配置，将其加入到扫描列表中，不再扫描的服务器的结果一起丢弃"""
+        self.scan_server_list = self.plugin_config.scan_groups()
+        members = self.scan_members()
+        self.scan_server_not_connect &= members
+        if any(key not in members for key in self.results):
+            self.results = {key: result for key, result in self.results.items() if key in members}
+            self.results_version += 1
+        self.latency_history = {key: history for key, history in self.latency_history.items() if key in members}
+        self.endpoints = {key: endpoint for key, endpoint in self.endpoints.items() if key in members}
+        self.players.prune(members)
+
+    def scan_members(self) -> set[tuple[int, str]]:
+        """扫描列表中的全部(群号, 服务器地址)，服务器网络包括代理和子服务器"""
+        return {(group.group_id, address) for group in self.scan_server_list
+                for address in (group.server_address, *(address for _, address in group.backends))}
 
     def bound_bot(self, bot: Bot) -> None:
         """
@@ -50,34 +110,131 @@ class ServerScaner:
         """
         self.bot = bot
 
-    async def run_scanner(self, _: int, arg2: list, arg3: Bot) -> None:
+    def update_config(self, plugin_config: ConfigSnapshot) -> bool:
+        """
+        不停止扫描器，直接切换到新的配置快照；下一轮扫描开始使用新的扫描列表
+        :return: 新配置中是否还有需要扫描的服务器
+        """
+        interval = self.plugin_config.config.mc_ping_server_interval_second if self.plugin_config else None
+        self.plugin_config = plugin_config
+        self.add_scan_server()
+        if nb_scheduler.get_job(SCAN_JOB_ID) is not None and interval != plugin_config.config.mc_ping_server_interval_second:
+            nb_scheduler.reschedule_job(SCAN_JOB_ID, trigger="interval", seconds=plugin_config.config.mc_ping_server_interval_second)
+        return bool(self.scan_server_list)
+
+    async def run_scanner(self, _: int, arg2: list | None = None, arg3: Bot | None = None) -> None:
         """
         每两分钟运行一次的任务
         :param arg1: 参数1
-        :param arg2: 服务器配置列表
-        :param arg3: 机器人对象
+        :param arg2: 服务器配置列表，为空时使用当前的扫描列表
+        :param arg3: 机器人对象，为空时使用当前绑定的机器人
         """
+        arg2 = self.scan_server_list if arg2 is None else arg2
+        arg3 = self.bot if arg3 is None else arg3
+        if arg3 is None:
+            return
+
+        from .MinecraftServer import MinecraftServer as mc_MinecraftServer    #pylint: disable=relative-beyond-top-level, import-outside-toplevel
+        from .ServerNetwork import ServerNetwork, PROXY_NAME                  #pylint: disable=relative-beyond-top-level, import-outside-toplevel
 
         logger.debug("服务器扫描器开始扫描")
+        plugin_config = self.plugin_config          # 本轮扫描固定使用同一个快照，重载配置不会影响进行中的扫描
         for scan_config in arg2:
-            mc_server = mc_MinecraftServer(scan_config["server_address"], self.plugin_config, scan_config["groupID"])
+            if scan_config.backends:                # 服务器网络：所有成员同时Ping，耗时取决于最慢的一个
+                status = await ServerNetwork.probe(scan_config, plugin_config)
+                logger.debug(f"服务器网络{scan_config.server_address}的ping结果：{[(member.name, member.online) for member in status.members]}")
+                for member in status.members:
+                    self.update_state(arg3, scan_config.group_id, member.address, member.online, member.error,
+                                      "" if member.name == PROXY_NAME else member.name, member.information)
+                continue
+
+            key = (scan_config.group_id, scan_config.server_address)
+            mc_server = mc_MinecraftServer(scan_config.server_address, plugin_config, scan_config.group_id, self.endpoints.get(key))
             ping_server_return = await mc_server.ping_server()
+            if ping_server_return is True and plugin_config.config.mc_query_enable:
+                await mc_server.query_players()
+            endpoint = mc_server.resolved_endpoint() if ping_server_return is True else None
+            if endpoint is not None:
+                self.endpoints[key] = endpoint
+            else:
+                self.endpoints.pop(key, None)       # 连接不上时下一轮重新解析和探测
 
-            logger.debug(f"服务器{scan_config['server_address']}的ping结果：{ping_server_return}")
+            logger.debug(f"服务器{scan_config.server_address}的ping结果：{ping_server_return}")
 
-            if isinstance(ping_server_return, str):  # 连接不上的反馈
-                if scan_config["groupID"] not in self.scan_server_not_connect:
-                    self.scan_server_not_connect.append(scan_config["groupID"])
-                    logger.info(f"服务器连接已丢失，错误信息：\n{ping_server_return}")
-                    await arg3.send_group_msg(group_id=scan_config["groupID"], message=f"⚠️服务器{scan_config["server_address"]}连接已丢失")
-            else:
-                if scan_config["groupID"] in self.scan_server_not_connect:
-                    self.scan_server_not_connect.remove(scan_config["groupID"])
-                    logger.info("服务器连接已恢复")
-                    await arg3.send_group_msg(group_id=scan_config["groupID"], message=f"✅服务器{scan_config["server_address"]}连接已恢复")
+            self.update_state(arg3, scan_config.group_id, scan_config.server_address, ping_server_return is True,
+                              ping_server_return if isinstance(ping_server_return, str) else "",
+                              information=mc_server.server_information if ping_server_return is True else None)
 
             del mc_server
 
+        if self.state_path is not None and time.monotonic() - self.state_saved > SAVE_INTERVAL_SECOND:
+            await self.save_state(in_thread=True)
+
+    async def save_state(self, in_thread: bool = False) -> None:
+        """保存扫描器的状态，序列化在事件循环中进行，in_thread时在线程中写文件"""
+        from .AtomicFile import AtomicFile                                    #pylint: disable=relative-beyond-top-level, import-outside-toplevel
+        from .ScannerState import ScannerState                                #pylint: disable=relative-beyond-top-level, import-outside-toplevel
+
+        if self.state_path is None:
+            return
+        self.state_saved = time.monotonic()
+        data = ScannerState.dump(self)
+        try:
+            if in_thread:
+                await asyncio.to_thread(AtomicFile.write, self.state_path, data, False)
+            else:
+                AtomicFile.write(self.state_path, data, sync=False)
+        except OSError as e:
+            logger.warning(f"[epmc_minecraft_bot] 保存扫描器状态失败：{e}")
+
+    def update_state(self, bot: Bot, group_id: int, address: str, online: bool, error: str = "", backend: str = "",
+                     information: dict | None = None) -> None:
+        """
+        记录一个服务器的连接状态和最近一次结果，断开和恢复时各提醒一次
+        :param backend: 子服务器名称，代理或普通服务器为空
+        :param information: 连接成功时的服务器信息
+        """
+        key = (group_id, address)
+        if information is not None:
+            information = {name: value for name, value in information.items() if name != "Icon"}   # base64图标很大，接口也用不到
+            history = self.latency_history.get(key)
+            if history is None:
+                history = self.latency_history[key] = deque(maxlen=LATENCY_HISTORY)
+            history.append(information["pingLatency"])
+        joined, left = self.players.update(key, information if online else None,
+                                           interval=self.plugin_config.config.mc_ping_server_interval_second)
+        if joined or left:
+            logger.debug(f"服务器{address}玩家变化：加入{sorted(joined)}，离开{sorted(left)}")
+        fingerprint = self.fingerprint(information) if online and information is not None else ""
+        label = f"子服务器{backend}（{address}）" if backend else f"服务器{address}"
+        previous = self.results.get(key)
+        if fingerprint and previous is not None and previous.fingerprint and previous.fingerprint != fingerprint:
+            logger.debug(f"{label}的类型/版本/MOTD/图标有变化")
+        self.results[key] = ScanResult(group_id, address, backend, information if online else None, error, time.time(), fingerprint)
+        self.results_version += 1
+        if not online:                              # 连接不上的反馈
+            if key not in self.scan_server_not_connect:
+                self.scan_server_not_connect.add(key)
+                logger.info(f"{label}连接已丢失，错误信息：\n{error}")
+                MessageDispatcher.post(bot, f"⚠️{label}连接已丢失", group_id=group_id,
+                                       priority=ALERT, merge_key=("scan", group_id, address))
+        elif key in self.scan_server_not_connect:
+            self.scan_server_not_connect.discard(key)
+            logger.info(f"{label}连接已恢复")
+            MessageDispatcher.post(bot, f"✅{label}连接已恢复", group_id=group_id,
+                                   priority=ALERT, merge_key=("scan", group_id, address))
+
+    @staticmethod
+    def fingerprint(information: dict) -> str:
+        """服务器状态的指纹，人数和延迟每轮都会变，不计入"""
+        parts = (information.get("serverType"), information.get("version"), information.get("maxPlayers"),
+                 motd_text(information.get("MOTD")), information.get("IconKey"))
+        return hashlib.sha1("\0".join(map(str, parts)).encode("utf-8")).hexdigest()[:16]
+
+    def latency_stats(self, group_id: int, address: str) -> LatencyStats | None:
+        """一个服务器最近几次扫描的延迟统计，还没有扫描到在线时返回None"""
+        return LatencyStats.from_samples(self.latency_history.get((group_id, address), ()))
+
     def start_scaner(self) -> bool:
         """
         启动服务器扫描器
@@ -88,9 +245,13 @@ class ServerScaner:
         
         logger.debug("服务器扫描器已启动")
 
+        # 第一轮在0.5~1个间隔之间随机开始：多个机器人同时重启时不会同时Ping同一批服务器，在这之前由恢复的状态回答
+        interval = self.plugin_config.config.mc_ping_server_interval_second
         nb_scheduler.add_job(
-            self.run_scanner, "interval", seconds=self.plugin_config.mc_ping_server_interval_second, id="job_scan_server", max_instances=5, args=[1], kwargs={"arg2": self.scan_server_list, "arg3": self.bot}
+            self.run_scanner, "interval", seconds=interval, id=SCAN_JOB_ID, max_instances=5, args=[1],
+            replace_existing=True, next_run_time=datetime.now(nb_scheduler.timezone) + timedelta(seconds=interval * random.uniform(0.5, 1.0))
         )
+        self.running = True
         return True
 
     def stop_scaner(self, deletebot: bool) -> bool:
@@ -98,7 +259,9 @@ class ServerScaner:
         停止服务器扫描器
         :return: 是否成功停止
         """
-        nb_scheduler.remove_all_jobs()
+        if nb_scheduler.get_job(SCAN_JOB_ID) is not None:    # 只移除自己的任务，不影响其他插件
+            nb_scheduler.remove_job(SCAN_JOB_ID)
+        self.running = False
         if deletebot:
             self.bot = None
         return True
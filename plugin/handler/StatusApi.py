@@ -0,0 +1,228 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+HTTP状态接口类 StatusApi.py 2026-10-19
+Author: AptS:1547
+
+StatusApi类在NoneBot的FastAPI驱动器上提供只读的JSON接口，网站和监控面板直接读取扫描器的结果，不用再自己Ping服务器，提供了以下方法：
+register_routes: 注册路由（只注册一次，mc_api_enable关闭后路由返回404）
+server_record: 一个服务器的结果转换为JSON对象
+
+路由（mc_api_token不为空时需要 Authorization: Bearer <token> 或 ?token=<token>）：
+GET /epmc/api/servers: 扫描器全部结果，NDJSON（一行一个服务器）流式输出
+GET /epmc/api/groups/{群号}: 一个群的扫描结果，JSON
+GET /epmc/api/ping?address=a&address=b: 按需Ping（mc_api_probe_enable），只能查询配置中出现过的地址，
+                                        同一地址的并发请求合并为一次Ping并按mc_ping_cooldown_second冷却，
+                                        按完成顺序流式输出NDJSON（~ping的结果依赖群配置，不和~ping共用）
+
+扫描结果的响应带 ETag（进程标识+扫描器的results_version）和 Cache-Control: max-age=扫描间隔，
+If-None-Match匹配时直接返回304，不序列化任何数据；序列化好的数据按版本缓存，版本不变时多次请求只序列化一次
+"""
+
+import asyncio
+import json
+import secrets
+import time
+
+from .ConfigHandler import ConfigHandler, ConfigSnapshot  # pylint: disable=relative-beyond-top-level
+from .FastApiApp import FastApiApp                        # pylint: disable=relative-beyond-top-level
+from .MotdFormat import motd_text                         # pylint: disable=relative-beyond-top-level
+from .PingCoalescer import PingCoalescer                  # pylint: disable=relative-beyond-top-level
+
+ROUTE_PREFIX = "/epmc/api"
+STREAM_BATCH = 64           # 流式输出时每次发送的行数
+_INSTANCE = secrets.token_hex(4)    # 重启后版本号从0开始，ETag里带上进程标识，旧的ETag不会误判为未修改
+
+
+def information_record(address: str, information: dict | None, error: str = "") -> dict:
+    """服务器信息转换为JSON对象，连接不上时只有地址和错误"""
+    if information is None:
+        return {"address": address, "online": False, "error": error}
+    record = {"address": address, "online": True, "type": information["serverType"], "version": information["version"],
+              "players": information["onlinePlayers"], "max_players": information["maxPlayers"],
+              "latency_ms": round(information["pingLatency"], 2), "motd": motd_text(information.get("MOTD"))}
+    if information.get("latencyStats") is not None:
+        record["latency"] = information["latencyStats"].as_dict()
+    return record
+
+
+def encode_line(record: dict) -> bytes:
+    """NDJSON的一行"""
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+class StatusApi:
+    """只读HTTP/JSON状态接口"""
+    scanner = None
+    route_registered: bool = False
+
+    _lines: tuple[int, list[bytes]] = (-1, [])                # (版本, 全部服务器的NDJSON行)
+    _groups: dict[int, tuple[int, bytes]] = {}                 # 群号 -> (版本, JSON)，只缓存配置中的群
+
+    @classmethod
+    def server_record(cls, result) -> dict:
+        """
+        扫描结果（ServerScaner.ScanResult）转换为JSON对象，latency_recent是最近几次扫描的延迟统计，
+        fingerprint只在服务器类型、版本、MOTD或图标变化时改变
+        """
+        record = information_record(result.address, result.information, result.error)
+        record["group_id"] = result.group_id
+        if result.backend:
+            record["backend"] = result.backend
+        recent = cls.scanner.latency_stats(result.group_id, result.address)
+        if recent is not None:
+            record["latency_recent"] = recent.as_dict()
+        if result.fingerprint:
+            record["fingerprint"] = result.fingerprint
+        record["updated"] = int(result.updated)
+        return record
+
+    @classmethod
+    def lines(cls) -> list[bytes]:
+        """全部服务器的NDJSON行，按扫描器版本缓存"""
+        version = cls.scanner.results_version
+        if cls._lines[0] != version:
+            cls._lines = (version, [encode_line(cls.server_record(result)) for result in cls.scanner.results.values()])
+        return cls._lines[1]
+
+    @classmethod
+    def group_body(cls, group_id: int) -> bytes:
+        """
+        一个群的扫描结果JSON，按扫描器版本缓存
+        只缓存配置中的群，缓存大小不超过群数；请求任意群号不会让缓存无限增长
+        """
+        version = cls.scanner.results_version
+        cached = cls._groups.get(group_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        if cls._groups and next(iter(cls._groups.values()))[0] != version:
+            cls._groups.clear()             # 版本变了，旧的缓存都没用了
+        servers = [cls.server_record(result) for result in cls.scanner.results.values() if result.group_id == group_id]
+        body = json.dumps({"group_id": group_id, "servers": servers}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if group_id in ConfigHandler.snapshot.group_ids:
+            cls._groups[group_id] = (version, body)
+        return body
+
+    @staticmethod
+    def allowed_addresses(snapshot: ConfigSnapshot) -> set[str]:
+        """按需Ping允许查询的地址：全局默认服务器、各群的默认服务器和子服务器"""
+        addresses = {snapshot.config.mc_global_default_server}
+        for group in snapshot.groups.values():
+            addresses.add(group.server_address)
+            addresses.update(address for _, address in group.backends)
+        addresses.discard("")
+        return addresses
+
+    @classmethod
+    def register_routes(cls, scanner) -> bool:
+        """在FastAPI驱动器上注册接口路由，驱动器不是FastAPI时返回False"""
+        cls.scanner = scanner
+        if cls.route_registered:
+            return True
+        app = FastApiApp.get("HTTP状态接口")
+        if app is None:
+            return False
+        from fastapi import Request  # pylint: disable=import-outside-toplevel
+        from fastapi.responses import JSONResponse, Response, StreamingResponse  # pylint: disable=import-outside-toplevel
+
+        def check(request: Request):
+            """接口关闭时返回404，token不对时返回401，可以访问时返回None"""
+            config = ConfigHandler.config
+            if not config.mc_api_enable:
+                return JSONResponse({"error": "not found"}, status_code=404)
+            if config.mc_api_token:
+                authorization = request.headers.get("authorization", "")
+                token = authorization[7:] if authorization.startswith("Bearer ") else request.query_params.get("token", "")
+                if not secrets.compare_digest(token.encode(), config.mc_api_token.encode()):
+                    return JSONResponse({"error": "unauthorized"}, status_code=401)
+            return None
+
+        def cache_headers(request: Request, tag: str):
+            """ETag和Cache-Control，If-None-Match匹配时同时返回304响应"""
+            etag = f'W/"{_INSTANCE}-{tag}"'
+            headers = {"ETag": etag, "Cache-Control": f"max-age={ConfigHandler.config.mc_ping_server_interval_second}"}
+            candidates = {item.strip() for item in request.headers.get("if-none-match", "").split(",")}
+            matched = "*" in candidates or etag in candidates or etag[2:] in candidates
+            return headers, Response(status_code=304, headers=headers) if matched else None
+
+        async def stream(lines: list[bytes]):
+            for start in range(0, len(lines), STREAM_BATCH):
+                yield b"".join(lines[start:start + STREAM_BATCH])
+
+        async def servers(request: Request):
+            if (error := check(request)) is not None:
+                return error
+            headers, not_modified = cache_headers(request, str(cls.scanner.results_version))
+            if not_modified is not None:
+                return not_modified
+            return StreamingResponse(stream(cls.lines()), media_type="application/x-ndjson", headers=headers)
+
+        async def group(group_id: int, request: Request):
+            if (error := check(request)) is not None:
+                return error
+            headers, not_modified = cache_headers(request, f"{group_id}-{cls.scanner.results_version}")
+            if not_modified is not None:
+                return not_modified
+            return Response(cls.group_body(group_id), media_type="application/json", headers=headers)
+
+        async def ping(request: Request):
+            if (error := check(request)) is not None:
+                return error
+            snapshot = ConfigHandler.snapshot
+            if not snapshot.config.mc_api_probe_enable:
+                return JSONResponse({"error": "probe is disabled"}, status_code=403)
+            addresses = list(dict.fromkeys(request.query_params.getlist("address")))[:snapshot.config.mc_ping_multi_max]
+            allowed = cls.allowed_addresses(snapshot)
+            if not addresses or any(address not in allowed for address in addresses):
+                return JSONResponse({"error": "address must be a configured server"}, status_code=400)
+            headers = {"Cache-Control": f"max-age={int(snapshot.config.mc_ping_cooldown_second)}"}
+            return StreamingResponse(cls.probe_stream(addresses, snapshot), media_type="application/x-ndjson", headers=headers)
+
+        app.add_api_route(f"{ROUTE_PREFIX}/servers", servers, methods=["GET"])
+        app.add_api_route(f"{ROUTE_PREFIX}/groups/{{group_id}}", group, methods=["GET"])
+        app.add_api_route(f"{ROUTE_PREFIX}/ping", ping, methods=["GET"])
+        cls.route_registered = True
+        return True
+
+    @classmethod
+    async def probe_stream(cls, addresses: list[str], snapshot: ConfigSnapshot):
+        """
+        按需Ping，按完成顺序输出，超过mc_ping_deadline_second的地址最后标记为超时
+        接口请求之间按地址合并与冷却；~ping的键带群号（结果依赖群配置），两者不共用
+        """
+        async def probe(address: str) -> tuple[str, bytes]:
+            try:
+                information = await PingCoalescer.run(("probe", 0, address), lambda: cls.probe(address, snapshot),
+                                                      cooldown=snapshot.config.mc_ping_cooldown_second, version=snapshot)
+            except Exception as e:  # pylint: disable=broad-except
+                information = str(e)
+            if isinstance(information, dict):
+                return address, encode_line({**information_record(address, information), "updated": int(time.time())})
+            return address, encode_line(information_record(address, None, information))
+
+        tasks = [asyncio.create_task(probe(address)) for address in addresses]
+        emitted = set()
+        try:
+            for future in asyncio.as_completed(tasks, timeout=snapshot.config.mc_ping_deadline_second):
+                try:
+                    address, line = await future
+                except asyncio.TimeoutError:
+                    break
+                emitted.add(address)
+                yield line
+        finally:
+            for task in tasks:
+                task.cancel()
+        for address in addresses:
+            if address not in emitted:
+                yield encode_line(information_record(address, None, "timeout"))
+
+    @staticmethod
+    async def probe(address: str, snapshot: ConfigSnapshot) -> dict | str:
+        """Ping一个地址，成功返回服务器信息，失败返回失败原因"""
+        from .MinecraftServer import MinecraftServer  # pylint: disable=import-outside-toplevel, relative-beyond-top-level
+
+        mc_server = MinecraftServer(address, snapshot)
+        ping_server_return = await mc_server.ping_server()
+        return mc_server.server_information if ping_server_return is True else ping_server_return
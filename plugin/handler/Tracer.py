@@ -0,0 +1,141 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+分阶段耗时追踪类 Tracer.py 2026-10-19
+Author: AptS:1547
+
+Tracer类给~ping流水线的每个阶段计时，结果交给可替换的输出（sink），提供了以下方法：
+configure: 按配置开关追踪并选择输出
+span: 计时上下文，with Tracer.span("ping.render"): ...
+summary: 内存环形缓冲中各阶段最近的次数/p50/p95
+clear: 清空环形缓冲
+
+输出（mc_trace_sink，逗号分隔可以同时使用多个）：
+ring: 每个阶段最近RING_SIZE次耗时，供~conf trace查看（开启追踪时总会启用）
+log: 每个阶段结束时输出一行debug日志
+otel: 转发给OpenTelemetry（需要安装opentelemetry-api，未安装时忽略）
+
+关闭追踪时span返回同一个空上下文，除了一次属性读取没有其他开销
+"""
+
+import time
+from collections import deque
+from contextlib import nullcontext
+from statistics import quantiles
+
+from nonebot import logger
+
+_NULL_SPAN = nullcontext()
+
+
+class RingSink:
+    """内存环形缓冲：每个阶段保留最近RING_SIZE次耗时"""
+    RING_SIZE = 512
+
+    def __init__(self) -> None:
+        self.samples: dict[str, deque] = {}
+
+    def emit(self, name: str, _start_ns: int, duration: float, _attributes: dict) -> None:
+        """记录一次耗时"""
+        ring = self.samples.get(name)
+        if ring is None:
+            ring = self.samples[name] = deque(maxlen=self.RING_SIZE)
+        ring.append(duration)
+
+
+class LogSink:
+    """结构化日志：每个阶段一行debug日志"""
+
+    def emit(self, name: str, _start_ns: int, duration: float, attributes: dict) -> None:
+        """输出一行日志"""
+        extra = "".join(f" {key}={value}" for key, value in attributes.items())
+        logger.debug(f"[epmc_minecraft_bot] trace stage={name} ms={duration * 1000:.2f}{extra}")
+
+
+class OtelSink:
+    """OpenTelemetry：按实际的开始/结束时间补记一个span"""
+
+    def __init__(self) -> None:
+        from opentelemetry import trace  # pylint: disable=import-outside-toplevel
+        self.tracer = trace.get_tracer("nonebot_plugin_esap_minecraft")
+
+    def emit(self, name: str, start_ns: int, duration: float, attributes: dict) -> None:
+        """补记一个span"""
+        span = self.tracer.start_span(name, start_time=start_ns, attributes=attributes)
+        span.end(end_time=start_ns + int(duration * 1e9))
+
+
+class _Span:
+    """一次计时"""
+    __slots__ = ("name", "attributes", "start", "start_ns")
+
+    def __init__(self, name: str, attributes: dict) -> None:
+        self.name = name
+        self.attributes = attributes
+        self.start = 0.0
+        self.start_ns = 0
+
+    def __enter__(self) -> "_Span":
+        self.start_ns = time.time_ns()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        duration = time.perf_counter() - self.start
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        for sink in Tracer.sinks:
+            sink.emit(self.name, self.start_ns, duration, self.attributes)
+
+
+class Tracer:
+    """分阶段耗时追踪"""
+    enabled: bool = False
+    sinks: list = []
+    ring: RingSink = RingSink()
+    _settings: tuple = ()
+
+    @classmethod
+    def configure(cls, enabled: bool, sink: str = "ring") -> None:
+        """按配置开关追踪并选择输出，参数没有变化时什么都不做"""
+        if (enabled, sink) == cls._settings:
+            return
+        cls._settings = (enabled, sink)
+        sinks = [cls.ring]
+        for name in (item.strip() for item in sink.split(",")):
+            if name == "log":
+                sinks.append(LogSink())
+            elif name == "otel":
+                try:
+                    sinks.append(OtelSink())
+                except ImportError:
+                    logger.warning("[epmc_minecraft_bot] 未安装opentelemetry-api，忽略otel输出")
+        cls.sinks = sinks
+        cls.enabled = enabled
+
+    @classmethod
+    def span(cls, name: str, **attributes):
+        """计时上下文，关闭追踪时返回空上下文"""
+        if not cls.enabled:
+            return _NULL_SPAN
+        return _Span(name, attributes)
+
+    @classmethod
+    def summary(cls) -> dict[str, tuple[int, float, float]]:
+        """各阶段最近的(次数, p50毫秒, p95毫秒)"""
+        result = {}
+        for name, ring in sorted(cls.ring.samples.items()):
+            samples = list(ring)
+            if len(samples) == 1:
+                p50 = p95 = samples[0]
+            else:
+                cuts = quantiles(samples, n=20, method="inclusive")
+                p50, p95 = cuts[9], cuts[18]
+            result[name] = (len(samples), p50 * 1000, p95 * 1000)
+        return result
+
+    @classmethod
+    def clear(cls) -> None:
+        """清空环形缓冲"""
+        cls.ring.samples.clear()
@@ -0,0 +1,192 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+Velocity白名单类 VelocityWhitelist.py 2026-10-19
+Author: AptS:1547
+
+VelocityWhitelist类管理mc_vwl_file_path指向的白名单文件（和原版whitelist.json相同的[{"uuid", "name"}]格式），提供了以下方法：
+open: 按文件路径获取（必要时加载）白名单对象
+add: 添加玩家，O(1)，向日志追加一行后安排合并
+remove: 删除玩家（名称或UUID），O(1)，向日志追加一行后安排合并
+contains: 查询玩家是否在白名单内
+page: 分页列出白名单
+compact: 把日志合并回白名单文件
+
+内存中用 小写名称->条目 和 UUID->条目 两个字典做索引；修改记录在 <文件名>.journal 中（每行一个JSON），
+加载时先读白名单文件再重放日志。代理只读白名单文件，所以每次修改后FLUSH_DELAY_SECOND秒内由后台线程合并一次，
+连续修改只重写一次文件；合并前崩溃时修改还在日志里，下次加载时重放并重新合并
+"""
+
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from .AtomicFile import AtomicFile  # pylint: disable=relative-beyond-top-level
+
+
+@dataclass(frozen=True, slots=True)
+class WhitelistEntry:
+    """白名单中的一个玩家，uuid未知时为空字符串"""
+    name: str
+    uuid: str = ""
+
+    def to_dict(self) -> dict:
+        """转换为白名单文件中的格式"""
+        return {"uuid": self.uuid, "name": self.name} if self.uuid else {"name": self.name}
+
+
+class VelocityWhitelist:
+    """Velocity白名单"""
+    FLUSH_DELAY_SECOND = 1.0    # 修改后等待这么久再合并，期间的修改一起写入白名单文件
+    PAGE_SIZE = 20
+
+    _instances: dict[Path, "VelocityWhitelist"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        加载白名单文件并重放日志
+        :param path: 白名单文件路径
+        """
+        self.path = Path(path)
+        self.journal_path = self.path.with_name(self.path.name + ".journal")
+        self.lock = threading.Lock()
+        self.by_name: dict[str, WhitelistEntry] = {}
+        self.by_uuid: dict[str, WhitelistEntry] = {}
+        self.journal_ops = 0
+        self._sorted: list[WhitelistEntry] | None = None
+        self._timer: threading.Timer | None = None
+        self._load()
+        if self.journal_ops:                    # 上次合并前退出了，日志中的修改还没有写进白名单文件
+            with self.lock:
+                self._schedule_compact()
+
+    @classmethod
+    def open(cls, path: str | Path) -> "VelocityWhitelist":
+        """按文件路径获取白名单对象，同一个文件只加载一次"""
+        path = Path(path)
+        with cls._instances_lock:
+            whitelist = cls._instances.get(path)
+            if whitelist is None:
+                whitelist = cls._instances[path] = cls(path)
+            return whitelist
+
+    def __len__(self) -> int:
+        return len(self.by_name)
+
+    def _load(self) -> None:
+        """读取白名单文件，再按顺序重放日志"""
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as file:
+                for item in json.load(file) or []:
+                    if item.get("name"):
+                        self._index(WhitelistEntry(item["name"], (item.get("uuid") or "").lower()))
+        if self.journal_path.exists():
+            with open(self.journal_path, "r", encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:        # 写到一半时被中断的最后一行
+                        continue
+                    if record.get("op") == "add":
+                        self._index(WhitelistEntry(record["name"], (record.get("uuid") or "").lower()))
+                    elif record.get("op") == "del":
+                        self._unindex(record["name"])
+                    self.journal_ops += 1
+
+    def _index(self, entry: WhitelistEntry) -> None:
+        """加入索引，同名或同UUID的旧条目会被替换"""
+        self._unindex(entry.name)
+        if entry.uuid:
+            self._unindex(entry.uuid)
+            self.by_uuid[entry.uuid] = entry
+        self.by_name[entry.name.lower()] = entry
+        self._sorted = None
+
+    def _unindex(self, key: str) -> WhitelistEntry | None:
+        """按名称或UUID从索引中删除"""
+        entry = self.by_name.get(key.lower()) or self.by_uuid.get(key.lower())
+        if entry is None:
+            return None
+        del self.by_name[entry.name.lower()]
+        if entry.uuid:
+            self.by_uuid.pop(entry.uuid, None)
+        self._sorted = None
+        return entry
+
+    def _append(self, record: dict) -> None:
+        """向日志追加一行，安排合并（调用方持有锁）"""
+        with open(self.journal_path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.journal_ops += 1
+        self._schedule_compact()
+
+    def _schedule_compact(self) -> None:
+        """FLUSH_DELAY_SECOND秒后在后台线程合并，已经安排过时不重复安排（调用方持有锁）"""
+        if self._timer is None:
+            self._timer = threading.Timer(self.FLUSH_DELAY_SECOND, self.compact)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def contains(self, key: str) -> bool:
+        """按名称（不区分大小写）或UUID查询"""
+        key = key.lower()
+        return key in self.by_name or key in self.by_uuid
+
+    def add(self, name: str, uuid: str = "") -> bool:
+        """
+        添加玩家
+        :return: 是否是新添加的（已存在且信息相同时返回False）
+        """
+        entry = WhitelistEntry(name, uuid.lower())
+        with self.lock:
+            if self.by_name.get(name.lower()) == entry:
+                return False
+            self._index(entry)
+            self._append({"op": "add", **entry.to_dict()})
+            return True
+
+    def remove(self, key: str) -> bool:
+        """
+        按名称或UUID删除玩家
+        :return: 是否删除了玩家
+        """
+        with self.lock:
+            entry = self._unindex(key)
+            if entry is None:
+                return False
+            self._append({"op": "del", "name": entry.name})
+            return True
+
+    def page(self, page: int = 1, page_size: int = PAGE_SIZE) -> tuple[list[WhitelistEntry], int]:
+        """
+        分页列出白名单（按名称排序，排序结果缓存到下一次修改）
+        :return: (本页条目, 总页数)
+        """
+        with self.lock:
+            if self._sorted is None:
+                self._sorted = sorted(self.by_name.values(), key=lambda entry: entry.name.lower())
+            entries = self._sorted
+        pages = max(1, -(-len(entries) // page_size))
+        page = min(max(page, 1), pages)
+        return entries[(page - 1) * page_size:page * page_size], pages
+
+    def compact(self) -> None:
+        """把日志合并回白名单文件"""
+        with self.lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        """原子写入白名单文件后清空日志（调用方持有锁）"""
+        if self._timer is not None:
+            self._timer.cancel()                # 直接调用compact时取消还没执行的合并；定时器自己调用时cancel没有影响
+            self._timer = None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = [entry.to_dict() for entry in self.by_name.values()]
+        AtomicFile.write(self.path, json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8"))
+        # 白名单文件已包含全部修改，日志可以清空；在这之间崩溃时重放日志也只是重复同样的修改
+        with open(self.journal_path, "w", encoding="utf-8"):
+            pass
+        self.journal_ops = 0
@@ -0,0 +1,19 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+测试公共设置 conftest.py 2026-10-19
+Author: AptS:1547
+
+测试直接导入plugin/handler下的模块（和benchmark一样），不加载整个插件；
+扫描器模块需要nonebot_plugin_apscheduler，所以先初始化NoneBot
+"""
+
+import sys
+from pathlib import Path
+
+import nonebot
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "plugin"))
+
+nonebot.init(driver="~none")
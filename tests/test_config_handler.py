@@ -0,0 +1,39 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+配置处理测试 test_config_handler.py 2026-10-19
+Author: AptS:1547
+"""
+
+from pathlib import Path
+
+import pytest
+
+from handler.ConfigHandler import ConfigHandler  # pylint: disable=import-error
+from handler.MessageDefine import MessageDefine  # pylint: disable=import-error
+
+
+@pytest.fixture(name="config_file")
+def fixture_config_file(tmp_path) -> Path:
+    """临时目录中的config.yml"""
+    path = tmp_path / "config.yml"
+    ConfigHandler.initialize(path)
+    ConfigHandler.save_config()
+    return path
+
+
+@pytest.mark.parametrize("key", ["server_address", "backends"])
+def test_group_key_rejected_for_superuser(config_file, key):
+    """~conf set的群参数不能写到全局配置中"""
+    before = config_file.read_bytes()
+    assert ConfigHandler.set_config(["set", key, "mc.example.com"], 0) == MessageDefine.args_error_set_command
+    assert config_file.read_bytes() == before
+
+
+def test_global_key_written(config_file):
+    """全局参数写入config.yml"""
+    assert ConfigHandler.set_config(["set", "mc_ping_server_interval_second", "30"], 0) == \
+        MessageDefine.command_set_sueccess("mc_ping_server_interval_second", "30")
+    assert ConfigHandler.config.mc_ping_server_interval_second == 30
+    assert "mc_ping_server_interval_second: 30" in config_file.read_text(encoding="utf-8")
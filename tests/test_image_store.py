@@ -0,0 +1,43 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+图片缓存测试 test_image_store.py 2026-10-19
+Author: AptS:1547
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from handler.ImageStore import ImageStore  # pylint: disable=import-error
+
+
+@pytest.fixture(name="store")
+def fixture_store(tmp_path):
+    """每个测试使用新的缓存目录"""
+    ImageStore.configure(tmp_path / "cache", 10 * 100)
+    yield tmp_path / "cache"
+    ImageStore.directory = None
+
+
+def test_concurrent_put_stays_within_limit(store):
+    """多个线程同时写入时索引和目录保持一致，总大小不超过上限"""
+    images = [bytes([i]) * 100 for i in range(40)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        paths = list(executor.map(ImageStore.put, images))
+
+    assert all(path.parent == store for path in paths)
+    on_disk = {file.name: file.stat().st_size for file in store.iterdir() if not file.name.startswith(".")}
+    assert on_disk == dict(ImageStore._files)  # pylint: disable=protected-access
+    assert sum(on_disk.values()) <= 10 * 100
+
+
+def test_same_content_written_once(store):
+    """内容相同的图片只保存一份，path可以按文件名取回"""
+    first = ImageStore.put(b"x" * 100)
+    second = ImageStore.put(b"x" * 100)
+    assert first == second
+    assert ImageStore.path(first.name) == first
+    assert ImageStore.path("../config.yml") is None
+    assert len(list(store.iterdir())) == 1
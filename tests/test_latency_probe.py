@@ -0,0 +1,40 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+延迟统计测试 test_latency_probe.py 2026-10-19
+Author: AptS:1547
+"""
+
+import pytest
+
+from handler.LatencyProbe import LatencyStats  # pylint: disable=import-error
+
+
+def test_no_samples():
+    """没有样本时没有统计值"""
+    assert LatencyStats.from_samples([]) is None
+
+
+def test_single_sample():
+    """只有一个样本时p95就是该样本，抖动为0"""
+    stats = LatencyStats.from_samples([42.0], lost=2)
+    assert (stats.count, stats.minimum, stats.median, stats.p95, stats.jitter, stats.lost) == (1, 42.0, 42.0, 42.0, 0.0, 2)
+
+
+def test_quantiles_and_jitter():
+    """p95按包含端点的插值计算，抖动是相邻样本差的平均值"""
+    stats = LatencyStats.from_samples(float(value) for value in range(1, 21))
+    assert stats.minimum == 1.0
+    assert stats.median == pytest.approx(10.5)
+    assert stats.p95 == pytest.approx(19.05)
+    assert stats.jitter == pytest.approx(1.0)
+
+
+def test_p95_within_range():
+    """p95不超过最大值，不低于中位数"""
+    samples = [10.0, 80.0, 12.0, 11.0, 13.0]
+    stats = LatencyStats.from_samples(samples)
+    assert stats.median <= stats.p95 <= max(samples)
+    assert stats.jitter == pytest.approx((70 + 68 + 1 + 2) / 4)
+    assert stats.as_dict()["samples"] == 5
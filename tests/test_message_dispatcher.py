@@ -0,0 +1,88 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+发送队列测试 test_message_dispatcher.py 2026-10-19
+Author: AptS:1547
+"""
+
+import asyncio
+
+import pytest
+
+from handler.MessageDispatcher import ALERT, MessageDispatcher  # pylint: disable=import-error
+
+
+class FakeBot:  # pylint: disable=too-few-public-methods
+    """只记录发送的消息"""
+
+    def __init__(self) -> None:
+        self.sent = []
+
+    async def send_group_msg(self, group_id: int, message):
+        """记录群消息"""
+        self.sent.append((group_id, message))
+        return {"message_id": len(self.sent)}
+
+
+@pytest.fixture(autouse=True)
+def dispatcher():
+    """每个测试使用干净的队列，结束时停止发送协程"""
+    asyncio.run(MessageDispatcher.stop())
+    yield MessageDispatcher
+    asyncio.run(MessageDispatcher.stop())
+
+
+async def drain(bot: FakeBot, count: int) -> None:
+    """等待发送协程发出count条消息"""
+    for _ in range(100):
+        if len(bot.sent) >= count:
+            return
+        await asyncio.sleep(0.01)
+
+
+def test_merge_keeps_latest():
+    """相同合并键的消息只发送最新的一条"""
+    async def run():
+        bot = FakeBot()
+        MessageDispatcher.post(bot, "lost", group_id=1, merge_key=("scan", 1, "a"))
+        MessageDispatcher.post(bot, "recovered", group_id=1, merge_key=("scan", 1, "a"))
+        await drain(bot, 1)
+        await asyncio.sleep(0.05)
+        assert bot.sent == [(1, "recovered")]
+        assert not MessageDispatcher._merge            # pylint: disable=protected-access
+        await MessageDispatcher.stop()
+    asyncio.run(run())
+
+
+def test_expired_alert_releases_merge_key(monkeypatch):
+    """过期丢弃的提醒不能挡住之后相同合并键的提醒"""
+    async def run():
+        bot = FakeBot()
+        monkeypatch.setattr(MessageDispatcher, "ALERT_TTL_SECOND", 0.0)
+        monkeypatch.setattr(MessageDispatcher, "start", classmethod(lambda cls: setattr(cls, "_wakeup", asyncio.Event())))
+        MessageDispatcher.post(bot, "lost", group_id=1, priority=ALERT, merge_key=("scan", 1, "a"))
+        await asyncio.sleep(0.01)
+        assert MessageDispatcher._pop() == (None, None)  # pylint: disable=protected-access
+        assert ("scan", 1, "a") not in MessageDispatcher._merge   # pylint: disable=protected-access
+        monkeypatch.undo()
+        MessageDispatcher.post(bot, "recovered", group_id=1, priority=ALERT, merge_key=("scan", 1, "a"))
+        await drain(bot, 1)
+        assert bot.sent == [(1, "recovered")]
+        await MessageDispatcher.stop()
+    asyncio.run(run())
+
+
+def test_full_queue_releases_merge_key(monkeypatch):
+    """队列已满被挤掉的提醒不能挡住之后相同合并键的提醒"""
+    async def run():
+        bot = FakeBot()
+        monkeypatch.setattr(MessageDispatcher, "QUEUE_SIZE", {**MessageDispatcher.QUEUE_SIZE, ALERT: 1})
+        monkeypatch.setattr(MessageDispatcher, "start", classmethod(lambda cls: setattr(cls, "_wakeup", asyncio.Event())))
+        MessageDispatcher.post(bot, "lost a", group_id=1, priority=ALERT, merge_key=("scan", 1, "a"))
+        MessageDispatcher.post(bot, "lost b", group_id=1, priority=ALERT, merge_key=("scan", 1, "b"))   # 挤掉a
+        assert ("scan", 1, "a") not in MessageDispatcher._merge   # pylint: disable=protected-access
+        item = MessageDispatcher.post(bot, "recovered a", group_id=1, priority=ALERT, merge_key=("scan", 1, "a"))
+        assert item.message == "recovered a"
+        assert [queued.message for queued in MessageDispatcher._queues[ALERT]] == ["recovered a"]  # pylint: disable=protected-access
+    asyncio.run(run())
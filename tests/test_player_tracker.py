@@ -0,0 +1,57 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+在线玩家跟踪测试 test_player_tracker.py 2026-10-19
+Author: AptS:1547
+"""
+
+from handler.PlayerTracker import PARTIAL_TICKS, PlayerTracker  # pylint: disable=import-error
+
+KEY = (123456, "mc.example.com")
+
+
+def scan(*names: str, online: int | None = None) -> dict:
+    """一次扫描的服务器信息，online默认和名单人数相同（名单完整）"""
+    return {"playerSample": PlayerTracker.sample_names(names), "onlinePlayers": len(names) if online is None else online}
+
+
+def test_first_scan_records_without_events():
+    """第一次扫描到的服务器只记录名单，不产生加入记录"""
+    tracker = PlayerTracker()
+    assert tracker.update(KEY, scan("Alex", "Steve"), now=0.0) == (frozenset(), frozenset())
+    state = tracker.online(KEY)
+    assert set(state.players) == {"Alex", "Steve"}
+    assert not state.events
+
+
+def test_complete_list_diff():
+    """名单完整时直接和上一轮做集合差"""
+    tracker = PlayerTracker()
+    tracker.update(KEY, scan("Alex", "Steve"), now=0.0)
+    joined, left = tracker.update(KEY, scan("Steve", "Herobrine"), now=60.0)
+    assert joined == {"Herobrine"}
+    assert left == {"Alex"}
+    assert list(tracker.online(KEY).events) == [(60.0, False, "Alex"), (60.0, True, "Herobrine")]
+
+
+def test_partial_list_waits_before_leaving():
+    """名单不完整时，连续PARTIAL_TICKS轮没有出现的玩家才算离开"""
+    tracker = PlayerTracker()
+    tracker.update(KEY, scan("Alex", "Steve", online=10), now=0.0, interval=60.0)
+    for tick in range(1, PARTIAL_TICKS + 1):
+        joined, left = tracker.update(KEY, scan("Steve", online=10), now=tick * 60.0, interval=60.0)
+        assert not joined
+        assert not left
+    _, left = tracker.update(KEY, scan("Steve", online=10), now=(PARTIAL_TICKS + 1) * 60.0, interval=60.0)
+    assert left == {"Alex"}
+    assert not tracker.online(KEY).complete
+
+
+def test_offline_clears_without_leaving():
+    """服务器离线时清空名单，不记为离开；重新连接上时也不产生加入记录"""
+    tracker = PlayerTracker()
+    tracker.update(KEY, scan("Alex"), now=0.0)
+    assert tracker.update(KEY, None, now=60.0) == (frozenset(), frozenset())
+    assert tracker.online(KEY) is None
+    assert tracker.update(KEY, scan("Alex"), now=120.0) == (frozenset(), frozenset())
@@ -0,0 +1,36 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+发送限速测试 test_rate_limiter.py 2026-10-19
+Author: AptS:1547
+"""
+
+import pytest
+
+from handler.RateLimiter import TokenBucket  # pylint: disable=import-error
+
+
+def test_burst_is_immediate():
+    """桶里有令牌时不需要等待"""
+    bucket = TokenBucket(rate=1.0, burst=3)
+    now = bucket.updated
+    assert [bucket.reserve(now) for _ in range(3)] == [0.0, 0.0, 0.0]
+
+
+def test_overdraft_waits_in_order():
+    """令牌用完后按透支的数量依次等待"""
+    bucket = TokenBucket(rate=2.0, burst=1)
+    now = bucket.updated
+    assert bucket.reserve(now) == 0.0
+    assert bucket.reserve(now) == pytest.approx(0.5)
+    assert bucket.reserve(now) == pytest.approx(1.0)
+
+
+def test_refill_is_capped_at_burst():
+    """空闲很久之后最多只有burst个令牌"""
+    bucket = TokenBucket(rate=10.0, burst=2)
+    later = bucket.updated + 100
+    assert bucket.reserve(later) == 0.0
+    assert bucket.reserve(later) == 0.0
+    assert bucket.reserve(later) == pytest.approx(0.1)
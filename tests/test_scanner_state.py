@@ -0,0 +1,117 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+扫描器状态保存测试 test_scanner_state.py 2026-10-19
+Author: AptS:1547
+"""
+
+import json
+
+import pytest
+
+from handler.ConfigHandler import Config, ConfigSnapshot, GroupConfig  # pylint: disable=import-error
+from handler.LatencyProbe import LatencyStats                          # pylint: disable=import-error
+from handler.MessageDispatcher import MessageDispatcher                # pylint: disable=import-error
+from handler.PlayerTracker import PlayerTracker                        # pylint: disable=import-error
+from handler.ScannerState import ScannerState                          # pylint: disable=import-error
+from handler.ServerScaner import ServerScaner                          # pylint: disable=import-error
+
+GROUP_ID = 5
+
+
+def snapshot(*backends: tuple[str, str]) -> ConfigSnapshot:
+    """群GROUP_ID扫描服务器a，backends为子服务器"""
+    groups = {GROUP_ID: GroupConfig(group_id=GROUP_ID, server_address="a", need_scan=True, backends=backends)}
+    return ConfigSnapshot(config=Config(enable=True), group_ids=frozenset({GROUP_ID}), groups=groups)
+
+
+def information() -> dict:
+    """一次成功扫描的服务器信息"""
+    return {"server_address": "a", "serverType": "Java", "version": "1.21", "onlinePlayers": 1, "maxPlayers": 20,
+            "pingLatency": 3.0, "MOTD": ["hi ", "there"], "Icon": "x", "IconKey": "black",
+            "playerSample": PlayerTracker.sample_names(["Steve"]), "latencyStats": LatencyStats.from_samples([1.0, 2.0, 3.0])}
+
+
+@pytest.fixture(name="alerts")
+def fixture_alerts(monkeypatch):
+    """记录扫描器发出的提醒，不真的发送"""
+    posted = []
+    monkeypatch.setattr(MessageDispatcher, "post", lambda bot, message, **kwargs: posted.append(message))
+    return posted
+
+
+@pytest.fixture(name="saved")
+def fixture_saved(tmp_path, alerts):  # pylint: disable=unused-argument
+    """保存了一个在线的服务器a和一个连接不上的子服务器b的状态文件"""
+    scanner = ServerScaner(snapshot(("lobby", "b")))
+    scanner.update_state(None, GROUP_ID, "a", True, information=information())
+    scanner.update_state(None, GROUP_ID, "b", False, error="down", backend="lobby")
+    scanner.endpoints[(GROUP_ID, "a")] = ("Java", "10.0.0.1", 25565)
+    path = tmp_path / "scanner_state.json"
+    path.write_bytes(ScannerState.dump(scanner))
+    return path
+
+
+def test_round_trip(saved, alerts):
+    """恢复结果、指纹、解析好的地址、延迟和玩家，已经离线的服务器不会再提醒一次"""
+    original = json.loads(saved.read_bytes())["servers"][0]
+    scanner = ServerScaner(snapshot(("lobby", "b")))
+    assert ScannerState.load(scanner, saved, max_age=900) == 2
+
+    result = scanner.results[(GROUP_ID, "a")]
+    assert result.information["MOTD"] == "hi there"
+    assert result.information["latencyStats"] == LatencyStats.from_samples([1.0, 2.0, 3.0])
+    assert result.fingerprint == original["fingerprint"] != ""
+    assert scanner.endpoints[(GROUP_ID, "a")] == ("Java", "10.0.0.1", 25565)
+    assert list(scanner.latency_history[(GROUP_ID, "a")]) == [3.0]
+    assert set(scanner.players.online((GROUP_ID, "a")).players) == {"Steve"}
+    assert scanner.scan_server_not_connect == {(GROUP_ID, "b")}
+
+    alerts.clear()
+    scanner.update_state(None, GROUP_ID, "b", False, error="down", backend="lobby")
+    assert not alerts
+
+
+def test_expired_file_is_ignored(saved):
+    """保存时间超过max_age时整个文件丢弃"""
+    data = json.loads(saved.read_bytes())
+    data["saved"] -= 1000
+    saved.write_text(json.dumps(data), encoding="utf-8")
+    scanner = ServerScaner(snapshot(("lobby", "b")))
+    assert ScannerState.load(scanner, saved, max_age=900) == 0
+    assert not scanner.results
+    assert not scanner.endpoints
+
+
+def test_expired_or_removed_server_is_dropped(saved):
+    """单个服务器的结果过期或者已经不在扫描列表中时丢弃"""
+    data = json.loads(saved.read_bytes())
+    data["servers"][0]["updated"] -= 1000
+    saved.write_text(json.dumps(data), encoding="utf-8")
+    scanner = ServerScaner(snapshot())
+    assert ScannerState.load(scanner, saved, max_age=900) == 0
+    assert not scanner.endpoints
+    assert not scanner.scan_server_not_connect
+
+
+def test_truncated_record_is_skipped(saved):
+    """不完整的记录只跳过这一条，其他记录照常恢复，不会抛出异常"""
+    data = json.loads(saved.read_bytes())
+    data["servers"][0] = {key: value for key, value in data["servers"][0].items() if key not in ("backend", "error")}
+    data["servers"].append({"group_id": GROUP_ID})
+    data["servers"].append("garbage")
+    saved.write_text(json.dumps(data), encoding="utf-8")
+    scanner = ServerScaner(snapshot(("lobby", "b")))
+    assert ScannerState.load(scanner, saved, max_age=900) == 1
+    assert (GROUP_ID, "a") not in scanner.results
+    assert not scanner.endpoints
+    assert scanner.scan_server_not_connect == {(GROUP_ID, "b")}
+
+
+def test_malformed_header_is_ignored(saved):
+    """saved不是数字时整个文件丢弃"""
+    data = json.loads(saved.read_bytes())
+    data["saved"] = "yesterday"
+    saved.write_text(json.dumps(data), encoding="utf-8")
+    assert ScannerState.load(ServerScaner(snapshot(("lobby", "b"))), saved, max_age=900) == 0
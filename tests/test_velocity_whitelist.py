@@ -0,0 +1,58 @@
+"""
+Copyright 2022-2024 The ESAP Project. All rights reserved.
+Use of this source code is governed by a GPL-3.0 license that can be found in the LICENSE file.
+
+Velocity白名单测试 test_velocity_whitelist.py 2026-10-19
+Author: AptS:1547
+"""
+
+import json
+import time
+
+import pytest
+
+from handler.VelocityWhitelist import VelocityWhitelist  # pylint: disable=import-error
+
+UUID = "069a79f4-44e9-4726-a5be-fca90e38aaf5"
+
+
+@pytest.fixture(name="whitelist")
+def fixture_whitelist(tmp_path, monkeypatch):
+    """临时目录中的白名单，合并延迟缩短"""
+    monkeypatch.setattr(VelocityWhitelist, "FLUSH_DELAY_SECOND", 0.05)
+    return VelocityWhitelist(tmp_path / "whitelist.json")
+
+
+def read_back(whitelist: VelocityWhitelist, timeout: float = 2.0) -> list:
+    """等待后台合并完成后读取代理使用的白名单文件"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if whitelist.path.exists() and whitelist.journal_ops == 0:
+            break
+        time.sleep(0.01)
+    return json.loads(whitelist.path.read_text(encoding="utf-8"))
+
+
+def test_add_reaches_whitelist_file(whitelist):
+    """添加后白名单文件中就有这个玩家，不用等日志攒够"""
+    assert whitelist.add("Steve", UUID)
+    assert read_back(whitelist) == [{"uuid": UUID, "name": "Steve"}]
+
+
+def test_remove_reaches_whitelist_file(whitelist):
+    """删除后白名单文件中没有这个玩家"""
+    whitelist.add("Steve", UUID)
+    whitelist.add("Alex")
+    read_back(whitelist)
+    assert whitelist.remove(UUID)
+    assert read_back(whitelist) == [{"name": "Alex"}]
+
+
+def test_unflushed_journal_is_replayed_and_flushed(whitelist):
+    """合并前退出时，下次加载重放日志并补上合并"""
+    whitelist.FLUSH_DELAY_SECOND = 3600.0
+    whitelist.add("Steve")
+    assert not whitelist.path.exists()
+    reloaded = VelocityWhitelist(whitelist.path)
+    assert reloaded.contains("steve")
+    assert read_back(reloaded) == [{"name": "Steve"}]